@@ -7,6 +7,8 @@ from api.routers import (
     auth,
     competitions,
     discussions,
+    images,
+    my_notifications,
     my_projects,
     my_review,
     projects,
@@ -26,9 +28,11 @@ api.add_router("/projects", projects.router)
 api.add_router("/projects", discussions.router)
 api.add_router("/my/projects", my_projects.router)
 api.add_router("/my/reviews", my_review.router)
+api.add_router("/my/notifications", my_notifications.router)
 api.add_router("/tags", tags.router)
 api.add_router("/competitions", competitions.router)
 api.add_router("/users", users.router)
+api.add_router("/img", images.router)
 
 
 @api.get("/")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
+from zoneinfo import available_timezones
 
 from django.contrib.auth import authenticate
 from django.http import HttpRequest
@@ -186,11 +187,14 @@ def get_current_user_info(request: HttpRequest) -> AbstractUser:
 def update_current_user(
     request: HttpRequest,
     payload: UserUpdate,
-) -> AbstractUser:
+) -> AbstractUser | tuple[int, Error]:
     user = request.auth
+    changes = payload.dict(exclude_unset=True)
+    if changes.get("time_zone") and changes["time_zone"] not in available_timezones():
+        return 400, Error(detail="Unknown time zone")
 
     # Update only provided fields
-    for field, value in payload.dict(exclude_unset=True).items():
+    for field, value in changes.items():
         setattr(user, field, value)
 
     user.save()
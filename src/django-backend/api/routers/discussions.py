@@ -1,9 +1,16 @@
-from django.db.models import QuerySet
+from typing import Any
+
 from django.http import HttpRequest
-from ninja import Router
+from ninja import Query, Router
 
 from api.auth.security import auth
-from api.schemas.discussion import DiscussionCreate, DiscussionResponse, ReplyResponse
+from api.schemas.discussion import (
+    DiscussionCreate,
+    DiscussionListResponse,
+    DiscussionResponse,
+    ReplyListResponse,
+    ReplyResponse,
+)
 from api.schemas.errors import Error
 from apps.discussions.models import Discussion
 from services import HANDLERS, REPO
@@ -11,21 +18,54 @@ from services.discussions.exceptions import (
     DiscussionNotFoundError,
     NotDiscussionAuthorError,
 )
+from services.pagination import InvalidCursorError
+
+MAX_PAGE_SIZE = 50
 
 router = Router()
 
 
 @router.get(
     "/{project_id}/discussions",
-    response={200: list[DiscussionResponse]},
+    response={200: DiscussionListResponse, 400: Error, 401: Error},
     auth=auth,
     tags=["Discussions"],
 )
 def list_discussions(
     request: HttpRequest,
     project_id: str,
-) -> QuerySet[Discussion]:
-    return REPO.discussions.list_for_project(project_id)
+    cursor: str | None = Query(None),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    try:
+        page = REPO.discussions.list_for_project(project_id, cursor=cursor, limit=limit)
+    except InvalidCursorError:
+        return 400, {"detail": "Invalid cursor"}
+    return {"discussions": page.discussions, "next_cursor": page.next_cursor}
+
+
+@router.get(
+    "/{project_id}/discussions/{discussion_id}/replies",
+    response={200: ReplyListResponse, 400: Error, 401: Error, 404: Error},
+    auth=auth,
+    tags=["Discussions"],
+)
+def list_replies(
+    request: HttpRequest,
+    project_id: str,
+    discussion_id: str,
+    cursor: str | None = Query(None),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    try:
+        page = REPO.discussions.list_replies(
+            project_id, discussion_id, cursor=cursor, limit=limit
+        )
+    except InvalidCursorError:
+        return 400, {"detail": "Invalid cursor"}
+    except DiscussionNotFoundError:
+        return 404, {"detail": "Discussion not found"}
+    return {"replies": page.discussions, "next_cursor": page.next_cursor}
 
 
 @router.post(
@@ -0,0 +1,53 @@
+from uuid import UUID
+
+from django.http import HttpRequest, HttpResponseRedirect
+from ninja import Router
+
+from api.schemas.errors import Error
+from services import HANDLERS
+from services.image.exceptions import (
+    DerivativePendingError,
+    ImageNotFoundError,
+    ImageNotInStorageError,
+    UnsupportedFormatError,
+)
+
+# Derivative URLs never change once generated, so the redirect can be cached
+REDIRECT_MAX_AGE = 24 * 60 * 60
+
+router = Router()
+
+
+@router.get(
+    "/{image_id}/w{width}.{fmt}",
+    response={302: None, 400: Error, 404: Error},
+    tags=["Images"],
+)
+def get_image_derivative(
+    request: HttpRequest,
+    image_id: UUID,
+    width: int,
+    fmt: str,
+) -> HttpResponseRedirect | tuple[int, dict[str, str]]:
+    """Redirect to a resized copy of an image, generating it on first use.
+
+    The width is rounded up to the nearest supported size, or down to the
+    widest supported size the original can fill; originals narrower than the
+    smallest size are served as they are.
+    """
+    try:
+        url = HANDLERS.image.get_derivative_url(str(image_id), width, fmt)
+    except UnsupportedFormatError:
+        return 400, {"detail": f"Unsupported image format: {fmt}"}
+    except (ImageNotFoundError, ImageNotInStorageError):
+        return 404, {"detail": "Image not found"}
+    except DerivativePendingError as e:
+        # Serve the original until the derivative is ready, uncached so the
+        # next request picks the derivative up
+        response = HttpResponseRedirect(e.fallback_url)
+        response["Cache-Control"] = "no-store"
+        return response
+
+    response = HttpResponseRedirect(url)
+    response["Cache-Control"] = f"public, max-age={REDIRECT_MAX_AGE}"
+    return response
@@ -0,0 +1,62 @@
+from typing import Any
+
+from django.http import HttpRequest
+from ninja import Query, Router
+
+from api.auth.security import auth
+from api.schemas.errors import Error
+from api.schemas.notification import (
+    MarkNotificationsRead,
+    NotificationListResponse,
+    UnreadCountResponse,
+)
+from services import HANDLERS, REPO
+from services.pagination import InvalidCursorError
+
+MAX_PAGE_SIZE = 50
+
+router = Router()
+
+
+@router.get(
+    "",
+    response={200: NotificationListResponse, 400: Error, 401: Error},
+    auth=auth,
+    tags=["My Notifications"],
+)
+def list_my_notifications(
+    request: HttpRequest,
+    cursor: str | None = Query(None),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    unread: bool = Query(False),  # noqa: FBT001, FBT003
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    try:
+        page = REPO.notifications.list_for_user(
+            request.auth.id, cursor=cursor, limit=limit, unread_only=unread
+        )
+    except InvalidCursorError:
+        return 400, {"detail": "Invalid cursor"}
+    return {"notifications": page.notifications, "next_cursor": page.next_cursor}
+
+
+@router.get(
+    "/unread-count",
+    response={200: UnreadCountResponse, 401: Error},
+    auth=auth,
+    tags=["My Notifications"],
+)
+def get_unread_count(request: HttpRequest) -> dict[str, int]:
+    return {"unread_count": REPO.notifications.unread_count(request.auth.id)}
+
+
+@router.post(
+    "/read",
+    response={200: UnreadCountResponse, 401: Error},
+    auth=auth,
+    tags=["My Notifications"],
+)
+def mark_notifications_read(
+    request: HttpRequest, payload: MarkNotificationsRead
+) -> dict[str, int]:
+    HANDLERS.notifications.mark_read(request.auth.id, payload.ids)
+    return {"unread_count": REPO.notifications.unread_count(request.auth.id)}
@@ -1,6 +1,9 @@
 import logging
+from functools import partial
+from math import ceil
 from typing import Any
 
+from django.db import transaction
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
@@ -10,7 +13,13 @@ from ninja import Router
 from api.auth.security import auth
 from api.schemas.errors import Error
 from api.schemas.project import (
+    BatchPresignedUploadItem,
+    BatchPresignedUploadRequest,
+    BatchPresignedUploadResponse,
+    ImageOrderUpdateRequest,
     ImageUploadCompleteRequest,
+    MultipartUploadInfo,
+    MultipartUploadPart,
     PresignedUploadRequest,
     PresignedUploadResponse,
     ProjectCreate,
@@ -19,12 +28,14 @@ from api.schemas.project import (
     SetMainImageRequest,
 )
 from api.tasks.images import generate_image_variants
+from api.tasks.web_ui import revalidate_project
 from apps.projects.models import (
     Project,
     ProjectImage,
     UploadStatus,
 )
 from services import HANDLERS, REPO
+from services.image.exceptions import ImageNotInStorageError, InvalidImageError
 from services.project.exceptions import (
     InvalidCompetitionError,
     InvalidProjectStateError,
@@ -43,6 +54,12 @@ ALLOWED_CONTENT_TYPES = {
     "image/webp",
     "image/gif",
 }
+# Files above this size are uploaded in parts. S3 requires every part except
+# the last to be at least 5MB.
+MULTIPART_PART_SIZE = 5 * 1024 * 1024
+MULTIPART_THRESHOLD = 6 * 1024 * 1024
+
+logger = logging.getLogger(__name__)
 
 router = Router()
 
@@ -172,6 +189,19 @@ def resubmit_project(
 # ============================================================================
 
 
+def _validate_upload_request(payload: PresignedUploadRequest) -> str | None:
+    """Return an error message if the file can't be uploaded, else None."""
+    if payload.content_type not in ALLOWED_CONTENT_TYPES:
+        allowed = ", ".join(sorted(ALLOWED_CONTENT_TYPES))
+        return f"Content type must be one of: {allowed}"
+
+    if payload.file_size > MAX_FILE_SIZE:
+        max_mb = MAX_FILE_SIZE // (1024 * 1024)
+        return f"File size must be less than {max_mb}MB"
+
+    return None
+
+
 @router.post(
     "/{project_id}/images/upload-url",
     response={200: PresignedUploadResponse, 400: Error, 401: Error, 404: Error},
@@ -186,15 +216,9 @@ def get_upload_url(
     """Generate a presigned URL for uploading an image."""
     project = get_object_or_404(Project, id=project_id, owner=request.auth)
 
-    # Validate content type
-    if payload.content_type not in ALLOWED_CONTENT_TYPES:
-        allowed = ", ".join(sorted(ALLOWED_CONTENT_TYPES))
-        return 400, {"detail": f"Content type must be one of: {allowed}"}
-
-    # Validate file size
-    if payload.file_size > MAX_FILE_SIZE:
-        max_mb = MAX_FILE_SIZE // (1024 * 1024)
-        return 400, {"detail": f"File size must be less than {max_mb}MB"}
+    error = _validate_upload_request(payload)
+    if error:
+        return 400, {"detail": error}
 
     # Check image count limit
     current_count = project.images.filter(upload_status=UploadStatus.UPLOADED).count()
@@ -233,6 +257,125 @@ def get_upload_url(
     )
 
 
+def _start_upload(
+    project: Project,
+    file: PresignedUploadRequest,
+    display_order: int,
+    images: list[ProjectImage],
+) -> BatchPresignedUploadItem:
+    """Build the image row and upload instructions for one file.
+
+    The row is appended to ``images`` before any multipart upload is started,
+    so a failure part way through can still abort it.
+    """
+    storage_key = storage_service.generate_upload_key(str(project.id), file.filename)
+    image = ProjectImage(
+        project=project,
+        storage_key=storage_key,
+        original_filename=file.filename,
+        content_type=file.content_type,
+        file_size=file.file_size,
+        upload_status=UploadStatus.PENDING,
+        display_order=display_order,
+    )
+    images.append(image)
+
+    if file.file_size > MULTIPART_THRESHOLD:
+        image.multipart_upload_id = storage_service.create_multipart_upload(
+            storage_key, file.content_type
+        )
+        part_urls = storage_service.generate_presigned_part_urls(
+            storage_key,
+            image.multipart_upload_id,
+            ceil(file.file_size / MULTIPART_PART_SIZE),
+        )
+        return BatchPresignedUploadItem(
+            image_id=image.id,
+            filename=file.filename,
+            storage_key=storage_key,
+            method="PUT",
+            headers={},
+            multipart=MultipartUploadInfo(
+                upload_id=image.multipart_upload_id,
+                part_size=MULTIPART_PART_SIZE,
+                parts=[
+                    MultipartUploadPart(part_number=number, upload_url=url)
+                    for number, url in enumerate(part_urls, start=1)
+                ],
+            ),
+        )
+
+    presigned = storage_service.generate_presigned_upload_url(
+        storage_key, file.content_type
+    )
+    return BatchPresignedUploadItem(
+        image_id=image.id,
+        filename=file.filename,
+        storage_key=storage_key,
+        method=presigned["method"],
+        headers=presigned["headers"],
+        upload_url=presigned["upload_url"],
+    )
+
+
+def _abort_multipart_uploads(images: list[ProjectImage]) -> None:
+    for image in images:
+        if not image.multipart_upload_id:
+            continue
+        try:
+            storage_service.abort_multipart_upload(
+                image.storage_key, image.multipart_upload_id
+            )
+        except Exception:
+            logger.exception(
+                "Failed to abort multipart upload for %s", image.storage_key
+            )
+
+
+@router.post(
+    "/{project_id}/images/upload-urls",
+    response={200: BatchPresignedUploadResponse, 400: Error, 401: Error, 404: Error},
+    auth=auth,
+    tags=["Project Images"],
+)
+def get_upload_urls(
+    request: HttpRequest,
+    project_id: str,
+    payload: BatchPresignedUploadRequest,
+) -> BatchPresignedUploadResponse | tuple[int, dict[str, str]]:
+    """Generate presigned upload URLs for several images in one request.
+
+    Files above MULTIPART_THRESHOLD get presigned multipart part URLs so the
+    client can upload parts in parallel and retry them individually.
+    """
+    project = get_object_or_404(Project, id=project_id, owner=request.auth)
+
+    if not payload.files:
+        return 400, {"detail": "No files given"}
+
+    for file in payload.files:
+        error = _validate_upload_request(file)
+        if error:
+            return 400, {"detail": f"{file.filename}: {error}"}
+
+    current_count = project.images.filter(upload_status=UploadStatus.UPLOADED).count()
+    if current_count + len(payload.files) > MAX_IMAGES_PER_PROJECT:
+        return 400, {"detail": f"Maximum {MAX_IMAGES_PER_PROJECT} images per project"}
+
+    images: list[ProjectImage] = []
+    uploads = []
+    try:
+        for offset, file in enumerate(payload.files):
+            uploads.append(_start_upload(project, file, current_count + offset, images))
+        ProjectImage.objects.bulk_create(images)
+    except Exception:
+        # Without their rows, expire_stale_uploads would never abort these
+        _abort_multipart_uploads(images)
+        raise
+
+    return BatchPresignedUploadResponse(uploads=uploads)
+
+
 @router.post(
     "/{project_id}/images/{image_id}/complete",
     response={200: ProjectImageResponse, 400: Error, 401: Error, 404: Error},
@@ -254,15 +397,36 @@ def complete_upload(
         upload_status=UploadStatus.PENDING,
     )
 
-    # Verify the object exists in storage
-    if not storage_service.object_exists(image.storage_key):
+    if image.multipart_upload_id:
+        if not payload.parts:
+            return 400, {"detail": "Multipart uploads must list their parts"}
+        try:
+            storage_service.complete_multipart_upload(
+                image.storage_key,
+                image.multipart_upload_id,
+                [(part.part_number, part.etag) for part in payload.parts],
+            )
+        except Exception:
+            logger.exception("Failed to complete multipart upload for %s", image.id)
+            return 400, {"detail": "Multipart upload could not be completed"}
+        image.multipart_upload_id = ""
+
+    # Read the image header from storage rather than trusting the client
+    try:
+        probe = HANDLERS.image.probe_upload(image.storage_key, image.content_type)
+    except ImageNotInStorageError:
         return 400, {"detail": "Image not found in storage. Upload may have failed."}
+    except InvalidImageError as exc:
+        image.upload_status = UploadStatus.FAILED
+        image.save(update_fields=["upload_status", "multipart_upload_id"])
+        return 400, {"detail": str(exc)}
 
     # Update image record
     image.upload_status = UploadStatus.UPLOADED
     image.uploaded_at = timezone.now()
-    image.width = payload.width
-    image.height = payload.height
+    image.width = probe.width
+    image.height = probe.height
+    image.file_size = probe.file_size
 
     # If this is the first image, make it the main image
     if not project.images.filter(is_main=True).exists():
@@ -306,6 +470,38 @@ def set_main_image(
     return image
 
 
+@router.put(
+    "/{project_id}/images/order",
+    response={200: list[ProjectImageResponse], 400: Error, 401: Error, 404: Error},
+    auth=auth,
+    tags=["Project Images"],
+)
+def update_image_order(
+    request: HttpRequest,
+    project_id: str,
+    payload: ImageOrderUpdateRequest,
+) -> QuerySet[ProjectImage] | tuple[int, dict[str, str]]:
+    """Set the display order of several project images at once."""
+    project = get_object_or_404(Project, id=project_id, owner=request.auth)
+
+    new_orders = {item.image_id: item.display_order for item in payload.images}
+    if len(new_orders) != len(payload.images):
+        return 400, {"detail": "Each image may only appear once"}
+
+    with transaction.atomic():
+        images = list(project.images.filter(id__in=new_orders))
+        if len(images) != len(new_orders):
+            return 400, {"detail": "Unknown image for this project"}
+
+        for image in images:
+            image.display_order = new_orders[image.id]
+        ProjectImage.objects.bulk_update(images, ["display_order"])
+
+        transaction.on_commit(partial(revalidate_project.enqueue, str(project.id)))
+
+    return project.images.prefetch_related("variants")
+
+
 @router.delete(
     "/{project_id}/images/{image_id}",
     response={204: None, 401: Error, 404: Error},
@@ -321,19 +517,9 @@ def delete_image(
     project = get_object_or_404(Project, id=project_id, owner=request.auth)
     image = get_object_or_404(ProjectImage, id=image_id, project=project)
 
-    # Delete variant files from S3 (DB rows cascade-delete with the image)
-    for variant in image.variants.all():
-        try:
-            storage_service.delete_object(variant.storage_key)
-        except Exception:
-            logging.getLogger(__name__).exception(
-                "Failed to delete variant %s from S3", variant.storage_key
-            )
-
-    # Delete original from storage
-    storage_service.delete_object(image.storage_key)
-
     was_main = image.is_main
+    # Storage objects are queued for removal as the row goes, once no other
+    # image shares the content
     image.delete()
 
     # If deleted image was main, promote the first remaining image
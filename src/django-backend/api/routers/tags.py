@@ -1,7 +1,7 @@
 from typing import Any
 
-from django.db.models import Prefetch, QuerySet
-from django.http import HttpRequest
+from django.db.models import Prefetch
+from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.text import slugify
@@ -16,33 +16,14 @@ from api.schemas.tag import (
     TagSuggestRequest,
     TagWithCategoryResponse,
 )
+from api.tag_catalogue import cached_response
 from apps.projects.models import ProjectStatus
-from apps.tags.models import Tag, TagCategory, TagStatus
+from apps.tags.models import CatalogueScope, Tag, TagCategory, TagStatus
 
 router = Router()
 
 
-@router.get("", response={200: list[TagResponse]}, tags=["Tags"])
-def list_tags(request: HttpRequest) -> QuerySet[Tag]:
-    """List all approved and pending tags (excludes rejected)."""
-    return Tag.objects.exclude(status=TagStatus.REJECTED)
-
-
-@router.get("/categories", response={200: list[TagCategoryResponse]}, tags=["Tags"])
-def list_categories(request: HttpRequest) -> QuerySet[TagCategory]:
-    """List all active tag categories."""
-    return TagCategory.objects.filter(is_active=True)
-
-
-@router.get("/grouped", response={200: list[TagGroupedResponse]}, tags=["Tags"])
-def list_tags_grouped(
-    request: HttpRequest,
-    with_projects: bool = Query(False),  # noqa: FBT001, FBT003
-) -> list[dict[str, Any]]:
-    """List tags grouped by category (excludes rejected tags).
-
-    If with_projects=true, only returns tags with at least one approved project.
-    """
+def _grouped_tags(*, with_projects: bool) -> list[dict[str, Any]]:
     # Build tag queryset with filters applied at database level
     tag_queryset = Tag.objects.exclude(status=TagStatus.REJECTED)
     if with_projects:
@@ -89,6 +70,52 @@ def list_tags_grouped(
     return result
 
 
+@router.get("", response={200: list[TagResponse]}, tags=["Tags"])
+def list_tags(request: HttpRequest) -> HttpResponse:
+    """List all approved and pending tags (excludes rejected)."""
+    return cached_response(
+        "tags",
+        (CatalogueScope.TAGS,),
+        TagResponse,
+        lambda: Tag.objects.exclude(status=TagStatus.REJECTED),
+    )
+
+
+@router.get("/categories", response={200: list[TagCategoryResponse]}, tags=["Tags"])
+def list_categories(request: HttpRequest) -> HttpResponse:
+    """List all active tag categories."""
+    return cached_response(
+        "categories",
+        (CatalogueScope.TAGS,),
+        TagCategoryResponse,
+        lambda: TagCategory.objects.filter(is_active=True),
+    )
+
+
+@router.get("/grouped", response={200: list[TagGroupedResponse]}, tags=["Tags"])
+def list_tags_grouped(
+    request: HttpRequest,
+    with_projects: bool = Query(False),  # noqa: FBT001, FBT003
+) -> HttpResponse:
+    """List tags grouped by category (excludes rejected tags).
+
+    If with_projects=true, only returns tags with at least one approved project.
+    """
+    if with_projects:
+        return cached_response(
+            "grouped_with_projects",
+            (CatalogueScope.TAGS, CatalogueScope.PROJECTS),
+            TagGroupedResponse,
+            lambda: _grouped_tags(with_projects=True),
+        )
+    return cached_response(
+        "grouped",
+        (CatalogueScope.TAGS,),
+        TagGroupedResponse,
+        lambda: _grouped_tags(with_projects=False),
+    )
+
+
 @router.post(
     "/suggest",
     response={201: TagWithCategoryResponse, 400: Error, 401: Error},
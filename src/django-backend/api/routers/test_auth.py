@@ -390,6 +390,32 @@ class TestUpdateCurrentUser:
 
         assert_that(response.status_code, equal_to(422))
 
+    def test_update_time_zone(self, client, user, auth_headers) -> None:
+        response = client.put(
+            "/api/auth/me",
+            data=json.dumps({"time_zone": "America/New_York"}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        user.refresh_from_db()
+        assert_that(user.time_zone, equal_to("America/New_York"))
+
+    def test_update_time_zone_rejects_unknown_zone(
+        self, client, user, auth_headers
+    ) -> None:
+        response = client.put(
+            "/api/auth/me",
+            data=json.dumps({"time_zone": "Mars/Olympus_Mons"}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
+        user.refresh_from_db()
+        assert_that(user.time_zone, equal_to(""))
+
     def test_partial_update_preserves_other_fields(
         self,
         client,
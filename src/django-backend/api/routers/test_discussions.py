@@ -1,10 +1,36 @@
+from datetime import timedelta
+
 import pytest
-from hamcrest import assert_that, equal_to, has_entries, has_length
+from django.utils import timezone
+from hamcrest import assert_that, equal_to, has_entries, has_length, not_none
 
+from apps.discussions.models import Discussion
 from apps.projects.models import ProjectStatus
+from services.discussions.django_impl.query import INLINE_REPLIES
 from tests.factories import DiscussionFactory, ProjectFactory, UserFactory
 
 
+def _stagger(discussions):
+    """Give discussions distinct creation times in the order given."""
+    start = timezone.now() - timedelta(hours=1)
+    for minutes, discussion in enumerate(discussions):
+        discussion.created_at = start + timedelta(minutes=minutes)
+        Discussion.objects.filter(id=discussion.id).update(
+            created_at=discussion.created_at
+        )
+    return discussions
+
+
+def _threads(project, count):
+    return _stagger(DiscussionFactory.create_batch(count, project=project))
+
+
+def _replies(root, count):
+    return _stagger(
+        DiscussionFactory.create_batch(count, project=root.project, parent=root)
+    )
+
+
 @pytest.mark.django_db
 class TestListDiscussions:
     def test_unauthenticated_returns_401(self, client) -> None:
@@ -22,15 +48,104 @@ class TestListDiscussions:
         response = client.get(f"/api/projects/{project.id}/discussions", **auth_headers)
 
         assert_that(response.status_code, equal_to(200))
-        data = response.json()
+        data = response.json()["discussions"]
         assert_that(data, has_length(1))
         assert_that(data[0]["replies"], has_length(1))
+        assert_that(data[0]["reply_count"], equal_to(1))
 
     def test_returns_empty_list_for_no_discussions(self, client, auth_headers) -> None:
         project = ProjectFactory(status=ProjectStatus.APPROVED)
         response = client.get(f"/api/projects/{project.id}/discussions", **auth_headers)
         assert_that(response.status_code, equal_to(200))
-        assert_that(response.json(), has_length(0))
+        assert_that(response.json()["discussions"], has_length(0))
+        assert_that(response.json()["next_cursor"], equal_to(None))
+
+    def test_pages_threads_newest_first(self, client, auth_headers) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        threads = _threads(project, 5)
+
+        seen = []
+        params = {"limit": 2}
+        while True:
+            page = client.get(
+                f"/api/projects/{project.id}/discussions", params, **auth_headers
+            ).json()
+            seen += [d["id"] for d in page["discussions"]]
+            if not page["next_cursor"]:
+                break
+            params["cursor"] = page["next_cursor"]
+
+        assert_that(seen, equal_to([str(t.id) for t in reversed(threads)]))
+
+    def test_inlines_first_replies_and_counts_the_rest(
+        self, client, auth_headers
+    ) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        [root] = _threads(project, 1)
+        replies = _replies(root, INLINE_REPLIES + 2)
+
+        response = client.get(f"/api/projects/{project.id}/discussions", **auth_headers)
+
+        [thread] = response.json()["discussions"]
+        assert_that(thread["reply_count"], equal_to(INLINE_REPLIES + 2))
+        assert_that(
+            [r["id"] for r in thread["replies"]],
+            equal_to([str(r.id) for r in replies[:INLINE_REPLIES]]),
+        )
+        assert_that(thread["replies_cursor"], not_none())
+
+    def test_query_count_does_not_grow_with_threads(
+        self, client, auth_headers, django_assert_max_num_queries
+    ) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        for root in _threads(project, 10):
+            _replies(root, 5)
+
+        with django_assert_max_num_queries(4):
+            client.get(f"/api/projects/{project.id}/discussions", **auth_headers)
+
+    def test_rejects_invalid_cursor(self, client, auth_headers) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        response = client.get(
+            f"/api/projects/{project.id}/discussions",
+            {"cursor": "garbage"},
+            **auth_headers,
+        )
+        assert_that(response.status_code, equal_to(400))
+
+
+@pytest.mark.django_db
+class TestListReplies:
+    def test_continues_after_inline_replies(self, client, auth_headers) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        [root] = _threads(project, 1)
+        replies = _replies(root, INLINE_REPLIES + 3)
+        thread = client.get(
+            f"/api/projects/{project.id}/discussions", **auth_headers
+        ).json()["discussions"][0]
+
+        url = f"/api/projects/{project.id}/discussions/{root.id}/replies"
+        first = client.get(
+            url, {"cursor": thread["replies_cursor"], "limit": 2}, **auth_headers
+        ).json()
+        second = client.get(
+            url, {"cursor": first["next_cursor"], "limit": 2}, **auth_headers
+        ).json()
+
+        fetched = [r["id"] for r in first["replies"] + second["replies"]]
+        assert_that(fetched, equal_to([str(r.id) for r in replies[INLINE_REPLIES:]]))
+        assert_that(second["next_cursor"], equal_to(None))
+
+    def test_unknown_thread_returns_404(self, client, auth_headers) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        other_thread = DiscussionFactory()
+
+        response = client.get(
+            f"/api/projects/{project.id}/discussions/{other_thread.id}/replies",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(404))
 
 
 @pytest.mark.django_db
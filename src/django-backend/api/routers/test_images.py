@@ -0,0 +1,57 @@
+"""Tests for the on-demand image derivative endpoint."""
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+from hamcrest import assert_that, equal_to
+
+from services.image.exceptions import DerivativePendingError, ImageNotFoundError
+from tests.factories import ProjectImageFactory
+
+
+@pytest.mark.django_db
+class TestGetImageDerivative:
+    def test_redirects_to_derivative(self, client) -> None:
+        image_id = uuid.uuid4()
+        with patch("api.routers.images.HANDLERS") as mock_handlers:
+            mock_handlers.image.get_derivative_url.return_value = (
+                "https://cdn.example.com/projects/p/photo/w640.webp"
+            )
+            response = client.get(f"/api/img/{image_id}/w600.webp")
+
+        assert_that(response.status_code, equal_to(302))
+        assert_that(
+            response["Location"],
+            equal_to("https://cdn.example.com/projects/p/photo/w640.webp"),
+        )
+        assert_that(response["Cache-Control"], equal_to("public, max-age=86400"))
+        mock_handlers.image.get_derivative_url.assert_called_once_with(
+            str(image_id), 600, "webp"
+        )
+
+    def test_unknown_image_returns_404(self, client) -> None:
+        with patch("api.routers.images.HANDLERS") as mock_handlers:
+            mock_handlers.image.get_derivative_url.side_effect = ImageNotFoundError
+            response = client.get(f"/api/img/{uuid.uuid4()}/w600.webp")
+
+        assert_that(response.status_code, equal_to(404))
+
+    def test_redirects_uncached_to_original_while_pending(self, client) -> None:
+        original = "https://cdn.example.com/projects/p/photo.jpg"
+        with patch("api.routers.images.HANDLERS") as mock_handlers:
+            mock_handlers.image.get_derivative_url.side_effect = DerivativePendingError(
+                original
+            )
+            response = client.get(f"/api/img/{uuid.uuid4()}/w600.webp")
+
+        assert_that(response.status_code, equal_to(302))
+        assert_that(response["Location"], equal_to(original))
+        assert_that(response["Cache-Control"], equal_to("no-store"))
+
+    def test_unsupported_format_returns_400(self, client) -> None:
+        image = ProjectImageFactory()
+
+        response = client.get(f"/api/img/{image.id}/w600.tiff")
+
+        assert_that(response.status_code, equal_to(400))
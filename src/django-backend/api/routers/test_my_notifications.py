@@ -0,0 +1,224 @@
+import json
+from datetime import timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries, has_length
+
+from apps.notifications.models import (
+    Notification,
+    NotificationCadence,
+    UnreadNotificationCount,
+)
+from services import HANDLERS
+from services.notifications.django_impl.unread import UNREAD_COUNT_TIMEOUT
+from tests.factories import (
+    DiscussionFactory,
+    NotificationFactory,
+    ProjectFactory,
+    UserFactory,
+)
+
+
+def _notifications_for(user, count):
+    now = timezone.now()
+    notifications = NotificationFactory.create_batch(count, recipient=user)
+    # Distinct, known activity times so the feed order is deterministic
+    for minutes, notification in enumerate(notifications):
+        Notification.objects.filter(id=notification.id).update(
+            updated_at=now - timedelta(minutes=minutes)
+        )
+    return notifications
+
+
+class TestListMyNotifications:
+    def test_returns_own_notifications_latest_first(
+        self, client, user, auth_headers
+    ) -> None:
+        notifications = _notifications_for(user, 3)
+        NotificationFactory()  # Someone else's
+
+        response = client.get("/api/my/notifications", **auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        ids = [n["id"] for n in response.json()["notifications"]]
+        assert_that(ids, equal_to([str(n.id) for n in notifications]))
+        assert_that(response.json()["next_cursor"], equal_to(None))
+
+    def test_describes_the_latest_comment(self, client, user, auth_headers) -> None:
+        author = UserFactory(first_name="Sigga")
+        discussion = DiscussionFactory(author=author, body="Flott verkefni!")
+        NotificationFactory(recipient=user, discussion=discussion, comment_count=2)
+
+        response = client.get("/api/my/notifications", **auth_headers)
+
+        assert_that(
+            response.json()["notifications"][0],
+            has_entries(
+                project=has_entries(title=discussion.project.title),
+                latest_author=has_entries(first_name="Sigga"),
+                latest_excerpt="Flott verkefni!",
+                comment_count=2,
+                read=False,
+            ),
+        )
+
+    def test_pages_with_cursor(self, client, user, auth_headers) -> None:
+        notifications = _notifications_for(user, 5)
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+            page = client.get("/api/my/notifications", params, **auth_headers).json()
+            seen += [n["id"] for n in page["notifications"]]
+            cursor = page["next_cursor"]
+
+        assert_that(seen, equal_to([str(n.id) for n in notifications]))
+        assert_that(cursor, equal_to(None))
+
+    def test_filters_unread(self, client, user, auth_headers) -> None:
+        unread = NotificationFactory(recipient=user)
+        NotificationFactory(recipient=user, read_at=timezone.now())
+
+        response = client.get(
+            "/api/my/notifications", {"unread": "true"}, **auth_headers
+        )
+
+        assert_that(
+            [n["id"] for n in response.json()["notifications"]],
+            contains_exactly(str(unread.id)),
+        )
+
+    def test_rejects_invalid_cursor(self, client, user, auth_headers) -> None:
+        response = client.get(
+            "/api/my/notifications", {"cursor": "not-a-cursor"}, **auth_headers
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+    def test_requires_auth(self, client) -> None:
+        response = client.get("/api/my/notifications")
+
+        assert_that(response.status_code, equal_to(401))
+
+
+class TestMarkNotificationsRead:
+    def test_marks_selected_notifications(self, client, user, auth_headers) -> None:
+        first, second = NotificationFactory.create_batch(2, recipient=user)
+
+        response = client.post(
+            "/api/my/notifications/read",
+            data=json.dumps({"ids": [str(first.id)]}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.json(), equal_to({"unread_count": 1}))
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert_that(first.read_at is not None, equal_to(True))
+        assert_that(second.read_at, equal_to(None))
+
+    def test_marks_everything_without_ids(self, client, user, auth_headers) -> None:
+        NotificationFactory.create_batch(3, recipient=user)
+        other = NotificationFactory()
+
+        client.post(
+            "/api/my/notifications/read",
+            data=json.dumps({}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(
+            Notification.objects.filter(read_at__isnull=True),
+            contains_exactly(other),
+        )
+
+    def test_ignores_other_users_notifications(
+        self, client, user, auth_headers
+    ) -> None:
+        other = NotificationFactory()
+
+        client.post(
+            "/api/my/notifications/read",
+            data=json.dumps({"ids": [str(other.id)]}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        other.refresh_from_db()
+        assert_that(other.read_at, equal_to(None))
+
+
+class TestUnreadCount:
+    def _count(self, client, auth_headers):
+        response = client.get("/api/my/notifications/unread-count", **auth_headers)
+        return response.json()["unread_count"]
+
+    def test_counts_unread(self, client, user, auth_headers) -> None:
+        NotificationFactory.create_batch(2, recipient=user)
+        NotificationFactory(recipient=user, read_at=timezone.now())
+
+        assert_that(self._count(client, auth_headers), equal_to(2))
+
+    def test_stored_count_needs_no_count_query(
+        self, client, user, auth_headers
+    ) -> None:
+        NotificationFactory(recipient=user)
+        self._count(client, auth_headers)
+
+        with CaptureQueriesContext(connection) as queries:
+            assert_that(self._count(client, auth_headers), equal_to(1))
+
+        notification_queries = [
+            q["sql"] for q in queries if '"notifications"' in q["sql"]
+        ]
+        assert_that(notification_queries, has_length(0))
+
+    def test_fan_out_and_mark_read_keep_stored_count_current(
+        self, client, user, auth_headers, django_capture_on_commit_callbacks
+    ) -> None:
+        user.notification_frequency = NotificationCadence.DAILY
+        user.save()
+        project = ProjectFactory(owner=user)
+        assert_that(self._count(client, auth_headers), equal_to(0))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            for _ in range(2):
+                HANDLERS.notifications.create_notifications_for_discussion(
+                    DiscussionFactory(project=project).id
+                )
+        # Both comments coalesce into one unread row. The count comes from
+        # the row the fan-out adjusted, as it would in a web worker that
+        # never saw the fan-out run, not from a recount.
+        with CaptureQueriesContext(connection) as queries:
+            assert_that(self._count(client, auth_headers), equal_to(1))
+        assert_that(
+            [q["sql"] for q in queries if '"notifications"' in q["sql"]],
+            has_length(0),
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            HANDLERS.notifications.mark_read(user.id)
+        assert_that(self._count(client, auth_headers), equal_to(0))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            HANDLERS.notifications.create_notifications_for_discussion(
+                DiscussionFactory(project=project).id
+            )
+        # A new comment makes the read row unread again
+        assert_that(self._count(client, auth_headers), equal_to(1))
+        assert_that(Notification.objects.get(recipient=user).comment_count, equal_to(3))
+
+    def test_recounts_stale_count(self, client, user, auth_headers) -> None:
+        NotificationFactory(recipient=user)
+        UnreadNotificationCount.objects.create(
+            user=user,
+            count=5,
+            counted_at=timezone.now() - UNREAD_COUNT_TIMEOUT - timedelta(seconds=1),
+        )
+
+        assert_that(self._count(client, auth_headers), equal_to(1))
@@ -1,5 +1,6 @@
 """Tests for project image upload functionality."""
 
+import io
 import json
 from unittest.mock import patch
 
@@ -13,15 +14,22 @@ from hamcrest import (
     is_,
 )
 from moto import mock_aws
+from PIL import Image
 
 from apps.projects.models import ImageVariant, ProjectImage, UploadStatus, VariantSize
-from tests.factories import ProjectFactory
+from tests.factories import ProjectFactory, ProjectImageFactory
 
 # Test bucket configuration
 TEST_BUCKET = "test-bucket"
 TEST_REGION = "us-east-1"
 
 
+def _image_bytes(width: int = 800, height: int = 600, fmt: str = "PNG") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color="blue").save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
 @pytest.fixture
 def s3_client():
     """Create mocked S3 client and bucket."""
@@ -183,6 +191,159 @@ class TestGetUploadUrl:
         assert_that(response.status_code, equal_to(401))
 
 
+class TestGetUploadUrls:
+    def _post(self, client, project, files, auth_headers):
+        return client.post(
+            f"/api/my/projects/{project.id}/images/upload-urls",
+            data=json.dumps({"files": files}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+    def test_issues_presigned_urls_for_each_file(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+        django_assert_max_num_queries,
+    ) -> None:
+        files = [
+            {"filename": f"shot{i}.png", "content_type": "image/png", "file_size": 1024}
+            for i in range(3)
+        ]
+
+        # Auth, project lookup, image count and a single bulk insert
+        with django_assert_max_num_queries(4):
+            response = self._post(client, project, files, auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        uploads = response.json()["uploads"]
+        assert_that(len(uploads), equal_to(3))
+        assert_that(
+            [u["filename"] for u in uploads],
+            equal_to(["shot0.png", "shot1.png", "shot2.png"]),
+        )
+        assert_that(uploads[0], has_entries(upload_url=contains_string("http")))
+        assert_that(uploads[0], has_entries(multipart=None))
+
+        images = ProjectImage.objects.filter(project=project).order_by("display_order")
+        assert_that(
+            [str(i.id) for i in images], equal_to([u["image_id"] for u in uploads])
+        )
+        assert_that([i.display_order for i in images], equal_to([0, 1, 2]))
+
+    def test_large_files_get_multipart_urls(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        files = [
+            {
+                "filename": "big.png",
+                "content_type": "image/png",
+                "file_size": 9 * 1024 * 1024,
+            },
+        ]
+
+        response = self._post(client, project, files, auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        upload = response.json()["uploads"][0]
+        assert_that(upload["upload_url"], is_(None))
+        multipart = upload["multipart"]
+        assert_that(len(multipart["parts"]), equal_to(2))
+        assert_that(multipart["parts"][0]["part_number"], equal_to(1))
+        image = ProjectImage.objects.get(id=upload["image_id"])
+        assert_that(image.multipart_upload_id, equal_to(multipart["upload_id"]))
+
+    def test_aborts_started_multipart_uploads_when_the_batch_fails(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        files = [
+            {
+                "filename": f"big{i}.png",
+                "content_type": "image/png",
+                "file_size": 9 * 1024 * 1024,
+            }
+            for i in range(2)
+        ]
+
+        with (
+            patch(
+                "services.storage.storage_service.generate_presigned_upload_url",
+                side_effect=RuntimeError,
+            ),
+            patch(
+                "services.storage.storage_service.generate_presigned_part_urls",
+                side_effect=[["https://example.com/part1"], RuntimeError("S3 down")],
+            ),
+            pytest.raises(RuntimeError, match="S3 down"),
+        ):
+            self._post(client, project, files, auth_headers)
+
+        uploads = mock_storage_service.list_multipart_uploads(Bucket=TEST_BUCKET)
+        assert_that(uploads.get("Uploads", []), equal_to([]))
+        assert_that(ProjectImage.objects.filter(project=project).exists(), is_(False))
+
+    def test_rejects_batch_exceeding_image_limit(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        files = [
+            {"filename": f"shot{i}.png", "content_type": "image/png", "file_size": 1}
+            for i in range(11)
+        ]
+
+        response = self._post(client, project, files, auth_headers)
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(response.json()["detail"], contains_string("Maximum"))
+        assert_that(ProjectImage.objects.filter(project=project).count(), equal_to(0))
+
+    def test_rejects_batch_with_invalid_file(
+        self,
+        client,
+        project,
+        auth_headers,
+    ) -> None:
+        files = [
+            {"filename": "ok.png", "content_type": "image/png", "file_size": 1},
+            {
+                "filename": "bad.exe",
+                "content_type": "application/x-msdownload",
+                "file_size": 1,
+            },
+        ]
+
+        response = self._post(client, project, files, auth_headers)
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(response.json()["detail"], contains_string("bad.exe"))
+        assert_that(ProjectImage.objects.filter(project=project).count(), equal_to(0))
+
+    def test_cannot_request_urls_for_other_users_project(
+        self,
+        client,
+        other_project,
+        auth_headers,
+    ) -> None:
+        files = [{"filename": "a.png", "content_type": "image/png", "file_size": 1}]
+
+        response = self._post(client, other_project, files, auth_headers)
+
+        assert_that(response.status_code, equal_to(404))
+
+
 class TestCompleteUpload:
     def test_marks_upload_complete(
         self,
@@ -205,7 +366,7 @@ class TestCompleteUpload:
         mock_storage_service.put_object(
             Bucket=TEST_BUCKET,
             Key="test/key.png",
-            Body=b"test",
+            Body=_image_bytes(),
         )
 
         response = client.post(
@@ -221,6 +382,70 @@ class TestCompleteUpload:
         assert_that(image.width, equal_to(800))
         assert_that(image.height, equal_to(600))
 
+    def test_uses_probed_dimensions_over_client_values(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        body = _image_bytes(1200, 900)
+        image = ProjectImage.objects.create(
+            project=project,
+            storage_key="test/probed.png",
+            original_filename="probed.png",
+            content_type="image/png",
+            file_size=1,
+            upload_status=UploadStatus.PENDING,
+        )
+        mock_storage_service.put_object(
+            Bucket=TEST_BUCKET, Key="test/probed.png", Body=body
+        )
+
+        response = client.post(
+            f"/api/my/projects/{project.id}/images/{image.id}/complete",
+            data=json.dumps({"width": 10, "height": 10}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        image.refresh_from_db()
+        assert_that(image.width, equal_to(1200))
+        assert_that(image.height, equal_to(900))
+        assert_that(image.file_size, equal_to(len(body)))
+
+    def test_rejects_content_not_matching_declared_type(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        image = ProjectImage.objects.create(
+            project=project,
+            storage_key="test/fake.png",
+            original_filename="fake.png",
+            content_type="image/png",
+            file_size=1024,
+            upload_status=UploadStatus.PENDING,
+        )
+        mock_storage_service.put_object(
+            Bucket=TEST_BUCKET, Key="test/fake.png", Body=_image_bytes(fmt="JPEG")
+        )
+
+        response = client.post(
+            f"/api/my/projects/{project.id}/images/{image.id}/complete",
+            data=json.dumps({}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(response.json()["detail"], contains_string("image/jpeg"))
+        image.refresh_from_db()
+        assert_that(image.upload_status, equal_to(UploadStatus.FAILED))
+
     def test_enqueues_variant_generation_task(
         self,
         client,
@@ -240,7 +465,7 @@ class TestCompleteUpload:
         mock_storage_service.put_object(
             Bucket=TEST_BUCKET,
             Key="test/key.png",
-            Body=b"test",
+            Body=_image_bytes(),
         )
 
         with patch("api.routers.my_projects.generate_image_variants") as mock_task:
@@ -273,7 +498,7 @@ class TestCompleteUpload:
         mock_storage_service.put_object(
             Bucket=TEST_BUCKET,
             Key="test/first.png",
-            Body=b"test",
+            Body=_image_bytes(),
         )
 
         response = client.post(
@@ -287,6 +512,79 @@ class TestCompleteUpload:
         image.refresh_from_db()
         assert_that(image.is_main, is_(True))
 
+    def test_completes_multipart_upload(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        key = "test/multipart.png"
+        upload_id = mock_storage_service.create_multipart_upload(
+            Bucket=TEST_BUCKET, Key=key, ContentType="image/png"
+        )["UploadId"]
+        first_part = _image_bytes(640, 480)
+        first_part += b"\0" * (5 * 1024 * 1024 - len(first_part))
+        parts = []
+        for number, body in enumerate([first_part, b"\0" * 1024], start=1):
+            etag = mock_storage_service.upload_part(
+                Bucket=TEST_BUCKET,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )["ETag"]
+            parts.append({"part_number": number, "etag": etag})
+        image = ProjectImage.objects.create(
+            project=project,
+            storage_key=key,
+            original_filename="multipart.png",
+            content_type="image/png",
+            file_size=len(first_part) + 1024,
+            upload_status=UploadStatus.PENDING,
+            multipart_upload_id=upload_id,
+        )
+
+        response = client.post(
+            f"/api/my/projects/{project.id}/images/{image.id}/complete",
+            data=json.dumps({"parts": parts}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        image.refresh_from_db()
+        assert_that(image.upload_status, equal_to(UploadStatus.UPLOADED))
+        assert_that(image.multipart_upload_id, equal_to(""))
+        assert_that(image.width, equal_to(640))
+
+    def test_multipart_upload_requires_parts(
+        self,
+        client,
+        project,
+        auth_headers,
+        mock_storage_service,
+    ) -> None:
+        image = ProjectImage.objects.create(
+            project=project,
+            storage_key="test/multipart.png",
+            original_filename="multipart.png",
+            content_type="image/png",
+            file_size=9 * 1024 * 1024,
+            upload_status=UploadStatus.PENDING,
+            multipart_upload_id="some-upload",
+        )
+
+        response = client.post(
+            f"/api/my/projects/{project.id}/images/{image.id}/complete",
+            data=json.dumps({}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(response.json()["detail"], contains_string("parts"))
+
     def test_fails_if_file_not_in_storage(
         self,
         client,
@@ -475,6 +773,139 @@ class TestSetMainImage:
         assert_that(image2.is_main, is_(True))
 
 
+class TestUpdateImageOrder:
+    def test_reorders_images(
+        self,
+        client,
+        project,
+        auth_headers,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        images = ProjectImageFactory.create_batch(3, project=project)
+        new_order = [images[2], images[0], images[1]]
+
+        with (
+            patch("api.routers.my_projects.revalidate_project") as mock_revalidate,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            response = client.put(
+                f"/api/my/projects/{project.id}/images/order",
+                data=json.dumps(
+                    {
+                        "images": [
+                            {"image_id": str(image.id), "display_order": position}
+                            for position, image in enumerate(new_order)
+                        ]
+                    }
+                ),
+                content_type="application/json",
+                **auth_headers,
+            )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            [item["id"] for item in response.json()],
+            equal_to([str(image.id) for image in new_order]),
+        )
+        mock_revalidate.enqueue.assert_called_once_with(str(project.id))
+
+    def test_uses_a_single_update(
+        self,
+        client,
+        project,
+        auth_headers,
+        django_assert_max_num_queries,
+    ) -> None:
+        images = ProjectImageFactory.create_batch(6, project=project)
+        payload = {
+            "images": [
+                {"image_id": str(image.id), "display_order": 10 - position}
+                for position, image in enumerate(images)
+            ]
+        }
+
+        # auth, project, images, bulk update, savepoint/transaction, result
+        with django_assert_max_num_queries(8):
+            response = client.put(
+                f"/api/my/projects/{project.id}/images/order",
+                data=json.dumps(payload),
+                content_type="application/json",
+                **auth_headers,
+            )
+
+        assert_that(response.status_code, equal_to(200))
+
+    def test_rejects_image_from_another_project(
+        self,
+        client,
+        project,
+        auth_headers,
+    ) -> None:
+        image = ProjectImageFactory(project=project, display_order=0)
+        foreign_image = ProjectImageFactory()
+
+        response = client.put(
+            f"/api/my/projects/{project.id}/images/order",
+            data=json.dumps(
+                {
+                    "images": [
+                        {"image_id": str(image.id), "display_order": 1},
+                        {"image_id": str(foreign_image.id), "display_order": 0},
+                    ]
+                }
+            ),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
+        image.refresh_from_db()
+        assert_that(image.display_order, equal_to(0))
+
+    def test_rejects_duplicate_images(
+        self,
+        client,
+        project,
+        auth_headers,
+    ) -> None:
+        image = ProjectImageFactory(project=project)
+
+        response = client.put(
+            f"/api/my/projects/{project.id}/images/order",
+            data=json.dumps(
+                {
+                    "images": [
+                        {"image_id": str(image.id), "display_order": 0},
+                        {"image_id": str(image.id), "display_order": 1},
+                    ]
+                }
+            ),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+    def test_cannot_reorder_other_users_project(
+        self,
+        client,
+        auth_headers,
+    ) -> None:
+        other_project = ProjectFactory()
+        image = ProjectImageFactory(project=other_project)
+
+        response = client.put(
+            f"/api/my/projects/{other_project.id}/images/order",
+            data=json.dumps(
+                {"images": [{"image_id": str(image.id), "display_order": 3}]}
+            ),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        assert_that(response.status_code, equal_to(404))
+
+
 class TestImageAuthorization:
     def test_cannot_upload_to_other_users_project(
         self,
@@ -3,7 +3,7 @@ from hamcrest import assert_that, equal_to, has_entries
 
 from api.auth.jwt import create_access_token
 from apps.projects.models import ProjectStatus
-from tests.factories import ProjectFactory, UserFactory
+from tests.factories import DiscussionFactory, ProjectFactory, UserFactory
 
 
 @pytest.mark.django_db
@@ -32,10 +32,26 @@ class TestListProjects:
     def test_sort_by_accepts_valid_fields(self, client) -> None:
         ProjectFactory(status=ProjectStatus.APPROVED)
 
-        for field in ["created_at", "title"]:
+        for field in ["created_at", "title", "activity"]:
             response = client.get(f"/api/projects?sort_by={field}")
             assert_that(response.status_code, equal_to(200))
 
+    def test_sort_by_activity_puts_recent_discussion_first(self, client) -> None:
+        quiet = ProjectFactory(status=ProjectStatus.APPROVED)
+        older = ProjectFactory(status=ProjectStatus.APPROVED)
+        recent = ProjectFactory(status=ProjectStatus.APPROVED)
+        DiscussionFactory(project=older)
+        DiscussionFactory(project=recent)
+        DiscussionFactory(project=recent)
+
+        response = client.get("/api/projects?sort_by=activity")
+
+        projects = response.json()["projects"]
+        assert_that(
+            [(p["id"], p["discussion_count"]) for p in projects],
+            equal_to([(str(recent.id), 2), (str(older.id), 1), (str(quiet.id), 0)]),
+        )
+
 
 @pytest.mark.django_db
 class TestGetPublicProject:
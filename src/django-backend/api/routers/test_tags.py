@@ -269,3 +269,62 @@ class TestListPendingTags:
         response = client.get("/api/tags/admin/pending", **auth_headers)
 
         assert_that(response.status_code, equal_to(403))
+
+
+def _staff_headers() -> dict[str, str]:
+    admin = UserFactory(is_staff=True)
+    return {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(admin.id)}"}
+
+
+def _grouped_tag_ids(response) -> list[str]:
+    return [tag["id"] for group in response.json() for tag in group["tags"]]
+
+
+class TestTagCatalogueCache:
+    def test_repeat_requests_only_check_the_version(
+        self, client, db, django_assert_num_queries
+    ) -> None:
+        first = client.get("/api/tags/grouped")
+
+        with django_assert_num_queries(1):
+            second = client.get("/api/tags/grouped")
+
+        assert_that(second.json(), equal_to(first.json()))
+
+    def test_rejecting_a_tag_refreshes_the_list(self, client, db) -> None:
+        tag = TagFactory(status=TagStatus.PENDING)
+        before = client.get("/api/tags")
+
+        client.put(f"/api/tags/admin/{tag.id}/reject", **_staff_headers())
+
+        after = client.get("/api/tags")
+        assert_that([t["id"] for t in before.json()], has_item(str(tag.id)))
+        assert str(tag.id) not in [t["id"] for t in after.json()]
+
+    def test_admin_approval_action_refreshes_the_list(self, client, db) -> None:
+        admin = UserFactory(is_staff=True, is_superuser=True)
+        tag = TagFactory(status=TagStatus.REJECTED)
+        client.get("/api/tags")
+        Tag.objects.filter(id=tag.id).update(status=TagStatus.PENDING)
+        client.force_login(admin)
+
+        client.post(
+            "/admin/tags/tag/",
+            {"action": "approve_tags", "_selected_action": [str(tag.id)]},
+        )
+
+        ids = [t["id"] for t in client.get("/api/tags").json()]
+        assert_that(ids, has_item(str(tag.id)))
+
+    def test_project_approval_refreshes_tags_in_use(self, client, db) -> None:
+        tag = TagFactory(category=TagCategory.objects.first())
+        project = ProjectFactory(status=ProjectStatus.PENDING)
+        project.tags.add(tag)
+        before = client.get("/api/tags/grouped?with_projects=true")
+
+        project.status = ProjectStatus.APPROVED
+        project.save()
+
+        after = client.get("/api/tags/grouped?with_projects=true")
+        assert str(tag.id) not in _grouped_tag_ids(before)
+        assert_that(_grouped_tag_ids(after), has_item(str(tag.id)))
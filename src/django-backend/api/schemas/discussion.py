@@ -39,10 +39,32 @@ class DiscussionResponse(Schema):
     body: str
     created_at: datetime
     author: DiscussionAuthor | None
+    reply_count: int = 0
+    # First replies, oldest first; fetch the rest from the replies endpoint
+    # starting at replies_cursor
     replies: list[ReplyResponse] = []
+    replies_cursor: str | None = None
 
     resolve_author = staticmethod(_resolve_author)
 
+    @staticmethod
+    def resolve_reply_count(obj: object) -> int:
+        return getattr(obj, "reply_count", 0)
+
     @staticmethod
     def resolve_replies(obj: object) -> list:
-        return list(obj.replies.all().order_by("created_at"))
+        return getattr(obj, "first_replies", [])
+
+    @staticmethod
+    def resolve_replies_cursor(obj: object) -> str | None:
+        return getattr(obj, "replies_cursor", None)
+
+
+class DiscussionListResponse(Schema):
+    discussions: list[DiscussionResponse]
+    next_cursor: str | None
+
+
+class ReplyListResponse(Schema):
+    replies: list[ReplyResponse]
+    next_cursor: str | None
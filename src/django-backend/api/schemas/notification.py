@@ -0,0 +1,56 @@
+from datetime import datetime
+from uuid import UUID
+
+from ninja import Schema
+
+from api.schemas.discussion import DiscussionAuthor
+
+
+class NotificationProject(Schema):
+    id: UUID
+    title: str
+
+
+class NotificationResponse(Schema):
+    id: UUID
+    project: NotificationProject
+    discussion_id: UUID
+    latest_author: DiscussionAuthor | None
+    latest_excerpt: str
+    comment_count: int
+    read: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @staticmethod
+    def resolve_latest_author(obj: object) -> dict | None:
+        author = obj.discussion.author
+        if author is None:
+            return None
+        return {
+            "id": author.id,
+            "first_name": author.first_name,
+            "last_name": author.last_name,
+        }
+
+    @staticmethod
+    def resolve_latest_excerpt(obj: object) -> str:
+        return obj.discussion.body[:200]
+
+    @staticmethod
+    def resolve_read(obj: object) -> bool:
+        return obj.read_at is not None
+
+
+class NotificationListResponse(Schema):
+    notifications: list[NotificationResponse]
+    next_cursor: str | None
+
+
+class MarkNotificationsRead(Schema):
+    # Omit to mark every notification read
+    ids: list[UUID] | None = None
+
+
+class UnreadCountResponse(Schema):
+    unread_count: int
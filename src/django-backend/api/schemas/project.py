@@ -70,6 +70,8 @@ class ProjectResponse(Schema):
     status: str
     created_at: datetime
     approved_at: datetime | None
+    discussion_count: int = 0
+    last_activity_at: datetime | None = None
     owner: PublicUserProfile
     tags: list[TagWithCategoryResponse]
     images: list[ProjectImageResponse] = []
@@ -108,11 +110,58 @@ class PresignedUploadResponse(Schema):
     storage_key: str
 
 
+class BatchPresignedUploadRequest(Schema):
+    """Request presigned upload URLs for several files at once."""
+
+    files: list[PresignedUploadRequest]
+
+
+class MultipartUploadPart(Schema):
+    part_number: int
+    upload_url: str
+
+
+class MultipartUploadInfo(Schema):
+    """Presigned per-part URLs for a multipart upload."""
+
+    upload_id: str
+    part_size: int
+    parts: list[MultipartUploadPart]
+
+
+class BatchPresignedUploadItem(Schema):
+    """Upload instructions for one file of a batch.
+
+    Small files get a single presigned PUT in upload_url. Files above the
+    multipart threshold get per-part URLs in multipart instead.
+    """
+
+    image_id: UUID
+    filename: str
+    storage_key: str
+    method: str
+    headers: dict[str, str]
+    upload_url: str | None = None
+    multipart: MultipartUploadInfo | None = None
+
+
+class BatchPresignedUploadResponse(Schema):
+    uploads: list[BatchPresignedUploadItem]
+
+
+class CompletedUploadPart(Schema):
+    part_number: int
+    etag: str
+
+
 class ImageUploadCompleteRequest(Schema):
     """Request to confirm upload completion."""
 
+    # Accepted for older clients but ignored: dimensions are probed server-side
     width: int | None = None
     height: int | None = None
+    # Required for multipart uploads: the ETag returned for each uploaded part
+    parts: list[CompletedUploadPart] | None = None
 
 
 class ImageOrderUpdate(Schema):
@@ -140,6 +189,8 @@ class ProjectListItemResponse(Schema):
     tagline: str
     status: str
     created_at: datetime
+    discussion_count: int = 0
+    last_activity_at: datetime | None = None
     tags: list[TagWithCategoryResponse] = []
     won_competitions: list[WonCompetitionInfo] = []
     main_image_url: str | None = None
@@ -153,6 +204,8 @@ class ProjectListItemResponse(Schema):
             tagline=item.project.tagline,
             status=item.project.status,
             created_at=item.project.created_at,
+            discussion_count=item.project.discussion_count,
+            last_activity_at=item.project.last_activity_at,
             tags=item.tags,
             won_competitions=list(item.project.won_competitions.all()),
             main_image_url=item.main_image_url,
@@ -28,6 +28,7 @@ class UserResponse(Schema):
     email_opt_in_platform_updates: bool
     opt_in_to_external_promotions: bool
     notification_frequency: str
+    time_zone: str
 
     @staticmethod
     def resolve_groups(obj: Any) -> list[str]:
@@ -42,6 +43,7 @@ class UserUpdate(Schema):
     email_opt_in_platform_updates: bool | None = None
     opt_in_to_external_promotions: bool | None = None
     notification_frequency: NotificationCadence | None = None
+    time_zone: str | None = None
 
 
 class PublicUserProfile(Schema):
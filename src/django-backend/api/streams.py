@@ -0,0 +1,138 @@
+"""Server-sent event streams for live updates.
+
+These are plain async Django views rather than API routes: each response
+stays open and waits on the in-process broker, so they are only served by
+ASGI workers. Clients authenticate with the same bearer token as the API,
+and resume after a dropped connection by sending back the last event id.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+
+from api.auth.jwt import get_user_from_token
+from apps.projects.models import ProjectStatus
+from services import REPO
+from services.project.exceptions import ProjectNotFoundError
+from services.streams.django_impl import (
+    SubscriptionClosedError,
+    broker,
+    project_channel,
+    user_channel,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from uuid import UUID
+
+    from django.contrib.auth.models import AbstractUser
+
+# Reconnect delay suggested to EventSource clients, in milliseconds
+RETRY_MS = 5000
+# Every stream URL ends with this; see project_showcase.asgi
+STREAM_PATH_SUFFIX = "/stream"
+
+
+async def _authenticate(request: HttpRequest) -> AbstractUser | None:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return await sync_to_async(get_user_from_token)(token)
+
+
+def _last_event_id(request: HttpRequest) -> int | None:
+    value = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        return int(value) if value else None
+    except ValueError:
+        return None
+
+
+async def _events(channel: str, last_event_id: int | None) -> AsyncIterator[bytes]:
+    async with broker.subscribe(channel, last_event_id) as subscription:
+        # Sent once subscribed, so a client that has read it misses nothing
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        while True:
+            try:
+                async with asyncio.timeout(settings.STREAM_HEARTBEAT_SECONDS):
+                    event = await subscription.get()
+            except TimeoutError:
+                # Comment line: keeps proxies from closing an idle connection
+                yield b": ping\n\n"
+                continue
+            except SubscriptionClosedError:
+                # Too far behind; the client reconnects with Last-Event-ID
+                return
+            yield event.message
+
+
+def _stream(request: HttpRequest, channel: str) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(
+        _events(channel, _last_event_id(request)),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Stop nginx-style proxies from buffering the stream
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _can_view_project(user: AbstractUser, project_id: UUID) -> bool:
+    """Same visibility as the project detail route."""
+    try:
+        project = REPO.project.get_by_id(project_id)
+    except ProjectNotFoundError:
+        return False
+    return (
+        project.status == ProjectStatus.APPROVED
+        or project.owner_id == user.id
+        or user.is_superuser
+    )
+
+
+def _unauthorized() -> JsonResponse:
+    return JsonResponse({"detail": "Unauthorized"}, status=401)
+
+
+def _unavailable(request: HttpRequest) -> JsonResponse | None:
+    """Refuse to stream from a WSGI worker, where a stream pins a thread.
+
+    APIClient.stream gives up on a 503 instead of reconnecting, so clients
+    fall back to fetching on their own. runserver is allowed in development.
+    """
+    if isinstance(request, ASGIRequest) or settings.DEBUG:
+        return None
+    return JsonResponse({"detail": "Live updates are unavailable"}, status=503)
+
+
+@require_GET
+async def project_discussions_stream(
+    request: HttpRequest, project_id: UUID
+) -> HttpResponse:
+    """New and deleted discussions on a project."""
+    if unavailable := _unavailable(request):
+        return unavailable
+    user = await _authenticate(request)
+    if user is None:
+        return _unauthorized()
+    if not await sync_to_async(_can_view_project)(user, project_id):
+        return JsonResponse({"detail": "Project not found"}, status=404)
+    return _stream(request, project_channel(project_id))
+
+
+@require_GET
+async def my_notifications_stream(request: HttpRequest) -> HttpResponse:
+    """Changes to the user's notifications; refetch the feed or count on each."""
+    if unavailable := _unavailable(request):
+        return unavailable
+    user = await _authenticate(request)
+    if user is None:
+        return _unauthorized()
+    return _stream(request, user_channel(user.id))
@@ -0,0 +1,43 @@
+"""Process-local cache of the public tag catalogue responses.
+
+The catalogue changes only when tags, categories or the tags on approved
+projects do, but is read on almost every page. Each worker keeps the
+rendered JSON of every catalogue response alongside the version tokens it
+was built from, and serves it until a token changes. The tokens live in the
+database, so a change made through any worker is seen by all of them on
+their next request, at the cost of one small query.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.http import HttpResponse
+from pydantic import TypeAdapter
+
+from apps.tags.models import TagCatalogueVersion
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from uuid import UUID
+
+    from ninja import Schema
+
+# Response name -> (version tokens, rendered body)
+_payloads: dict[str, tuple[tuple[UUID | None, ...], bytes]] = {}
+
+
+def cached_response(
+    name: str,
+    scopes: tuple[str, ...],
+    schema: type[Schema],
+    build: Callable[[], Iterable[Any]],
+) -> HttpResponse:
+    """Serve ``build()`` rendered as a list of ``schema``, rebuilt on change."""
+    versions = TagCatalogueVersion.current(scopes)
+    cached = _payloads.get(name)
+    if cached is None or cached[0] != versions:
+        adapter = TypeAdapter(list[schema])
+        cached = (versions, adapter.dump_json(adapter.validate_python(list(build()))))
+        _payloads[name] = cached
+    return HttpResponse(cached[1], content_type="application/json; charset=utf-8")
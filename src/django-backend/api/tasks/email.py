@@ -4,9 +4,12 @@ from uuid import UUID
 
 from django_tasks import task
 
+from apps.emails.models import BroadcastEmail
 from apps.projects.models import Project
 from apps.users.models import User
 
+from .scheduling import enqueue_at
+
 
 @task()
 def send_verification_email(user_id: str, code: str, expires_minutes: int) -> None:
@@ -30,3 +33,24 @@ def send_project_approved_email(project_id: str) -> None:
 
     project = Project.objects.select_related("owner").get(id=UUID(project_id))
     HANDLERS.email.send_project_approved_email(project)
+
+
+@task()
+def send_broadcast(broadcast_id: str) -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    broadcast = BroadcastEmail.objects.select_related("sent_by").get(
+        id=UUID(broadcast_id)
+    )
+    if broadcast.sent_at is not None:
+        return
+    HANDLERS.email.send_broadcast(broadcast, broadcast.sent_by)
+
+
+@task()
+def dispatch_email_outbox() -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    next_attempt_at = HANDLERS.email.dispatch_outbox()
+    if next_attempt_at is not None:
+        enqueue_at(dispatch_email_outbox, next_attempt_at)
@@ -1,10 +1,51 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
+from django.utils import timezone
 from django_tasks import task
 
+from .scheduling import enqueue_at
+
+SWEEP_INTERVAL = timedelta(hours=6)
+
 
 @task()
 def generate_image_variants(image_id: str) -> None:
     from services import HANDLERS  # noqa: PLC0415
 
     HANDLERS.image.generate_variants(image_id)
+
+
+@task()
+def generate_competition_image_variants(competition_id: str) -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    HANDLERS.image.generate_competition_variants(competition_id)
+
+
+@task()
+def generate_broadcast_image_variants(image_id: str) -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    HANDLERS.image.generate_broadcast_image_variants(image_id)
+
+
+@task()
+def flush_storage_deletions() -> None:
+    from services import HANDLERS  # noqa: PLC0415
+
+    HANDLERS.image.flush_storage_deletions()
+
+
+@task()
+def sweep_storage() -> None:
+    """Expire abandoned uploads and sweep orphans, then queue the next run."""
+    from services import HANDLERS  # noqa: PLC0415
+
+    try:
+        HANDLERS.image.expire_stale_uploads()
+        HANDLERS.image.sweep_orphaned_objects()
+        HANDLERS.image.flush_storage_deletions()
+    finally:
+        enqueue_at(sweep_storage, timezone.now() + SWEEP_INTERVAL)
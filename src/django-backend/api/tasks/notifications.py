@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from uuid import UUID
 
+from django.utils import timezone
 from django_tasks import task
 
+from .scheduling import enqueue_at
+
+DIGEST_SWEEP_INTERVAL = timedelta(minutes=1)
+ARCHIVE_INTERVAL = timedelta(days=1)
+
 
 @task()
 def create_discussion_notifications(discussion_id: str) -> None:
@@ -12,15 +19,47 @@ def create_discussion_notifications(discussion_id: str) -> None:
     HANDLERS.notifications.create_notifications_for_discussion(UUID(discussion_id))
 
 
+@task()
+def send_due_digests() -> None:
+    """Queue the next chunk of due digests, then run again in a minute."""
+    from services import HANDLERS  # noqa: PLC0415
+
+    try:
+        HANDLERS.notifications.send_due_digests()
+    finally:
+        enqueue_at(send_due_digests, timezone.now() + DIGEST_SWEEP_INTERVAL)
+
+
 @task()
 def send_hourly_notifications() -> None:
+    """Send every digest that is due.
+
+    Digests now go out in per-user slots through send_due_digests; this
+    stays so runs scheduled before the change keep working. Unlike the
+    per-minute sweep it drains the whole backlog in one run, stopping at the
+    first chunk that fails.
+    """
     from services import HANDLERS  # noqa: PLC0415
 
-    HANDLERS.notifications.send_batch_notifications("hourly")
+    while HANDLERS.notifications.send_due_digests():
+        pass
 
 
 @task()
 def send_daily_notifications() -> None:
+    """Send every digest that is due; see send_hourly_notifications."""
+    from services import HANDLERS  # noqa: PLC0415
+
+    while HANDLERS.notifications.send_due_digests():
+        pass
+
+
+@task()
+def archive_sent_notifications() -> None:
+    """Archive expired notifications, then queue the next run."""
     from services import HANDLERS  # noqa: PLC0415
 
-    HANDLERS.notifications.send_batch_notifications("daily")
+    try:
+        HANDLERS.notifications.archive_sent_notifications()
+    finally:
+        enqueue_at(archive_sent_notifications, timezone.now() + ARCHIVE_INTERVAL)
@@ -0,0 +1,39 @@
+"""Deferred and periodic runs on top of django_tasks, which has no scheduler.
+
+A periodic task queues its own next run as it finishes, and
+``schedule_periodic_tasks`` starts any task that has nothing queued (on
+first deploy, or after a run was lost). Only the database backend keeps
+queued runs that can be inspected; on other backends nothing is deferred.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+from django_tasks import TaskResultStatus
+from django_tasks_db.backend import DatabaseBackend
+from django_tasks_db.models import DBTaskResult, get_date_max
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from django_tasks import Task
+
+
+def is_queued(task: Task, by: datetime | None = None) -> bool:
+    """Whether a run of ``task`` is waiting, due no later than ``by`` if given."""
+    if not isinstance(task.get_backend(), DatabaseBackend):
+        return False
+    queued = DBTaskResult.objects.filter(
+        status=TaskResultStatus.READY, task_path=task.module_path
+    )
+    if by is not None:
+        queued = queued.filter(Q(run_after__lte=by) | Q(run_after=get_date_max()))
+    return queued.exists()
+
+
+def enqueue_at(task: Task, when: datetime) -> None:
+    """Queue a run of ``task`` at ``when`` unless one is already due by then."""
+    if task.get_backend().supports_defer and not is_queued(task, when):
+        task.using(run_after=when).enqueue()
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from django.utils import timezone
+from django_tasks import task
+
+from .scheduling import enqueue_at
+
+PRUNE_INTERVAL = timedelta(hours=1)
+
+
+@task()
+def prune_stream_events() -> None:
+    """Delete expired stream events, then queue the next run."""
+    from services.streams.django_impl import prune  # noqa: PLC0415
+
+    try:
+        prune()
+    finally:
+        enqueue_at(prune_stream_events, timezone.now() + PRUNE_INTERVAL)
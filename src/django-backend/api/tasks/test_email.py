@@ -0,0 +1,74 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from django_tasks_db.models import DBTaskResult
+
+from api.tasks.email import dispatch_email_outbox
+from apps.emails.models import OutboxEmail, OutboxPriority, SentEmailType
+from services import HANDLERS
+from tests.factories import UserFactory
+
+
+@pytest.fixture
+def _database_task_backend(settings):
+    settings.TASKS = {
+        "default": {"BACKEND": "django_tasks_db.backend.DatabaseBackend"},
+    }
+
+
+def _pending_email(**kwargs):
+    return OutboxEmail.objects.create(
+        email_type=SentEmailType.VERIFICATION,
+        priority=OutboxPriority.CODE,
+        to_email="someone@example.com",
+        from_email="noreply@example.com",
+        subject="Verify your email",
+        template_name="verification_code",
+        attempts=1,
+        **kwargs,
+    )
+
+
+def _queued_dispatches():
+    return DBTaskResult.objects.filter(task_path=dispatch_email_outbox.module_path)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("_database_task_backend")
+class TestDispatchEmailOutbox:
+    def test_schedules_one_dispatch_for_a_retry(self):
+        retry_at = timezone.now() + timedelta(minutes=5)
+        _pending_email(next_attempt_at=retry_at)
+
+        dispatch_email_outbox.call()
+        dispatch_email_outbox.call()
+
+        assert list(_queued_dispatches().values_list("run_after", flat=True)) == [
+            retry_at
+        ]
+
+    def test_relies_on_queued_dispatch_that_runs_sooner(self):
+        dispatch_email_outbox.enqueue()
+        _pending_email(next_attempt_at=timezone.now() + timedelta(minutes=5))
+
+        dispatch_email_outbox.call()
+
+        assert _queued_dispatches().count() == 1
+
+    def test_does_not_schedule_for_claimed_messages(self):
+        now = timezone.now()
+        _pending_email(claimed_at=now, next_attempt_at=now + timedelta(minutes=5))
+
+        dispatch_email_outbox.call()
+
+        assert not _queued_dispatches().exists()
+
+    def test_queued_emails_share_one_waiting_dispatch(self):
+        user = UserFactory()
+
+        HANDLERS.email.send_verification_email(user, "123456", 15)
+        HANDLERS.email.send_password_reset_email(user, "654321", 15)
+
+        assert OutboxEmail.objects.count() == 2
+        assert _queued_dispatches().count() == 1
@@ -0,0 +1,42 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+
+from api.tasks.notifications import send_daily_notifications, send_hourly_notifications
+from apps.notifications.models import NotificationCadence
+from tests.factories import NotificationFactory
+
+
+@pytest.mark.parametrize(
+    "legacy_task", [send_hourly_notifications, send_daily_notifications]
+)
+def test_legacy_digest_tasks_drain_every_due_chunk(legacy_task):
+    with patch(
+        "services.HANDLERS.notifications.send_due_digests",
+        side_effect=[200, 200, 3, 0],
+    ) as mock_send:
+        legacy_task.call()
+
+    assert mock_send.call_count == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "legacy_task", [send_hourly_notifications, send_daily_notifications]
+)
+def test_legacy_digest_tasks_stop_when_a_chunk_fails(legacy_task):
+    NotificationFactory(
+        cadence=NotificationCadence.DAILY,
+        next_digest_at=timezone.now() - timedelta(minutes=1),
+    )
+
+    with patch(
+        "services.email.django_impl.handler.DjangoEmailHandler"
+        ".send_discussion_digest_emails",
+        side_effect=RuntimeError("boom"),
+    ) as mock_send:
+        legacy_task.call()
+
+    assert mock_send.call_count == 1
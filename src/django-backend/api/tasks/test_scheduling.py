@@ -0,0 +1,44 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.utils import timezone
+from django_tasks_db.models import DBTaskResult
+
+from api.tasks.streams import PRUNE_INTERVAL, prune_stream_events
+
+
+@pytest.fixture(autouse=True)
+def _database_task_backend(settings):
+    settings.TASKS = {
+        "default": {"BACKEND": "django_tasks_db.backend.DatabaseBackend"},
+    }
+
+
+def _queued_runs():
+    return DBTaskResult.objects.filter(task_path=prune_stream_events.module_path)
+
+
+@pytest.mark.django_db
+class TestPeriodicTask:
+    def test_queues_its_next_run(self):
+        prune_stream_events.call()
+
+        run_after = _queued_runs().get().run_after
+        expected = timezone.now() + PRUNE_INTERVAL
+        assert expected - timedelta(minutes=1) < run_after <= expected
+
+    def test_queues_next_run_when_it_fails(self):
+        with (
+            patch("services.streams.django_impl.prune", side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
+            prune_stream_events.call()
+
+        assert _queued_runs().count() == 1
+
+    def test_concurrent_runs_keep_a_single_chain(self):
+        prune_stream_events.call()
+        prune_stream_events.call()
+
+        assert _queued_runs().count() == 1
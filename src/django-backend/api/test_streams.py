@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.test import AsyncClient, Client
+from hamcrest import assert_that, equal_to, has_entries
+
+from apps.projects.models import ProjectStatus
+from services import HANDLERS
+from tests.factories import NotificationFactory, ProjectFactory
+
+
+@pytest.fixture(autouse=True)
+def _fast_polling(settings):
+    settings.STREAM_POLL_INTERVAL = 0.01
+
+
+async def _read_event(content) -> tuple[str, dict]:
+    async with asyncio.timeout(2):
+        chunk = await anext(content)
+    fields = dict(line.split(": ", 1) for line in chunk.decode().strip().splitlines())
+    return fields["event"], json.loads(fields["data"])
+
+
+async def _open(url: str, token: str):
+    response = await AsyncClient().get(
+        url, headers={"Authorization": f"Bearer {token}"}
+    )
+    content = response.streaming_content
+    # The retry hint is sent once the subscription is in place
+    async with asyncio.timeout(2):
+        assert (await anext(content)).startswith(b"retry:")
+    return response, content
+
+
+@pytest.mark.django_db
+class TestProjectDiscussionsStream:
+    def test_requires_authentication(self) -> None:
+        project = ProjectFactory()
+
+        response = async_to_sync(AsyncClient().get)(
+            f"/api/projects/{project.id}/discussions/stream"
+        )
+
+        assert_that(response.status_code, equal_to(401))
+
+    def test_unavailable_from_a_wsgi_worker(self, access_token) -> None:
+        project = ProjectFactory()
+
+        response = Client().get(
+            f"/api/projects/{project.id}/discussions/stream",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        assert_that(response.status_code, equal_to(503))
+        assert_that(response.streaming, equal_to(False))
+
+    def test_hides_projects_the_user_cannot_see(self, access_token) -> None:
+        project = ProjectFactory(status=ProjectStatus.PENDING)
+
+        response = async_to_sync(AsyncClient().get)(
+            f"/api/projects/{project.id}/discussions/stream",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        assert_that(response.status_code, equal_to(404))
+        assert_that(response.streaming, equal_to(False))
+
+    def test_pushes_new_and_deleted_discussions(self, user, access_token) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        async def scenario():
+            response, content = await _open(
+                f"/api/projects/{project.id}/discussions/stream", access_token
+            )
+            discussion = await sync_to_async(HANDLERS.discussions.create_discussion)(
+                project.id, user.id, "Live!"
+            )
+            created = await _read_event(content)
+            await sync_to_async(HANDLERS.discussions.delete_discussion)(
+                discussion.id, user.id
+            )
+            deleted = await _read_event(content)
+            await content.aclose()
+            return response, discussion, created, deleted
+
+        response, discussion, created, deleted = async_to_sync(scenario)()
+
+        assert_that(response["Content-Type"], equal_to("text/event-stream"))
+        assert_that(created[0], equal_to("discussion.created"))
+        assert_that(
+            created[1],
+            has_entries(id=str(discussion.id), body="Live!", parent_id=None),
+        )
+        assert_that(deleted[0], equal_to("discussion.deleted"))
+        assert_that(deleted[1], has_entries(id=str(discussion.id)))
+
+
+@pytest.mark.django_db
+class TestMyNotificationsStream:
+    def test_pushes_changes_to_own_notifications(self, user, access_token) -> None:
+        NotificationFactory(recipient=user)
+
+        async def scenario():
+            _, content = await _open("/api/my/notifications/stream", access_token)
+            await sync_to_async(HANDLERS.notifications.mark_read)(user.id)
+            event = await _read_event(content)
+            await content.aclose()
+            return event
+
+        assert_that(async_to_sync(scenario)(), equal_to(("notifications.changed", {})))
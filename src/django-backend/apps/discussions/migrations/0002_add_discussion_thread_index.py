@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("discussions", "0001_initial"),
+        ("projects", "0028_add_projectimage_optimized_original"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="discussion",
+            index=models.Index(
+                fields=["project", "parent", "created_at"],
+                name="discussions_thread_idx",
+            ),
+        ),
+    ]
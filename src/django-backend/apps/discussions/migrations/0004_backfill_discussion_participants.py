@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:21
+
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Coalesce
+
+BATCH_SIZE = 1000
+
+
+def backfill_participants(apps, schema_editor):
+    Discussion = apps.get_model("discussions", "Discussion")
+    DiscussionParticipant = apps.get_model("discussions", "DiscussionParticipant")
+
+    # A reply counts towards its parent's thread, a root towards its own
+    comments = (
+        Discussion.objects.exclude(author=None)
+        .values(root_id=Coalesce("parent_id", "id"))
+        .annotate(comments=Count("id"))
+        .values_list("root_id", "author_id", "comments")
+    )
+    DiscussionParticipant.objects.bulk_create(
+        (
+            DiscussionParticipant(root_id=root_id, user_id=user_id, comment_count=n)
+            for root_id, user_id, n in comments.iterator()
+        ),
+        batch_size=BATCH_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("discussions", "0003_add_discussion_participants"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_participants, migrations.RunPython.noop),
+    ]
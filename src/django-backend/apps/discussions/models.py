@@ -31,8 +31,51 @@ class Discussion(models.Model):
     class Meta:
         db_table = "discussions"
         ordering = ["-created_at"]
+        indexes = [
+            # Threads of a project (parent null) and replies of a thread,
+            # both read in created_at order
+            models.Index(
+                fields=["project", "parent", "created_at"],
+                name="discussions_thread_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         prefix = "Reply" if self.parent else "Discussion"
         author = self.author.email if self.author else "deleted user"
         return f"{prefix} by {author} on {self.project}"
+
+
+class DiscussionParticipant(models.Model):
+    """A user who has posted in a thread, kept in step with its comments.
+
+    ``root`` is the top-level discussion and ``comment_count`` the number of
+    comments the user has in the thread, including the root itself, so the
+    row can be dropped when their last one is deleted.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    root = models.ForeignKey(
+        Discussion,
+        on_delete=models.CASCADE,
+        related_name="participants",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="discussion_participations",
+    )
+    comment_count = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "discussion_participants"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["root", "user"],
+                name="discussion_participants_unique",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user} in {self.root_id}"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.contrib import admin, messages
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import path, reverse
 from django.utils.html import format_html
@@ -14,6 +14,7 @@ from .models import (
     BroadcastEmail,
     BroadcastEmailImage,
     BroadcastEmailRecipient,
+    OutboxEmail,
     SentEmail,
 )
 
@@ -93,7 +94,7 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         obj: BroadcastEmail | None = None,
     ) -> tuple[str, ...]:
         always_readonly = ("sent_at", "sent_by", "created_by")
-        if obj and obj.is_sent:
+        if obj and (obj.is_sent or obj.is_sending):
             return (
                 "subject",
                 "body_markdown",
@@ -108,7 +109,7 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         request: HttpRequest,
         obj: BroadcastEmail | None = None,
     ) -> list[type]:
-        if obj and obj.is_sent:
+        if obj and (obj.is_sent or obj.is_sending):
             return [BroadcastEmailRecipientInline]
         if obj:
             return [BroadcastEmailImageInline]
@@ -119,7 +120,7 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         request: HttpRequest,
         obj: BroadcastEmail | None = None,
     ) -> bool:
-        if obj and obj.is_sent:
+        if obj and (obj.is_sent or obj.is_sending):
             return False
         return super().has_delete_permission(request, obj)
 
@@ -143,6 +144,13 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
                 "#16a34a",
                 "Sent",
             )
+        if obj.is_sending:
+            return format_html(
+                '<span style="background:{};color:#fff;padding:3px 8px;'
+                'border-radius:4px;font-size:11px;">{}</span>',
+                "#d97706",
+                "Sending",
+            )
         return format_html(
             '<span style="background:{};color:#fff;padding:3px 8px;'
             'border-radius:4px;font-size:11px;">{}</span>',
@@ -154,6 +162,8 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
     def recipient_count(self, obj: BroadcastEmail) -> int:
         if obj.is_sent:
             return obj.delivery_records.count()
+        if obj.is_sending:
+            return obj.total_recipients or 0
         return REPO.email.resolve_broadcast_recipients(obj).count()
 
     def get_urls(self) -> list:
@@ -168,6 +178,11 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
                 self.admin_site.admin_view(self.send_view),
                 name="emails_broadcastemail_send",
             ),
+            path(
+                "<uuid:pk>/progress/",
+                self.admin_site.admin_view(self.progress_view),
+                name="emails_broadcastemail_progress",
+            ),
         ]
         return custom_urls + super().get_urls()
 
@@ -195,6 +210,14 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
                 )
             )
 
+        if broadcast.is_sending:
+            return redirect(
+                reverse(
+                    "admin:emails_broadcastemail_progress",
+                    args=[broadcast.pk],
+                )
+            )
+
         recipients = REPO.email.resolve_broadcast_recipients(broadcast)
         recipient_count = recipients.count()
 
@@ -208,18 +231,14 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
             )
 
         if request.method == "POST":
-            success_count, failure_count = HANDLERS.email.send_broadcast(
-                broadcast, request.user
-            )
+            HANDLERS.email.queue_broadcast(broadcast, request.user)
             messages.success(
                 request,
-                f"Email sent to {success_count} recipient(s)"
-                + (f" ({failure_count} failed)" if failure_count else "")
-                + ".",
+                f"Sending email to {recipient_count} recipient(s).",
             )
             return redirect(
                 reverse(
-                    "admin:emails_broadcastemail_change",
+                    "admin:emails_broadcastemail_progress",
                     args=[broadcast.pk],
                 )
             )
@@ -236,6 +255,42 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
             context,
         )
 
+    def progress_view(self, request: HttpRequest, pk: str) -> HttpResponse:
+        broadcast = get_object_or_404(BroadcastEmail, pk=pk)
+
+        if request.method == "POST" and broadcast.is_sending:
+            # Resume a run that stopped part way; sent recipients are skipped
+            HANDLERS.email.queue_broadcast(broadcast, broadcast.sent_by)
+            messages.success(request, "Sending resumed.")
+            return redirect(
+                reverse(
+                    "admin:emails_broadcastemail_progress",
+                    args=[broadcast.pk],
+                )
+            )
+
+        records = broadcast.delivery_records.all()
+        progress = {
+            "total": broadcast.total_recipients or 0,
+            "processed": records.count(),
+            "failed": records.filter(success=False).count(),
+            "done": broadcast.is_sent,
+        }
+        if request.GET.get("format") == "json":
+            return JsonResponse(progress)
+
+        context = {
+            **self.admin_site.each_context(request),
+            "broadcast": broadcast,
+            "progress": progress,
+            "opts": self.model._meta,  # noqa: SLF001
+        }
+        return render(
+            request,
+            "admin/emails/broadcastemail/send_progress.html",
+            context,
+        )
+
     def change_view(
         self,
         request: HttpRequest,
@@ -246,7 +301,9 @@ class BroadcastEmailAdmin(admin.ModelAdmin):
         extra_context = extra_context or {}
         obj = self.get_object(request, object_id)
         if obj:
-            extra_context["show_broadcast_buttons"] = not obj.is_sent
+            extra_context["show_broadcast_buttons"] = not (
+                obj.is_sent or obj.is_sending
+            )
             extra_context["preview_url"] = reverse(
                 "admin:emails_broadcastemail_preview",
                 args=[obj.pk],
@@ -286,12 +343,12 @@ class SentEmailAdmin(admin.ModelAdmin):
         "created_at",
         "preview_link",
     )
-    exclude = ("html_body",)
+    exclude = ("html_body", "body_template", "body_context")
     ordering = ("-created_at",)
 
     @admin.display(description="Preview")
     def preview_link(self, obj: SentEmail) -> str:
-        if not obj.pk or not obj.html_body:
+        if not obj.pk or not obj.has_body:
             return "-"
         url = reverse("admin:emails_sentemail_preview", args=[obj.pk])
         return format_html('<a href="{}" target="_blank">View</a>', url)
@@ -307,13 +364,15 @@ class SentEmailAdmin(admin.ModelAdmin):
         return custom_urls + super().get_urls()
 
     def preview_view(self, request: HttpRequest, pk: str) -> HttpResponse:
-        sent_email = get_object_or_404(SentEmail, pk=pk)
-        if not sent_email.html_body:
+        sent_email = get_object_or_404(
+            SentEmail.objects.select_related("body_template"), pk=pk
+        )
+        if not sent_email.has_body:
             return HttpResponse(
                 "<p>No HTML preview available for this email.</p>",
                 content_type="text/html",
             )
-        return HttpResponse(sent_email.html_body)
+        return HttpResponse(REPO.email.render_sent_email(sent_email))
 
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
@@ -327,3 +386,28 @@ class SentEmailAdmin(admin.ModelAdmin):
         self, request: HttpRequest, obj: SentEmail | None = None
     ) -> bool:
         return False
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "email_type",
+        "to_email",
+        "priority",
+        "status",
+        "attempts",
+        "next_attempt_at",
+    )
+    list_filter = ("status", "email_type", "priority")
+    search_fields = ("to_email", "subject")
+    exclude = ("context",)
+    ordering = ("-created_at",)
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(
+        self, request: HttpRequest, obj: OutboxEmail | None = None
+    ) -> bool:
+        return False
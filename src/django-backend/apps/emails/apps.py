@@ -5,3 +5,11 @@ class EmailsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.emails"
     verbose_name = "Emails"
+
+    def ready(self) -> None:
+        from django.db.models.signals import post_save  # noqa: PLC0415
+
+        from apps.emails.models import BroadcastEmailImage  # noqa: PLC0415
+        from apps.emails.signals import on_broadcast_image_saved  # noqa: PLC0415
+
+        post_save.connect(on_broadcast_image_saved, sender=BroadcastEmailImage)
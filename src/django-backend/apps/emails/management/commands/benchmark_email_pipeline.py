@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import functools
+import json
+import subprocess
+import time
+import uuid
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.mail.backends import smtp
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.discussions.models import Discussion
+from apps.emails.models import BroadcastEmail
+from apps.emails.smtp_sink import SMTPSink
+from apps.notifications.models import Notification, NotificationCadence
+from apps.projects.models import Project, ProjectStatus
+from apps.users.models import User
+from services import HANDLERS
+from services.email.django_impl import compiled_templates
+from services.email.django_impl import handler as email_handler
+from services.email.django_impl import query as email_query
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from django.core.management.base import CommandParser
+
+STAGES = ("mjml_compile", "template_render", "smtp", "db")
+NOTIFICATIONS_PER_DIGEST = 3
+BENCHMARK_PROJECTS = 5
+
+
+class StageTimer:
+    """Accumulates time per stage, excluding time spent in nested stages."""
+
+    def __init__(self) -> None:
+        self.totals: defaultdict[str, float] = defaultdict(float)
+        self.db_queries = 0
+        self._stack: list[float] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        self._stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.totals[name] += elapsed - self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            with self.stage(name):
+                return func(*args, **kwargs)
+
+        return timed
+
+    def db_wrapper(self, execute: Callable, *args: Any) -> Any:
+        self.db_queries += 1
+        with self.stage("db"):
+            return execute(*args)
+
+    @contextmanager
+    def instrument(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for module in (email_handler, email_query):
+                stack.enter_context(
+                    patch.object(
+                        module,
+                        "render_email",
+                        self.wrap("template_render", module.render_email),
+                    )
+                )
+            stack.enter_context(
+                patch.object(
+                    compiled_templates,
+                    "compile_mjml_source",
+                    self.wrap("mjml_compile", compiled_templates.compile_mjml_source),
+                )
+            )
+            for method in ("open", "send_messages"):
+                stack.enter_context(
+                    patch.object(
+                        smtp.EmailBackend,
+                        method,
+                        self.wrap("smtp", getattr(smtp.EmailBackend, method)),
+                    )
+                )
+            stack.enter_context(connection.execute_wrapper(self.db_wrapper))
+            yield
+
+
+def _seed_users(count: int, **fields: Any) -> list[User]:
+    run_id = uuid.uuid4().hex[:8]
+    return User.objects.bulk_create(
+        User(
+            email=f"bench-{run_id}-{i}@example.com",
+            first_name=f"Bench{i}",
+            **fields,
+        )
+        for i in range(count)
+    )
+
+
+def _seed_digests(count: int) -> None:
+    owner = _seed_users(1)[0]
+    projects = Project.objects.bulk_create(
+        Project(
+            title=f"Benchmark project {i}",
+            website_url="https://example.com",
+            status=ProjectStatus.APPROVED,
+            submission_month=timezone.now().strftime("%Y-%m"),
+            owner=owner,
+        )
+        for i in range(BENCHMARK_PROJECTS)
+    )
+    discussions = Discussion.objects.bulk_create(
+        Discussion(project=project, author=owner, body="Benchmark comment")
+        for project in projects
+    )
+    users = _seed_users(count, notification_frequency=NotificationCadence.DAILY)
+    Notification.objects.bulk_create(
+        Notification(
+            recipient=user,
+            project_id=discussion.project_id,
+            discussion=discussion,
+            cadence=NotificationCadence.DAILY,
+        )
+        for i, user in enumerate(users)
+        for j in range(NOTIFICATIONS_PER_DIGEST)
+        for discussion in [discussions[(i + j) % len(discussions)]]
+    )
+
+
+def _run_digests(count: int) -> Iterator[None]:
+    _seed_digests(count)
+    yield
+    HANDLERS.notifications.send_batch_notifications(NotificationCadence.DAILY)
+    HANDLERS.email.dispatch_outbox()
+
+
+def _run_broadcast(count: int) -> Iterator[None]:
+    users = _seed_users(count)
+    admin = users[0]
+    broadcast = BroadcastEmail.objects.create(
+        subject="Benchmark broadcast",
+        body_markdown="Hello **everyone**!\n\nThis is a benchmark broadcast.",
+        created_by=admin,
+    )
+    broadcast.individual_recipients.set(users)
+    yield
+    HANDLERS.email.send_broadcast(broadcast, admin)
+
+
+def _run_transactional(count: int) -> Iterator[None]:
+    users = _seed_users(count)
+    yield
+    for user in users:
+        HANDLERS.email.send_verification_email(user, "123456", expires_minutes=15)
+    HANDLERS.email.dispatch_outbox()
+
+
+# Each scenario seeds its data, yields, then sends; only sending is timed
+SCENARIOS = {
+    "digests": _run_digests,
+    "broadcast": _run_broadcast,
+    "transactional": _run_transactional,
+}
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=settings.BASE_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure email pipeline throughput against an in-process SMTP sink. "
+        "All seeded data is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--users", type=int, default=200)
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / "benchmarks" / "email_pipeline.json",
+        )
+
+    def _run_scenario(self, name: str, count: int, sink: SMTPSink) -> dict:
+        compiled_templates.clear_cache()
+        messages_before = sink.messages
+        connections_before = sink.connections
+        timer = StageTimer()
+
+        with transaction.atomic():
+            steps = SCENARIOS[name](count)
+            next(steps)
+            with timer.instrument():
+                start = time.perf_counter()
+                next(steps, None)
+                elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+
+        emails = sink.messages - messages_before
+        per_email = max(emails, 1)
+        stage_ms = {
+            stage: round(timer.totals[stage] * 1000 / per_email, 3) for stage in STAGES
+        }
+        stage_ms["other"] = round(
+            (elapsed - sum(timer.totals.values())) * 1000 / per_email, 3
+        )
+        return {
+            "emails": emails,
+            "seconds": round(elapsed, 3),
+            "emails_per_second": round(emails / elapsed, 1) if elapsed else 0,
+            "ms_per_email": stage_ms,
+            "db_queries_per_email": round(timer.db_queries / per_email, 2),
+            "smtp_connections": sink.connections - connections_before,
+        }
+
+    def handle(self, *args, **options) -> None:
+        output: Path = options["output"]
+        previous = json.loads(output.read_text()) if output.exists() else None
+
+        with (
+            SMTPSink() as sink,
+            override_settings(
+                EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+                EMAIL_HOST="127.0.0.1",
+                EMAIL_PORT=sink.port,
+                EMAIL_USE_TLS=False,
+                EMAIL_HOST_USER="",
+                EMAIL_HOST_PASSWORD="",
+                EMAIL_SEND_RATE_PER_SECOND=1_000_000,
+                # Queue dispatch tasks without running them; each scenario
+                # drains the outbox itself, as the worker would
+                TASKS={
+                    "default": {"BACKEND": "django_tasks.backends.dummy.DummyBackend"}
+                },
+            ),
+        ):
+            results = {
+                name: self._run_scenario(name, options["users"], sink)
+                for name in SCENARIOS
+            }
+
+        report = {
+            "commit": _git_commit(),
+            "recorded_at": timezone.now().isoformat(),
+            "users": options["users"],
+            "scenarios": results,
+        }
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n")
+
+        for name, result in results.items():
+            line = (
+                f"{name:<14} {result['emails']:>5} emails  "
+                f"{result['emails_per_second']:>8} emails/s  "
+                f"{result['db_queries_per_email']:>6} queries/email"
+            )
+            before = (previous or {}).get("scenarios", {}).get(name)
+            if before and before["emails_per_second"]:
+                change = result["emails_per_second"] / before["emails_per_second"]
+                line += f"  ({(change - 1) * 100:+.1f}% vs {previous['commit']})"
+            self.stdout.write(line)
+            stages = ", ".join(
+                f"{stage} {ms} ms" for stage, ms in result["ms_per_email"].items()
+            )
+            self.stdout.write(f"{'':<14} per email: {stages}")
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+from django.template.loader import render_to_string
+from django.utils import timezone
+from mjml import mjml_to_html
+
+from services.email import EMAIL_LOGO_URL
+from services.email.django_impl import render_email
+from services.email.django_impl.compiled_templates import clear_cache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.core.management.base import CommandParser
+
+
+def _sample_context() -> dict:
+    return {
+        "recipient_name": "Sample User",
+        "groups": [
+            {
+                "project_title": f"Project {i}",
+                "project_url": f"https://naglasupan.is/projects/{i}",
+                "comment_count": i,
+            }
+            for i in range(1, 6)
+        ],
+        "site_url": "https://naglasupan.is",
+        "profile_url": "https://naglasupan.is/my-profile",
+        "logo_url": EMAIL_LOGO_URL,
+        "current_year": timezone.now().year,
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare per-email HTML render time with and without compiled templates."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--template", default="discussion_digest")
+        parser.add_argument("--iterations", type=int, default=200)
+
+    def _time_per_email(self, render: Callable[[], object], iterations: int) -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            render()
+        return (time.perf_counter() - start) * 1000 / iterations
+
+    def handle(self, *args, **options) -> None:
+        template = options["template"]
+        iterations = options["iterations"]
+        context = _sample_context()
+
+        live_ms = self._time_per_email(
+            lambda: mjml_to_html(render_to_string(f"email/{template}.mjml", context)),
+            iterations,
+        )
+
+        clear_cache()
+        start = time.perf_counter()
+        render_email(template, context)
+        first_ms = (time.perf_counter() - start) * 1000
+        compiled_ms = self._time_per_email(
+            lambda: render_email(template, context), iterations
+        )
+
+        self.stdout.write(f"Template:          {template} ({iterations} renders)")
+        self.stdout.write(f"Live MJML:         {live_ms:.3f} ms/email")
+        self.stdout.write(f"Compiled (first):  {first_ms:.3f} ms")
+        self.stdout.write(f"Compiled:          {compiled_ms:.3f} ms/email")
+        self.stdout.write(
+            self.style.SUCCESS(f"Speedup:           {live_ms / compiled_ms:.1f}x")
+        )
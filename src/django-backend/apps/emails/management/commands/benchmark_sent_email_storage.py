@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import random
+import zlib
+from typing import TYPE_CHECKING
+
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from services.email import EMAIL_LOGO_URL
+from services.email.django_impl import render_email
+from services.email.django_impl.compiled_templates import get_compiled_template
+
+if TYPE_CHECKING:
+    from django.core.management.base import CommandParser
+
+# Share of daily email traffic by template
+TRAFFIC_MIX = {
+    "discussion_notification": 0.45,
+    "discussion_digest": 0.35,
+    "verification_code": 0.1,
+    "password_reset_code": 0.05,
+    "project_approved": 0.05,
+}
+
+
+def _sample_context(template_name: str, rng: random.Random, n: int) -> dict:
+    site = "https://naglasupan.is"
+    context = {
+        "recipient_name": f"User {n}",
+        "user_name": f"User {n}",
+        "profile_url": f"{site}/profile",
+        "logo_url": EMAIL_LOGO_URL,
+        "current_year": 2026,
+    }
+    if template_name == "discussion_notification":
+        context |= {
+            "author_name": f"Author {rng.randint(1, 500)}",
+            "author_initial": "A",
+            "project_title": f"Project {rng.randint(1, 300)}",
+            "comment_body": "Nice work on this! " * rng.randint(1, 25),
+            "project_url": f"{site}/projects/{n}",
+            "discussion_url": f"{site}/projects/{n}#discussions",
+        }
+    elif template_name == "discussion_digest":
+        context |= {
+            "groups": [
+                {
+                    "project_title": f"Project {rng.randint(1, 300)}",
+                    "project_url": f"{site}/projects/{i}#discussions",
+                    "comment_count": rng.randint(1, 9),
+                }
+                for i in range(rng.randint(1, 6))
+            ],
+            "site_url": site,
+        }
+    elif template_name == "project_approved":
+        context |= {
+            "project_title": f"Project {n}",
+            "project_url": f"{site}/projects/{n}",
+        }
+    else:
+        context |= {"code": f"{rng.randint(0, 999999):06d}", "expiry_minutes": 15}
+    return context
+
+
+def _kilobytes(num_bytes: int) -> str:
+    return f"{num_bytes / 1024:,.0f} KB"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare SentEmail body storage for a synthetic month of traffic: full "
+        "rendered HTML per row versus shared compressed templates plus context."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--days", type=int, default=30)
+        parser.add_argument("--emails-per-day", type=int, default=500)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options) -> None:
+        rng = random.Random(options["seed"])  # noqa: S311
+        count = options["days"] * options["emails_per_day"]
+        names = list(TRAFFIC_MIX)
+        weights = list(TRAFFIC_MIX.values())
+
+        html_bytes = 0
+        context_bytes = 0
+        used_templates = set()
+        for n in range(count):
+            template_name = rng.choices(names, weights)[0]
+            context = _sample_context(template_name, rng, n)
+            html, _ = render_email(template_name, context)
+            html_bytes += len(html.encode())
+            context_bytes += len(json.dumps(context, cls=DjangoJSONEncoder).encode())
+            used_templates.add(template_name)
+
+        # Each compiled template is stored once, compressed
+        template_bytes = sum(
+            len(
+                zlib.compress(
+                    get_compiled_template(name).template.source.encode(), level=9
+                )
+            )
+            for name in used_templates
+        )
+        compact_bytes = context_bytes + template_bytes
+        reduction = 100 * (1 - compact_bytes / html_bytes) if html_bytes else 0
+
+        self.stdout.write(f"Emails:            {count:,}")
+        self.stdout.write(f"Full HTML bodies:  {_kilobytes(html_bytes)}")
+        self.stdout.write(f"Context JSON:      {_kilobytes(context_bytes)}")
+        self.stdout.write(f"Shared templates:  {_kilobytes(template_bytes)}")
+        self.stdout.write(self.style.SUCCESS(f"Reduction:         {reduction:.1f}%"))
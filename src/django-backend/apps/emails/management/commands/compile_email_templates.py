@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.email.django_impl.compiled_templates import build_templates
+
+
+class Command(BaseCommand):
+    help = "Compile MJML email templates to HTML and write the build manifest."
+
+    def handle(self, *args, **options) -> None:
+        build_dir = Path(settings.EMAIL_TEMPLATE_BUILD_DIR)
+        manifest = build_templates(build_dir)
+        for name, entry in manifest.items():
+            self.stdout.write(f"{name}: {entry['file']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled {len(manifest)} email templates into {build_dir}"
+            )
+        )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.emails.models import OutboxEmail
+from apps.users.models import User
+
+
+@pytest.mark.django_db
+class TestBenchmarkEmailPipelineCommand:
+    def test_writes_results_and_rolls_back(self, tmp_path):
+        output = tmp_path / "email_pipeline.json"
+
+        call_command(
+            "benchmark_email_pipeline", users=3, output=output, stdout=StringIO()
+        )
+
+        report = json.loads(output.read_text())
+        assert report["users"] == 3
+        digests = report["scenarios"]["digests"]
+        assert digests["emails"] == 3
+        assert digests["smtp_connections"] == 1
+        assert set(digests["ms_per_email"]) == {
+            "mjml_compile",
+            "template_render",
+            "smtp",
+            "db",
+            "other",
+        }
+        assert report["scenarios"]["broadcast"]["emails"] == 3
+        assert report["scenarios"]["transactional"]["emails"] == 3
+        assert not User.objects.exists()
+        assert not OutboxEmail.objects.exists()
+
+    def test_compares_with_previous_run(self, tmp_path):
+        output = tmp_path / "email_pipeline.json"
+        call_command(
+            "benchmark_email_pipeline", users=2, output=output, stdout=StringIO()
+        )
+
+        out = StringIO()
+        call_command("benchmark_email_pipeline", users=2, output=output, stdout=out)
+
+        assert "% vs " in out.getvalue()
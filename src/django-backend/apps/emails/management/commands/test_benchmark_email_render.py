@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class TestBenchmarkEmailRenderCommand:
+    def test_reports_live_and_compiled_timings(self, settings, tmp_path):
+        settings.EMAIL_TEMPLATE_CACHE_DIR = tmp_path
+
+        out = StringIO()
+        call_command("benchmark_email_render", iterations=2, stdout=out)
+
+        output = out.getvalue()
+        assert "Live MJML:" in output
+        assert "Compiled:" in output
+        assert "Speedup:" in output
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class TestBenchmarkSentEmailStorageCommand:
+    def test_reports_reduction(self):
+        out = StringIO()
+        call_command(
+            "benchmark_sent_email_storage", days=1, emails_per_day=20, stdout=out
+        )
+
+        output = out.getvalue()
+        assert "Emails:            20" in output
+        assert "Full HTML bodies:" in output
+        assert "Reduction:" in output
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+from django.core.management import call_command
+
+
+class TestCompileEmailTemplatesCommand:
+    def test_compiles_every_template(self, settings, tmp_path):
+        settings.EMAIL_TEMPLATE_BUILD_DIR = tmp_path
+
+        out = StringIO()
+        call_command("compile_email_templates", stdout=out)
+
+        manifest = json.loads((tmp_path / "manifest.json").read_text())["templates"]
+        assert {"broadcast", "discussion_digest", "verification_code"} <= set(manifest)
+        for entry in manifest.values():
+            assert (tmp_path / entry["file"]).exists()
+        assert f"Compiled {len(manifest)} email templates" in out.getvalue()
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("emails", "0005_change_sentemail_recipient_to_set_null"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="broadcastemailimage",
+            name="variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
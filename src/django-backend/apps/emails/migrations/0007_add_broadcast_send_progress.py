@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("emails", "0006_add_broadcastemailimage_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="broadcastemail",
+            name="send_queued_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="broadcastemail",
+            name="total_recipients",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
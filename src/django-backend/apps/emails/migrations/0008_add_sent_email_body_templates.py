@@ -0,0 +1,56 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:05
+
+import django.core.serializers.json
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("emails", "0007_add_broadcast_send_progress"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmailBodyTemplate",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("template_name", models.CharField(max_length=100)),
+                ("content_hash", models.CharField(max_length=64, unique=True)),
+                ("compressed_html", models.BinaryField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "email_body_templates",
+            },
+        ),
+        migrations.AddField(
+            model_name="sentemail",
+            name="body_context",
+            field=models.JSONField(
+                blank=True,
+                default=dict,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+            ),
+        ),
+        migrations.AddField(
+            model_name="sentemail",
+            name="body_template",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="sent_emails",
+                to="emails.emailbodytemplate",
+            ),
+        ),
+    ]
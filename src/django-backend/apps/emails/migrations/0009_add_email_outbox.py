@@ -0,0 +1,107 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:20
+
+import django.core.serializers.json
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("emails", "0008_add_sent_email_body_templates"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxEmail",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "email_type",
+                    models.CharField(
+                        choices=[
+                            ("verification", "Verification"),
+                            ("password_reset", "Password Reset"),
+                            ("project_approved", "Project Approved"),
+                            ("discussion_notification", "Discussion Notification"),
+                            ("discussion_digest", "Discussion Digest"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                (
+                    "priority",
+                    models.PositiveSmallIntegerField(
+                        choices=[
+                            (0, "Verification and reset codes"),
+                            (10, "Transactional"),
+                            (20, "Notification"),
+                            (30, "Digest"),
+                        ]
+                    ),
+                ),
+                ("to_email", models.EmailField(max_length=254)),
+                ("from_email", models.CharField(max_length=200)),
+                ("subject", models.CharField(max_length=200)),
+                ("template_name", models.CharField(max_length=100)),
+                (
+                    "context",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "recipient",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="outbox_emails",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "email_outbox",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "pending")),
+                        fields=["priority", "next_attempt_at"],
+                        name="email_outbox_ready_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.1 on 2026-10-19 07:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("emails", "0010_add_outbox_claimed_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SendRateBucket",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=50, primary_key=True, serialize=False),
+                ),
+                ("tokens", models.FloatField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "email_send_rate_buckets",
+            },
+        ),
+    ]
@@ -1,8 +1,11 @@
 import uuid
+import zlib
 
 from django.conf import settings
 from django.core.files.storage import Storage, storages
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 
 
 class BroadcastEmailType(models.TextChoices):
@@ -41,6 +44,10 @@ class BroadcastEmail(models.Model):
         null=True,
         related_name="broadcast_emails_created",
     )
+    # Set when sending is handed to the background task; sent_at is set once
+    # every recipient has been processed
+    send_queued_at = models.DateTimeField(null=True, blank=True)
+    total_recipients = models.PositiveIntegerField(null=True, blank=True)
     sent_at = models.DateTimeField(null=True, blank=True)
     sent_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -57,13 +64,22 @@ class BroadcastEmail(models.Model):
         ordering = ["-created_at"]
 
     def __str__(self) -> str:
-        status = "Sent" if self.sent_at else "Draft"
+        if self.sent_at:
+            status = "Sent"
+        elif self.send_queued_at:
+            status = "Sending"
+        else:
+            status = "Draft"
         return f"[{status}] {self.subject}"
 
     @property
     def is_sent(self) -> bool:
         return self.sent_at is not None
 
+    @property
+    def is_sending(self) -> bool:
+        return self.send_queued_at is not None and self.sent_at is None
+
 
 class BroadcastEmailRecipient(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -90,6 +106,10 @@ class BroadcastEmailRecipient(models.Model):
         return f"{self.user.email} - {status}"
 
 
+# Emails render in a 600px column; this keeps images sharp on 2x screens
+BROADCAST_IMAGE_EMAIL_WIDTH = 1200
+
+
 def _broadcast_image_storage() -> Storage:
     return storages["broadcast_images"]
 
@@ -106,6 +126,26 @@ class SentEmailType(models.TextChoices):
     DISCUSSION_DIGEST = "discussion_digest", "Discussion Digest"
 
 
+class EmailBodyTemplate(models.Model):
+    """A compiled email template, stored once for every email rendered from it."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    template_name = models.CharField(max_length=100)
+    content_hash = models.CharField(max_length=64, unique=True)
+    compressed_html = models.BinaryField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "email_body_templates"
+
+    def __str__(self) -> str:
+        return f"{self.template_name} ({self.content_hash[:12]})"
+
+    @property
+    def html(self) -> str:
+        return zlib.decompress(self.compressed_html).decode()
+
+
 class SentEmail(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     recipient = models.ForeignKey(
@@ -123,7 +163,17 @@ class SentEmail(models.Model):
     to_email = models.EmailField()
     success = models.BooleanField(default=True)
     error_message = models.TextField(blank=True, default="")
+    # Only set on older rows; newer rows keep the template they were rendered
+    # from and their context, and are re-rendered on demand
     html_body = models.TextField(blank=True, default="")
+    body_template = models.ForeignKey(
+        EmailBodyTemplate,
+        on_delete=models.PROTECT,
+        related_name="sent_emails",
+        null=True,
+        blank=True,
+    )
+    body_context = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -134,6 +184,86 @@ class SentEmail(models.Model):
         status = "OK" if self.success else "FAILED"
         return f"[{status}] {self.email_type} to {self.to_email}"
 
+    @property
+    def has_body(self) -> bool:
+        return bool(self.html_body) or self.body_template_id is not None
+
+
+class OutboxStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    SENT = "sent", "Sent"
+    FAILED = "failed", "Failed"
+
+
+class OutboxPriority(models.IntegerChoices):
+    # Lower values are sent first
+    CODE = 0, "Verification and reset codes"
+    TRANSACTIONAL = 10, "Transactional"
+    NOTIFICATION = 20, "Notification"
+    DIGEST = 30, "Digest"
+
+
+class OutboxEmail(models.Model):
+    """A transactional email waiting to be sent by the outbox dispatcher."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    email_type = models.CharField(max_length=30, choices=SentEmailType.choices)
+    priority = models.PositiveSmallIntegerField(choices=OutboxPriority.choices)
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="outbox_emails",
+        null=True,
+        blank=True,
+    )
+    to_email = models.EmailField()
+    from_email = models.CharField(max_length=200)
+    subject = models.CharField(max_length=200)
+    template_name = models.CharField(max_length=100)
+    context = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        max_length=10,
+        choices=OutboxStatus.choices,
+        default=OutboxStatus.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Also pushed forward while a dispatcher holds the message, so a crashed
+    # dispatcher's claims become available again
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # Set while a dispatcher holds the message, telling a claim apart from a
+    # retry waiting out its backoff
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "email_outbox"
+        indexes = [
+            models.Index(
+                fields=["priority", "next_attempt_at"],
+                condition=models.Q(status="pending"),
+                name="email_outbox_ready_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"[{self.status}] {self.email_type} to {self.to_email}"
+
+
+class SendRateBucket(models.Model):
+    """Token bucket state for a send rate limit shared by every process."""
+
+    name = models.CharField(max_length=50, primary_key=True)
+    tokens = models.FloatField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "email_send_rate_buckets"
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.tokens:.1f} tokens"
+
 
 class BroadcastEmailImage(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -147,6 +277,8 @@ class BroadcastEmailImage(models.Model):
         storage=_broadcast_image_storage,
     )
     original_filename = models.CharField(max_length=255, blank=True)
+    # size -> {"name", "width", "height", "source"}, written by the image task
+    variants = models.JSONField(default=dict, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -163,4 +295,16 @@ class BroadcastEmailImage(models.Model):
 
     @property
     def url(self) -> str:
+        """URL to use in emails: the resized copy once it exists."""
+        variant = self.variants.get("email")
+        if variant and variant["source"] == self.image.name:
+            return self.image.storage.url(variant["name"])
         return self.image.url
+
+    @property
+    def needs_variants(self) -> bool:
+        if not self.image:
+            return False
+        return not any(
+            variant["source"] == self.image.name for variant in self.variants.values()
+        )
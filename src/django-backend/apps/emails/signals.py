@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from django.db import transaction
+
+from api.tasks.images import generate_broadcast_image_variants
+
+if TYPE_CHECKING:
+    from apps.emails.models import BroadcastEmailImage
+
+
+def on_broadcast_image_saved(
+    sender: type, instance: BroadcastEmailImage, **kwargs: Any
+) -> None:
+    if not instance.needs_variants:
+        return
+    image_id = str(instance.id)
+    # The upload is already stored by now; if the queue is unavailable the
+    # email falls back to the original and generate_image_variants can
+    # backfill it later, so don't turn the admin save into an error.
+    transaction.on_commit(
+        lambda: generate_broadcast_image_variants.enqueue(image_id), robust=True
+    )
@@ -0,0 +1,83 @@
+"""Minimal in-process SMTP server that accepts and discards mail.
+
+Used by the email benchmarks so SMTP cost is measured against a real socket
+without sending anything anywhere. Only the commands Django's SMTP backend
+uses are supported; there is no TLS or authentication.
+"""
+
+from __future__ import annotations
+
+import socketserver
+import threading
+from typing import Self
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    server: SMTPSink
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def _read_data(self) -> int:
+        size = 0
+        while (line := self.rfile.readline()) not in {b".\r\n", b".\n", b""}:
+            size += len(line)
+        return size
+
+    def handle(self) -> None:
+        self.server.record_connection()
+        self._reply("220 smtp-sink ready")
+        while line := self.rfile.readline():
+            verb = line.decode(errors="replace").strip().split(" ", 1)[0].upper()
+            if verb in {"EHLO", "HELO"}:
+                self._reply("250 smtp-sink")
+            elif verb in {"MAIL", "RCPT", "RSET", "NOOP"}:
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self.server.record_message(self._read_data())
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """Counts connections, messages and bytes received on a free local port."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__((host, port), _SMTPHandler)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.connections = 0
+        self.messages = 0
+        self.bytes = 0
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def record_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def record_message(self, size: int) -> None:
+        with self._lock:
+            self.messages += 1
+            self.bytes += size
+
+    def __enter__(self) -> Self:
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
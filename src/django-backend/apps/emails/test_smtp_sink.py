@@ -0,0 +1,14 @@
+import smtplib
+
+from .smtp_sink import SMTPSink
+
+
+class TestSMTPSink:
+    def test_accepts_and_counts_messages(self):
+        with SMTPSink() as sink, smtplib.SMTP("127.0.0.1", sink.port) as client:
+            client.sendmail("a@example.com", ["b@example.com"], "Subject: hi\r\n\r\n1")
+            client.sendmail("a@example.com", ["c@example.com"], "Subject: hi\r\n\r\n2")
+
+        assert sink.connections == 1
+        assert sink.messages == 2
+        assert sink.bytes > 0
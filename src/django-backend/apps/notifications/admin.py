@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from django.conf import settings
 from django.contrib import admin
-from django.db.models import QuerySet
+from django.db.models import QuerySet, Sum
 from django.http import HttpResponse
 from django.shortcuts import render
 from django.urls import path, reverse
@@ -14,7 +13,7 @@ from django.utils import timezone
 from services.email.django_impl import render_email
 from services.email.django_impl.handler import build_digest_groups
 
-from .models import Notification
+from .models import ArchivedNotification, Notification
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -27,7 +26,8 @@ class NotificationAdmin(admin.ModelAdmin):
     list_display = (
         "id",
         "recipient",
-        "discussion",
+        "project",
+        "comment_count",
         "cadence",
         "sent",
         "created_at",
@@ -35,11 +35,11 @@ class NotificationAdmin(admin.ModelAdmin):
     )
     list_filter = ("cadence", "sent", "created_at")
     search_fields = ("recipient__email",)
-    readonly_fields = ("id", "created_at")
+    readonly_fields = ("id", "created_at", "updated_at")
     ordering = ("-created_at",)
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Notification]:
-        return super().get_queryset(request).select_related("recipient", "discussion")
+        return super().get_queryset(request).select_related("recipient", "project")
 
     def get_urls(self) -> list:
         custom_urls = [
@@ -68,46 +68,57 @@ class NotificationAdmin(admin.ModelAdmin):
         return super().changelist_view(request, extra_context=extra_context)
 
     def preview_digest_list_view(self, request: HttpRequest) -> HttpResponse:
-        unsent = (
+        # One row per recipient and project, so the page costs the same
+        # however many notifications are waiting
+        rows = (
             Notification.objects.filter(sent=False)
-            .select_related(
-                "recipient",
-                "discussion",
-                "discussion__project",
-                "discussion__author",
+            .values(
+                "recipient_id",
+                "recipient__email",
+                "recipient__first_name",
+                "recipient__last_name",
+                "project__title",
             )
-            .order_by("recipient_id", "created_at")
+            .annotate(count=Sum("comment_count"))
+            .order_by()
         )
 
-        by_recipient: defaultdict[UUID, dict] = defaultdict(
-            lambda: {"recipient": None, "projects": defaultdict(int), "count": 0}
-        )
-        for n in unsent:
-            entry = by_recipient[n.recipient_id]
-            entry["recipient"] = n.recipient
-            entry["projects"][n.discussion.project.title] += 1
-            entry["count"] += 1
-
-        recipients_data = []
-        for recipient_id, data in sorted(
-            by_recipient.items(), key=lambda x: x[1]["count"], reverse=True
-        ):
-            recipients_data.append(
+        by_recipient: dict[UUID, dict] = {}
+        for row in rows:
+            entry = by_recipient.setdefault(
+                row["recipient_id"],
                 {
-                    "recipient": data["recipient"],
-                    "count": data["count"],
-                    "projects": dict(data["projects"]),
-                    "preview_url": reverse(
-                        "admin:notifications_notification_preview_digest_detail",
-                        args=[recipient_id],
-                    ),
-                }
+                    "recipient": {
+                        "email": row["recipient__email"],
+                        "full_name": (
+                            f"{row['recipient__first_name']} "
+                            f"{row['recipient__last_name']}"
+                        ).strip(),
+                    },
+                    "projects": {},
+                    "count": 0,
+                },
+            )
+            entry["projects"][row["project__title"]] = row["count"]
+            entry["count"] += row["count"]
+
+        recipients_data = [
+            {
+                **data,
+                "preview_url": reverse(
+                    "admin:notifications_notification_preview_digest_detail",
+                    args=[recipient_id],
+                ),
+            }
+            for recipient_id, data in sorted(
+                by_recipient.items(), key=lambda x: x[1]["count"], reverse=True
             )
+        ]
 
         context = {
             **self.admin_site.each_context(request),
             "recipients": recipients_data,
-            "total_unsent": unsent.count(),
+            "total_unsent": sum(r["count"] for r in recipients_data),
             "opts": self.model._meta,  # noqa: SLF001
         }
         return render(
@@ -121,12 +132,7 @@ class NotificationAdmin(admin.ModelAdmin):
     ) -> HttpResponse:
         unsent = (
             Notification.objects.filter(recipient_id=recipient_id, sent=False)
-            .select_related(
-                "recipient",
-                "discussion",
-                "discussion__project",
-                "discussion__author",
-            )
+            .select_related("recipient", "project")
             .order_by("created_at")
         )
 
@@ -156,3 +162,19 @@ class NotificationAdmin(admin.ModelAdmin):
                 content_type="text/html",
             )
         return HttpResponse(html)
+
+
+@admin.register(ArchivedNotification)
+class ArchivedNotificationAdmin(admin.ModelAdmin):
+    list_display = ("recipient", "project", "comment_count", "cadence", "sent_at")
+    list_filter = ("cadence",)
+    search_fields = ("recipient__email",)
+    ordering = ("-sent_at",)
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        return False
+
+    def has_change_permission(
+        self, request: HttpRequest, obj: ArchivedNotification | None = None
+    ) -> bool:
+        return False
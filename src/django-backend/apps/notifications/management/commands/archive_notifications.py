@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services import HANDLERS
+
+
+class Command(BaseCommand):
+    help = (
+        "Move notifications sent more than NOTIFICATION_RETENTION_DAYS ago "
+        "into the archive table."
+    )
+
+    def handle(self, *args, **options) -> None:
+        archived = HANDLERS.notifications.archive_sent_notifications()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {archived} notifications sent more than "
+                f"{settings.NOTIFICATION_RETENTION_DAYS} days ago."
+            )
+        )
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestArchiveNotificationsCommand:
+    def test_runs_archive(self):
+        out = StringIO()
+        with patch(
+            "services.HANDLERS.notifications.archive_sent_notifications",
+            return_value=12,
+        ) as mock_archive:
+            call_command("archive_notifications", stdout=out)
+
+        mock_archive.assert_called_once_with()
+        assert "Archived 12 notifications" in out.getvalue()
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0001_initial"),
+        ("projects", "0028_add_projectimage_optimized_original"),
+    ]
+
+    operations = [
+        # Nullable until existing rows are backfilled in the next migration
+        migrations.AddField(
+            model_name="notification",
+            name="project",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="notifications",
+                to="projects.project",
+            ),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="comment_count",
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AddField(
+            model_name="notification",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+    ]
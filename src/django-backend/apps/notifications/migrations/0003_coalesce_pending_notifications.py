@@ -0,0 +1,43 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:13
+
+from itertools import groupby
+from operator import attrgetter
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def coalesce_pending(apps, schema_editor):
+    Discussion = apps.get_model("discussions", "Discussion")
+    Notification = apps.get_model("notifications", "Notification")
+
+    Notification.objects.update(
+        project_id=Subquery(
+            Discussion.objects.filter(id=OuterRef("discussion_id")).values("project_id")
+        )
+    )
+
+    # Fold duplicate pending rows into the newest one per recipient and project
+    pending = (
+        Notification.objects.filter(sent=False)
+        .exclude(cadence="immediate")
+        .order_by("recipient_id", "project_id", "cadence", "-created_at")
+    )
+    key = attrgetter("recipient_id", "project_id", "cadence")
+    for _, group in groupby(pending.iterator(), key=key):
+        newest, *older = group
+        if older:
+            newest.comment_count += len(older)
+            newest.save(update_fields=["comment_count"])
+            Notification.objects.filter(id__in=[n.id for n in older]).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("discussions", "0001_initial"),
+        ("notifications", "0002_add_notification_coalescing_fields"),
+    ]
+
+    operations = [
+        migrations.RunPython(coalesce_pending, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,100 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:14
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("discussions", "0001_initial"),
+        ("notifications", "0003_coalesce_pending_notifications"),
+        ("projects", "0028_add_projectimage_optimized_original"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedNotification",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                (
+                    "cadence",
+                    models.CharField(
+                        choices=[
+                            ("immediate", "Every Time"),
+                            ("hourly", "At most every hour"),
+                            ("daily", "At most every day"),
+                            ("never", "Never"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("comment_count", models.PositiveIntegerField()),
+                ("created_at", models.DateTimeField()),
+                ("sent_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "notifications_archive",
+                "ordering": ["-sent_at"],
+            },
+        ),
+        migrations.AlterField(
+            model_name="notification",
+            name="project",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="notifications",
+                to="projects.project",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("sent", False)),
+                fields=["cadence", "recipient"],
+                name="notifications_pending_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="notification",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("sent", False), models.Q(("cadence", "immediate"), _negated=True)
+                ),
+                fields=("recipient", "project", "cadence"),
+                name="notifications_one_pending_per_project",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivednotification",
+            name="discussion",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="discussions.discussion",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivednotification",
+            name="project",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to="projects.project",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivednotification",
+            name="recipient",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
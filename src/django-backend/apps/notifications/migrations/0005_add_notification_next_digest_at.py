@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-19 09:40
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def schedule_pending(apps, schema_editor):
+    # Rows already waiting go out with the first sweep after deploy
+    Notification = apps.get_model("notifications", "Notification")
+    Notification.objects.filter(sent=False, cadence__in=["hourly", "daily"]).update(
+        next_digest_at=timezone.now()
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0004_add_notification_pending_constraints"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="next_digest_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("sent", False)),
+                fields=["next_digest_at"],
+                name="notifications_due_idx",
+            ),
+        ),
+        migrations.RunPython(schedule_pending, migrations.RunPython.noop),
+    ]
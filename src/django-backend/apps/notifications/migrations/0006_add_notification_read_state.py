@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:05
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_delivered_read(apps, schema_editor):
+    # Notifications already emailed predate the feed; don't badge them as new
+    Notification = apps.get_model("notifications", "Notification")
+    Notification.objects.filter(sent=True).update(read_at=F("sent_at"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0005_add_notification_next_digest_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="notification",
+            name="read_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["recipient", "-updated_at", "-id"],
+                name="notifications_feed_idx",
+            ),
+        ),
+        migrations.RunPython(mark_delivered_read, migrations.RunPython.noop),
+    ]
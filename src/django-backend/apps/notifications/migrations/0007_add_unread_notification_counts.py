@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-19 15:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("notifications", "0006_add_notification_read_state"),
+        ("users", "0012_set_all_users_notification_immediate"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UnreadNotificationCount",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("count", models.IntegerField()),
+                ("counted_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "notification_unread_counts",
+            },
+        ),
+    ]
@@ -18,6 +18,12 @@ class Notification(models.Model):
         on_delete=models.CASCADE,
         related_name="notifications",
     )
+    project = models.ForeignKey(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        related_name="notifications",
+    )
+    # Latest comment folded into this notification
     discussion = models.ForeignKey(
         "discussions.Discussion",
         on_delete=models.CASCADE,
@@ -27,13 +33,105 @@ class Notification(models.Model):
         max_length=20,
         choices=NotificationCadence.choices,
     )
+    # Comments on the project coalesced into this row while it was unsent
+    comment_count = models.PositiveIntegerField(default=1)
     sent = models.BooleanField(default=False)
+    # Seen in the in-app feed; cleared again when a new comment is coalesced
+    read_at = models.DateTimeField(null=True, blank=True)
+    # The recipient's digest slot this row goes out in; null for immediate
+    next_digest_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     sent_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "notifications"
         ordering = ["-created_at"]
+        constraints = [
+            # Batched cadences keep one pending row per recipient and project
+            models.UniqueConstraint(
+                fields=["recipient", "project", "cadence"],
+                condition=models.Q(sent=False)
+                & ~models.Q(cadence=NotificationCadence.IMMEDIATE),
+                name="notifications_one_pending_per_project",
+            ),
+        ]
+        indexes = [
+            # Digest runs scan pending rows by cadence in recipient order
+            models.Index(
+                fields=["cadence", "recipient"],
+                condition=models.Q(sent=False),
+                name="notifications_pending_idx",
+            ),
+            # In-app feed, latest activity first
+            models.Index(
+                fields=["recipient", "-updated_at", "-id"],
+                name="notifications_feed_idx",
+            ),
+            # Digest sweeps pick pending rows whose slot has come round
+            models.Index(
+                fields=["next_digest_at"],
+                condition=models.Q(sent=False),
+                name="notifications_due_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Notification for {self.recipient} re: {self.discussion_id}"
+
+
+class UnreadNotificationCount(models.Model):
+    """A user's unread notification count, so reads don't COUNT notifications.
+
+    Kept in the database rather than a cache because the workers that write
+    notifications are not the ones serving the count.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="+",
+    )
+    count = models.IntegerField()
+    # When ``count`` was last recounted; adjustments leave it alone
+    counted_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "notification_unread_counts"
+
+    def __str__(self) -> str:
+        return f"{self.count} unread for {self.user_id}"
+
+
+class ArchivedNotification(models.Model):
+    """Sent notification moved out of the live table by the retention job."""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    project = models.ForeignKey(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    discussion = models.ForeignKey(
+        "discussions.Discussion",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    cadence = models.CharField(max_length=20, choices=NotificationCadence.choices)
+    comment_count = models.PositiveIntegerField()
+    created_at = models.DateTimeField()
+    sent_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "notifications_archive"
+        ordering = ["-sent_at"]
+
+    def __str__(self) -> str:
+        return f"Archived notification for {self.recipient_id} re: {self.project_id}"
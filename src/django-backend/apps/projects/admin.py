@@ -13,16 +13,19 @@ from django.utils.safestring import mark_safe
 
 from api.tasks import email as email_tasks
 from api.tasks import web_ui as web_ui_tasks
+from apps.tags.models import CatalogueScope, TagCatalogueVersion
 
 from .models import (
     Competition,
     CompetitionReviewer,
+    ImageDerivative,
     ImageVariant,
     Project,
     ProjectImage,
     ProjectRanking,
     ProjectStatus,
     ProjectView,
+    VariantSize,
 )
 
 if TYPE_CHECKING:
@@ -200,6 +203,8 @@ class ProjectAdmin(admin.ModelAdmin):
             approved_by=request.user,
             approved_at=timezone.now(),
         )
+        # update() skips the save signal that normally bumps the version
+        TagCatalogueVersion.bump(CatalogueScope.PROJECTS)
         for project in pending:
             try:
                 email_tasks.send_project_approved_email.enqueue(str(project.id))
@@ -283,6 +288,35 @@ class ImageVariantInline(admin.TabularInline):
         return False
 
 
+class ImageDerivativeInline(admin.TabularInline):
+    model = ImageDerivative
+    extra = 0
+    fields = (
+        "width",
+        "format",
+        "height",
+        "file_size",
+        "storage_key",
+        "claimed_at",
+        "created_at",
+    )
+    readonly_fields = fields
+
+    def has_add_permission(
+        self,
+        request: HttpRequest,
+        obj: ProjectImage | None = None,
+    ) -> bool:
+        return False
+
+    def has_delete_permission(
+        self,
+        request: HttpRequest,
+        obj: ProjectImage | None = None,
+    ) -> bool:
+        return False
+
+
 @admin.register(ProjectImage)
 class ProjectImageAdmin(admin.ModelAdmin):
     list_display = (
@@ -299,13 +333,15 @@ class ProjectImageAdmin(admin.ModelAdmin):
     list_filter = ("is_main", "upload_status", "content_type", "created_at")
     search_fields = ("original_filename", "project__title", "project__owner__email")
     ordering = ("-created_at",)
-    inlines = (ImageVariantInline,)
+    inlines = (ImageVariantInline, ImageDerivativeInline)
     readonly_fields = (
         "id",
         "thumbnail_large",
         "storage_key",
+        "optimized_key",
         "content_type",
         "file_size",
+        "optimized_file_size",
         "width",
         "height",
         "created_at",
@@ -315,7 +351,14 @@ class ProjectImageAdmin(admin.ModelAdmin):
     fieldsets = (
         (
             "Image",
-            {"fields": ("thumbnail_large", "original_filename", "storage_key")},
+            {
+                "fields": (
+                    "thumbnail_large",
+                    "original_filename",
+                    "storage_key",
+                    "optimized_key",
+                )
+            },
         ),
         (
             "Project",
@@ -323,7 +366,15 @@ class ProjectImageAdmin(admin.ModelAdmin):
         ),
         (
             "File Info",
-            {"fields": ("content_type", "file_size", "width", "height")},
+            {
+                "fields": (
+                    "content_type",
+                    "file_size",
+                    "optimized_file_size",
+                    "width",
+                    "height",
+                )
+            },
         ),
         (
             "Status",
@@ -435,7 +486,7 @@ class CompetitionAdmin(admin.ModelAdmin):
         if obj.image:
             return format_html(
                 '<img src="{}" style="max-height: 50px; max-width: 80px;" />',
-                obj.image.url,
+                obj.image_variant_url(VariantSize.THUMB),
             )
         return mark_safe('<span style="color: #999;">No image</span>')
 
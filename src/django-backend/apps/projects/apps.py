@@ -6,13 +6,25 @@ class ProjectsConfig(AppConfig):
     name = "apps.projects"
 
     def ready(self) -> None:
-        from django.db.models.signals import post_delete, post_save  # noqa: PLC0415
+        from django.db.models.signals import (  # noqa: PLC0415
+            post_delete,
+            post_save,
+            pre_delete,
+        )
 
-        from apps.projects.models import Project  # noqa: PLC0415
+        from apps.projects.models import (  # noqa: PLC0415
+            Competition,
+            Project,
+            ProjectImage,
+        )
         from apps.projects.signals import (  # noqa: PLC0415
+            on_competition_saved,
             on_project_deleted,
+            on_project_image_deleting,
             on_project_saved,
         )
 
         post_save.connect(on_project_saved, sender=Project)
         post_delete.connect(on_project_deleted, sender=Project)
+        pre_delete.connect(on_project_image_deleting, sender=ProjectImage)
+        post_save.connect(on_competition_saved, sender=Competition)
@@ -1,53 +1,105 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
 
 from django.core.management.base import BaseCommand
-from django.db.models import Count
+from django.db.models import Count, Q
 
+from apps.emails.models import BroadcastEmailImage
 from apps.projects.models import (
+    Competition,
     ProjectImage,
     UploadStatus,
     VariantSize,
 )
 from services import HANDLERS
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from django.db.models import Model
+
 logger = logging.getLogger(__name__)
 
 
 class Command(BaseCommand):
-    help = "Generate missing image variants for all uploaded project images."
+    help = (
+        "Generate missing image variants and optimized originals for all "
+        "uploaded project images, and variants for competition and broadcast "
+        "email images that lack them."
+    )
 
     def handle(self, *args, **options) -> None:
         all_sizes = list(VariantSize)
         expected_count = len(all_sizes)
 
-        # Find uploaded images that are missing at least one expected variant.
+        # Find uploaded images that are missing at least one expected variant
+        # or an optimized original.
         # We can't filter on "missing for original width" here because that
         # depends on per-image width, so we grab all images with fewer than
         # the max possible variants and let the handler skip sizes that don't
         # apply (>= original width) or already exist.
         images = (
             ProjectImage.objects.filter(upload_status=UploadStatus.UPLOADED)
-            .annotate(variant_count=Count("variants"))
-            .filter(variant_count__lt=expected_count)
+            .annotate(
+                variant_count=Count(
+                    "variants", filter=Q(variants__size__in=VariantSize.values)
+                )
+            )
+            .filter(Q(variant_count__lt=expected_count) | Q(optimized_key=""))
             .order_by("created_at")
         )
 
-        total = images.count()
+        self._process("project images", images, HANDLERS.image.generate_variants)
+
+        # Competition and broadcast images keep their variants in a JSON
+        # field, so whether they are current is only known per row. Images
+        # uploaded before variants existed are picked up here; new uploads
+        # are handled by the post_save signals.
+        competitions = [
+            competition
+            for competition in Competition.objects.order_by("created_at")
+            if competition.needs_image_variants
+        ]
+        self._process(
+            "competition images",
+            competitions,
+            HANDLERS.image.generate_competition_variants,
+        )
+
+        broadcast_images = [
+            image
+            for image in BroadcastEmailImage.objects.order_by("created_at")
+            if image.needs_variants
+        ]
+        self._process(
+            "broadcast email images",
+            broadcast_images,
+            HANDLERS.image.generate_broadcast_image_variants,
+        )
+
+    def _process(
+        self,
+        label: str,
+        rows: Iterable[Model],
+        generate: Callable[[str], None],
+    ) -> None:
+        rows = list(rows)
+        total = len(rows)
         if total == 0:
-            self.stdout.write("No images need variant generation.")
+            self.stdout.write(f"No {label} need variant generation.")
             return
 
-        self.stdout.write(f"Processing {total} images...")
+        self.stdout.write(f"Processing {total} {label}...")
 
-        for i, image in enumerate(images, start=1):
+        for i, row in enumerate(rows, start=1):
             try:
-                HANDLERS.image.generate_variants(str(image.id))
+                generate(str(row.id))
             except Exception:
-                logger.exception("Failed to process image %s", image.id)
+                logger.exception("Failed to process %s %s", label, row.id)
 
             if i % 10 == 0 or i == total:
                 self.stdout.write(f"  {i}/{total} processed")
 
-        self.stdout.write(self.style.SUCCESS(f"Done. Processed {total} images."))
+        self.stdout.write(self.style.SUCCESS(f"Done. Processed {total} {label}."))
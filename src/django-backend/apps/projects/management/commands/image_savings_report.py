@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Q, Sum
+
+from apps.projects.models import ProjectImage, UploadStatus
+
+
+def _megabytes(num_bytes: int) -> str:
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+class Command(BaseCommand):
+    help = "Report storage bytes saved by serving optimized originals."
+
+    def handle(self, *args, **options) -> None:
+        totals = ProjectImage.objects.filter(
+            upload_status=UploadStatus.UPLOADED
+        ).aggregate(
+            pending=Count("id", filter=Q(optimized_key="")),
+            optimized=Count("id", filter=~Q(optimized_key="")),
+            original_bytes=Sum("file_size", filter=~Q(optimized_key="")),
+            served_bytes=Sum("optimized_file_size", filter=~Q(optimized_key="")),
+        )
+
+        original = totals["original_bytes"] or 0
+        served = totals["served_bytes"] or 0
+        saved = original - served
+        percent = 100 * saved / original if original else 0
+
+        self.stdout.write(f"Optimized images: {totals['optimized']}")
+        self.stdout.write(f"Original bytes:   {_megabytes(original)}")
+        self.stdout.write(f"Served bytes:     {_megabytes(served)}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Saved:            {_megabytes(saved)} ({percent:.1f}%)"
+            )
+        )
+        if totals["pending"]:
+            self.stdout.write(
+                f"{totals['pending']} images not optimized yet; "
+                "run generate_image_variants to backfill them."
+            )
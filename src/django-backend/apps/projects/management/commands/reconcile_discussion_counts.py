@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from services import HANDLERS
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount each project's discussions and latest comment time, fixing "
+        "any that have drifted from the discussions table."
+    )
+
+    def handle(self, *args, **options) -> None:
+        repaired = HANDLERS.discussions.reconcile_activity_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"Repaired discussion counts on {repaired} projects.")
+        )
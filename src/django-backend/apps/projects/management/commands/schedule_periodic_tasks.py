@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from api.tasks.images import sweep_storage
+from api.tasks.notifications import archive_sent_notifications, send_due_digests
+from api.tasks.scheduling import is_queued
+from api.tasks.streams import prune_stream_events
+
+# Each of these queues its own next run; see api.tasks.scheduling
+PERIODIC_TASKS = (
+    send_due_digests,
+    archive_sent_notifications,
+    prune_stream_events,
+    sweep_storage,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue a run of every periodic task that has none waiting. Safe to "
+        "run on every deploy."
+    )
+
+    def handle(self, *args, **options) -> None:
+        for task in PERIODIC_TASKS:
+            if is_queued(task):
+                self.stdout.write(f"{task.name} already queued.")
+            else:
+                task.enqueue()
+                self.stdout.write(f"Queued {task.name}.")
+        self.stdout.write(self.style.SUCCESS("Periodic tasks scheduled."))
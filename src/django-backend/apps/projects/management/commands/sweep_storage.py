@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from services import HANDLERS
+
+
+class Command(BaseCommand):
+    help = (
+        "Expire abandoned uploads, delete storage objects no image references "
+        "and flush queued deletions."
+    )
+
+    def handle(self, *args, **options) -> None:
+        expired = HANDLERS.image.expire_stale_uploads()
+        self.stdout.write(f"Expired {expired} stale or failed uploads.")
+
+        orphaned = HANDLERS.image.sweep_orphaned_objects()
+        self.stdout.write(f"Deleted {orphaned} orphaned objects.")
+
+        flushed = HANDLERS.image.flush_storage_deletions()
+        self.stdout.write(self.style.SUCCESS(f"Flushed {flushed} queued deletions."))
@@ -5,8 +5,13 @@ from unittest.mock import patch
 import pytest
 from django.core.management import call_command
 
-from apps.projects.models import ImageVariant, UploadStatus, VariantSize
-from tests.factories import ProjectImageFactory
+from apps.emails.models import BroadcastEmailImage
+from apps.projects.models import Competition, ImageVariant, UploadStatus, VariantSize
+from tests.factories import (
+    BroadcastEmailImageFactory,
+    CompetitionFactory,
+    ProjectImageFactory,
+)
 
 
 @pytest.mark.django_db
@@ -37,7 +42,10 @@ class TestGenerateImageVariantsCommand:
 
     def test_idempotent_skips_images_with_all_variants(self):
         image = ProjectImageFactory(
-            width=4000, height=2250, upload_status=UploadStatus.UPLOADED
+            width=4000,
+            height=2250,
+            upload_status=UploadStatus.UPLOADED,
+            optimized_key="projects/test/optimized.jpg",
         )
         # Pre-create all 3 variants
         for size in VariantSize:
@@ -55,6 +63,25 @@ class TestGenerateImageVariantsCommand:
 
         mock_gen.assert_not_called()
 
+    def test_processes_images_without_optimized_original(self):
+        image = ProjectImageFactory(
+            width=4000, height=2250, upload_status=UploadStatus.UPLOADED
+        )
+        for size in VariantSize:
+            ImageVariant.objects.create(
+                image=image,
+                size=size,
+                storage_key=f"projects/test/{size}.webp",
+                width=100,
+                height=100,
+                file_size=1000,
+            )
+
+        with patch("services.HANDLERS.image.generate_variants") as mock_gen:
+            call_command("generate_image_variants")
+
+        mock_gen.assert_called_once_with(str(image.id))
+
     def test_processes_images_with_partial_variants(self):
         image = ProjectImageFactory(
             width=4000, height=2250, upload_status=UploadStatus.UPLOADED
@@ -95,3 +122,41 @@ class TestGenerateImageVariantsCommand:
 
         # Both should have been attempted despite the first failing
         assert mock_gen.call_count == 2
+
+    def test_backfills_competition_images_without_current_variants(self):
+        stale = CompetitionFactory()
+        current = CompetitionFactory()
+        CompetitionFactory()  # no image
+        Competition.objects.filter(id=stale.id).update(
+            image="competitions/old.png",
+            image_variants={"thumb": {"source": "competitions/older.png"}},
+        )
+        Competition.objects.filter(id=current.id).update(
+            image="competitions/new.png",
+            image_variants={"thumb": {"source": "competitions/new.png"}},
+        )
+
+        with (
+            patch("services.HANDLERS.image.generate_variants"),
+            patch("services.HANDLERS.image.generate_competition_variants") as mock_gen,
+        ):
+            call_command("generate_image_variants")
+
+        mock_gen.assert_called_once_with(str(stale.id))
+
+    def test_backfills_broadcast_images_without_current_variants(self):
+        stale = BroadcastEmailImageFactory()
+        current = BroadcastEmailImageFactory()
+        BroadcastEmailImage.objects.filter(id=current.id).update(
+            variants={"email": {"source": current.image.name}}
+        )
+
+        with (
+            patch("services.HANDLERS.image.generate_variants"),
+            patch(
+                "services.HANDLERS.image.generate_broadcast_image_variants"
+            ) as mock_gen,
+        ):
+            call_command("generate_image_variants")
+
+        mock_gen.assert_called_once_with(str(stale.id))
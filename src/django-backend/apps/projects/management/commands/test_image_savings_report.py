@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.projects.models import UploadStatus
+from tests.factories import ProjectImageFactory
+
+MB = 1024 * 1024
+
+
+@pytest.mark.django_db
+class TestImageSavingsReportCommand:
+    def test_reports_bytes_saved(self):
+        ProjectImageFactory(
+            file_size=8 * MB,
+            optimized_key="a/optimized.jpg",
+            optimized_file_size=2 * MB,
+        )
+        ProjectImageFactory(
+            file_size=2 * MB, optimized_key="b/optimized.webp", optimized_file_size=MB
+        )
+        ProjectImageFactory(file_size=5 * MB, optimized_key="")
+        ProjectImageFactory(
+            file_size=9 * MB, upload_status=UploadStatus.PENDING, optimized_key=""
+        )
+
+        out = StringIO()
+        call_command("image_savings_report", stdout=out)
+
+        output = out.getvalue()
+        assert "Optimized images: 2" in output
+        assert "Original bytes:   10.0 MB" in output
+        assert "Served bytes:     3.0 MB" in output
+        assert "Saved:            7.0 MB (70.0%)" in output
+        assert "1 images not optimized yet" in output
+
+    def test_empty_bucket(self):
+        out = StringIO()
+        call_command("image_savings_report", stdout=out)
+
+        assert "Saved:            0.0 MB (0.0%)" in out.getvalue()
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestReconcileDiscussionCountsCommand:
+    def test_reports_repaired_projects(self):
+        out = StringIO()
+        with patch(
+            "services.HANDLERS.discussions.reconcile_activity_counts", return_value=3
+        ) as mock_reconcile:
+            call_command("reconcile_discussion_counts", stdout=out)
+
+        mock_reconcile.assert_called_once_with()
+        assert "Repaired discussion counts on 3 projects" in out.getvalue()
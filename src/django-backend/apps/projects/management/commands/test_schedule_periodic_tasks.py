@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django_tasks_db.models import DBTaskResult
+
+
+@pytest.fixture(autouse=True)
+def _database_task_backend(settings):
+    settings.TASKS = {
+        "default": {"BACKEND": "django_tasks_db.backend.DatabaseBackend"},
+    }
+
+
+@pytest.mark.django_db
+class TestSchedulePeriodicTasksCommand:
+    def test_queues_each_periodic_task_once(self):
+        call_command("schedule_periodic_tasks", stdout=StringIO())
+        out = StringIO()
+        call_command("schedule_periodic_tasks", stdout=out)
+
+        assert sorted(DBTaskResult.objects.values_list("task_path", flat=True)) == [
+            "api.tasks.images.sweep_storage",
+            "api.tasks.notifications.archive_sent_notifications",
+            "api.tasks.notifications.send_due_digests",
+            "api.tasks.streams.prune_stream_events",
+        ]
+        assert "prune_stream_events already queued" in out.getvalue()
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestSweepStorageCommand:
+    def test_runs_expiry_sweep_and_flush(self):
+        out = StringIO()
+        with (
+            patch(
+                "services.HANDLERS.image.expire_stale_uploads", return_value=2
+            ) as mock_expire,
+            patch(
+                "services.HANDLERS.image.sweep_orphaned_objects", return_value=5
+            ) as mock_sweep,
+            patch(
+                "services.HANDLERS.image.flush_storage_deletions", return_value=7
+            ) as mock_flush,
+        ):
+            call_command("sweep_storage", stdout=out)
+
+        mock_expire.assert_called_once_with()
+        mock_sweep.assert_called_once_with()
+        mock_flush.assert_called_once_with()
+        output = out.getvalue()
+        assert "Expired 2" in output
+        assert "Deleted 5" in output
+        assert "Flushed 7" in output
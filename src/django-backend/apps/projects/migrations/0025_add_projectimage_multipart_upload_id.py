@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0024_add_image_content_hash"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectimage",
+            name="multipart_upload_id",
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
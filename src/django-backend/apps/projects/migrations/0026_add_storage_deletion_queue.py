@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:05
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0025_add_projectimage_multipart_upload_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StorageDeletion",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("storage_key", models.CharField(max_length=500)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "storage_deletions",
+                "ordering": ["created_at"],
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0026_add_storage_deletion_queue"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="competition",
+            name="image_variants",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0027_add_competition_image_variants"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="projectimage",
+            name="optimized_file_size",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="projectimage",
+            name="optimized_key",
+            field=models.CharField(blank=True, max_length=500),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0028_add_projectimage_optimized_original"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="discussion_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="project",
+            name="last_activity_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:41
+
+from django.db import migrations
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_activity(apps, schema_editor):
+    Discussion = apps.get_model("discussions", "Discussion")
+    Project = apps.get_model("projects", "Project")
+
+    comments = (
+        Discussion.objects.filter(project=OuterRef("pk")).order_by().values("project")
+    )
+    Project.objects.update(
+        discussion_count=Coalesce(
+            Subquery(comments.annotate(n=Count("id")).values("n")), 0
+        ),
+        last_activity_at=Subquery(
+            comments.annotate(latest=Max("created_at")).values("latest")
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("discussions", "0004_backfill_discussion_participants"),
+        ("projects", "0029_add_project_discussion_activity"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 6.0.1 on 2026-10-19 14:02
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0030_backfill_project_discussion_activity"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImageDerivative",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "width",
+                    models.PositiveIntegerField(
+                        choices=[
+                            (96, "96w"),
+                            (192, "192w"),
+                            (320, "320w"),
+                            (384, "384w"),
+                            (480, "480w"),
+                            (640, "640w"),
+                            (768, "768w"),
+                            (960, "960w"),
+                            (1200, "1200w"),
+                            (1536, "1536w"),
+                            (1920, "1920w"),
+                            (2048, "2048w"),
+                        ]
+                    ),
+                ),
+                (
+                    "format",
+                    models.CharField(
+                        choices=[("webp", "WebP"), ("jpg", "JPEG")], max_length=4
+                    ),
+                ),
+                ("storage_key", models.CharField(blank=True, max_length=500)),
+                ("height", models.PositiveIntegerField(default=0)),
+                ("file_size", models.PositiveIntegerField(default=0)),
+                ("claimed_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "image",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="derivatives",
+                        to="projects.projectimage",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "project_image_derivatives",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("image", "width", "format"),
+                        name="project_image_derivatives_unique",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -69,6 +69,11 @@ class Project(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Kept in step by the discussions handler; reconcile_discussion_counts
+    # repairs any drift. last_activity_at is the newest comment's time.
+    discussion_count = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(blank=True, null=True)
+
     # Foreign Keys
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -143,6 +148,12 @@ class ProjectImage(models.Model):
     # Image metadata
     width = models.PositiveIntegerField(null=True, blank=True)
     height = models.PositiveIntegerField(null=True, blank=True)
+    # SHA-256 of the uploaded bytes, set once the image task has processed it
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    # Re-encoded copy served in place of the upload, which is kept for archival.
+    # Equal to storage_key when re-encoding would not have helped.
+    optimized_key = models.CharField(max_length=500, blank=True)
+    optimized_file_size = models.PositiveIntegerField(null=True, blank=True)
 
     # Ordering and main image tracking
     is_main = models.BooleanField(default=False)
@@ -154,6 +165,8 @@ class ProjectImage(models.Model):
         choices=UploadStatus.choices,
         default=UploadStatus.PENDING,
     )
+    # Set while a large file is being uploaded in parts
+    multipart_upload_id = models.CharField(max_length=255, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     uploaded_at = models.DateTimeField(null=True, blank=True)
@@ -168,9 +181,50 @@ class ProjectImage(models.Model):
     @property
     def url(self) -> str:
         """Returns the public URL for this image."""
+        return f"{settings.S3_PUBLIC_URL_BASE}/{self.optimized_key or self.storage_key}"
+
+    @property
+    def original_url(self) -> str:
+        """Returns the public URL of the upload exactly as received."""
         return f"{settings.S3_PUBLIC_URL_BASE}/{self.storage_key}"
 
 
+class ImageBlob(models.Model):
+    """Content-addressed index of uploaded image bytes.
+
+    Images with identical content share one stored original (and its variants).
+    ``ref_count`` tracks how many ProjectImage rows point at the blob so storage
+    is only released when the last reference goes.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    content_hash = models.CharField(max_length=64, unique=True)
+    storage_key = models.CharField(max_length=500)
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "project_image_blobs"
+
+    def __str__(self) -> str:
+        return f"{self.content_hash[:12]} ({self.ref_count} refs)"
+
+
+class StorageDeletion(models.Model):
+    """A storage object queued for removal by the batched delete task."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    storage_key = models.CharField(max_length=500)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "storage_deletions"
+        ordering = ["created_at"]
+
+    def __str__(self) -> str:
+        return self.storage_key
+
+
 class VariantSize(models.TextChoices):
     THUMB = "thumb", "Thumb (384w)"
     MEDIUM = "medium", "Medium (768w)"
@@ -213,6 +267,53 @@ class ImageVariant(models.Model):
         return f"{settings.S3_PUBLIC_URL_BASE}/{self.storage_key}"
 
 
+# Widths served by the on-demand resize endpoint. Requests snap up to the next
+# one so the number of stored derivatives per image stays bounded.
+DERIVATIVE_WIDTHS = (96, 192, 320, 384, 480, 640, 768, 960, 1200, 1536, 1920, 2048)
+
+
+class DerivativeFormat(models.TextChoices):
+    WEBP = "webp", "WebP"
+    JPG = "jpg", "JPEG"
+
+
+class ImageDerivative(models.Model):
+    """A resized copy of a ProjectImage made on first request by /api/img."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    image = models.ForeignKey(
+        ProjectImage,
+        on_delete=models.CASCADE,
+        related_name="derivatives",
+    )
+    width = models.PositiveIntegerField(
+        choices=[(width, f"{width}w") for width in DERIVATIVE_WIDTHS]
+    )
+    format = models.CharField(max_length=4, choices=DerivativeFormat.choices)
+    # Blank while the worker that claimed the derivative is still encoding it
+    storage_key = models.CharField(max_length=500, blank=True)
+    height = models.PositiveIntegerField(default=0)
+    file_size = models.PositiveIntegerField(default=0)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "project_image_derivatives"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["image", "width", "format"],
+                name="project_image_derivatives_unique",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.image.original_filename} - w{self.width}.{self.format}"
+
+    @property
+    def url(self) -> str:
+        return f"{settings.S3_PUBLIC_URL_BASE}/{self.storage_key}"
+
+
 class CompetitionStatus(models.TextChoices):
     PENDING = "pending", "Pending"
     ACCEPTING_APPLICATIONS = "accepting_applications", "Accepting Applications"
@@ -233,6 +334,8 @@ class Competition(models.Model):
     quote = models.TextField(blank=True, null=True)
     prize_amount = models.IntegerField(default=50000, null=True, blank=True)
     image = models.ImageField(upload_to=competition_image_path, blank=True, null=True)
+    # size -> {"name", "width", "height", "source"}, written by the image task
+    image_variants = models.JSONField(default=dict, blank=True)
     projects = models.ManyToManyField(Project, related_name="competitions", blank=True)
     winner = models.ForeignKey(
         Project,
@@ -267,9 +370,25 @@ class Competition(models.Model):
     @property
     def image_url(self) -> str | None:
         """Returns the public URL for the competition image."""
-        if self.image:
-            return self.image.url
-        return None
+        return self.image_variant_url(VariantSize.LARGE)
+
+    def image_variant_url(self, size: str) -> str | None:
+        """URL of a WebP size variant, falling back to the uploaded image."""
+        if not self.image:
+            return None
+        variant = self.image_variants.get(size)
+        if variant and variant["source"] == self.image.name:
+            return self.image.storage.url(variant["name"])
+        return self.image.url
+
+    @property
+    def needs_image_variants(self) -> bool:
+        if not self.image:
+            return False
+        return not any(
+            variant["source"] == self.image.name
+            for variant in self.image_variants.values()
+        )
 
 
 class ReviewStatus(models.TextChoices):
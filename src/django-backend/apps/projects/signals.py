@@ -3,10 +3,13 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+from django.db import transaction
+
+from api.tasks.images import generate_competition_image_variants
 from api.tasks.web_ui import revalidate_project
 
 if TYPE_CHECKING:
-    from apps.projects.models import Project
+    from apps.projects.models import Competition, Project, ProjectImage
 
 logger = logging.getLogger(__name__)
 
@@ -23,3 +26,25 @@ def on_project_deleted(sender: type, instance: Project, **kwargs: Any) -> None:
         revalidate_project.enqueue(str(instance.id))
     except Exception:
         logger.exception("Failed to enqueue revalidation for project %s", instance.id)
+
+
+def on_project_image_deleting(
+    sender: type, instance: ProjectImage, **kwargs: Any
+) -> None:
+    # Before the delete, while its variants can still be read. Runs for
+    # admin and cascading deletes as well, and in their transaction
+    from services import HANDLERS  # noqa: PLC0415
+
+    HANDLERS.image.release_storage(instance)
+
+
+def on_competition_saved(sender: type, instance: Competition, **kwargs: Any) -> None:
+    if not instance.needs_image_variants:
+        return
+    competition_id = str(instance.id)
+    # Enqueued after commit so the task sees the new image. A queue outage
+    # only leaves the banner serving its original until the variants are
+    # backfilled, so it is logged rather than raised out of the save.
+    transaction.on_commit(
+        lambda: generate_competition_image_variants.enqueue(competition_id), robust=True
+    )
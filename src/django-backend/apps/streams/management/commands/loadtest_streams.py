@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import resource
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager, suppress
+from pathlib import Path
+from statistics import quantiles
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api.auth.jwt import create_access_token
+from apps.emails.management.commands.benchmark_email_pipeline import _git_commit
+from apps.projects.models import Project, ProjectStatus
+from apps.streams.models import StreamEvent
+from apps.users.models import User
+from services.streams.django_impl import project_channel, publish
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from django.core.management.base import CommandParser
+
+LOADTEST_EVENT = "loadtest.ping"
+SERVER_START_TIMEOUT = 30.0
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _raise_open_file_limit(connections: int) -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = connections + 256
+    if soft < wanted:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(wanted, hard), hard))
+
+
+def _rss_mb(pid: int) -> float | None:
+    try:
+        status = Path(f"/proc/{pid}/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return round(int(line.split()[1]) / 1024, 1)
+    return None
+
+
+@contextmanager
+def _asgi_server(connections: int) -> Iterator[tuple[str, int, int]]:
+    """Run a single uvicorn worker on a free port, sharing this database."""
+    port = _free_port()
+    server = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "project_showcase.asgi:application",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--backlog",
+            str(connections),
+        ],
+        cwd=settings.BASE_DIR,
+    )
+    try:
+        deadline = time.monotonic() + SERVER_START_TIMEOUT
+        while True:
+            if server.poll() is not None:
+                msg = "ASGI server exited during startup; is uvicorn installed?"
+                raise CommandError(msg)
+            with suppress(OSError), socket.create_connection(("127.0.0.1", port)):
+                break
+            if time.monotonic() > deadline:
+                msg = "ASGI server did not start"
+                raise CommandError(msg)
+            time.sleep(0.1)
+        yield "127.0.0.1", port, server.pid
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def _connect(
+    host: str, port: int, path: str, token: str
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    reader, writer = await asyncio.open_connection(host, port, limit=2**16)
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAuthorization: Bearer {token}\r\n"
+        "Accept: text/event-stream\r\n\r\n".encode()
+    )
+    await writer.drain()
+    status = await reader.readline()
+    if b" 200 " not in status:
+        writer.close()
+        msg = f"Stream request failed: {status.decode().strip()}"
+        raise ConnectionError(msg)
+    # Headers, then the retry line the server sends once subscribed
+    while (await reader.readline()).strip():
+        pass
+    while not (await reader.readline()).startswith(b"retry:"):
+        pass
+    return reader, writer
+
+
+async def _receive(
+    reader: asyncio.StreamReader, expected: int, latencies: dict[int, list[float]]
+) -> None:
+    received = 0
+    while received < expected:
+        line = await reader.readline()
+        if not line:
+            return
+        if line.startswith(b"data:"):
+            data = json.loads(line[5:])
+            latencies[data["seq"]].append(time.time() - data["sent_at"])
+            received += 1
+
+
+def _summary_ms(values: list[float]) -> dict[str, float]:
+    if len(values) < 2:  # noqa: PLR2004
+        values = values * 2 or [0.0, 0.0]
+    percentiles = quantiles(values, n=100, method="inclusive")
+    return {
+        "p50": round(percentiles[49] * 1000, 1),
+        "p95": round(percentiles[94] * 1000, 1),
+        "p99": round(percentiles[98] * 1000, 1),
+        "max": round(max(values) * 1000, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Hold many idle event-stream connections open on one ASGI worker, then "
+        "publish events and measure how long each takes to reach every client."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--connections", type=int, default=1000)
+        parser.add_argument("--events", type=int, default=10)
+        parser.add_argument(
+            "--interval", type=float, default=1.0, help="Seconds between events"
+        )
+        parser.add_argument(
+            "--url",
+            help="Use a running server instead of starting a uvicorn worker",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            default=settings.BASE_DIR / "benchmarks" / "stream_fanout.json",
+        )
+
+    async def _run(
+        self, host: str, port: int, token: str, project_id: uuid.UUID, options: dict
+    ) -> dict:
+        path = f"/api/projects/{project_id}/discussions/stream"
+        start = time.perf_counter()
+        attempts = await asyncio.gather(
+            *(_connect(host, port, path, token) for _ in range(options["connections"])),
+            return_exceptions=True,
+        )
+        connect_seconds = time.perf_counter() - start
+        clients = [c for c in attempts if not isinstance(c, BaseException)]
+        failures = {repr(c) for c in attempts if isinstance(c, BaseException)}
+        for failure in sorted(failures)[:3]:
+            self.stderr.write(f"Connection failed: {failure}")
+
+        latencies: dict[int, list[float]] = {
+            seq: [] for seq in range(options["events"])
+        }
+        receivers = [
+            asyncio.create_task(_receive(reader, options["events"], latencies))
+            for reader, _ in clients
+        ]
+        for seq in range(options["events"]):
+            await sync_to_async(publish)(
+                [project_channel(project_id)],
+                LOADTEST_EVENT,
+                {"seq": seq, "sent_at": time.time()},
+            )
+            # Jittered so publishing doesn't fall into step with polling
+            await asyncio.sleep(options["interval"] * random.uniform(0.5, 1.5))  # noqa: S311
+        _, pending = await asyncio.wait(
+            receivers, timeout=settings.STREAM_POLL_INTERVAL * 5 + 5
+        )
+        for task in pending:
+            task.cancel()
+        for _, writer in clients:
+            writer.close()
+
+        delivered = [
+            latency for per_event in latencies.values() for latency in per_event
+        ]
+        return {
+            "connections_open": len(clients),
+            "connection_failures": len(attempts) - len(clients),
+            "connect_seconds": round(connect_seconds, 3),
+            "deliveries": len(delivered),
+            "expected_deliveries": len(clients) * options["events"],
+            # Publish to receipt, including up to one poll interval of waiting
+            "latency_ms": _summary_ms(delivered),
+            # First to last client receiving the same event: the cost of
+            # fanning out within the worker
+            "fanout_spread_ms": _summary_ms(
+                [max(v) - min(v) for v in latencies.values() if v]
+            ),
+        }
+
+    def handle(self, *args, **options) -> None:
+        _raise_open_file_limit(options["connections"])
+        run_id = uuid.uuid4().hex[:8]
+        user = User.objects.create(email=f"loadtest-{run_id}@example.com")
+        project = Project.objects.create(
+            title=f"Stream load test {run_id}",
+            website_url="https://example.com",
+            status=ProjectStatus.APPROVED,
+            submission_month=timezone.now().strftime("%Y-%m"),
+            owner=user,
+        )
+        token = create_access_token(user.id)
+
+        server_rss_mb = {}
+        try:
+            if options["url"]:
+                url = urlsplit(options["url"])
+                results = asyncio.run(
+                    self._run(url.hostname, url.port or 80, token, project.id, options)
+                )
+            else:
+                with _asgi_server(options["connections"]) as (host, port, pid):
+                    server_rss_mb["idle"] = _rss_mb(pid)
+                    results = asyncio.run(
+                        self._run(host, port, token, project.id, options)
+                    )
+                    server_rss_mb["connected"] = _rss_mb(pid)
+        finally:
+            StreamEvent.objects.filter(channel=project_channel(project.id)).delete()
+            user.delete()
+
+        report = {
+            "commit": _git_commit(),
+            "recorded_at": timezone.now().isoformat(),
+            "connections": options["connections"],
+            "events": options["events"],
+            "poll_interval": settings.STREAM_POLL_INTERVAL,
+            "server_rss_mb": server_rss_mb,
+            **results,
+        }
+        output: Path = options["output"]
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n")
+
+        latency = results["latency_ms"]
+        spread = results["fanout_spread_ms"]
+        self.stdout.write(
+            f"{results['connections_open']}/{options['connections']} connections "
+            f"open in {results['connect_seconds']}s, "
+            f"{results['deliveries']}/{results['expected_deliveries']} deliveries"
+        )
+        self.stdout.write(
+            f"Fan-out latency: p50 {latency['p50']} ms, p95 {latency['p95']} ms, "
+            f"p99 {latency['p99']} ms, max {latency['max']} ms; "
+            f"spread across clients p50 {spread['p50']} ms, max {spread['max']} ms"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Results written to {output}"))
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.streams.django_impl import prune
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete stream events older than STREAM_RETENTION_HOURS; clients that "
+        "reconnect later reload instead of replaying them."
+    )
+
+    def handle(self, *args, **options) -> None:
+        deleted = prune()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {deleted} stream events older than "
+                f"{settings.STREAM_RETENTION_HOURS} hours."
+            )
+        )
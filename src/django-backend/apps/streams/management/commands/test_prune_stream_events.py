@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.streams.models import StreamEvent
+
+
+@pytest.mark.django_db
+class TestPruneStreamEventsCommand:
+    def test_deletes_only_expired_events(self, settings):
+        settings.STREAM_RETENTION_HOURS = 24
+        old = StreamEvent.objects.create(channel="project:1", event="e")
+        StreamEvent.objects.filter(id=old.id).update(
+            created_at=timezone.now() - timedelta(hours=25)
+        )
+        recent = StreamEvent.objects.create(channel="project:1", event="e")
+
+        out = StringIO()
+        call_command("prune_stream_events", stdout=out)
+
+        assert list(StreamEvent.objects.values_list("id", flat=True)) == [recent.id]
+        assert "Deleted 1 stream events" in out.getvalue()
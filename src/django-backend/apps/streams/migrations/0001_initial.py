@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-19 12:05
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="StreamEvent",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("channel", models.CharField(max_length=64)),
+                ("event", models.CharField(max_length=64)),
+                (
+                    "data",
+                    models.JSONField(
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "db_table": "stream_events",
+                "indexes": [
+                    models.Index(
+                        fields=["channel", "id"], name="stream_events_replay_idx"
+                    ),
+                    models.Index(
+                        fields=["created_at"], name="stream_events_created_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class StreamEvent(models.Model):
+    """A change pushed to live clients, in commit order of its id.
+
+    The auto-incrementing id is the stream cursor: workers poll for ids above
+    the last one they have seen, and clients resume with it as Last-Event-ID.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    channel = models.CharField(max_length=64)
+    event = models.CharField(max_length=64)
+    data = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "stream_events"
+        indexes = [
+            # Replay for a reconnecting client
+            models.Index(fields=["channel", "id"], name="stream_events_replay_idx"),
+            models.Index(fields=["created_at"], name="stream_events_created_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event} on {self.channel}"
@@ -9,7 +9,7 @@ from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.html import format_html
 
-from .models import Tag, TagCategory, TagStatus
+from .models import CatalogueScope, Tag, TagCatalogueVersion, TagCategory, TagStatus
 
 if TYPE_CHECKING:
     from django.utils.safestring import SafeString
@@ -154,6 +154,8 @@ class TagAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now(),
         )
+        # update() skips the save signals that normally bump the version
+        TagCatalogueVersion.bump(CatalogueScope.TAGS)
         self.message_user(
             request,
             f"{updated} tag(s) approved.",
@@ -171,6 +173,7 @@ class TagAdmin(admin.ModelAdmin):
             reviewed_by=request.user,
             reviewed_at=timezone.now(),
         )
+        TagCatalogueVersion.bump(CatalogueScope.TAGS)
         self.message_user(
             request,
             f"{updated} tag(s) rejected and removed from projects.",
@@ -4,3 +4,25 @@ from django.apps import AppConfig
 class TagsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tags"
+
+    def ready(self) -> None:
+        from django.db.models.signals import (  # noqa: PLC0415
+            m2m_changed,
+            post_delete,
+            post_save,
+        )
+
+        from apps.projects.models import Project  # noqa: PLC0415
+        from apps.tags.models import Tag, TagCategory  # noqa: PLC0415
+        from apps.tags.signals import (  # noqa: PLC0415
+            on_catalogue_changed,
+            on_project_changed,
+            on_project_tags_changed,
+        )
+
+        for model in (Tag, TagCategory):
+            post_save.connect(on_catalogue_changed, sender=model)
+            post_delete.connect(on_catalogue_changed, sender=model)
+        post_save.connect(on_project_changed, sender=Project)
+        post_delete.connect(on_project_changed, sender=Project)
+        m2m_changed.connect(on_project_tags_changed, sender=Project.tags.through)
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.1 on 2026-10-19 13:10
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tags", "0004_assign_colors_and_default_tags"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagCatalogueVersion",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "scope",
+                    models.CharField(
+                        choices=[
+                            ("tags", "Tags and categories"),
+                            ("projects", "Tags on approved projects"),
+                        ],
+                        max_length=20,
+                        unique=True,
+                    ),
+                ),
+                ("token", models.UUIDField(default=uuid.uuid4)),
+            ],
+            options={
+                "db_table": "tag_catalogue_versions",
+            },
+        ),
+    ]
@@ -147,3 +147,41 @@ class Tag(models.Model):
             category_slug = self.category.slug if self.category else None
             self.color = generate_tag_color(self.name, category_slug)
         super().save(*args, **kwargs)
+
+
+class CatalogueScope(models.TextChoices):
+    TAGS = "tags", "Tags and categories"
+    PROJECTS = "projects", "Tags on approved projects"
+
+
+class TagCatalogueVersion(models.Model):
+    """Version tokens for the cached tag catalogue responses.
+
+    Each change within a scope writes a fresh random token, which every
+    worker sees on its next read and rebuilds its cached payload for. Tokens
+    are random rather than counted so a rolled-back change can never reuse
+    one that a payload has already been cached against.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    scope = models.CharField(max_length=20, choices=CatalogueScope.choices, unique=True)
+    token = models.UUIDField(default=uuid.uuid4)
+
+    class Meta:
+        db_table = "tag_catalogue_versions"
+
+    def __str__(self) -> str:
+        return f"{self.scope} {self.token}"
+
+    @classmethod
+    def bump(cls, scope: str) -> None:
+        if not cls.objects.filter(scope=scope).update(token=uuid.uuid4()):
+            cls.objects.get_or_create(scope=scope)
+
+    @classmethod
+    def current(cls, scopes: tuple[str, ...]) -> tuple[uuid.UUID | None, ...]:
+        """Tokens for ``scopes`` in order; None for a scope never bumped."""
+        tokens = dict(
+            cls.objects.filter(scope__in=scopes).values_list("scope", "token")
+        )
+        return tuple(tokens.get(scope) for scope in scopes)
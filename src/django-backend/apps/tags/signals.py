@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+from apps.tags.models import CatalogueScope, TagCatalogueVersion
+
+
+def on_catalogue_changed(sender: type, **kwargs: Any) -> None:
+    TagCatalogueVersion.bump(CatalogueScope.TAGS)
+
+
+def on_project_changed(sender: type, **kwargs: Any) -> None:
+    # Approval, rejection or deletion can change which tags are in use
+    TagCatalogueVersion.bump(CatalogueScope.PROJECTS)
+
+
+def on_project_tags_changed(sender: type, action: str, **kwargs: Any) -> None:
+    if action in {"post_add", "post_remove", "post_clear"}:
+        TagCatalogueVersion.bump(CatalogueScope.PROJECTS)
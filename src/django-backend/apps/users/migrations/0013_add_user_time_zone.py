@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-19 06:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0012_set_all_users_notification_immediate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="time_zone",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
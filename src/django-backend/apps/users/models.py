@@ -71,6 +71,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         choices=NotificationCadence.choices,
         default=NotificationCadence.NEVER,
     )
+    # IANA name reported by the user's browser; blank until it is known
+    time_zone = models.CharField(max_length=64, default="", blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -28,6 +28,12 @@ def _use_immediate_task_backend(settings):
     }
 
 
+@pytest.fixture(autouse=True)
+def _unthrottled_email_outbox(settings):
+    """Keep the outbox rate limit from slowing down tests that send email."""
+    settings.EMAIL_SEND_RATE_PER_SECOND = 1_000_000
+
+
 @pytest.fixture(autouse=True)
 def _use_in_memory_storage(settings):
     settings.STORAGES = {
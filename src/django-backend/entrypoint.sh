@@ -10,5 +10,8 @@ uv run python manage.py migrate --noinput
 MIGRATE_END=$(date +%s)
 echo "[entrypoint] Migrations completed in $((MIGRATE_END - MIGRATE_START))s"
 
+echo "[entrypoint] Scheduling periodic tasks..."
+uv run python manage.py schedule_periodic_tasks
+
 echo "[entrypoint] Starting server... (total boot time so far: $((MIGRATE_END - BOOT_START))s)"
 exec "$@"
@@ -5,6 +5,10 @@ from gunicorn_logger import StructuredLogger
 # Server socket
 bind = "0.0.0.0:8000"
 
+# ASGI workers, so the live event streams hold a connection rather than a
+# thread each; plain views still run in Django's sync thread
+worker_class = "uvicorn_worker.UvicornWorker"
+
 # Worker timeout — OTEL + Django init can exceed the 30s default on constrained CPUs
 timeout = 120
 
@@ -23,6 +27,9 @@ logconfig_dict = {
             "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
         },
     },
+    "filters": {
+        "uvicorn_access": {"()": "gunicorn_logger.UvicornAccessFilter"},
+    },
     "handlers": {
         "console": {
             "class": "logging.StreamHandler",
@@ -44,6 +51,12 @@ logconfig_dict = {
             "level": "INFO",
             "propagate": False,
         },
+        # The worker swaps in the gunicorn.access handlers; the filter stays
+        "uvicorn.access": {
+            "filters": ["uvicorn_access"],
+            "level": "INFO",
+            "propagate": False,
+        },
     },
 }
 
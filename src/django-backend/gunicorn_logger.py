@@ -71,3 +71,27 @@ class StructuredLogger(GunicornLogger):
                 "request_time_ms": request_time_ms,
             },
         )
+
+
+class UvicornAccessFilter(logging.Filter):
+    """Give uvicorn's access records the fields StructuredLogger emits.
+
+    The ASGI worker logs requests through uvicorn rather than the gunicorn
+    logger, as one formatted line. Health checks are dropped as above;
+    uvicorn doesn't record the user agent, so kube-probe can't be told apart.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        client, method, url, _, status = record.args
+        path, _, query = url.partition("?")
+        if path == "/health":
+            return False
+
+        record.msg = "%s %s %s"
+        record.args = (method, url, status)
+        record.method = method
+        record.url = path
+        record.query = query
+        record.ip = client.rpartition(":")[0] if client else ""
+        record.status = status
+        return True
@@ -8,8 +8,30 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_showcase.settings")
 
-application = get_asgi_application()
+django.setup(set_prefix=False)
+
+from api.streams import STREAM_PATH_SUFFIX  # noqa: E402
+
+
+class StreamingASGIHandler(ASGIHandler):
+    """Serve event streams without a thread per connection.
+
+    Django gives every request its own thread for sync code (middleware, ORM
+    calls), held until the response finishes. A stream never finishes, so
+    those requests share the process-wide sync thread instead; their sync
+    work is a few quick calls while connecting.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:  # noqa: ANN001
+        if scope["type"] == "http" and scope["path"].endswith(STREAM_PATH_SUFFIX):
+            await self.handle(scope, receive, send)
+        else:
+            await super().__call__(scope, receive, send)
+
+
+application = StreamingASGIHandler()
@@ -10,6 +10,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 import dj_database_url
@@ -67,6 +68,7 @@ INSTALLED_APPS = [
     "apps.emails",
     "apps.discussions",
     "apps.notifications",
+    "apps.streams",
     "django_tasks",
     "django_tasks_db",
 ]
@@ -166,6 +168,19 @@ S3_PUBLIC_URL_BASE = os.getenv("S3_PUBLIC_URL_BASE", "https://cdn.naglasupan.is"
 S3_CDN_DOMAIN = os.getenv("S3_CDN_DOMAIN", "cdn.naglasupan.is")
 SCW_ACCESS_KEY = os.getenv("SCW_ACCESS_KEY", "")
 SCW_SECRET_KEY = os.getenv("SCW_SECRET_KEY", "")
+# Shared boto3 client tuning: task workers upload variants concurrently
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "32"))
+S3_CONNECT_TIMEOUT = float(os.getenv("S3_CONNECT_TIMEOUT", "5"))
+S3_READ_TIMEOUT = float(os.getenv("S3_READ_TIMEOUT", "30"))
+
+# Project image storage backend: "s3" or "local". The local backend keeps files
+# under LOCAL_STORAGE_ROOT and serves them (and upload URLs) via /dev-storage/,
+# so the image pipeline can be run and timed without S3.
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "s3")
+LOCAL_STORAGE_ROOT = Path(os.getenv("LOCAL_STORAGE_ROOT", BASE_DIR / "local-storage"))
+LOCAL_STORAGE_URL = os.getenv("LOCAL_STORAGE_URL", "http://localhost:8000/dev-storage")
+if STORAGE_BACKEND == "local" and "S3_PUBLIC_URL_BASE" not in os.environ:
+    S3_PUBLIC_URL_BASE = LOCAL_STORAGE_URL
 
 
 # Whitenoise for serving static files in production
@@ -288,7 +303,30 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() == "true"
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "noreply@naglasupan.is")
 ADMIN_FROM_EMAIL = os.getenv("ADMIN_FROM_EMAIL", "alex@naglasupan.is")
+# Provider send quota, enforced by the email outbox dispatcher
+EMAIL_SEND_RATE_PER_SECOND = float(os.getenv("EMAIL_SEND_RATE_PER_SECOND", "10"))
+EMAIL_SEND_BURST = int(os.getenv("EMAIL_SEND_BURST", "20"))
 FRONTEND_URL = os.getenv("FRONTEND_URL", "https://naglasupan.is")
+# Email templates compiled at image build time by compile_email_templates
+EMAIL_TEMPLATE_BUILD_DIR = Path(
+    os.getenv("EMAIL_TEMPLATE_BUILD_DIR", BASE_DIR / "compiled_email_templates")
+)
+# Runtime cache for templates missing from the build, keyed by source hash
+EMAIL_TEMPLATE_CACHE_DIR = Path(
+    os.getenv(
+        "EMAIL_TEMPLATE_CACHE_DIR", Path(tempfile.gettempdir()) / "email-templates"
+    )
+)
+# Daily digests go out at a per-user slot within these local hours
+DIGEST_TIMEZONE = os.getenv("DIGEST_TIMEZONE", "Atlantic/Reykjavik")
+DIGEST_DAILY_HOURS = (8, 20)
+# Sent notifications older than this are moved to the archive table
+NOTIFICATION_RETENTION_DAYS = int(os.getenv("NOTIFICATION_RETENTION_DAYS", "90"))
+# Live event streams: how often each worker polls for new events, how often
+# idle connections get a keep-alive, and how long events stay replayable
+STREAM_POLL_INTERVAL = float(os.getenv("STREAM_POLL_INTERVAL", "1.0"))
+STREAM_HEARTBEAT_SECONDS = 20
+STREAM_RETENTION_HOURS = int(os.getenv("STREAM_RETENTION_HOURS", "24"))
 REVALIDATION_SECRET = os.getenv("REVALIDATION_SECRET", "")
 
 # Logging configuration - JSON format for Grafana/Cockpit filtering
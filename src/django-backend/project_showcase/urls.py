@@ -19,6 +19,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from api import streams
 from api.main import api
 
 from . import views
@@ -27,5 +28,18 @@ urlpatterns = [
     path("", views.home, name="home"),
     path("health", views.health, name="health"),
     path("admin/", admin.site.urls),
+    # Live streams need async views, so they sit outside the API router;
+    # listed first so its routes don't shadow them
+    path(
+        "api/projects/<uuid:project_id>/discussions/stream",
+        streams.project_discussions_stream,
+        name="project_discussions_stream",
+    ),
+    path(
+        "api/my/notifications/stream",
+        streams.my_notifications_stream,
+        name="my_notifications_stream",
+    ),
     path("api/", api.urls),
+    path("dev-storage/<path:key>", views.local_storage, name="local_storage"),
 ]
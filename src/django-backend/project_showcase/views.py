@@ -1,4 +1,15 @@
-from django.http import HttpRequest, HttpResponse
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseForbidden,
+    HttpResponseNotAllowed,
+)
+from django.views.decorators.csrf import csrf_exempt
+
+from services.storage import LocalStorageService, ObjectNotFoundError, storage_service
+from services.storage.local_impl import InvalidUploadTokenError
 
 
 def health(request: HttpRequest) -> HttpResponse:
@@ -32,3 +43,32 @@ def home(request: HttpRequest) -> HttpResponse:
 </body>
 </html>"""
     return HttpResponse(html)
+
+
+@csrf_exempt
+def local_storage(request: HttpRequest, key: str) -> HttpResponse:
+    """Serve and accept uploads for the local storage backend (development)."""
+    if not isinstance(storage_service, LocalStorageService):
+        raise Http404
+
+    if request.method == "PUT":
+        try:
+            etag = storage_service.receive_upload(
+                key, request.GET.get("token", ""), request
+            )
+        except (InvalidUploadTokenError, ObjectNotFoundError):
+            return HttpResponseForbidden()
+        response = HttpResponse()
+        response["ETag"] = f'"{etag}"'
+        return response
+
+    if request.method not in {"GET", "HEAD"}:
+        return HttpResponseNotAllowed(["GET", "HEAD", "PUT"])
+
+    try:
+        path = storage_service.path_for(key)
+    except ObjectNotFoundError:
+        raise Http404 from None
+    if not path.is_file():
+        raise Http404
+    return FileResponse(path.open("rb"))
@@ -0,0 +1,94 @@
+"""Maintenance of the discussion counters stored on each project.
+
+``Project.discussion_count`` counts every comment on the project, replies
+included, and ``last_activity_at`` is the time of the newest one. Both are
+adjusted in the same transaction as the comment itself so project lists can
+show and sort by them without counting discussions per project.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Count, F, Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.discussions.models import Discussion
+from apps.projects.models import Project
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from django.db.models import Expression, QuerySet
+
+BATCH_SIZE = 500
+
+
+def _comments() -> QuerySet[Discussion]:
+    return (
+        Discussion.objects.filter(project=OuterRef("pk")).order_by().values("project")
+    )
+
+
+def _actual_count() -> Expression:
+    return Coalesce(Subquery(_comments().annotate(n=Count("id")).values("n")), 0)
+
+
+def _actual_last_activity() -> Expression:
+    return Subquery(_comments().annotate(latest=Max("created_at")).values("latest"))
+
+
+def record_activity(discussion: Discussion) -> None:
+    created_at = Value(discussion.created_at)
+    Project.objects.filter(id=discussion.project_id).update(
+        discussion_count=F("discussion_count") + 1,
+        # Comments committing out of order must not move it backwards
+        last_activity_at=Greatest(
+            Coalesce(F("last_activity_at"), created_at), created_at
+        ),
+    )
+
+
+def forget_activity(discussion: Discussion, removed: int) -> None:
+    """Undo ``record_activity`` once ``removed`` comments have been deleted.
+
+    Called after the delete, so the newest remaining comment can be read
+    back; it is found through the thread index rather than a scan.
+    """
+    Project.objects.filter(id=discussion.project_id).update(
+        # Clamped so a count that has drifted low cannot go negative
+        discussion_count=Greatest(F("discussion_count") - removed, Value(0)),
+        last_activity_at=_actual_last_activity(),
+    )
+
+
+def _drifted() -> list[UUID]:
+    rows = Project.objects.annotate(
+        actual_count=_actual_count(), actual_last_activity=_actual_last_activity()
+    ).values_list(
+        "id",
+        "discussion_count",
+        "last_activity_at",
+        "actual_count",
+        "actual_last_activity",
+    )
+    return [
+        project_id
+        for project_id, count, last, actual_count, actual_last in rows.iterator()
+        if (count, last) != (actual_count, actual_last)
+    ]
+
+
+def reconcile_activity() -> int:
+    """Recount projects whose stored counters disagree with their comments.
+
+    Returns the number of projects repaired. The recount is a single UPDATE
+    per batch, so comments added while it runs are not lost.
+    """
+    drifted = _drifted()
+    for start in range(0, len(drifted), BATCH_SIZE):
+        Project.objects.filter(id__in=drifted[start : start + BATCH_SIZE]).update(
+            discussion_count=_actual_count(),
+            last_activity_at=_actual_last_activity(),
+        )
+    return len(drifted)
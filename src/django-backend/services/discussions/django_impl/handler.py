@@ -2,17 +2,43 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from django.db import transaction
+
 from apps.discussions.models import Discussion
 from services.discussions.exceptions import (
     DiscussionNotFoundError,
     NotDiscussionAuthorError,
 )
 from services.discussions.handler_interface import DiscussionHandlerInterface
+from services.streams.django_impl import project_channel, publish
+
+from .activity import forget_activity, reconcile_activity, record_activity
+from .participants import forget_participation, record_participation
 
 if TYPE_CHECKING:
     from uuid import UUID
 
 
+def _stream_payload(discussion: Discussion) -> dict:
+    """The new comment as list_discussions would return it."""
+    author = discussion.author
+    return {
+        "id": discussion.id,
+        "parent_id": discussion.parent_id,
+        "body": discussion.body,
+        "created_at": discussion.created_at,
+        "author": author
+        and {
+            "id": author.id,
+            "first_name": author.first_name,
+            "last_name": author.last_name,
+        },
+        "reply_count": 0,
+        "replies": [],
+        "replies_cursor": None,
+    }
+
+
 class DjangoDiscussionHandler(DiscussionHandlerInterface):
     def create_discussion(
         self,
@@ -28,12 +54,20 @@ class DjangoDiscussionHandler(DiscussionHandlerInterface):
                 raise DiscussionNotFoundError from None
             project_id = parent.project_id
 
-        discussion = Discussion.objects.create(
-            project_id=project_id,
-            author_id=author_id,
-            parent_id=parent_id,
-            body=body,
-        )
+        with transaction.atomic():
+            discussion = Discussion.objects.create(
+                project_id=project_id,
+                author_id=author_id,
+                parent_id=parent_id,
+                body=body,
+            )
+            record_participation(discussion)
+            record_activity(discussion)
+            publish(
+                [project_channel(project_id)],
+                "discussion.created",
+                _stream_payload(discussion),
+            )
 
         from api.tasks.notifications import (  # noqa: PLC0415
             create_discussion_notifications,
@@ -52,4 +86,16 @@ class DjangoDiscussionHandler(DiscussionHandlerInterface):
         if discussion.author_id != requesting_user_id:
             raise NotDiscussionAuthorError
 
-        discussion.delete()
+        with transaction.atomic():
+            forget_participation(discussion)
+            # Deleting a root takes its replies with it
+            _, deleted = discussion.delete()
+            forget_activity(discussion, deleted.get("discussions.Discussion", 0))
+            publish(
+                [project_channel(discussion.project_id)],
+                "discussion.deleted",
+                {"id": discussion_id, "parent_id": discussion.parent_id},
+            )
+
+    def reconcile_activity_counts(self) -> int:
+        return reconcile_activity()
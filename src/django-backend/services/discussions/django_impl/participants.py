@@ -0,0 +1,55 @@
+"""Maintenance of the per-thread participant table.
+
+Every comment adds one to its author's ``comment_count`` on the thread root
+and every deletion takes one away, so notification targeting can read a
+thread's participants directly instead of scanning its replies.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+
+from apps.discussions.models import Discussion, DiscussionParticipant
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+def _thread_root_id(discussion: Discussion) -> UUID:
+    return discussion.parent_id or discussion.id
+
+
+def record_participation(discussion: Discussion) -> None:
+    if discussion.author_id is None:
+        return
+    participant = DiscussionParticipant.objects.filter(
+        root_id=_thread_root_id(discussion), user_id=discussion.author_id
+    )
+    if participant.update(comment_count=F("comment_count") + 1):
+        return
+    try:
+        with transaction.atomic():
+            DiscussionParticipant.objects.create(
+                root_id=_thread_root_id(discussion), user_id=discussion.author_id
+            )
+    except IntegrityError:
+        # A concurrent comment by the same user created the row first
+        participant.update(comment_count=F("comment_count") + 1)
+
+
+def forget_participation(discussion: Discussion) -> None:
+    """Undo ``record_participation`` for a comment that is being deleted.
+
+    Deleting a root removes its participants by cascade, so only replies
+    need adjusting.
+    """
+    if discussion.parent_id is None or discussion.author_id is None:
+        return
+    participant = DiscussionParticipant.objects.filter(
+        root_id=discussion.parent_id, user_id=discussion.author_id
+    )
+    participant.update(comment_count=F("comment_count") - 1)
+    participant.filter(comment_count=0).delete()
@@ -2,28 +2,91 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from django.db.models import QuerySet
+from django.db.models import Count, Prefetch, Q, QuerySet
 
 from apps.discussions.models import Discussion
 from services.discussions.exceptions import DiscussionNotFoundError
-from services.discussions.query_interface import DiscussionQueryInterface
+from services.discussions.query_interface import (
+    DiscussionPage,
+    DiscussionQueryInterface,
+)
+from services.pagination import decode_cursor, encode_cursor
 
 if TYPE_CHECKING:
     from uuid import UUID
 
+# Replies returned inline with each thread; the rest are fetched on demand
+INLINE_REPLIES = 3
+
 
 def _base_queryset() -> QuerySet[Discussion]:
     return Discussion.objects.select_related("author")
 
 
+def _page(discussions: list[Discussion], limit: int) -> DiscussionPage:
+    next_cursor = None
+    if len(discussions) > limit:
+        discussions = discussions[:limit]
+        last = discussions[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return DiscussionPage(discussions=discussions, next_cursor=next_cursor)
+
+
 class DjangoDiscussionQuery(DiscussionQueryInterface):
-    def list_for_project(self, project_id: UUID) -> QuerySet[Discussion]:
-        return (
+    def list_for_project(
+        self, project_id: UUID, *, cursor: str | None = None, limit: int = 20
+    ) -> DiscussionPage:
+        threads = (
             _base_queryset()
             .filter(project_id=project_id, parent__isnull=True)
-            .prefetch_related("replies", "replies__author")
-            .order_by("-created_at")
+            .annotate(reply_count=Count("replies"))
+            .prefetch_related(
+                Prefetch(
+                    "replies",
+                    queryset=_base_queryset().order_by("created_at", "id")[
+                        :INLINE_REPLIES
+                    ],
+                    to_attr="first_replies",
+                )
+            )
+        )
+        if cursor:
+            created_at, discussion_id = decode_cursor(cursor)
+            threads = threads.filter(
+                Q(created_at__lt=created_at)
+                | Q(created_at=created_at, id__lt=discussion_id)
+            )
+
+        page = _page(list(threads.order_by("-created_at", "-id")[: limit + 1]), limit)
+        for thread in page.discussions:
+            thread.replies_cursor = None
+            if thread.reply_count > len(thread.first_replies):
+                last = thread.first_replies[-1]
+                thread.replies_cursor = encode_cursor(last.created_at, last.id)
+        return page
+
+    def list_replies(
+        self,
+        project_id: UUID,
+        discussion_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> DiscussionPage:
+        if not Discussion.objects.filter(
+            id=discussion_id, project_id=project_id, parent__isnull=True
+        ).exists():
+            raise DiscussionNotFoundError
+
+        replies = _base_queryset().filter(
+            project_id=project_id, parent_id=discussion_id
         )
+        if cursor:
+            created_at, reply_id = decode_cursor(cursor)
+            replies = replies.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=reply_id)
+            )
+        return _page(list(replies.order_by("created_at", "id")[: limit + 1]), limit)
 
     def get_by_id(self, discussion_id: UUID) -> Discussion:
         try:
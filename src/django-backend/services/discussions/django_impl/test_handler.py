@@ -0,0 +1,144 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from hamcrest import assert_that, contains_inanyorder, empty, equal_to, none
+
+from apps.discussions.models import DiscussionParticipant
+from apps.projects.models import Project
+from services.discussions.django_impl.activity import record_activity
+from services.discussions.django_impl.handler import DjangoDiscussionHandler
+from tests.factories import DiscussionFactory, ProjectFactory, UserFactory
+
+
+@pytest.fixture
+def handler():
+    with patch("api.tasks.notifications.create_discussion_notifications"):
+        yield DjangoDiscussionHandler()
+
+
+def _participants(root):
+    return list(
+        DiscussionParticipant.objects.filter(root=root).values_list(
+            "user_id", "comment_count"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestParticipants:
+    def test_root_author_participates_in_new_thread(self, handler) -> None:
+        project = ProjectFactory()
+        author = UserFactory()
+
+        root = handler.create_discussion(project.id, author.id, "Hello")
+
+        assert_that(_participants(root), equal_to([(author.id, 1)]))
+
+    def test_replies_count_towards_the_thread(self, handler) -> None:
+        root = DiscussionFactory()
+        replier = UserFactory()
+
+        handler.create_discussion(root.project_id, replier.id, "One", root.id)
+        handler.create_discussion(root.project_id, replier.id, "Two", root.id)
+        handler.create_discussion(root.project_id, root.author_id, "Three", root.id)
+
+        assert_that(
+            _participants(root),
+            contains_inanyorder((root.author_id, 2), (replier.id, 2)),
+        )
+
+    def test_deleting_a_reply_decrements_the_count(self, handler) -> None:
+        root = DiscussionFactory()
+        replier = UserFactory()
+        first = handler.create_discussion(root.project_id, replier.id, "1", root.id)
+        handler.create_discussion(root.project_id, replier.id, "2", root.id)
+
+        handler.delete_discussion(first.id, replier.id)
+
+        assert_that(
+            _participants(root),
+            contains_inanyorder((root.author_id, 1), (replier.id, 1)),
+        )
+
+    def test_deleting_last_reply_removes_the_participant(self, handler) -> None:
+        root = DiscussionFactory()
+        replier = UserFactory()
+        reply = handler.create_discussion(root.project_id, replier.id, "Hi", root.id)
+
+        handler.delete_discussion(reply.id, replier.id)
+
+        assert_that(_participants(root), equal_to([(root.author_id, 1)]))
+
+    def test_deleting_the_root_removes_all_participants(self, handler) -> None:
+        root = DiscussionFactory()
+        DiscussionFactory(project=root.project, parent=root)
+
+        handler.delete_discussion(root.id, root.author_id)
+
+        assert_that(_participants(root), empty())
+
+
+def _activity(project):
+    return Project.objects.values_list("discussion_count", "last_activity_at").get(
+        id=project.id
+    )
+
+
+@pytest.mark.django_db
+class TestActivityCounts:
+    def test_comments_count_and_move_last_activity(self, handler) -> None:
+        project = ProjectFactory()
+        author = UserFactory()
+
+        root = handler.create_discussion(project.id, author.id, "Hello")
+        reply = handler.create_discussion(project.id, author.id, "Hi", root.id)
+
+        assert_that(_activity(project), equal_to((2, reply.created_at)))
+
+    def test_older_comment_does_not_move_last_activity_back(self) -> None:
+        newer = DiscussionFactory()
+        older = DiscussionFactory.build(
+            project=newer.project,
+            author=newer.author,
+            created_at=newer.created_at - timedelta(seconds=5),
+        )
+
+        record_activity(older)
+
+        assert_that(_activity(newer.project), equal_to((2, newer.created_at)))
+
+    def test_deleting_a_reply_falls_back_to_the_newest_comment(self, handler) -> None:
+        root = DiscussionFactory()
+        reply = handler.create_discussion(
+            root.project_id, root.author_id, "Hi", root.id
+        )
+
+        handler.delete_discussion(reply.id, root.author_id)
+
+        assert_that(_activity(root.project), equal_to((1, root.created_at)))
+
+    def test_deleting_a_root_removes_its_replies_from_the_count(self, handler) -> None:
+        root = DiscussionFactory()
+        DiscussionFactory(project=root.project, parent=root)
+        DiscussionFactory(project=root.project, parent=root)
+
+        handler.delete_discussion(root.id, root.author_id)
+
+        count, last_activity_at = _activity(root.project)
+        assert_that(count, equal_to(0))
+        assert_that(last_activity_at, none())
+
+    def test_reconcile_repairs_only_drifted_projects(self, handler) -> None:
+        drifted = DiscussionFactory(parent=None)
+        DiscussionFactory(project=drifted.project, parent=drifted)
+        DiscussionFactory()
+        Project.objects.filter(id=drifted.project_id).update(
+            discussion_count=7, last_activity_at=None
+        )
+
+        repaired = handler.reconcile_activity_counts()
+
+        latest = drifted.project.discussions.latest("created_at").created_at
+        assert_that(repaired, equal_to(1))
+        assert_that(_activity(drifted.project), equal_to((2, latest)))
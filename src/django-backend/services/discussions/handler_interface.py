@@ -18,3 +18,7 @@ class DiscussionHandlerInterface(ABC):
     def delete_discussion(
         self, discussion_id: UUID, requesting_user_id: UUID
     ) -> None: ...
+
+    @abstractmethod
+    def reconcile_activity_counts(self) -> int:
+        """Repair projects' discussion counters; returns how many changed."""
@@ -1,14 +1,37 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from uuid import UUID
 
-from django.db.models import QuerySet
-
 from apps.discussions.models import Discussion
 
 
+@dataclass(frozen=True)
+class DiscussionPage:
+    discussions: list[Discussion]
+    next_cursor: str | None
+
+
 class DiscussionQueryInterface(ABC):
     @abstractmethod
-    def list_for_project(self, project_id: UUID) -> QuerySet[Discussion]: ...
+    def list_for_project(
+        self, project_id: UUID, *, cursor: str | None = None, limit: int = 20
+    ) -> DiscussionPage:
+        """Newest threads first, each with ``reply_count`` and its first replies.
+
+        Threads carry ``first_replies`` and, when there are more replies than
+        that, ``replies_cursor`` for fetching the rest with ``list_replies``.
+        """
+
+    @abstractmethod
+    def list_replies(
+        self,
+        project_id: UUID,
+        discussion_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> DiscussionPage:
+        """Replies to a thread, oldest first."""
 
     @abstractmethod
     def get_by_id(self, discussion_id: UUID) -> Discussion: ...
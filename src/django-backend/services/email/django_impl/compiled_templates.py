@@ -0,0 +1,189 @@
+"""Compile MJML email templates once into plain HTML Django templates.
+
+MJML compilation is far slower than a Django template render, and its output
+only depends on the template source. Each template (with its base template
+inlined) is compiled once with every Django tag swapped for an opaque
+placeholder, then the tags are put back. The result is a Django template that
+renders straight to the final HTML.
+
+Production images compile every template at build time (see the
+``compile_email_templates`` command) and load the artifacts listed in the
+build manifest. Anything missing from the manifest, and everything in DEBUG,
+is compiled at runtime and cached in-process and on disk, keyed by a hash of
+the source, so edits to a template produce a new entry instead of serving
+stale HTML.
+
+Only ``{% extends %}``/``{% block %}`` inheritance is inlined, and blocks must
+not be nested; ``{% include %}`` of MJML fragments is not supported.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.template import engines
+from django.template.loader import get_template
+from mjml import mjml_to_html
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.template.backends.django import Template
+
+logger = logging.getLogger(__name__)
+
+EXTENDS_RE = re.compile(r'{%\s*extends\s+"([^"]+)"\s*%}')
+BLOCK_RE = re.compile(
+    r"{%\s*block\s+(\w+)\s*%}(.*?){%\s*endblock(?:\s+\w+)?\s*%}", re.DOTALL
+)
+BLOCK_SUPER_RE = re.compile(r"{{\s*block\.super\s*}}")
+DJANGO_TAG_RE = re.compile(r"{%.*?%}|{{.*?}}|{#.*?#}", re.DOTALL)
+# Plain alphanumerics pass through MJML untouched, in text and attributes alike
+PLACEHOLDER = "DJTAG{}END"
+PLACEHOLDER_RE = re.compile(r"DJTAG(\d+)END")
+MANIFEST_NAME = "manifest.json"
+
+# digest -> compiled template
+_compiled: dict[str, Template] = {}
+# template name -> digest, so repeat renders skip reading and hashing sources
+_digests: dict[str, str] = {}
+
+
+def _resolve_inheritance(template_name: str) -> str:
+    source = get_template(template_name).template.source
+    extends = EXTENDS_RE.search(source)
+    if not extends:
+        return source
+
+    overrides = dict(BLOCK_RE.findall(source))
+
+    def fill(match: re.Match) -> str:
+        name, default = match[1], match[2]
+        body = BLOCK_SUPER_RE.sub(lambda _: default, overrides.get(name, default))
+        return f"{{% block {name} %}}{body}{{% endblock %}}"
+
+    return BLOCK_RE.sub(fill, _resolve_inheritance(extends[1]))
+
+
+def flatten_template(template_name: str) -> str:
+    """Return the MJML source with its base templates inlined."""
+    return BLOCK_RE.sub(lambda m: m[2], _resolve_inheritance(template_name))
+
+
+def source_digest(source: str) -> str:
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def compile_mjml_source(source: str) -> str:
+    """Compile flattened MJML to HTML, keeping Django tags as they were."""
+    tags: list[str] = []
+
+    def protect(match: re.Match) -> str:
+        tags.append(match[0])
+        return PLACEHOLDER.format(len(tags) - 1)
+
+    html = mjml_to_html(DJANGO_TAG_RE.sub(protect, source)).html
+    return PLACEHOLDER_RE.sub(lambda m: tags[int(m[1])], html)
+
+
+def _write_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename so a concurrent reader never sees a partial file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(content)
+    tmp_path.replace(path)
+
+
+def _load_or_compile(template_name: str, source: str, digest: str) -> str:
+    path = Path(settings.EMAIL_TEMPLATE_CACHE_DIR) / f"{template_name}-{digest}.html"
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        pass
+
+    compiled = compile_mjml_source(source)
+    try:
+        _write_atomic(path, compiled)
+    except OSError:
+        logger.warning("Could not cache compiled email template %s", path)
+    return compiled
+
+
+def email_template_names() -> list[str]:
+    """Names of every ``email/*.mjml`` template the Django engine can load."""
+    names = {
+        path.stem
+        for template_dir in engines["django"].template_dirs
+        for path in Path(template_dir).glob("email/*.mjml")
+    }
+    return sorted(names)
+
+
+def build_templates(build_dir: Path) -> dict[str, dict[str, str]]:
+    """Compile every email template into ``build_dir`` and write its manifest."""
+    manifest = {}
+    for name in email_template_names():
+        source = flatten_template(f"email/{name}.mjml")
+        digest = source_digest(source)
+        filename = f"{name}-{digest}.html"
+        _write_atomic(build_dir / filename, compile_mjml_source(source))
+        manifest[name] = {"source_digest": digest, "file": filename}
+    # Written last, so a half-finished build is never picked up
+    _write_atomic(
+        build_dir / MANIFEST_NAME,
+        json.dumps({"templates": manifest}, indent=2, sort_keys=True),
+    )
+    return manifest
+
+
+def _read_manifest() -> dict[str, dict[str, str]]:
+    path = Path(settings.EMAIL_TEMPLATE_BUILD_DIR) / MANIFEST_NAME
+    try:
+        return json.loads(path.read_text())["templates"]
+    except FileNotFoundError:
+        return {}
+
+
+def _locate(template_name: str) -> tuple[str, Callable[[], str]]:
+    """Return the digest of a template and a loader for its compiled HTML."""
+    if not settings.DEBUG:
+        entry = _read_manifest().get(template_name)
+        if entry:
+            path = Path(settings.EMAIL_TEMPLATE_BUILD_DIR) / entry["file"]
+            return entry["source_digest"], path.read_text
+        logger.warning(
+            "Email template %s was not precompiled; compiling it at runtime",
+            template_name,
+        )
+
+    source = flatten_template(f"email/{template_name}.mjml")
+    digest = source_digest(source)
+    return digest, lambda: _load_or_compile(template_name, source, digest)
+
+
+def get_compiled_template(template_name: str) -> Template:
+    """Return the compiled HTML template for ``email/<template_name>.mjml``.
+
+    In DEBUG build artifacts are ignored and the source is re-hashed on every
+    call, so template edits show up straight away.
+    """
+    digest = _digests.get(template_name)
+    if digest is None or settings.DEBUG:
+        digest, load = _locate(template_name)
+        if digest not in _compiled:
+            _compiled[digest] = engines["django"].from_string(load())
+        _digests[template_name] = digest
+    return _compiled[digest]
+
+
+def clear_cache() -> None:
+    """Drop in-process compiled templates; the disk cache is left alone."""
+    _compiled.clear()
+    _digests.clear()
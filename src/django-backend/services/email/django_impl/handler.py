@@ -1,60 +1,112 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import smtplib
+import zlib
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import Count, Q
 from django.utils import timezone
 
-from apps.emails.models import BroadcastEmailRecipient, SentEmail, SentEmailType
+from apps.emails.models import (
+    BroadcastEmail,
+    BroadcastEmailRecipient,
+    EmailBodyTemplate,
+    OutboxEmail,
+    OutboxPriority,
+    OutboxStatus,
+    SentEmail,
+    SentEmailType,
+)
 from services.email import EMAIL_LOGO_URL
 from services.email.handler_interface import EmailHandlerInterface
 
 from . import render_email
+from .compiled_templates import get_compiled_template
 from .query import DjangoEmailQuery
+from .rate_limit import TokenBucket
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from uuid import UUID
+
+    from django.core.mail.backends.base import BaseEmailBackend
+    from django.db.models import QuerySet
 
     from apps.discussions.models import Discussion
-    from apps.emails.models import BroadcastEmail
     from apps.notifications.models import Notification
     from apps.projects.models import Project
     from apps.users.models import User
 
 logger = logging.getLogger(__name__)
 
+# Recipients sent over a single SMTP connection before progress is saved
+BROADCAST_BATCH_SIZE = 100
+BROADCAST_INTERRUPTED_MESSAGE = "Delivery interrupted before the email was sent"
 
-def _log_sent_email(
-    *,
-    recipient: User | None,
-    email_type: str,
-    subject: str,
-    to_email: str,
-    success: bool = True,
-    error_message: str = "",
-    html_body: str = "",
-) -> None:
-    try:
-        SentEmail.objects.create(
-            recipient=recipient,
-            email_type=email_type,
-            subject=subject,
-            to_email=to_email,
-            success=success,
-            error_message=error_message,
-            html_body=html_body,
-        )
-    except Exception:
-        logger.exception("Failed to log sent email record for %s", to_email)
+OUTBOX_PRIORITIES = {
+    SentEmailType.VERIFICATION: OutboxPriority.CODE,
+    SentEmailType.PASSWORD_RESET: OutboxPriority.CODE,
+    SentEmailType.PROJECT_APPROVED: OutboxPriority.TRANSACTIONAL,
+    SentEmailType.DISCUSSION_NOTIFICATION: OutboxPriority.NOTIFICATION,
+    SentEmailType.DISCUSSION_DIGEST: OutboxPriority.DIGEST,
+}
+OUTBOX_BATCH_SIZE = 50
+# How long a dispatcher may hold claimed messages before others may retry them
+OUTBOX_CLAIM_TIMEOUT = timedelta(minutes=5)
+OUTBOX_MAX_ATTEMPTS = 6
+OUTBOX_RETRY_BASE_DELAY = timedelta(seconds=30)
+OUTBOX_RETRY_MAX_DELAY = timedelta(hours=1)
+
+# SendRateBucket holding the provider's send quota
+SEND_RATE_BUCKET = "email"
+
+
+def _get_rate_limiter() -> TokenBucket:
+    """The provider's send limit, shared by every dispatcher in every process."""
+    return TokenBucket(
+        SEND_RATE_BUCKET,
+        settings.EMAIL_SEND_RATE_PER_SECOND,
+        settings.EMAIL_SEND_BURST,
+    )
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a send failure is worth retrying (4xx replies, network errors)."""
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500  # noqa: PLR2004
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())  # noqa: PLR2004
+    return isinstance(error, (smtplib.SMTPServerDisconnected, OSError))
+
+
+def _retry_delay(attempts: int) -> timedelta:
+    return min(OUTBOX_RETRY_BASE_DELAY * 2 ** (attempts - 1), OUTBOX_RETRY_MAX_DELAY)
+
+
+def _body_template_id(template_name: str) -> UUID:
+    """Return the stored copy of a compiled template, creating it on first use."""
+    html = get_compiled_template(template_name).template.source
+    body_template, _ = EmailBodyTemplate.objects.get_or_create(
+        content_hash=hashlib.sha256(html.encode()).hexdigest(),
+        defaults={
+            "template_name": template_name,
+            "compressed_html": zlib.compress(html.encode(), level=9),
+        },
+    )
+    return body_template.id
 
 
 def build_digest_groups(notifications: Sequence[Notification]) -> list[dict]:
     """Group notifications by project for digest emails."""
     groups_dict: dict[str, dict] = {}
     for n in notifications:
-        project = n.discussion.project
+        project = n.project
         project_key = str(project.id)
         if project_key not in groups_dict:
             groups_dict[project_key] = {
@@ -64,12 +116,191 @@ def build_digest_groups(notifications: Sequence[Notification]) -> list[dict]:
                 ),
                 "comment_count": 0,
             }
-        groups_dict[project_key]["comment_count"] += 1
+        groups_dict[project_key]["comment_count"] += n.comment_count
 
     return list(groups_dict.values())
 
 
 class DjangoEmailHandler(EmailHandlerInterface):
+    def _queue_email(
+        self,
+        *,
+        email_type: str,
+        recipient: User | None,
+        to_email: str,
+        subject: str,
+        template_name: str,
+        context: dict,
+    ) -> None:
+        self._queue_emails(
+            [
+                OutboxEmail(
+                    email_type=email_type,
+                    priority=OUTBOX_PRIORITIES[email_type],
+                    recipient=recipient,
+                    to_email=to_email,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    subject=subject,
+                    template_name=template_name,
+                    context=context,
+                )
+            ]
+        )
+
+    def _queue_emails(self, messages: list[OutboxEmail]) -> None:
+        """Insert outbox messages in one query and wake a single dispatcher."""
+        from api.tasks.email import dispatch_email_outbox  # noqa: PLC0415
+        from api.tasks.scheduling import is_queued  # noqa: PLC0415
+
+        if not messages:
+            return
+        OutboxEmail.objects.bulk_create(messages)
+        # A dispatch already waiting to start will pick these up too
+        if not is_queued(dispatch_email_outbox, timezone.now()):
+            dispatch_email_outbox.enqueue()
+
+    def dispatch_outbox(self) -> datetime | None:
+        """Send every outbox message that is due, most urgent first.
+
+        All batches share one mail connection, and every dispatcher shares one
+        rate limit.
+        Transient failures are retried with exponential backoff; the rest, and
+        messages out of attempts, are marked failed. Returns when the earliest
+        retry is due, or None if no message is waiting out a backoff.
+        """
+        connection = get_connection()
+        try:
+            while messages := self._claim_outbox_batch():
+                self._send_outbox_batch(connection, messages)
+        finally:
+            connection.close()
+
+        # Messages claimed by another dispatcher are that dispatcher's to
+        # finish, so only retries waiting out a backoff are reported
+        waiting = OutboxEmail.objects.filter(
+            status=OutboxStatus.PENDING, claimed_at__isnull=True
+        )
+        return (
+            waiting.order_by("next_attempt_at")
+            .values_list("next_attempt_at", flat=True)
+            .first()
+        )
+
+    def _claim_outbox_batch(self) -> list[OutboxEmail]:
+        now = timezone.now()
+        with transaction.atomic():
+            messages = list(
+                OutboxEmail.objects.select_for_update(skip_locked=True)
+                .filter(status=OutboxStatus.PENDING, next_attempt_at__lte=now)
+                .order_by("priority", "next_attempt_at")[:OUTBOX_BATCH_SIZE]
+            )
+            for message in messages:
+                message.attempts += 1
+                message.next_attempt_at = now + OUTBOX_CLAIM_TIMEOUT
+                message.claimed_at = now
+            OutboxEmail.objects.bulk_update(
+                messages, ["attempts", "next_attempt_at", "claimed_at"]
+            )
+        return messages
+
+    def _send_outbox_batch(
+        self, connection: BaseEmailBackend, messages: list[OutboxEmail]
+    ) -> None:
+        rate_limiter = _get_rate_limiter()
+        body_templates: dict[str, UUID] = {}
+        sent_emails = []
+
+        for message in messages:
+            rendered = self._send_outbox_message(connection, rate_limiter, message)
+            message.claimed_at = None
+            if message.status == OutboxStatus.PENDING:
+                # Left for a retry; it is recorded once it is sent or gives up
+                continue
+
+            if rendered and message.template_name not in body_templates:
+                body_templates[message.template_name] = _body_template_id(
+                    message.template_name
+                )
+            sent_emails.append(
+                SentEmail(
+                    recipient_id=message.recipient_id,
+                    email_type=message.email_type,
+                    subject=message.subject,
+                    to_email=message.to_email,
+                    success=message.status == OutboxStatus.SENT,
+                    error_message=(
+                        ""
+                        if message.status == OutboxStatus.SENT
+                        else f"Failed to send to {message.to_email}"
+                    ),
+                    body_template_id=(
+                        body_templates[message.template_name] if rendered else None
+                    ),
+                    body_context=message.context,
+                )
+            )
+
+        OutboxEmail.objects.bulk_update(
+            messages,
+            ["status", "next_attempt_at", "claimed_at", "last_error", "sent_at"],
+        )
+        SentEmail.objects.bulk_create(sent_emails)
+
+    def _send_outbox_message(
+        self,
+        connection: BaseEmailBackend,
+        rate_limiter: TokenBucket,
+        message: OutboxEmail,
+    ) -> bool:
+        """Send one claimed message and set its status for the outcome.
+
+        Returns whether the message rendered. A message that cannot be
+        rendered never will be, so it fails straight away rather than
+        failing the rest of the batch or being claimed again.
+        """
+        try:
+            html, text = render_email(message.template_name, message.context)
+        except Exception as e:
+            logger.exception(
+                "Failed to render %s email to %s",
+                message.template_name,
+                message.to_email,
+            )
+            message.last_error = f"{type(e).__name__}: {e}"
+            message.status = OutboxStatus.FAILED
+            return False
+
+        email = EmailMultiAlternatives(
+            subject=message.subject,
+            body=text,
+            from_email=message.from_email,
+            to=[message.to_email],
+            connection=connection,
+        )
+        email.attach_alternative(html, "text/html")
+
+        rate_limiter.acquire()
+        try:
+            # send_messages closes connections it opened itself, so open
+            # (or reopen after an error) here to keep one for the batch
+            connection.open()
+            connection.send_messages([email])
+        except Exception as e:
+            logger.exception("Failed to send email to %s", message.to_email)
+            # Start the next message on a fresh connection
+            connection.close()
+            message.last_error = f"{type(e).__name__}: {e}"
+            if _is_transient(e) and message.attempts < OUTBOX_MAX_ATTEMPTS:
+                message.next_attempt_at = timezone.now() + _retry_delay(
+                    message.attempts
+                )
+            else:
+                message.status = OutboxStatus.FAILED
+        else:
+            message.status = OutboxStatus.SENT
+            message.sent_at = timezone.now()
+        return True
+
     def send_verification_email(
         self,
         user: User,
@@ -83,35 +314,14 @@ class DjangoEmailHandler(EmailHandlerInterface):
             "logo_url": EMAIL_LOGO_URL,
             "current_year": timezone.now().year,
         }
-        html, text = render_email("verification_code", context)
-
         subject = "Verify your email - Naglasúpan"
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.email],
-        )
-        email.attach_alternative(html, "text/html")
-        try:
-            email.send(fail_silently=False)
-        except Exception:
-            _log_sent_email(
-                recipient=user,
-                email_type=SentEmailType.VERIFICATION,
-                subject=subject,
-                to_email=user.email,
-                success=False,
-                error_message=f"Failed to send to {user.email}",
-                html_body=html,
-            )
-            raise
-        _log_sent_email(
-            recipient=user,
+        self._queue_email(
             email_type=SentEmailType.VERIFICATION,
-            subject=subject,
+            recipient=user,
             to_email=user.email,
-            html_body=html,
+            subject=subject,
+            template_name="verification_code",
+            context=context,
         )
 
     def send_password_reset_email(
@@ -127,35 +337,14 @@ class DjangoEmailHandler(EmailHandlerInterface):
             "logo_url": EMAIL_LOGO_URL,
             "current_year": timezone.now().year,
         }
-        html, text = render_email("password_reset_code", context)
-
         subject = "Reset your password - Naglasúpan"
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[user.email],
-        )
-        email.attach_alternative(html, "text/html")
-        try:
-            email.send(fail_silently=False)
-        except Exception:
-            _log_sent_email(
-                recipient=user,
-                email_type=SentEmailType.PASSWORD_RESET,
-                subject=subject,
-                to_email=user.email,
-                success=False,
-                error_message=f"Failed to send to {user.email}",
-                html_body=html,
-            )
-            raise
-        _log_sent_email(
-            recipient=user,
+        self._queue_email(
             email_type=SentEmailType.PASSWORD_RESET,
-            subject=subject,
+            recipient=user,
             to_email=user.email,
-            html_body=html,
+            subject=subject,
+            template_name="password_reset_code",
+            context=context,
         )
 
     def send_project_approved_email(self, project: Project) -> None:
@@ -167,91 +356,140 @@ class DjangoEmailHandler(EmailHandlerInterface):
             "logo_url": EMAIL_LOGO_URL,
             "current_year": timezone.now().year,
         }
-        html, text = render_email("project_approved", context)
-
         subject = "Your project has been approved - Naglasúpan"
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[owner.email],
-        )
-        email.attach_alternative(html, "text/html")
-        try:
-            email.send(fail_silently=False)
-        except Exception:
-            _log_sent_email(
-                recipient=owner,
-                email_type=SentEmailType.PROJECT_APPROVED,
-                subject=subject,
-                to_email=owner.email,
-                success=False,
-                error_message=f"Failed to send to {owner.email}",
-                html_body=html,
-            )
-            raise
-        _log_sent_email(
-            recipient=owner,
+        self._queue_email(
             email_type=SentEmailType.PROJECT_APPROVED,
-            subject=subject,
+            recipient=owner,
             to_email=owner.email,
-            html_body=html,
+            subject=subject,
+            template_name="project_approved",
+            context=context,
         )
 
+    def queue_broadcast(self, broadcast: BroadcastEmail, sent_by_user: User) -> None:
+        from api.tasks.email import send_broadcast  # noqa: PLC0415
+
+        recipients = DjangoEmailQuery().resolve_broadcast_recipients(broadcast)
+        broadcast.sent_by = sent_by_user
+        broadcast.send_queued_at = timezone.now()
+        broadcast.total_recipients = recipients.count()
+        broadcast.save(update_fields=["sent_by", "send_queued_at", "total_recipients"])
+        send_broadcast.enqueue(str(broadcast.id))
+
     def send_broadcast(
         self,
         broadcast: BroadcastEmail,
         sent_by_user: User,
     ) -> tuple[int, int]:
+        """Send a broadcast in batches, resuming after any earlier partial run.
+
+        Each batch is claimed by writing its delivery records before anything
+        is sent, so recipients with a record are never emailed again. If a run
+        dies mid-batch, the claimed recipients keep the "interrupted" error.
+        If the mail connection cannot be opened, the batch's claims are
+        dropped and the error is raised, leaving them for the next run.
+        """
+        from services import HANDLERS  # noqa: PLC0415
+
+        # The body may still point at full-size uploads whose email copy the
+        # variant task has not made yet; make it now so rendering swaps it in
+        for image in broadcast.images.all():
+            if image.needs_variants:
+                HANDLERS.image.generate_broadcast_image_variants(str(image.id))
+
         query = DjangoEmailQuery()
         html, text = query.render_broadcast_email(broadcast)
-        recipients = query.resolve_broadcast_recipients(broadcast)
-        success_count = 0
-        failure_count = 0
-
-        for user in recipients.iterator():
-            error_message = ""
-            success = True
-            try:
+        pending = (
+            query.resolve_broadcast_recipients(broadcast)
+            .exclude(broadcast_deliveries__broadcast_email=broadcast)
+            .order_by("id")
+        )
+
+        while records := self._claim_broadcast_batch(broadcast, pending):
+            self._deliver_broadcast_batch(broadcast, records, html, text)
+
+        broadcast.sent_at = timezone.now()
+        broadcast.sent_by = sent_by_user
+        broadcast.save(update_fields=["sent_at", "sent_by"])
+
+        counts = broadcast.delivery_records.aggregate(
+            success_count=Count("id", filter=Q(success=True)),
+            failure_count=Count("id", filter=Q(success=False)),
+        )
+        return counts["success_count"], counts["failure_count"]
+
+    def _claim_broadcast_batch(
+        self, broadcast: BroadcastEmail, pending: QuerySet
+    ) -> list[BroadcastEmailRecipient]:
+        with transaction.atomic():
+            # Serialise claims so two workers never pick the same recipients
+            BroadcastEmail.objects.select_for_update().filter(id=broadcast.id).get()
+            users = list(pending[:BROADCAST_BATCH_SIZE])
+            return BroadcastEmailRecipient.objects.bulk_create(
+                BroadcastEmailRecipient(
+                    broadcast_email=broadcast,
+                    user=user,
+                    success=False,
+                    error_message=BROADCAST_INTERRUPTED_MESSAGE,
+                )
+                for user in users
+            )
+
+    def _deliver_broadcast_batch(
+        self,
+        broadcast: BroadcastEmail,
+        records: list[BroadcastEmailRecipient],
+        html: str,
+        text: str,
+    ) -> None:
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception:
+            # Nothing was sent, so hand the recipients back to the next run
+            BroadcastEmailRecipient.objects.filter(
+                id__in=[record.id for record in records]
+            ).delete()
+            raise
+
+        with connection:
+            for record in records:
                 email = EmailMultiAlternatives(
                     subject=f"{broadcast.subject} - Naglasúpan",
                     body=text,
                     from_email=settings.ADMIN_FROM_EMAIL,
-                    to=[user.email],
+                    to=[record.user.email],
+                    connection=connection,
                 )
                 email.attach_alternative(html, "text/html")
-                email.send(fail_silently=False)
-            except Exception:
-                logger.exception("Failed to send broadcast email to %s", user.email)
-                success = False
-                failure_count += 1
-                error_message = f"Failed to send to {user.email}"
-            else:
-                success_count += 1
-
-            BroadcastEmailRecipient.objects.create(
-                broadcast_email=broadcast,
-                user=user,
-                success=success,
-                error_message=error_message,
-            )
+                try:
+                    connection.send_messages([email])
+                except Exception:
+                    logger.exception(
+                        "Failed to send broadcast email to %s", record.user.email
+                    )
+                    record.error_message = f"Failed to send to {record.user.email}"
+                else:
+                    record.success = True
+                    record.error_message = ""
 
-        broadcast.sent_at = timezone.now()
-        broadcast.sent_by = sent_by_user
-        broadcast.save(update_fields=["sent_at", "sent_by"])
-
-        return success_count, failure_count
+        BroadcastEmailRecipient.objects.bulk_update(
+            records, ["success", "error_message"]
+        )
 
     def send_discussion_notification_email(
         self, notification: Notification, discussion: Discussion
+    ) -> None:
+        self.send_discussion_notification_emails([notification], discussion)
+
+    def send_discussion_notification_emails(
+        self, notifications: Sequence[Notification], discussion: Discussion
     ) -> None:
         author_name = "Someone"
         if discussion.author:
             author_name = discussion.author.full_name or discussion.author.email
 
-        recipient = notification.recipient
-        context = {
-            "recipient_name": recipient.first_name or "there",
+        shared_context = {
             "author_name": author_name,
             "author_initial": author_name[0].upper() if author_name else "?",
             "project_title": discussion.project.title,
@@ -266,35 +504,24 @@ class DjangoEmailHandler(EmailHandlerInterface):
             "logo_url": f"{settings.S3_PUBLIC_URL_BASE}/email/logo.png",
             "current_year": timezone.now().year,
         }
-        html, text = render_email("discussion_notification", context)
-
         subject = f"New comment on {discussion.project.title} - Naglasúpan"
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[recipient.email],
-        )
-        email.attach_alternative(html, "text/html")
-        try:
-            email.send(fail_silently=False)
-        except Exception:
-            _log_sent_email(
-                recipient=recipient,
-                email_type=SentEmailType.DISCUSSION_NOTIFICATION,
-                subject=subject,
-                to_email=recipient.email,
-                success=False,
-                error_message=f"Failed to send to {recipient.email}",
-                html_body=html,
-            )
-            raise
-        _log_sent_email(
-            recipient=recipient,
-            email_type=SentEmailType.DISCUSSION_NOTIFICATION,
-            subject=subject,
-            to_email=recipient.email,
-            html_body=html,
+        self._queue_emails(
+            [
+                OutboxEmail(
+                    email_type=SentEmailType.DISCUSSION_NOTIFICATION,
+                    priority=OUTBOX_PRIORITIES[SentEmailType.DISCUSSION_NOTIFICATION],
+                    recipient=notification.recipient,
+                    to_email=notification.recipient.email,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    subject=subject,
+                    template_name="discussion_notification",
+                    context={
+                        "recipient_name": notification.recipient.first_name or "there",
+                        **shared_context,
+                    },
+                )
+                for notification in notifications
+            ]
         )
 
     def send_discussion_digest_email(
@@ -302,7 +529,14 @@ class DjangoEmailHandler(EmailHandlerInterface):
     ) -> None:
         if not notifications:
             return
+        self._queue_emails([self._digest_message(notifications)])
+
+    def send_discussion_digest_emails(
+        self, digests: Sequence[Sequence[Notification]]
+    ) -> None:
+        self._queue_emails([self._digest_message(n) for n in digests if n])
 
+    def _digest_message(self, notifications: Sequence[Notification]) -> OutboxEmail:
         recipient = notifications[0].recipient
 
         context = {
@@ -313,33 +547,13 @@ class DjangoEmailHandler(EmailHandlerInterface):
             "logo_url": f"{settings.S3_PUBLIC_URL_BASE}/email/logo.png",
             "current_year": timezone.now().year,
         }
-        html, text = render_email("discussion_digest", context)
-
-        subject = "Discussion updates - Naglasúpan"
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=[recipient.email],
-        )
-        email.attach_alternative(html, "text/html")
-        try:
-            email.send(fail_silently=False)
-        except Exception:
-            _log_sent_email(
-                recipient=recipient,
-                email_type=SentEmailType.DISCUSSION_DIGEST,
-                subject=subject,
-                to_email=recipient.email,
-                success=False,
-                error_message=f"Failed to send to {recipient.email}",
-                html_body=html,
-            )
-            raise
-        _log_sent_email(
-            recipient=recipient,
+        return OutboxEmail(
             email_type=SentEmailType.DISCUSSION_DIGEST,
-            subject=subject,
+            priority=OUTBOX_PRIORITIES[SentEmailType.DISCUSSION_DIGEST],
+            recipient=recipient,
             to_email=recipient.email,
-            html_body=html,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            subject="Discussion updates - Naglasúpan",
+            template_name="discussion_digest",
+            context=context,
         )
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING
 
 import markdown
 from django.conf import settings
+from django.template import engines
 from django.utils import timezone
 
 from services.email import EMAIL_LOGO_URL
@@ -15,19 +16,26 @@ from . import render_email
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
-    from apps.emails.models import BroadcastEmail
+    from apps.emails.models import BroadcastEmail, SentEmail
 
 
 class DjangoEmailQuery(EmailQueryInterface):
     def render_broadcast_email(self, broadcast: BroadcastEmail) -> tuple[str, str]:
+        body_markdown = broadcast.body_markdown
+        # Images inserted before their email-sized copy existed still point at
+        # the full-size upload; send_broadcast makes any missing copies first
+        saved = not broadcast._state.adding  # noqa: SLF001
+        for image in broadcast.images.all() if saved else []:
+            if image.image:
+                body_markdown = body_markdown.replace(image.image.url, image.url)
         body_html = markdown.markdown(
-            broadcast.body_markdown,
+            body_markdown,
             extensions=["extra", "smarty"],
         )
         context = {
             "subject": broadcast.subject,
             "body_html": body_html,
-            "body_markdown": broadcast.body_markdown,
+            "body_markdown": body_markdown,
             "profile_url": f"{settings.FRONTEND_URL}/profile",
             "logo_url": EMAIL_LOGO_URL,
             "current_year": timezone.now().year,
@@ -40,3 +48,9 @@ class DjangoEmailQuery(EmailQueryInterface):
                 broadcast.email_type
             )
         return broadcast.individual_recipients.filter(is_active=True)
+
+    def render_sent_email(self, sent_email: SentEmail) -> str:
+        if sent_email.body_template_id is None:
+            return sent_email.html_body
+        template = engines["django"].from_string(sent_email.body_template.html)
+        return template.render(sent_email.body_context)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.emails.models import SendRateBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+
+class TokenBucket:
+    """Blocking token bucket: ``rate`` sends per second, bursts up to ``capacity``.
+
+    The bucket lives in a SendRateBucket row, so every process acquiring from
+    the same ``name`` shares one limit. A token is reserved under the row lock
+    and any shortfall is slept off after the lock is released, so concurrent
+    senders queue behind each other without holding the row while they wait.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], datetime] = timezone.now,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+
+    def _reserve(self) -> float:
+        """Take one token, possibly on credit. Returns the seconds to wait."""
+        with transaction.atomic():
+            now = self._clock()
+            bucket, _ = SendRateBucket.objects.select_for_update().get_or_create(
+                name=self.name,
+                defaults={"tokens": self.capacity, "updated_at": now},
+            )
+            # Clamped so a process whose clock lags cannot mint tokens
+            elapsed = max((now - bucket.updated_at).total_seconds(), 0)
+            bucket.tokens = min(self.capacity, bucket.tokens + elapsed * self.rate) - 1
+            bucket.updated_at = max(now, bucket.updated_at)
+            bucket.save(update_fields=["tokens", "updated_at"])
+        return max(-bucket.tokens / self.rate, 0)
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it is available."""
+        wait = self._reserve()
+        if wait > 0:
+            self._sleep(wait)
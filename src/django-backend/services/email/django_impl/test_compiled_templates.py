@@ -0,0 +1,127 @@
+import re
+from unittest.mock import patch
+
+import pytest
+from django.template.loader import render_to_string
+from mjml import mjml_to_html
+
+from . import compiled_templates, render_email
+
+
+def _collapse_whitespace(html: str) -> str:
+    return re.sub(r">\s+<", "><", html)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(settings, tmp_path):
+    settings.EMAIL_TEMPLATE_CACHE_DIR = tmp_path
+    settings.EMAIL_TEMPLATE_BUILD_DIR = tmp_path / "build"
+    compiled_templates.clear_cache()
+    yield tmp_path
+    compiled_templates.clear_cache()
+
+
+DIGEST_CONTEXT = {
+    "recipient_name": "Jo & Co",
+    "groups": [
+        {"project_url": "https://x/1", "project_title": "<One>", "comment_count": 1},
+        {"project_url": "https://x/2", "project_title": "Two", "comment_count": 3},
+    ],
+    "site_url": "https://x",
+    "profile_url": "https://x/profile?a=1&b=2",
+    "logo_url": "https://x/logo.png",
+    "current_year": 2026,
+}
+
+
+class TestCompiledTemplates:
+    def test_matches_live_mjml_render(self):
+        live = mjml_to_html(
+            render_to_string("email/discussion_digest.mjml", DIGEST_CONTEXT)
+        ).html
+
+        html, _ = render_email("discussion_digest", DIGEST_CONTEXT)
+
+        assert _collapse_whitespace(html) == _collapse_whitespace(live)
+
+    def test_inlines_base_template_blocks(self):
+        source = compiled_templates.flatten_template("email/broadcast.mjml")
+
+        assert "{% extends" not in source
+        assert "{% block" not in source
+        assert "{{ subject }} - Naglasúpan" in source
+        assert "Manage your email preferences" in source
+
+    def test_compiles_each_template_once(self):
+        with patch.object(
+            compiled_templates,
+            "mjml_to_html",
+            wraps=compiled_templates.mjml_to_html,
+        ) as mock_compile:
+            render_email("discussion_digest", DIGEST_CONTEXT)
+            render_email("discussion_digest", {**DIGEST_CONTEXT, "groups": []})
+
+        assert mock_compile.call_count == 1
+
+    def test_reuses_compiled_template_from_disk(self, cache_dir):
+        render_email("discussion_digest", DIGEST_CONTEXT)
+        compiled_templates.clear_cache()
+
+        with patch.object(compiled_templates, "mjml_to_html") as mock_compile:
+            html, _ = render_email("discussion_digest", DIGEST_CONTEXT)
+
+        mock_compile.assert_not_called()
+        assert "Jo &amp; Co" in html
+        assert len(list(cache_dir.glob("discussion_digest-*.html"))) == 1
+
+    def test_source_change_recompiles_in_debug(self, settings):
+        settings.DEBUG = True
+        render_email("discussion_digest", DIGEST_CONTEXT)
+
+        with patch.object(
+            compiled_templates,
+            "flatten_template",
+            return_value="<mjml><mj-body><mj-text>{{ recipient_name }}</mj-text>"
+            "</mj-body></mjml>",
+        ):
+            html, _ = render_email("discussion_digest", DIGEST_CONTEXT)
+
+        assert "Jo &amp; Co" in html
+        assert "There's been some activity" not in html
+
+
+class TestBuildTemplates:
+    def test_writes_artifacts_and_manifest(self, settings):
+        build_dir = settings.EMAIL_TEMPLATE_BUILD_DIR
+
+        manifest = compiled_templates.build_templates(build_dir)
+
+        assert "discussion_digest" in manifest
+        entry = manifest["discussion_digest"]
+        source = compiled_templates.flatten_template("email/discussion_digest.mjml")
+        assert entry["source_digest"] == compiled_templates.source_digest(source)
+        assert "{% for group in groups %}" in (build_dir / entry["file"]).read_text()
+        assert (build_dir / compiled_templates.MANIFEST_NAME).exists()
+
+    def test_renders_from_build_without_compiling(self, settings):
+        compiled_templates.build_templates(settings.EMAIL_TEMPLATE_BUILD_DIR)
+
+        with (
+            patch.object(compiled_templates, "mjml_to_html") as mock_compile,
+            patch.object(compiled_templates, "flatten_template") as mock_flatten,
+        ):
+            html, _ = render_email("discussion_digest", DIGEST_CONTEXT)
+
+        mock_compile.assert_not_called()
+        mock_flatten.assert_not_called()
+        assert "Jo &amp; Co" in html
+
+    def test_debug_ignores_build(self, settings):
+        settings.DEBUG = True
+        build_dir = settings.EMAIL_TEMPLATE_BUILD_DIR
+        manifest = compiled_templates.build_templates(build_dir)
+        (build_dir / manifest["discussion_digest"]["file"]).write_text("stale")
+
+        html, _ = render_email("discussion_digest", DIGEST_CONTEXT)
+
+        assert "Jo &amp; Co" in html
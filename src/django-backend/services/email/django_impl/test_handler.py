@@ -1,11 +1,29 @@
+import io
+import smtplib
+from datetime import timedelta
 from unittest.mock import patch
 
 import pytest
-
-from apps.emails.models import BroadcastEmailRecipient
-from services.email.django_impl import DjangoEmailHandler
+from django.core.files.base import ContentFile
+from django.core.mail import get_connection
+from django.utils import timezone
+from PIL import Image
+
+from apps.emails.models import (
+    BroadcastEmailImage,
+    BroadcastEmailRecipient,
+    EmailBodyTemplate,
+    OutboxEmail,
+    OutboxPriority,
+    OutboxStatus,
+    SentEmail,
+    SentEmailType,
+)
+from services.email.django_impl import DjangoEmailHandler, DjangoEmailQuery
+from services.email.django_impl.handler import OUTBOX_MAX_ATTEMPTS
 from tests.factories import (
     BroadcastEmailFactory,
+    BroadcastEmailImageFactory,
     DiscussionFactory,
     NotificationFactory,
     ProjectFactory,
@@ -45,6 +63,35 @@ class TestSendVerificationEmail:
         assert "#ffffff" in html_content  # white background
 
 
+@pytest.mark.django_db
+class TestSentEmailLog:
+    def test_stores_template_and_context_instead_of_html(self, mailoutbox):
+        user = UserFactory(first_name="Alice")
+
+        handler.send_verification_email(user, "987654", expires_minutes=15)
+
+        sent_email = SentEmail.objects.get(recipient=user)
+        assert sent_email.html_body == ""
+        assert sent_email.body_template.template_name == "verification_code"
+        assert sent_email.body_context["code"] == "987654"
+
+    def test_rerendered_body_matches_sent_html(self, mailoutbox):
+        user = UserFactory(first_name="Alice")
+
+        handler.send_verification_email(user, "987654", expires_minutes=15)
+
+        sent_email = SentEmail.objects.get(recipient=user)
+        sent_html, _ = mailoutbox[0].alternatives[0]
+        assert DjangoEmailQuery().render_sent_email(sent_email) == sent_html
+
+    def test_emails_share_one_stored_template(self, mailoutbox):
+        for code in ("111111", "222222"):
+            handler.send_verification_email(UserFactory(), code, expires_minutes=15)
+
+        assert EmailBodyTemplate.objects.count() == 1
+        assert SentEmail.objects.filter(body_template__isnull=False).count() == 2
+
+
 @pytest.mark.django_db
 class TestSendProjectApprovedEmail:
     def test_sends_email_with_html_and_text_parts(self, mailoutbox):
@@ -111,7 +158,7 @@ class TestSendBroadcast:
         call_count = 0
 
         with patch(
-            "services.email.django_impl.handler.EmailMultiAlternatives.send",
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
         ) as mock_send:
 
             def fail_first(*args, **kwargs):
@@ -120,6 +167,7 @@ class TestSendBroadcast:
                 if call_count == 1:
                     msg = "SMTP error"
                     raise Exception(msg)  # noqa: TRY002
+                return 1
 
             mock_send.side_effect = fail_first
             success_count, failure_count = handler.send_broadcast(broadcast, admin)
@@ -131,7 +179,7 @@ class TestSendBroadcast:
         broadcast, admin, _ = self._make_broadcast_with_recipients(1)
 
         with patch(
-            "services.email.django_impl.handler.EmailMultiAlternatives.send",
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
             side_effect=Exception("SMTP error"),
         ):
             handler.send_broadcast(broadcast, admin)
@@ -140,6 +188,63 @@ class TestSendBroadcast:
         assert record.success is False
         assert record.error_message != ""
 
+    def test_reuses_one_connection_per_batch(self, mailoutbox):
+        broadcast, admin, _ = self._make_broadcast_with_recipients(3)
+
+        with (
+            patch("services.email.django_impl.handler.BROADCAST_BATCH_SIZE", 2),
+            patch(
+                "services.email.django_impl.handler.get_connection",
+                wraps=get_connection,
+            ) as mock_get_connection,
+        ):
+            handler.send_broadcast(broadcast, admin)
+
+        assert mock_get_connection.call_count == 2
+        assert len(mailoutbox) == 3
+
+    def test_connection_failure_leaves_recipients_for_the_next_run(self, mailoutbox):
+        broadcast, admin, _ = self._make_broadcast_with_recipients(2)
+
+        with (
+            patch(
+                "django.core.mail.backends.locmem.EmailBackend.open",
+                side_effect=OSError("Connection refused"),
+            ),
+            pytest.raises(OSError, match="Connection refused"),
+        ):
+            handler.send_broadcast(broadcast, admin)
+
+        assert not BroadcastEmailRecipient.objects.filter(
+            broadcast_email=broadcast
+        ).exists()
+        broadcast.refresh_from_db()
+        assert broadcast.sent_at is None
+
+        assert handler.send_broadcast(broadcast, admin) == (2, 0)
+        assert len(mailoutbox) == 2
+
+    def test_resume_skips_recipients_already_processed(self, mailoutbox):
+        broadcast, admin, users = self._make_broadcast_with_recipients(2)
+        BroadcastEmailRecipient.objects.create(broadcast_email=broadcast, user=users[0])
+
+        success_count, failure_count = handler.send_broadcast(broadcast, admin)
+
+        assert [m.to for m in mailoutbox] == [[users[1].email]]
+        assert (success_count, failure_count) == (2, 0)
+
+    def test_queue_broadcast_records_progress_and_sends(self, mailoutbox):
+        broadcast, admin, _ = self._make_broadcast_with_recipients(2)
+
+        handler.queue_broadcast(broadcast, admin)
+
+        broadcast.refresh_from_db()
+        assert broadcast.send_queued_at is not None
+        assert broadcast.total_recipients == 2
+        assert broadcast.sent_by == admin
+        assert broadcast.sent_at is not None
+        assert len(mailoutbox) == 2
+
     def test_returns_correct_counts(self, mailoutbox):
         broadcast, admin, _ = self._make_broadcast_with_recipients(2)
         success_count, failure_count = handler.send_broadcast(broadcast, admin)
@@ -161,6 +266,26 @@ class TestSendBroadcast:
         assert mime == "text/html"
         assert "<strong>world</strong>" in html
 
+    def test_makes_missing_email_image_copies_before_sending(self, mailoutbox):
+        broadcast, admin, _ = self._make_broadcast_with_recipients(1)
+        buffer = io.BytesIO()
+        Image.new("RGB", (3000, 2000), "red").save(buffer, format="JPEG")
+        image = BroadcastEmailImageFactory(broadcast_email=broadcast)
+        image.image.save("photo.jpg", ContentFile(buffer.getvalue()), save=False)
+        # As the admin leaves it: the variant task has not run yet
+        BroadcastEmailImage.objects.filter(id=image.id).update(image=image.image)
+        original_url = image.image.url
+        broadcast.body_markdown = f"![photo]({original_url})"
+        broadcast.save()
+
+        handler.send_broadcast(broadcast, admin)
+
+        image.refresh_from_db()
+        html, _ = mailoutbox[0].alternatives[0]
+        assert image.url != original_url
+        assert image.url in html
+        assert original_url not in html
+
     def test_email_subject_includes_naglasupan(self, mailoutbox):
         broadcast, admin, _ = self._make_broadcast_with_recipients(
             1,
@@ -239,3 +364,145 @@ class TestSendDiscussionNotificationEmail:
         # The context passes body[:500], so the full 1000-char body should not appear
         assert long_body not in mailoutbox[0].body
         assert "x" * 500 in mailoutbox[0].body
+
+
+_SEND_MESSAGES = "django.core.mail.backends.locmem.EmailBackend.send_messages"
+
+
+def _outbox_email(**kwargs):
+    defaults = {
+        "email_type": SentEmailType.VERIFICATION,
+        "priority": OutboxPriority.CODE,
+        "to_email": "someone@example.com",
+        "from_email": "noreply@example.com",
+        "subject": "Verify your email - Naglasúpan",
+        "template_name": "verification_code",
+        "context": {
+            "code": "123456",
+            "expiry_minutes": 15,
+            "user_name": "there",
+            "logo_url": "https://example.com/logo.png",
+            "current_year": 2026,
+        },
+    }
+    return OutboxEmail.objects.create(**{**defaults, **kwargs})
+
+
+@pytest.mark.django_db
+class TestEmailOutbox:
+    def test_send_queues_and_dispatches(self, mailoutbox):
+        user = UserFactory()
+
+        handler.send_verification_email(user, "987654", expires_minutes=15)
+
+        message = OutboxEmail.objects.get(recipient=user)
+        assert message.priority == OutboxPriority.CODE
+        assert message.status == OutboxStatus.SENT
+        assert message.attempts == 1
+        assert len(mailoutbox) == 1
+        assert SentEmail.objects.get(recipient=user).success is True
+
+    def test_sends_codes_before_digests(self, mailoutbox):
+        _outbox_email(
+            email_type=SentEmailType.DISCUSSION_DIGEST,
+            priority=OutboxPriority.DIGEST,
+            subject="Digest",
+            template_name="discussion_digest",
+            context={"groups": []},
+        )
+        _outbox_email(subject="Code")
+
+        handler.dispatch_outbox()
+
+        assert [m.subject for m in mailoutbox] == ["Code", "Digest"]
+
+    def test_batch_shares_one_connection(self, mailoutbox):
+        for _ in range(3):
+            _outbox_email()
+
+        with patch(
+            "services.email.django_impl.handler.get_connection",
+            wraps=get_connection,
+        ) as mock_get_connection:
+            handler.dispatch_outbox()
+
+        assert mock_get_connection.call_count == 1
+        assert len(mailoutbox) == 3
+        assert SentEmail.objects.count() == 3
+
+    def test_transient_failure_is_retried_with_backoff(self):
+        message = _outbox_email()
+
+        with patch(_SEND_MESSAGES, side_effect=smtplib.SMTPServerDisconnected()):
+            next_attempt_at = handler.dispatch_outbox()
+
+        message.refresh_from_db()
+        assert message.status == OutboxStatus.PENDING
+        assert message.attempts == 1
+        assert message.next_attempt_at > timezone.now() + timedelta(seconds=20)
+        assert next_attempt_at == message.next_attempt_at
+        assert not SentEmail.objects.exists()
+
+    def test_retry_is_sent_once_due(self, mailoutbox):
+        message = _outbox_email(attempts=1, next_attempt_at=timezone.now())
+
+        handler.dispatch_outbox()
+
+        message.refresh_from_db()
+        assert message.status == OutboxStatus.SENT
+        assert message.attempts == 2
+        assert len(mailoutbox) == 1
+
+    def test_permanent_failure_is_not_retried(self):
+        message = _outbox_email()
+        refused = smtplib.SMTPRecipientsRefused(
+            {"someone@example.com": (550, b"No such user")}
+        )
+
+        with patch(_SEND_MESSAGES, side_effect=refused):
+            handler.dispatch_outbox()
+
+        message.refresh_from_db()
+        assert message.status == OutboxStatus.FAILED
+        sent_email = SentEmail.objects.get()
+        assert sent_email.success is False
+
+    def test_gives_up_after_max_attempts(self):
+        message = _outbox_email(attempts=OUTBOX_MAX_ATTEMPTS - 1)
+
+        with patch(_SEND_MESSAGES, side_effect=smtplib.SMTPServerDisconnected()):
+            next_attempt_at = handler.dispatch_outbox()
+
+        message.refresh_from_db()
+        assert message.status == OutboxStatus.FAILED
+        assert message.attempts == OUTBOX_MAX_ATTEMPTS
+        assert next_attempt_at is None
+
+    def test_render_failure_fails_only_that_message(self, mailoutbox):
+        broken = _outbox_email(template_name="no_such_template")
+        _outbox_email()
+
+        next_attempt_at = handler.dispatch_outbox()
+
+        broken.refresh_from_db()
+        assert broken.status == OutboxStatus.FAILED
+        assert broken.last_error.startswith("TemplateDoesNotExist")
+        assert next_attempt_at is None
+        assert len(mailoutbox) == 1
+        assert sorted(SentEmail.objects.values_list("success", flat=True)) == [
+            False,
+            True,
+        ]
+
+    def test_ignores_messages_claimed_by_another_dispatcher(self):
+        now = timezone.now()
+        _outbox_email(attempts=1, claimed_at=now, next_attempt_at=now + timedelta(1))
+
+        assert handler.dispatch_outbox() is None
+
+    def test_skips_messages_not_yet_due(self, mailoutbox):
+        _outbox_email(next_attempt_at=timezone.now() + timedelta(minutes=1))
+
+        handler.dispatch_outbox()
+
+        assert mailoutbox == []
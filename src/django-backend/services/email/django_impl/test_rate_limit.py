@@ -0,0 +1,81 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from .rate_limit import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime(2026, 1, 1, tzinfo=UTC)
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += timedelta(seconds=seconds)
+
+
+@pytest.mark.django_db
+class TestTokenBucket:
+    def _bucket(self, clock, rate, capacity):
+        return TokenBucket(
+            "test", rate=rate, capacity=capacity, clock=clock, sleep=clock.sleep
+        )
+
+    def test_allows_burst_without_waiting(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=2, capacity=3)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_waits_for_refill_once_empty(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=2, capacity=1)
+
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == [0.5]
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = self._bucket(clock, rate=2, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+
+        clock.now += timedelta(seconds=1)
+        bucket.acquire()
+        bucket.acquire()
+
+        assert clock.sleeps == []
+
+    def test_is_shared_between_instances(self):
+        # As if each were in a different worker process
+        clock = FakeClock()
+        first = self._bucket(clock, rate=2, capacity=1)
+        second = self._bucket(clock, rate=2, capacity=1)
+
+        first.acquire()
+        second.acquire()
+
+        assert clock.sleeps == [0.5]
+
+    def test_concurrent_waiters_queue_behind_each_other(self):
+        clock = FakeClock()
+        waits = []
+        buckets = [
+            TokenBucket("test", rate=2, capacity=1, clock=clock, sleep=waits.append)
+            for _ in range(3)
+        ]
+
+        # Nobody has slept yet, so each reserves the next slot along
+        for bucket in buckets:
+            bucket.acquire()
+
+        assert waits == [0.5, 1.0]
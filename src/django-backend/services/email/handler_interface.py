@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from datetime import datetime
 
     from apps.discussions.models import Discussion
     from apps.emails.models import BroadcastEmail
@@ -27,6 +28,14 @@ class EmailHandlerInterface(ABC):
         self, user: User, code: str, expires_minutes: int
     ) -> None: ...
 
+    @abstractmethod
+    def dispatch_outbox(self) -> datetime | None:
+        """Send due outbox emails; return when the next retry is due, if any."""
+
+    @abstractmethod
+    def queue_broadcast(self, broadcast: BroadcastEmail, sent_by_user: User) -> None:
+        """Record who is sending the broadcast and hand it to a background task."""
+
     @abstractmethod
     def send_broadcast(
         self, broadcast: BroadcastEmail, sent_by_user: User
@@ -37,7 +46,19 @@ class EmailHandlerInterface(ABC):
         self, notification: Notification, discussion: Discussion
     ) -> None: ...
 
+    @abstractmethod
+    def send_discussion_notification_emails(
+        self, notifications: Sequence[Notification], discussion: Discussion
+    ) -> None:
+        """Queue one notification email per recipient of a single comment."""
+
     @abstractmethod
     def send_discussion_digest_email(
         self, notifications: Sequence[Notification]
     ) -> None: ...
+
+    @abstractmethod
+    def send_discussion_digest_emails(
+        self, digests: Sequence[Sequence[Notification]]
+    ) -> None:
+        """Queue one digest per group of a single recipient's notifications."""
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from django.db.models import QuerySet
 
-    from apps.emails.models import BroadcastEmail
+    from apps.emails.models import BroadcastEmail, SentEmail
 
 
 class EmailQueryInterface(ABC):
@@ -15,3 +15,7 @@ class EmailQueryInterface(ABC):
 
     @abstractmethod
     def resolve_broadcast_recipients(self, broadcast: BroadcastEmail) -> QuerySet: ...
+
+    @abstractmethod
+    def render_sent_email(self, sent_email: SentEmail) -> str:
+        """Return the HTML body of a logged email, or "" if none was kept."""
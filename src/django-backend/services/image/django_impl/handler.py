@@ -1,27 +1,234 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import logging
+import struct
+from datetime import timedelta
 from pathlib import PurePosixPath
+from typing import TYPE_CHECKING
 
-from PIL import Image
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from PIL import Image, ImageCms, ImageFile, ImageOps
 
+from apps.emails.models import BROADCAST_IMAGE_EMAIL_WIDTH, BroadcastEmailImage
 from apps.projects.models import (
+    DERIVATIVE_WIDTHS,
     VARIANT_SIZE_WIDTHS,
+    Competition,
+    ImageBlob,
+    ImageDerivative,
     ImageVariant,
     ProjectImage,
+    StorageDeletion,
     UploadStatus,
     VariantSize,
 )
-from services.image.handler_interface import ImageHandlerInterface
-from services.storage import storage_service
+from services.image.exceptions import (
+    DerivativePendingError,
+    ImageNotFoundError,
+    ImageNotInStorageError,
+    InvalidImageError,
+    UnsupportedFormatError,
+)
+from services.image.handler_interface import ImageHandlerInterface, ImageProbe
+from services.storage import (
+    DELETE_BATCH_SIZE,
+    ObjectNotFoundError,
+    storage_service,
+)
+
+if TYPE_CHECKING:
+    from django.db.models.fields.files import FieldFile
 
 logger = logging.getLogger(__name__)
 
 WEBP_QUALITY = 80
+JPEG_QUALITY = 85
+
+# Pillow format -> file extension for variants of uploaded file fields
+FORMAT_EXTENSIONS = {"WEBP": "webp", "JPEG": "jpg", "PNG": "png"}
+
+# Derivative extension -> (Pillow format, content type)
+DERIVATIVE_FORMATS = {
+    "webp": ("WEBP", "image/webp"),
+    "jpg": ("JPEG", "image/jpeg"),
+}
+
+# Pillow format -> content type for uploads. Explicit rather than Image.MIME,
+# which only lists formats whose plugins have been loaded, and maps the
+# multi-picture JPEGs many cameras write to image/mpo
+PROBE_CONTENT_TYPES = {
+    "JPEG": "image/jpeg",
+    "MPO": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+# Enough for the header of PNG, GIF, WebP and most JPEGs
+PROBE_BYTES = 16 * 1024
+# JPEGs carrying large EXIF/ICC segments put the frame header further in
+PROBE_RETRY_BYTES = 256 * 1024
+
+# Served originals are capped to this many pixels on the longest edge
+MAX_ORIGINAL_DIMENSION = 3840
+OPTIMIZED_JPEG_QUALITY = 90
+# Formats re-encoded to lossless WebP; anything else that isn't JPEG is
+# re-encoded to near-lossless WebP
+LOSSLESS_FORMATS = {"PNG", "GIF", "BMP", "TIFF"}
+
+PROJECT_IMAGES_PREFIX = "projects/"
+# Pending uploads older than this are assumed abandoned
+STALE_UPLOAD_AGE = timedelta(days=1)
+# Unreferenced objects younger than this are left alone by the sweep
+ORPHAN_GRACE_PERIOD = timedelta(hours=6)
+# A derivative claimed this long ago without being stored is encoded again
+DERIVATIVE_CLAIM_TIMEOUT = timedelta(minutes=2)
+
+
+def _read_webp_header(data: bytes) -> tuple[int, int] | None:
+    """Parse WebP dimensions from the RIFF header.
+
+    Pillow's WebP plugin hands the whole file to libwebp, so it cannot open
+    a truncated prefix the way the other formats can.
+    """
+    if len(data) < 30 or data[:4] != b"RIFF" or data[8:12] != b"WEBP":  # noqa: PLR2004
+        return None
+    chunk = data[12:16]
+    if chunk == b"VP8X":
+        width = 1 + int.from_bytes(data[24:27], "little")
+        height = 1 + int.from_bytes(data[27:30], "little")
+        return width, height
+    if chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and data[20] == 0x2F:  # noqa: PLR2004
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    return None
+
+
+def _read_header(data: bytes) -> tuple[str, int, int] | None:
+    """Return (format, width, height) from the leading bytes of an image."""
+    webp = _read_webp_header(data)
+    if webp:
+        return "WEBP", *webp
+
+    parser = ImageFile.Parser()
+    try:
+        parser.feed(data)
+    except (OSError, SyntaxError):
+        return None
+    if parser.image is None:
+        return None
+    return parser.image.format, parser.image.width, parser.image.height
+
+
+def snap_width(width: int, original_width: int | None = None) -> int | None:
+    """Round a requested width up to the nearest allowed derivative width.
+
+    Without upscaling past ``original_width``: a request wider than the
+    original gets the widest allowed width that fits, or None if none does.
+    """
+    width = next((w for w in DERIVATIVE_WIDTHS if w >= width), DERIVATIVE_WIDTHS[-1])
+    if original_width and width > original_width:
+        return next(
+            (w for w in reversed(DERIVATIVE_WIDTHS) if w <= original_width), None
+        )
+    return width
+
+
+def _encode_resized(
+    img: Image.Image, target_width: int, pil_format: str
+) -> tuple[bytes, int, int]:
+    """Resize to ``target_width`` and encode. Returns (data, width, height)."""
+    target_height = round(img.height * target_width / img.width)
+
+    # Resize with high-quality resampling
+    resized = img.copy()
+    resized.thumbnail((target_width, target_height), Image.LANCZOS)
+
+    if pil_format == "JPEG" and resized.mode not in {"RGB", "L"}:
+        resized = resized.convert("RGB")
+    buffer = io.BytesIO()
+    resized.save(
+        buffer,
+        format=pil_format,
+        quality=JPEG_QUALITY if pil_format == "JPEG" else WEBP_QUALITY,
+    )
+    return buffer.getvalue(), resized.width, resized.height
+
+
+def _to_srgb(img: Image.Image, icc_profile: bytes) -> Image.Image:
+    """Convert pixels from an embedded colour profile to sRGB."""
+    try:
+        return ImageCms.profileToProfile(
+            img,
+            ImageCms.ImageCmsProfile(io.BytesIO(icc_profile)),
+            ImageCms.createProfile("sRGB"),
+            outputMode="RGBA" if img.mode in {"RGBA", "LA"} else "RGB",
+        )
+    except (ImageCms.PyCMSError, OSError, ValueError):
+        logger.warning("Could not convert embedded colour profile, dropping it")
+        return img
+
+
+def _email_safe_format(img: Image.Image) -> str:
+    """Pick JPEG, or PNG for transparent images; not every mail client has WebP."""
+    if img.mode in {"RGBA", "LA"} or "transparency" in img.info:
+        return "PNG"
+    return "JPEG"
+
+
+def _match_variant(
+    variants: list[ImageVariant], width: int, fmt: str
+) -> ImageVariant | None:
+    """A pre-generated size that can stand in for a derivative.
+
+    They are WebP, so only serve WebP requests of exactly their width.
+    """
+    if fmt != "webp":
+        return None
+    return next((v for v in variants if v.width == width), None)
 
 
 class DjangoImageHandler(ImageHandlerInterface):
+    def probe_upload(self, storage_key: str, content_type: str) -> ImageProbe:
+        try:
+            data, file_size = storage_service.download_range(
+                storage_key, 0, PROBE_BYTES - 1
+            )
+        except ObjectNotFoundError:
+            raise ImageNotInStorageError from None
+
+        header = _read_header(data)
+        if header is None and file_size > len(data):
+            data, file_size = storage_service.download_range(
+                storage_key, 0, PROBE_RETRY_BYTES - 1
+            )
+            header = _read_header(data)
+
+        if header is None:
+            msg = "Uploaded file is not a recognised image"
+            raise InvalidImageError(msg)
+
+        fmt, width, height = header
+        detected = PROBE_CONTENT_TYPES.get(fmt)
+        if detected != content_type:
+            msg = f"Uploaded file is {detected or fmt}, expected {content_type}"
+            raise InvalidImageError(msg)
+
+        return ImageProbe(
+            content_type=detected,
+            width=width,
+            height=height,
+            file_size=file_size,
+        )
+
     def generate_variants(self, image_id: str) -> None:
         try:
             image = ProjectImage.objects.get(
@@ -40,47 +247,549 @@ class DjangoImageHandler(ImageHandlerInterface):
             logger.exception("Failed to download original image %s from S3", image_id)
             return
 
+        if not image.content_hash:
+            self._register_content(image, original_bytes)
+
+        existing_sizes = set(image.variants.values_list("size", flat=True))
+        if (
+            image.optimized_key
+            and image.width
+            and not self._missing_sizes(image.width, existing_sizes)
+        ):
+            # Everything was reused from an identical upload (or already
+            # generated), so there is nothing to decode.
+            return
+
+        img = self._prepare_original(image, original_bytes)
+        if img is None:
+            return
+
+        # Strip the file extension from the storage key to build variant paths
+        p = PurePosixPath(image.storage_key)
+        base_key = str(p.parent / p.stem)
+
+        for size in self._missing_sizes(image.width, existing_sizes):
+            try:
+                self._generate_single_variant(
+                    img, image, base_key, size, VARIANT_SIZE_WIDTHS[size]
+                )
+            except Exception:
+                logger.exception(
+                    "Failed to generate %s variant for image %s", size, image_id
+                )
+
+    def get_derivative_url(self, image_id: str, width: int, fmt: str) -> str:
+        if fmt not in DERIVATIVE_FORMATS:
+            raise UnsupportedFormatError(fmt)
         try:
-            img = Image.open(io.BytesIO(original_bytes))
-            img.load()
-        except Exception:
-            logger.exception("Failed to decode image %s", image_id)
+            image = ProjectImage.objects.get(
+                id=image_id, upload_status=UploadStatus.UPLOADED
+            )
+        except ProjectImage.DoesNotExist:
+            raise ImageNotFoundError from None
+
+        width = snap_width(width, image.width)
+        if width is None:
+            # Narrower than the smallest derivative; never upscale
+            return image.url
+
+        variants = list(image.variants.all())
+        variant = _match_variant(variants, width, fmt)
+        if variant is not None:
+            return variant.url
+
+        derivative, claimed = self._claim_derivative(image, width, fmt)
+        if claimed:
+            self._create_derivative(derivative, image, variants)
+        elif not derivative.storage_key:
+            raise DerivativePendingError(image.url)
+        return derivative.url
+
+    def generate_competition_variants(self, competition_id: str) -> None:
+        competition = Competition.objects.filter(id=competition_id).first()
+        if competition is None or not competition.needs_image_variants:
+            return
+        variants = self._generate_file_variants(
+            competition.image,
+            competition.image_variants,
+            VARIANT_SIZE_WIDTHS,
+            "WEBP",
+        )
+        if variants is not None:
+            Competition.objects.filter(id=competition.id).update(
+                image_variants=variants
+            )
+
+    def generate_broadcast_image_variants(self, image_id: str) -> None:
+        image = BroadcastEmailImage.objects.filter(id=image_id).first()
+        if image is None or not image.needs_variants:
+            return
+        variants = self._generate_file_variants(
+            image.image,
+            image.variants,
+            {"email": BROADCAST_IMAGE_EMAIL_WIDTH},
+            None,
+        )
+        if variants is not None:
+            BroadcastEmailImage.objects.filter(id=image.id).update(variants=variants)
+
+    def flush_storage_deletions(self) -> int:
+        deleted = 0
+        while True:
+            batch = list(StorageDeletion.objects.all()[:DELETE_BATCH_SIZE])
+            if not batch:
+                return deleted
+
+            keys = list({entry.storage_key for entry in batch})
+            try:
+                failed = set(storage_service.delete_objects(keys))
+            except Exception:
+                logger.exception("Failed to delete %d objects from S3", len(keys))
+                return deleted
+
+            done = [entry.id for entry in batch if entry.storage_key not in failed]
+            StorageDeletion.objects.filter(id__in=done).delete()
+            deleted += len(keys) - len(failed)
+            if failed:
+                # Leave failures queued for the next run rather than spinning
+                logger.warning("Failed to delete %d objects from S3", len(failed))
+                return deleted
+
+    def expire_stale_uploads(self) -> int:
+        cutoff = timezone.now() - STALE_UPLOAD_AGE
+        # Failed uploads can never be completed, so they go at once
+        expired = Q(upload_status=UploadStatus.FAILED) | Q(
+            upload_status=UploadStatus.PENDING, created_at__lt=cutoff
+        )
+        stale = list(
+            ProjectImage.objects.filter(expired).values_list(
+                "id", "storage_key", "multipart_upload_id"
+            )
+        )
+        if not stale:
+            return 0
+
+        for _, key, upload_id in stale:
+            if upload_id:
+                try:
+                    storage_service.abort_multipart_upload(key, upload_id)
+                except Exception:
+                    logger.exception("Failed to abort multipart upload for %s", key)
+
+        # Filtered again so an upload completed since it was read is kept.
+        # Storage objects are queued by release_storage as the rows go
+        _, deleted = ProjectImage.objects.filter(
+            expired, id__in=[row[0] for row in stale]
+        ).delete()
+        count = deleted.get("projects.ProjectImage", 0)
+        logger.info("Expired %d stale or failed uploads", count)
+        return count
+
+    def sweep_orphaned_objects(self) -> int:
+        cutoff = timezone.now() - ORPHAN_GRACE_PERIOD
+        orphaned = 0
+        for page in storage_service.iter_object_pages(PROJECT_IMAGES_PREFIX):
+            # Skip recent objects: their upload may still be in flight
+            candidates = {key for key, modified in page if modified < cutoff}
+            if not candidates:
+                continue
+
+            referenced = set(
+                ProjectImage.objects.filter(storage_key__in=candidates).values_list(
+                    "storage_key", flat=True
+                )
+            )
+            referenced.update(
+                ProjectImage.objects.filter(optimized_key__in=candidates).values_list(
+                    "optimized_key", flat=True
+                )
+            )
+            for model in (ImageVariant, ImageDerivative):
+                referenced.update(
+                    model.objects.filter(storage_key__in=candidates).values_list(
+                        "storage_key", flat=True
+                    )
+                )
+            orphans = sorted(candidates - referenced)
+            if not orphans:
+                continue
+
+            failed = storage_service.delete_objects(orphans)
+            orphaned += len(orphans) - len(failed)
+
+        if orphaned:
+            logger.info("Swept %d orphaned objects from storage", orphaned)
+        return orphaned
+
+    def release_storage(self, image: ProjectImage) -> None:
+        """Queue the storage objects of an image that is being deleted.
+
+        Objects shared with other images through a content blob are only
+        queued once the last reference is released.
+        """
+        # Read back rather than trusting the instance, which may predate
+        # variant generation repointing it at a shared blob
+        row = (
+            ProjectImage.objects.filter(pk=image.pk)
+            .values_list("storage_key", "optimized_key", "content_hash")
+            .first()
+        )
+        if row is None:
+            return
+        storage_key, optimized_key, content_hash = row
+        if content_hash and not self._release_content(content_hash):
+            # Another image still shares these objects
             return
 
-        original_width = image.width
-        if not original_width:
+        keys = [storage_key]
+        if optimized_key and optimized_key != storage_key:
+            keys.append(optimized_key)
+        for model in (ImageVariant, ImageDerivative):
+            keys.extend(
+                model.objects.filter(image_id=image.pk)
+                .exclude(storage_key="")
+                .values_list("storage_key", flat=True)
+            )
+        self._queue_deletions(keys)
+
+    def _queue_deletions(self, keys: list[str]) -> None:
+        if not keys:
+            return
+        StorageDeletion.objects.bulk_create(
+            StorageDeletion(storage_key=key) for key in keys
+        )
+
+        from api.tasks.images import flush_storage_deletions  # noqa: PLC0415
+
+        transaction.on_commit(flush_storage_deletions.enqueue)
+
+    def _missing_sizes(self, original_width: int, existing: set[str]) -> list[str]:
+        return [
+            size
+            for size in VariantSize
+            if VARIANT_SIZE_WIDTHS[size] < original_width and size not in existing
+        ]
+
+    def _register_content(self, image: ProjectImage, data: bytes) -> None:
+        """Record the content hash and point duplicates at the existing blob.
+
+        When identical bytes were uploaded before, the fresh upload is deleted,
+        ``image`` is repointed at the shared original and the variants already
+        generated for it are reused.
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        with transaction.atomic():
+            blob, _ = ImageBlob.objects.select_for_update().get_or_create(
+                content_hash=content_hash,
+                defaults={"storage_key": image.storage_key},
+            )
+            ImageBlob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") + 1)
+
+            duplicate_key = None
+            if blob.storage_key != image.storage_key:
+                duplicate_key = image.storage_key
+                image.storage_key = blob.storage_key
+            image.content_hash = content_hash
+            image.save(update_fields=["storage_key", "content_hash"])
+
+            self._reuse_variants(image)
+
+        if duplicate_key:
+            logger.info(
+                "Image %s duplicates blob %s, reusing stored original",
+                image.id,
+                content_hash[:12],
+            )
+            try:
+                storage_service.delete_object(duplicate_key)
+            except Exception:
+                logger.exception("Failed to delete duplicate upload %s", duplicate_key)
+
+    def _reuse_variants(self, image: ProjectImage) -> None:
+        donor = (
+            ProjectImage.objects.filter(content_hash=image.content_hash)
+            .exclude(id=image.id)
+            .exclude(optimized_key="")
+            .first()
+        )
+        if donor and not image.optimized_key:
+            image.optimized_key = donor.optimized_key
+            image.optimized_file_size = donor.optimized_file_size
+            image.width = donor.width
+            image.height = donor.height
+            image.save(
+                update_fields=[
+                    "optimized_key",
+                    "optimized_file_size",
+                    "width",
+                    "height",
+                ]
+            )
+
+        existing = set(image.variants.values_list("size", flat=True))
+        donors = ImageVariant.objects.filter(
+            image__content_hash=image.content_hash
+        ).exclude(image=image)
+
+        reused: dict[str, ImageVariant] = {}
+        for variant in donors:
+            if variant.size in existing or variant.size in reused:
+                continue
+            reused[variant.size] = ImageVariant(
+                image=image,
+                size=variant.size,
+                storage_key=variant.storage_key,
+                width=variant.width,
+                height=variant.height,
+                file_size=variant.file_size,
+            )
+        ImageVariant.objects.bulk_create(reused.values())
+
+    def _release_content(self, content_hash: str) -> bool:
+        """Drop one reference to a blob. Returns True if it was the last one."""
+        try:
+            blob = ImageBlob.objects.select_for_update().get(content_hash=content_hash)
+        except ImageBlob.DoesNotExist:
+            return True
+
+        if blob.ref_count > 1:
+            ImageBlob.objects.filter(pk=blob.pk).update(ref_count=F("ref_count") - 1)
+            return False
+
+        blob.delete()
+        return True
+
+    def _prepare_original(
+        self, image: ProjectImage, original_bytes: bytes
+    ) -> Image.Image | None:
+        """Decode the upload, optimize it if needed and return it upright."""
+        try:
+            source = Image.open(io.BytesIO(original_bytes))
+            source.load()
+            img = ImageOps.exif_transpose(source)
+        except Exception:
+            logger.exception("Failed to decode image %s", image.id)
+            return None
+
+        if not image.optimized_key:
+            try:
+                self._optimize_original(image, source, img, len(original_bytes))
+            except Exception:
+                logger.exception("Failed to optimize original of image %s", image.id)
+
+        if not image.width:
             # Fallback: read dimensions from the decoded image and backfill the DB
-            original_width = img.width
             image.width = img.width
             image.height = img.height
             image.save(update_fields=["width", "height"])
             logger.info(
                 "Backfilled dimensions for image %s from Pillow (%dx%d)",
-                image_id,
+                image.id,
                 img.width,
                 img.height,
             )
+        return img
+
+    def _optimize_original(
+        self,
+        image: ProjectImage,
+        source: Image.Image,
+        img: Image.Image,
+        original_size: int,
+    ) -> None:
+        """Store a re-encoded copy of the upload to serve in its place.
+
+        ``source`` is the upload as decoded and ``img`` the same image with its
+        EXIF orientation applied. The copy is capped to MAX_ORIGINAL_DIMENSION,
+        converted to sRGB and has its metadata stripped. JPEGs stay JPEG at high
+        quality; other formats become lossless (or near-lossless) WebP. The
+        upload itself is served when it carries no metadata and re-encoding
+        would not make it smaller.
+        """
+        if getattr(source, "is_animated", False):
+            # Re-encoding would drop every frame but the first
+            self._set_optimized(image, image.storage_key, original_size, img)
+            return
+
+        optimized = img
+        if max(optimized.size) > MAX_ORIGINAL_DIMENSION:
+            optimized = optimized.copy()
+            optimized.thumbnail(
+                (MAX_ORIGINAL_DIMENSION, MAX_ORIGINAL_DIMENSION), Image.LANCZOS
+            )
+        icc_profile = source.info.get("icc_profile")
+        if icc_profile:
+            optimized = _to_srgb(optimized, icc_profile)
+
+        buffer = io.BytesIO()
+        if source.format == "JPEG":
+            if optimized.mode not in {"RGB", "L"}:
+                optimized = optimized.convert("RGB")
+            optimized.save(
+                buffer,
+                format="JPEG",
+                quality=OPTIMIZED_JPEG_QUALITY,
+                optimize=True,
+                progressive=True,
+            )
+            ext, content_type = "jpg", "image/jpeg"
+        else:
+            if source.format in LOSSLESS_FORMATS:
+                options = {"lossless": True}
+            else:
+                options = {"quality": OPTIMIZED_JPEG_QUALITY}
+            optimized.save(buffer, format="WEBP", **options)
+            ext, content_type = "webp", "image/webp"
+        data = buffer.getvalue()
+
+        has_metadata = any(
+            source.info.get(key) for key in ("exif", "icc_profile", "xmp")
+        )
+        if not has_metadata and optimized is img and len(data) >= original_size:
+            self._set_optimized(image, image.storage_key, original_size, img)
+            return
 
-        # Strip the file extension from the storage key to build variant paths
         p = PurePosixPath(image.storage_key)
-        base_key = str(p.parent / p.stem)
+        optimized_key = f"{p.parent / p.stem}/optimized.{ext}"
+        storage_service.upload_object(optimized_key, data, content_type)
+        self._set_optimized(image, optimized_key, len(data), img)
+        logger.info(
+            "Optimized original of image %s: %d -> %d bytes",
+            image.id,
+            original_size,
+            len(data),
+        )
 
-        for size in VariantSize:
-            target_width = VARIANT_SIZE_WIDTHS[size]
+    def _set_optimized(
+        self, image: ProjectImage, key: str, file_size: int, img: Image.Image
+    ) -> None:
+        image.optimized_key = key
+        image.optimized_file_size = file_size
+        # The header probe saw the stored orientation; record the upright size
+        image.width, image.height = img.size
+        image.save(
+            update_fields=["optimized_key", "optimized_file_size", "width", "height"]
+        )
 
-            if target_width >= original_width:
-                continue
+    def _claim_derivative(
+        self, image: ProjectImage, width: int, fmt: str
+    ) -> tuple[ImageDerivative, bool]:
+        """Fetch the derivative's row, claiming it if nobody is encoding it.
 
-            # Skip if this variant already exists
-            if ImageVariant.objects.filter(image=image, size=size).exists():
-                continue
+        The row is inserted blank as the claim, so of several concurrent first
+        requests only the one that inserts it encodes. A claim older than
+        DERIVATIVE_CLAIM_TIMEOUT is assumed abandoned and taken over.
+        """
+        now = timezone.now()
+        derivative, created = ImageDerivative.objects.get_or_create(
+            image=image, width=width, format=fmt, defaults={"claimed_at": now}
+        )
+        if created or derivative.storage_key:
+            return derivative, created
+
+        taken = ImageDerivative.objects.filter(
+            pk=derivative.pk,
+            storage_key="",
+            claimed_at__lt=now - DERIVATIVE_CLAIM_TIMEOUT,
+        ).update(claimed_at=now)
+        return derivative, bool(taken)
 
+    def _create_derivative(
+        self,
+        derivative: ImageDerivative,
+        image: ProjectImage,
+        variants: list[ImageVariant],
+    ) -> None:
+        width = derivative.width
+        fmt = derivative.format
+        p = PurePosixPath(image.storage_key)
+        variant_key = f"{p.parent / p.stem}/w{width}.{fmt}"
+        try:
+            # Resize from the smallest stored copy that is still wide enough,
+            # which is usually far cheaper to fetch and decode than the original
+            larger = [v for v in variants if v.width >= width]
+            source_key = (
+                min(larger, key=lambda v: v.width).storage_key
+                if larger
+                else image.optimized_key or image.storage_key
+            )
             try:
-                self._generate_single_variant(img, image, base_key, size, target_width)
-            except Exception:
-                logger.exception(
-                    "Failed to generate %s variant for image %s", size, image_id
-                )
+                source_bytes = storage_service.download_object(source_key)
+            except ObjectNotFoundError:
+                raise ImageNotInStorageError from None
+
+            img = ImageOps.exif_transpose(Image.open(io.BytesIO(source_bytes)))
+            pil_format, content_type = DERIVATIVE_FORMATS[fmt]
+            data, _, resized_height = _encode_resized(img, width, pil_format)
+            storage_service.upload_object(variant_key, data, content_type)
+        except Exception:
+            # Release the claim so the next request tries again
+            ImageDerivative.objects.filter(pk=derivative.pk, storage_key="").delete()
+            raise
+
+        derivative.storage_key = variant_key
+        derivative.height = resized_height
+        derivative.file_size = len(data)
+        derivative.claimed_at = None
+        derivative.save(
+            update_fields=["storage_key", "height", "file_size", "claimed_at"]
+        )
+
+    def _generate_file_variants(
+        self,
+        field_file: FieldFile,
+        previous: dict[str, dict],
+        sizes: dict[str, int],
+        pil_format: str | None,
+    ) -> dict[str, dict] | None:
+        """Generate size variants of an uploaded file field next to the original.
+
+        Sizes at least as wide as the original, and every size of an animated
+        image, point at the original itself. ``pil_format=None`` picks a format
+        mail clients can display. Variants of a replaced upload are deleted.
+        Returns None if the upload could not be read.
+        """
+        storage = field_file.storage
+        source = field_file.name
+        try:
+            with storage.open(source, "rb") as f:
+                img = Image.open(io.BytesIO(f.read()))
+                img.load()
+            animated = getattr(img, "is_animated", False)
+            if not animated:
+                img = ImageOps.exif_transpose(img)
+        except Exception:
+            logger.exception("Failed to read uploaded image %s", source)
+            return None
+
+        pil_format = pil_format or _email_safe_format(img)
+        base_name = str(PurePosixPath(source).with_suffix(""))
+        variants: dict[str, dict] = {}
+        for size, target_width in sizes.items():
+            if animated or target_width >= img.width:
+                name, width, height = source, img.width, img.height
+            else:
+                data, width, height = _encode_resized(img, target_width, pil_format)
+                name = f"{base_name}/{size}.{FORMAT_EXTENSIONS[pil_format]}"
+                # Storages may rename rather than overwrite an existing name
+                storage.delete(name)
+                name = storage.save(name, ContentFile(data))
+            variants[size] = {
+                "name": name,
+                "width": width,
+                "height": height,
+                "source": source,
+            }
+
+        current = {variant["name"] for variant in variants.values()}
+        for variant in previous.values():
+            if variant["name"] not in current and variant["name"] != variant["source"]:
+                try:
+                    storage.delete(variant["name"])
+                except Exception:
+                    logger.exception("Failed to delete old variant %s", variant["name"])
+        return variants
 
     def _generate_single_variant(
         self,
@@ -90,18 +799,7 @@ class DjangoImageHandler(ImageHandlerInterface):
         size: str,
         target_width: int,
     ) -> None:
-        # Calculate proportional height
-        ratio = target_width / img.width
-        target_height = round(img.height * ratio)
-
-        # Resize with high-quality resampling
-        resized = img.copy()
-        resized.thumbnail((target_width, target_height), Image.LANCZOS)
-
-        # Encode to WebP
-        buffer = io.BytesIO()
-        resized.save(buffer, format="WEBP", quality=WEBP_QUALITY)
-        webp_bytes = buffer.getvalue()
+        webp_bytes, width, height = _encode_resized(img, target_width, "WEBP")
 
         # Upload to S3
         variant_key = f"{base_key}/{size}.webp"
@@ -112,7 +810,7 @@ class DjangoImageHandler(ImageHandlerInterface):
             image=image,
             size=size,
             storage_key=variant_key,
-            width=resized.width,
-            height=resized.height,
+            width=width,
+            height=height,
             file_size=len(webp_bytes),
         )
@@ -1,26 +1,62 @@
 from __future__ import annotations
 
 import io
+import os
+import subprocess
+import sys
+from datetime import timedelta
 from unittest.mock import patch
 
 import boto3
 import pytest
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.utils import timezone
 from moto import mock_aws
 from PIL import Image
 
-from apps.projects.models import ImageVariant, UploadStatus, VariantSize
-from services.image.django_impl.handler import DjangoImageHandler
-from tests.factories import ProjectImageFactory
+from apps.emails.models import BroadcastEmailImage
+from apps.projects.models import (
+    Competition,
+    ImageBlob,
+    ImageDerivative,
+    ImageVariant,
+    ProjectImage,
+    StorageDeletion,
+    UploadStatus,
+    VariantSize,
+)
+from services import REPO
+from services.image.django_impl.handler import (
+    DERIVATIVE_CLAIM_TIMEOUT,
+    DjangoImageHandler,
+)
+from services.image.exceptions import (
+    DerivativePendingError,
+    ImageNotFoundError,
+    ImageNotInStorageError,
+    InvalidImageError,
+    UnsupportedFormatError,
+)
+from services.storage import storage_service
+from tests.factories import (
+    BroadcastEmailImageFactory,
+    CompetitionFactory,
+    ProjectFactory,
+    ProjectImageFactory,
+)
 
 TEST_BUCKET = "test-bucket"
 TEST_REGION = "us-east-1"
 
 
-def _create_test_image(width: int, height: int, fmt: str = "JPEG") -> bytes:
+def _create_test_image(
+    width: int, height: int, fmt: str = "JPEG", **save_kwargs
+) -> bytes:
     """Create a test image of the given dimensions and return as bytes."""
     img = Image.new("RGB", (width, height), color="red")
     buffer = io.BytesIO()
-    img.save(buffer, format=fmt)
+    img.save(buffer, format=fmt, **save_kwargs)
     return buffer.getvalue()
 
 
@@ -240,3 +276,817 @@ class TestGenerateVariants:
         # Running again should not create duplicates
         handler.generate_variants(str(image.id))
         assert ImageVariant.objects.filter(image=image).count() == 3
+
+
+def _object_keys(s3) -> set[str]:
+    response = s3.list_objects_v2(Bucket=TEST_BUCKET)
+    return {obj["Key"] for obj in response.get("Contents", [])}
+
+
+@pytest.mark.django_db
+class TestContentDeduplication:
+    def test_records_content_hash_and_blob(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET,
+            Key="projects/abc/def123/photo.jpg",
+            Body=_create_test_image(1000, 600),
+        )
+        image = ProjectImageFactory(
+            storage_key="projects/abc/def123/photo.jpg",
+            width=1000,
+            height=600,
+            upload_status=UploadStatus.UPLOADED,
+        )
+
+        handler.generate_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert len(image.content_hash) == 64
+        blob = ImageBlob.objects.get(content_hash=image.content_hash)
+        assert blob.storage_key == "projects/abc/def123/photo.jpg"
+        assert blob.ref_count == 1
+
+    def test_duplicate_upload_reuses_original_and_variants(self, mock_storage, handler):
+        image_bytes = _create_test_image(1000, 600)
+        for key in ("projects/a/111/photo.jpg", "projects/b/222/copy.jpg"):
+            mock_storage.put_object(Bucket=TEST_BUCKET, Key=key, Body=image_bytes)
+
+        first = ProjectImageFactory(
+            storage_key="projects/a/111/photo.jpg",
+            width=1000,
+            height=600,
+            upload_status=UploadStatus.UPLOADED,
+        )
+        second = ProjectImageFactory(
+            storage_key="projects/b/222/copy.jpg",
+            width=1000,
+            height=600,
+            upload_status=UploadStatus.UPLOADED,
+        )
+
+        handler.generate_variants(str(first.id))
+        with patch.object(type(handler), "_generate_single_variant") as mock_gen:
+            handler.generate_variants(str(second.id))
+
+        mock_gen.assert_not_called()
+        second.refresh_from_db()
+        assert second.storage_key == "projects/a/111/photo.jpg"
+        assert second.content_hash == ProjectImage.objects.get(id=first.id).content_hash
+        assert set(second.variants.values_list("storage_key", flat=True)) == set(
+            first.variants.values_list("storage_key", flat=True)
+        )
+        assert ImageBlob.objects.get(content_hash=second.content_hash).ref_count == 2
+        assert (
+            second.optimized_key == ProjectImage.objects.get(id=first.id).optimized_key
+        )
+        # The redundant upload is removed from storage
+        assert "projects/b/222/copy.jpg" not in _object_keys(mock_storage)
+
+    def test_rerun_does_not_double_count(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET,
+            Key="projects/abc/def123/photo.jpg",
+            Body=_create_test_image(1000, 600),
+        )
+        image = ProjectImageFactory(
+            storage_key="projects/abc/def123/photo.jpg",
+            width=1000,
+            height=600,
+            upload_status=UploadStatus.UPLOADED,
+        )
+
+        handler.generate_variants(str(image.id))
+        handler.generate_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert ImageBlob.objects.get(content_hash=image.content_hash).ref_count == 1
+
+
+@pytest.mark.django_db
+class TestReleaseStorage:
+    def _upload_pair(self, mock_storage, handler):
+        image_bytes = _create_test_image(1000, 600)
+        for key in ("projects/a/111/photo.jpg", "projects/b/222/copy.jpg"):
+            mock_storage.put_object(Bucket=TEST_BUCKET, Key=key, Body=image_bytes)
+        first = ProjectImageFactory(
+            storage_key="projects/a/111/photo.jpg",
+            width=1000,
+            upload_status=UploadStatus.UPLOADED,
+        )
+        second = ProjectImageFactory(
+            storage_key="projects/b/222/copy.jpg",
+            width=1000,
+            upload_status=UploadStatus.UPLOADED,
+        )
+        handler.generate_variants(str(first.id))
+        handler.generate_variants(str(second.id))
+        return first, second
+
+    def test_keeps_shared_objects_until_last_reference(
+        self, mock_storage, handler, django_capture_on_commit_callbacks
+    ):
+        first, second = self._upload_pair(mock_storage, handler)
+        shared_keys = _object_keys(mock_storage)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first.delete()
+
+        assert not ProjectImage.objects.filter(id=first.id).exists()
+        assert _object_keys(mock_storage) == shared_keys
+        assert ImageBlob.objects.get().ref_count == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            second.delete()
+
+        assert _object_keys(mock_storage) == set()
+        assert not ImageBlob.objects.exists()
+
+    def test_queues_deletions_instead_of_deleting_inline(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET, Key="projects/legacy/photo.jpg", Body=b"jpg"
+        )
+        image = ProjectImageFactory(
+            storage_key="projects/legacy/photo.jpg",
+            upload_status=UploadStatus.UPLOADED,
+        )
+
+        with patch.object(storage_service, "delete_object") as mock_delete:
+            image.delete()
+
+        mock_delete.assert_not_called()
+        assert list(StorageDeletion.objects.values_list("storage_key", flat=True)) == [
+            "projects/legacy/photo.jpg"
+        ]
+        assert _object_keys(mock_storage) == {"projects/legacy/photo.jpg"}
+
+    def test_deletes_objects_for_unhashed_image(
+        self, mock_storage, handler, django_capture_on_commit_callbacks
+    ):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET, Key="projects/legacy/photo.jpg", Body=b"jpg"
+        )
+        image = ProjectImageFactory(
+            storage_key="projects/legacy/photo.jpg",
+            upload_status=UploadStatus.UPLOADED,
+        )
+        ImageVariant.objects.create(
+            image=image,
+            size=VariantSize.THUMB,
+            storage_key="projects/legacy/photo/thumb.webp",
+            width=384,
+            height=216,
+            file_size=512,
+        )
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET, Key="projects/legacy/photo/thumb.webp", Body=b"webp"
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            image.delete()
+
+        assert _object_keys(mock_storage) == set()
+        assert not ProjectImage.objects.filter(id=image.id).exists()
+
+    def test_project_delete_queues_all_keys(self, mock_storage, handler):
+        project = ProjectFactory()
+        for n in range(3):
+            ProjectImageFactory(
+                project=project, storage_key=f"projects/{project.id}/{n}.jpg"
+            )
+        ProjectImageFactory(
+            project=project,
+            storage_key=f"projects/{project.id}/3.png",
+            optimized_key=f"projects/{project.id}/3/optimized.webp",
+        )
+        other = ProjectImageFactory(storage_key="projects/other/keep.jpg")
+
+        project_id = project.id
+        project.delete()
+
+        assert not ProjectImage.objects.filter(project_id=project_id).exists()
+        assert ProjectImage.objects.filter(id=other.id).exists()
+        assert set(StorageDeletion.objects.values_list("storage_key", flat=True)) == {
+            *(f"projects/{project_id}/{n}.jpg" for n in range(3)),
+            f"projects/{project_id}/3.png",
+            f"projects/{project_id}/3/optimized.webp",
+        }
+
+
+@pytest.mark.django_db
+class TestFlushStorageDeletions:
+    def test_deletes_queued_objects_in_one_batch(self, mock_storage, handler):
+        keys = [f"projects/p/{n}.jpg" for n in range(5)]
+        for key in keys:
+            mock_storage.put_object(Bucket=TEST_BUCKET, Key=key, Body=b"x")
+            StorageDeletion.objects.create(storage_key=key)
+
+        with patch.object(
+            storage_service, "delete_objects", wraps=storage_service.delete_objects
+        ) as mock_delete:
+            deleted = handler.flush_storage_deletions()
+
+        assert deleted == 5
+        mock_delete.assert_called_once()
+        assert _object_keys(mock_storage) == set()
+        assert not StorageDeletion.objects.exists()
+
+    def test_keeps_failed_keys_queued(self, mock_storage, handler):
+        StorageDeletion.objects.create(storage_key="projects/p/ok.jpg")
+        StorageDeletion.objects.create(storage_key="projects/p/stuck.jpg")
+
+        with patch.object(
+            storage_service, "delete_objects", return_value=["projects/p/stuck.jpg"]
+        ):
+            deleted = handler.flush_storage_deletions()
+
+        assert deleted == 1
+        assert list(StorageDeletion.objects.values_list("storage_key", flat=True)) == [
+            "projects/p/stuck.jpg"
+        ]
+
+
+@pytest.mark.django_db
+class TestExpireStaleUploads:
+    def test_removes_old_pending_uploads(self, mock_storage, handler):
+        stale = ProjectImageFactory(
+            storage_key="projects/p/stale.jpg", upload_status=UploadStatus.PENDING
+        )
+        ProjectImage.objects.filter(id=stale.id).update(
+            created_at=stale.created_at - timedelta(days=2)
+        )
+        fresh = ProjectImageFactory(upload_status=UploadStatus.PENDING)
+        uploaded = ProjectImageFactory(upload_status=UploadStatus.UPLOADED)
+        ProjectImage.objects.filter(id=uploaded.id).update(
+            created_at=uploaded.created_at - timedelta(days=2)
+        )
+
+        assert handler.expire_stale_uploads() == 1
+
+        remaining = set(ProjectImage.objects.values_list("id", flat=True))
+        assert remaining == {fresh.id, uploaded.id}
+        assert list(StorageDeletion.objects.values_list("storage_key", flat=True)) == [
+            "projects/p/stale.jpg"
+        ]
+
+    def test_aborts_multipart_uploads(self, mock_storage, handler):
+        upload_id = mock_storage.create_multipart_upload(
+            Bucket=TEST_BUCKET, Key="projects/p/big.png"
+        )["UploadId"]
+        stale = ProjectImageFactory(
+            storage_key="projects/p/big.png",
+            upload_status=UploadStatus.PENDING,
+            multipart_upload_id=upload_id,
+        )
+        ProjectImage.objects.filter(id=stale.id).update(
+            created_at=stale.created_at - timedelta(days=2)
+        )
+
+        handler.expire_stale_uploads()
+
+        uploads = mock_storage.list_multipart_uploads(Bucket=TEST_BUCKET)
+        assert uploads.get("Uploads", []) == []
+
+    def test_removes_failed_uploads(self, mock_storage, handler):
+        ProjectImageFactory(
+            storage_key="projects/p/not-an-image.jpg",
+            upload_status=UploadStatus.FAILED,
+        )
+
+        assert handler.expire_stale_uploads() == 1
+
+        assert not ProjectImage.objects.exists()
+        assert list(StorageDeletion.objects.values_list("storage_key", flat=True)) == [
+            "projects/p/not-an-image.jpg"
+        ]
+
+    def test_keeps_upload_completed_while_expiring(self, mock_storage, handler):
+        stale = ProjectImageFactory(upload_status=UploadStatus.PENDING)
+        ProjectImage.objects.filter(id=stale.id).update(
+            created_at=stale.created_at - timedelta(days=2)
+        )
+
+        def complete(key, upload_id):
+            ProjectImage.objects.filter(id=stale.id).update(
+                upload_status=UploadStatus.UPLOADED
+            )
+
+        ProjectImage.objects.filter(id=stale.id).update(multipart_upload_id="u1")
+        with patch.object(
+            storage_service, "abort_multipart_upload", side_effect=complete
+        ):
+            assert handler.expire_stale_uploads() == 0
+
+        assert ProjectImage.objects.filter(id=stale.id).exists()
+        assert not StorageDeletion.objects.exists()
+
+
+@pytest.mark.django_db
+class TestOptimizeOriginal:
+    def _upload(self, mock_storage, key, body, **kwargs):
+        mock_storage.put_object(Bucket=TEST_BUCKET, Key=key, Body=body)
+        return ProjectImageFactory(
+            storage_key=key, upload_status=UploadStatus.UPLOADED, **kwargs
+        )
+
+    def _served(self, mock_storage, image):
+        body = mock_storage.get_object(Bucket=TEST_BUCKET, Key=image.optimized_key)
+        return Image.open(io.BytesIO(body["Body"].read()))
+
+    def test_applies_orientation_and_strips_metadata(self, mock_storage, handler):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90 CW
+        exif[0x010F] = "Camera Maker"
+        image = self._upload(
+            mock_storage,
+            "projects/p/1/phone.jpg",
+            _create_test_image(800, 600, exif=exif.tobytes()),
+            width=800,
+            height=600,
+        )
+
+        handler.generate_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert image.optimized_key == "projects/p/1/phone/optimized.jpg"
+        assert image.url.endswith("/projects/p/1/phone/optimized.jpg")
+        assert image.original_url.endswith("/projects/p/1/phone.jpg")
+        assert (image.width, image.height) == (600, 800)
+        served = self._served(mock_storage, image)
+        assert served.size == (600, 800)
+        assert "exif" not in served.info
+        thumb = image.variants.get(size=VariantSize.THUMB)
+        assert (thumb.width, thumb.height) == (384, 512)
+
+    def test_caps_dimensions_and_reencodes_png_losslessly(self, mock_storage, handler):
+        image = self._upload(
+            mock_storage,
+            "projects/p/2/screenshot.png",
+            _create_test_image(5000, 1000, "PNG"),
+            width=5000,
+            height=1000,
+        )
+
+        handler.generate_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert image.optimized_key == "projects/p/2/screenshot/optimized.webp"
+        served = self._served(mock_storage, image)
+        assert served.format == "WEBP"
+        assert served.size == (3840, 768)
+        assert image.optimized_file_size < image.file_size
+
+    def test_serves_upload_when_reencoding_does_not_help(self, mock_storage, handler):
+        noise = Image.effect_noise((300, 200), 100).convert("RGB")
+        buffer = io.BytesIO()
+        noise.save(buffer, format="WEBP", quality=40)
+        image = self._upload(
+            mock_storage,
+            "projects/p/3/noise.webp",
+            buffer.getvalue(),
+            file_size=len(buffer.getvalue()),
+        )
+
+        handler.generate_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert image.optimized_key == image.storage_key
+        assert image.optimized_file_size == len(buffer.getvalue())
+        assert _object_keys(mock_storage) == {"projects/p/3/noise.webp"}
+
+    def test_keeps_animated_gif(self, mock_storage, handler):
+        frames = [Image.new("RGB", (400, 300), color) for color in ("red", "blue")]
+        buffer = io.BytesIO()
+        frames[0].save(buffer, format="GIF", save_all=True, append_images=frames[1:])
+        image = self._upload(mock_storage, "projects/p/4/anim.gif", buffer.getvalue())
+
+        handler.generate_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert image.optimized_key == "projects/p/4/anim.gif"
+
+
+@pytest.mark.django_db
+class TestSweepOrphanedObjects:
+    def test_deletes_unreferenced_objects(self, mock_storage, handler):
+        image = ProjectImageFactory(
+            storage_key="projects/p/kept.jpg",
+            optimized_key="projects/p/kept/optimized.jpg",
+        )
+        ImageVariant.objects.create(
+            image=image,
+            size=VariantSize.THUMB,
+            storage_key="projects/p/kept/thumb.webp",
+            width=384,
+            height=216,
+            file_size=512,
+        )
+        for key in (
+            "projects/p/kept.jpg",
+            "projects/p/kept/optimized.jpg",
+            "projects/p/kept/thumb.webp",
+            "projects/gone/orphan.jpg",
+            "projects/gone/orphan/thumb.webp",
+            "competitions/not-swept.jpg",
+        ):
+            mock_storage.put_object(Bucket=TEST_BUCKET, Key=key, Body=b"x")
+
+        with patch(
+            "services.image.django_impl.handler.ORPHAN_GRACE_PERIOD", timedelta(0)
+        ):
+            swept = handler.sweep_orphaned_objects()
+
+        assert swept == 2
+        assert _object_keys(mock_storage) == {
+            "projects/p/kept.jpg",
+            "projects/p/kept/optimized.jpg",
+            "projects/p/kept/thumb.webp",
+            "competitions/not-swept.jpg",
+        }
+
+    def test_leaves_recent_objects_alone(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET, Key="projects/new/in-flight.jpg", Body=b"x"
+        )
+
+        assert handler.sweep_orphaned_objects() == 0
+        assert _object_keys(mock_storage) == {"projects/new/in-flight.jpg"}
+
+
+@pytest.mark.django_db
+class TestProbeUpload:
+    @pytest.mark.parametrize(
+        ("fmt", "content_type", "save_kwargs"),
+        [
+            ("JPEG", "image/jpeg", {}),
+            ("PNG", "image/png", {}),
+            ("GIF", "image/gif", {}),
+            ("WEBP", "image/webp", {}),
+            ("WEBP", "image/webp", {"lossless": True}),
+            ("WEBP", "image/webp", {"exif": b"Exif\x00\x00"}),
+            # Multi-picture JPEG, as written by many cameras
+            (
+                "MPO",
+                "image/jpeg",
+                {"save_all": True, "append_images": [Image.new("RGB", (8, 8))]},
+            ),
+        ],
+    )
+    def test_reads_dimensions_from_header(
+        self, mock_storage, handler, fmt, content_type, save_kwargs
+    ):
+        body = _create_test_image(1280, 720, fmt, **save_kwargs)
+        mock_storage.put_object(Bucket=TEST_BUCKET, Key="uploads/img", Body=body)
+
+        probe = handler.probe_upload("uploads/img", content_type)
+
+        assert probe.content_type == content_type
+        assert (probe.width, probe.height) == (1280, 720)
+        assert probe.file_size == len(body)
+
+    def test_fetches_only_a_prefix(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET,
+            Key="uploads/big.png",
+            Body=_create_test_image(3000, 2000, "PNG"),
+        )
+
+        with patch(
+            "services.image.django_impl.handler.storage_service.download_range",
+            wraps=storage_service.download_range,
+        ) as mock_range:
+            handler.probe_upload("uploads/big.png", "image/png")
+
+        mock_range.assert_called_once_with("uploads/big.png", 0, 16 * 1024 - 1)
+
+    def test_retries_with_larger_range_for_jpeg_with_large_exif(
+        self, mock_storage, handler
+    ):
+        body = _create_test_image(
+            640, 480, "JPEG", exif=b"Exif\x00\x00" + b"\x00" * 60000
+        )
+        mock_storage.put_object(Bucket=TEST_BUCKET, Key="uploads/exif.jpg", Body=body)
+
+        probe = handler.probe_upload("uploads/exif.jpg", "image/jpeg")
+
+        assert (probe.width, probe.height) == (640, 480)
+
+    def test_rejects_mismatched_content_type(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET,
+            Key="uploads/img.png",
+            Body=_create_test_image(100, 100, "JPEG"),
+        )
+
+        with pytest.raises(InvalidImageError, match="image/jpeg"):
+            handler.probe_upload("uploads/img.png", "image/png")
+
+    def test_rejects_non_image(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET, Key="uploads/evil.png", Body=b"<html></html>"
+        )
+
+        with pytest.raises(InvalidImageError):
+            handler.probe_upload("uploads/evil.png", "image/png")
+
+    def test_missing_object(self, mock_storage, handler):
+        with pytest.raises(ImageNotInStorageError):
+            handler.probe_upload("uploads/missing.png", "image/png")
+
+    @pytest.mark.parametrize(
+        ("fmt", "content_type", "save_kwargs"),
+        [
+            ("WEBP", "image/webp", {}),
+            (
+                "MPO",
+                "image/jpeg",
+                {"save_all": True, "append_images": [Image.new("RGB", (8, 8))]},
+            ),
+        ],
+    )
+    def test_accepts_formats_before_pillow_loads_its_plugins(
+        self, tmp_path, fmt, content_type, save_kwargs
+    ):
+        # Run in a fresh process: this one has loaded every Pillow plugin
+        path = tmp_path / "upload"
+        path.write_bytes(_create_test_image(320, 240, fmt, **save_kwargs))
+        script = f"""
+import django
+django.setup()
+from pathlib import Path
+from unittest.mock import patch
+from PIL import Image
+from services.image.django_impl.handler import DjangoImageHandler
+assert "WEBP" not in Image.MIME
+data = Path({str(path)!r}).read_bytes()
+with patch(
+    "services.image.django_impl.handler.storage_service.download_range",
+    return_value=(data, len(data)),
+):
+    probe = DjangoImageHandler().probe_upload("uploads/img", {content_type!r})
+print(probe.content_type, probe.width, probe.height)
+"""
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", script],
+            capture_output=True,
+            text=True,
+            cwd=settings.BASE_DIR,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "project_showcase.settings"},
+            check=False,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == [content_type, "320", "240"]
+
+
+@pytest.mark.django_db
+class TestGetDerivativeUrl:
+    @pytest.fixture
+    def image(self, mock_storage, handler):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET,
+            Key="projects/abc/def123/photo.jpg",
+            Body=_create_test_image(2000, 1000),
+        )
+        image = ProjectImageFactory(
+            storage_key="projects/abc/def123/photo.jpg",
+            width=2000,
+            height=1000,
+            upload_status=UploadStatus.UPLOADED,
+        )
+        handler.generate_variants(str(image.id))
+        return image
+
+    def test_snaps_width_and_stores_derivative(self, mock_storage, handler, image):
+        url = handler.get_derivative_url(str(image.id), 600, "webp")
+
+        derivative = ImageDerivative.objects.get(image=image, width=640, format="webp")
+        assert url == derivative.url
+        assert derivative.storage_key == "projects/abc/def123/photo/w640.webp"
+        assert derivative.height == 320
+        derivative.full_clean()
+        body = mock_storage.get_object(Bucket=TEST_BUCKET, Key=derivative.storage_key)
+        assert Image.open(body["Body"]).format == "WEBP"
+
+    def test_generates_from_nearest_larger_variant(self, mock_storage, handler, image):
+        with patch(
+            "services.image.django_impl.handler.storage_service.download_object",
+            wraps=storage_service.download_object,
+        ) as mock_download:
+            handler.get_derivative_url(str(image.id), 640, "jpg")
+
+        mock_download.assert_called_once_with("projects/abc/def123/photo/medium.webp")
+        derivative = ImageDerivative.objects.get(image=image, width=640, format="jpg")
+        body = mock_storage.get_object(Bucket=TEST_BUCKET, Key=derivative.storage_key)
+        assert Image.open(body["Body"]).format == "JPEG"
+
+    def test_falls_back_to_original_above_largest_variant(self, handler, image):
+        with patch(
+            "services.image.django_impl.handler.storage_service.download_object",
+            wraps=storage_service.download_object,
+        ) as mock_download:
+            handler.get_derivative_url(str(image.id), 1920, "webp")
+
+        mock_download.assert_called_once_with("projects/abc/def123/photo/optimized.jpg")
+
+    def test_reuses_existing_derivative(self, handler, image):
+        first = handler.get_derivative_url(str(image.id), 640, "webp")
+
+        with patch(
+            "services.image.django_impl.handler.storage_service.upload_object"
+        ) as mock_upload:
+            second = handler.get_derivative_url(str(image.id), 620, "webp")
+
+        assert first == second
+        mock_upload.assert_not_called()
+
+    def test_serves_pregenerated_variant_for_matching_width(self, handler, image):
+        url = handler.get_derivative_url(str(image.id), 384, "webp")
+
+        assert url == image.variants.get(size=VariantSize.THUMB).url
+        assert not image.derivatives.exists()
+
+    def test_waits_for_a_derivative_another_request_is_encoding(self, handler, image):
+        ImageDerivative.objects.create(
+            image=image, width=640, format="webp", claimed_at=timezone.now()
+        )
+
+        with (
+            patch(
+                "services.image.django_impl.handler.storage_service.upload_object"
+            ) as mock_upload,
+            pytest.raises(DerivativePendingError) as exc_info,
+        ):
+            handler.get_derivative_url(str(image.id), 640, "webp")
+
+        image.refresh_from_db()
+        assert exc_info.value.fallback_url == image.url
+        mock_upload.assert_not_called()
+
+    def test_takes_over_an_abandoned_claim(self, handler, image):
+        ImageDerivative.objects.create(
+            image=image,
+            width=640,
+            format="webp",
+            claimed_at=timezone.now() - DERIVATIVE_CLAIM_TIMEOUT - timedelta(seconds=1),
+        )
+
+        url = handler.get_derivative_url(str(image.id), 640, "webp")
+
+        derivative = ImageDerivative.objects.get(image=image, width=640, format="webp")
+        assert url == derivative.url
+        assert derivative.storage_key == "projects/abc/def123/photo/w640.webp"
+        assert derivative.claimed_at is None
+
+    def test_releases_the_claim_when_encoding_fails(self, handler, image):
+        with (
+            patch(
+                "services.image.django_impl.handler.storage_service.upload_object",
+                side_effect=RuntimeError("S3 down"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            handler.get_derivative_url(str(image.id), 640, "webp")
+
+        assert not image.derivatives.exists()
+
+    def _small_image(self, mock_storage, width, height):
+        mock_storage.put_object(
+            Bucket=TEST_BUCKET,
+            Key="projects/abc/small/photo.png",
+            Body=_create_test_image(width, height, "PNG"),
+        )
+        return ProjectImageFactory(
+            storage_key="projects/abc/small/photo.png",
+            width=width,
+            height=height,
+            upload_status=UploadStatus.UPLOADED,
+        )
+
+    def test_never_upscales(self, handler, mock_storage):
+        image = self._small_image(mock_storage, 300, 200)
+
+        handler.get_derivative_url(str(image.id), 2048, "webp")
+
+        # The widest supported size that fits, not the original's own width
+        derivative = ImageDerivative.objects.get(image=image)
+        assert (derivative.width, derivative.height) == (192, 128)
+
+    def test_serves_original_below_smallest_width(self, handler, mock_storage):
+        image = self._small_image(mock_storage, 64, 48)
+
+        url = handler.get_derivative_url(str(image.id), 320, "webp")
+
+        assert url == image.url
+        assert not image.derivatives.exists()
+
+    def test_rejects_unsupported_format(self, handler, image):
+        with pytest.raises(UnsupportedFormatError):
+            handler.get_derivative_url(str(image.id), 640, "tiff")
+
+    def test_pending_image_not_found(self, handler):
+        image = ProjectImageFactory(upload_status=UploadStatus.PENDING)
+
+        with pytest.raises(ImageNotFoundError):
+            handler.get_derivative_url(str(image.id), 640, "webp")
+
+
+@pytest.mark.django_db
+class TestGenerateCompetitionVariants:
+    def _competition_with_image(self, width, height):
+        competition = CompetitionFactory()
+        competition.image.save(
+            "banner.jpg", ContentFile(_create_test_image(width, height)), save=False
+        )
+        Competition.objects.filter(id=competition.id).update(image=competition.image)
+        return competition
+
+    def test_generates_webp_variants(self, handler):
+        competition = self._competition_with_image(2000, 1000)
+
+        handler.generate_competition_variants(str(competition.id))
+
+        competition.refresh_from_db()
+        large = competition.image_variants["large"]
+        assert large["name"] == f"{competition.id}/banner/large.webp"
+        assert (large["width"], large["height"]) == (1536, 768)
+        with competition.image.storage.open(large["name"]) as f:
+            assert Image.open(f).format == "WEBP"
+        assert competition.image_url == competition.image.storage.url(large["name"])
+
+    def test_small_image_uses_original_for_larger_sizes(self, handler):
+        competition = self._competition_with_image(500, 250)
+
+        handler.generate_competition_variants(str(competition.id))
+
+        competition.refresh_from_db()
+        assert competition.image_variants["thumb"]["width"] == 384
+        assert competition.image_variants["large"]["name"] == competition.image.name
+        assert competition.image_url == competition.image.url
+        assert not competition.needs_image_variants
+
+    def test_replacing_image_regenerates_variants(
+        self, handler, django_capture_on_commit_callbacks
+    ):
+        competition = self._competition_with_image(2000, 1000)
+        handler.generate_competition_variants(str(competition.id))
+        competition.refresh_from_db()
+        old_large = competition.image_variants["large"]["name"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            competition.image.save(
+                "new.jpg", ContentFile(_create_test_image(1800, 900))
+            )
+
+        competition.refresh_from_db()
+        assert competition.image_variants["large"]["source"] == competition.image.name
+        assert not competition.image.storage.exists(old_large)
+
+    def test_image_url_falls_back_until_variants_exist(self):
+        competition = self._competition_with_image(2000, 1000)
+
+        assert competition.needs_image_variants
+        assert competition.image_url == competition.image.url
+
+
+@pytest.mark.django_db
+class TestGenerateBroadcastImageVariants:
+    def _broadcast_image(self, img_bytes, name):
+        image = BroadcastEmailImageFactory()
+        image.image.save(name, ContentFile(img_bytes), save=False)
+        BroadcastEmailImage.objects.filter(id=image.id).update(image=image.image)
+        return image
+
+    def test_resizes_photo_to_email_width_as_jpeg(self, handler):
+        image = self._broadcast_image(_create_test_image(3000, 2000), "photo.jpg")
+
+        handler.generate_broadcast_image_variants(str(image.id))
+
+        image.refresh_from_db()
+        variant = image.variants["email"]
+        assert (variant["width"], variant["height"]) == (1200, 800)
+        assert variant["name"].endswith("/photo/email.jpg")
+        assert image.url == image.image.storage.url(variant["name"])
+
+    def test_keeps_transparency_as_png(self, handler):
+        buffer = io.BytesIO()
+        Image.new("RGBA", (2400, 1200), (0, 0, 0, 0)).save(buffer, format="PNG")
+        image = self._broadcast_image(buffer.getvalue(), "logo.png")
+
+        handler.generate_broadcast_image_variants(str(image.id))
+
+        image.refresh_from_db()
+        assert image.variants["email"]["name"].endswith("/logo/email.png")
+
+    def test_render_uses_email_variant(self, handler):
+        image = self._broadcast_image(_create_test_image(3000, 2000), "photo.jpg")
+        original_url = image.image.url
+        broadcast = image.broadcast_email
+        broadcast.body_markdown = f"![photo]({original_url})"
+        broadcast.save()
+
+        handler.generate_broadcast_image_variants(str(image.id))
+        image.refresh_from_db()
+
+        html, _ = REPO.email.render_broadcast_email(broadcast)
+        assert image.url in html
+        assert original_url not in html
@@ -0,0 +1,22 @@
+class ImageNotFoundError(Exception):
+    pass
+
+
+class ImageNotInStorageError(Exception):
+    pass
+
+
+class InvalidImageError(Exception):
+    pass
+
+
+class UnsupportedFormatError(Exception):
+    pass
+
+
+class DerivativePendingError(Exception):
+    """Another request is still generating the derivative."""
+
+    def __init__(self, fallback_url: str) -> None:
+        super().__init__(fallback_url)
+        self.fallback_url = fallback_url
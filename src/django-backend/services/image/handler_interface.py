@@ -1,8 +1,50 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from apps.projects.models import ProjectImage
+
+
+@dataclass(frozen=True)
+class ImageProbe:
+    content_type: str
+    width: int
+    height: int
+    file_size: int
 
 
 class ImageHandlerInterface(ABC):
+    @abstractmethod
+    def probe_upload(self, storage_key: str, content_type: str) -> ImageProbe: ...
+
     @abstractmethod
     def generate_variants(self, image_id: str) -> None: ...
+
+    @abstractmethod
+    def generate_competition_variants(self, competition_id: str) -> None: ...
+
+    @abstractmethod
+    def generate_broadcast_image_variants(self, image_id: str) -> None: ...
+
+    @abstractmethod
+    def get_derivative_url(self, image_id: str, width: int, fmt: str) -> str:
+        """Return the public URL of a resized copy, generating it on first use.
+
+        Raises DerivativePendingError while another request is generating it.
+        """
+
+    @abstractmethod
+    def release_storage(self, image: ProjectImage) -> None:
+        """Queue an image's storage objects for deletion as its row goes."""
+
+    @abstractmethod
+    def flush_storage_deletions(self) -> int: ...
+
+    @abstractmethod
+    def expire_stale_uploads(self) -> int: ...
+
+    @abstractmethod
+    def sweep_orphaned_objects(self) -> int: ...
@@ -1,5 +1,7 @@
 from .handler import DjangoNotificationHandler
+from .query import DjangoNotificationQuery
 
 __all__ = [
     "DjangoNotificationHandler",
+    "DjangoNotificationQuery",
 ]
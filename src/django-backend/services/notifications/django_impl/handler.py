@@ -1,121 +1,318 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F, Min, Q
 from django.utils import timezone
 
-from apps.discussions.models import Discussion
-from apps.notifications.models import Notification, NotificationCadence
+from apps.discussions.models import Discussion, DiscussionParticipant
+from apps.notifications.models import (
+    ArchivedNotification,
+    Notification,
+    NotificationCadence,
+)
+from apps.users.models import User
 from services.notifications.handler_interface import NotificationHandlerInterface
+from services.streams.django_impl import publish, user_channel
+
+from .schedule import next_digest_at
+from .unread import adjust_unread_counts, forget_unread_counts
 
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from apps.users.models import User
+    from django.db.models import QuerySet
 
 logger = logging.getLogger(__name__)
 
+# Recipients whose digests are built and queued together
+DIGEST_RECIPIENT_CHUNK_SIZE = 200
+DIGEST_RETRY_DELAY = timedelta(minutes=15)
+ARCHIVE_BATCH_SIZE = 1000
+ARCHIVED_FIELDS = (
+    "id",
+    "recipient_id",
+    "project_id",
+    "discussion_id",
+    "cadence",
+    "comment_count",
+    "created_at",
+    "sent_at",
+)
+
 
 class DjangoNotificationHandler(NotificationHandlerInterface):
     def create_notifications_for_discussion(self, discussion_id: UUID) -> None:
         try:
-            discussion = Discussion.objects.select_related(
-                "project__owner", "author", "parent"
-            ).get(id=discussion_id)
+            discussion = Discussion.objects.select_related("project", "author").get(
+                id=discussion_id
+            )
         except Discussion.DoesNotExist:
             logger.warning("Discussion %s not found for notification", discussion_id)
             return
 
-        recipients: set[User] = set()
+        # Project owner and everyone who has posted in the thread (its author
+        # included), resolved in a single query
+        root_id = discussion.parent_id or discussion.id
+        participant_ids = DiscussionParticipant.objects.filter(root_id=root_id).values(
+            "user_id"
+        )
+        recipients = (
+            User.objects.filter(
+                Q(id=discussion.project.owner_id) | Q(id__in=participant_ids)
+            )
+            .exclude(notification_frequency=NotificationCadence.NEVER)
+            .exclude(id=discussion.author_id)
+        )
 
-        # 1. Project owner
-        project_owner = discussion.project.owner
-        if project_owner:
-            recipients.add(project_owner)
+        immediate = []
+        batched = []
+        for recipient in recipients:
+            if recipient.notification_frequency == NotificationCadence.IMMEDIATE:
+                immediate.append(recipient)
+            else:
+                batched.append(recipient)
 
-        # 2. Root discussion author (if this is a reply)
-        root = discussion.parent if discussion.parent else discussion
-        if discussion.parent and root.author:
-            recipients.add(root.author)
+        if batched:
+            self._coalesce(discussion, batched)
+        if immediate:
+            notifications = Notification.objects.bulk_create(
+                Notification(
+                    recipient=recipient,
+                    project_id=discussion.project_id,
+                    discussion=discussion,
+                    cadence=NotificationCadence.IMMEDIATE,
+                )
+                for recipient in immediate
+            )
+            self._unread_changed(dict.fromkeys((r.id for r in immediate), 1))
+            self._send_immediate(notifications, discussion)
 
-        # 3. All previous participants in the root discussion thread
-        participant_ids = (
-            Discussion.objects.filter(parent=root)
-            .exclude(author__isnull=True)
-            .values_list("author_id", flat=True)
-            .distinct()
-        )
-        from apps.users.models import User as UserModel  # noqa: PLC0415
+    def _coalesce(self, discussion: Discussion, recipients: list[User]) -> None:
+        """Fold the comment into each recipient's pending row for the project.
 
-        participants = UserModel.objects.filter(id__in=participant_ids)
-        recipients.update(participants)
+        Recipients without one get a new row. A concurrent insert of the same
+        row trips the partial unique constraint, and the second pass then
+        finds and updates it instead.
+        """
+        for attempt in range(2):
+            try:
+                with transaction.atomic():
+                    self._upsert_pending(discussion, recipients)
+            except IntegrityError:
+                if attempt:
+                    raise
+            else:
+                return
 
-        # Exclude the comment author
-        if discussion.author:
-            recipients.discard(discussion.author)
+    def _upsert_pending(self, discussion: Discussion, recipients: list[User]) -> None:
+        rows = (
+            Notification.objects.select_for_update()
+            .filter(
+                project_id=discussion.project_id,
+                recipient__in=recipients,
+                sent=False,
+            )
+            .exclude(cadence=NotificationCadence.IMMEDIATE)
+            .values_list("recipient_id", "cadence", "id", "read_at")
+        )
+        pending = {
+            (recipient_id, cadence): (pk, read_at)
+            for recipient_id, cadence, pk, read_at in rows
+        }
 
-        # Skip users with NEVER cadence, create notifications for the rest
+        now = timezone.now()
+        updates = []
+        inserts = []
+        # Recipients whose unread count goes up: new rows, and pending rows
+        # they had already read that this comment makes unread again
+        newly_unread = {}
         for recipient in recipients:
-            if recipient.notification_frequency == NotificationCadence.NEVER:
-                continue
-
-            notification = Notification.objects.create(
-                recipient=recipient,
-                discussion=discussion,
-                cadence=recipient.notification_frequency,
+            pk, read_at = pending.get(
+                (recipient.id, recipient.notification_frequency), (None, None)
             )
+            if pk is None or read_at is not None:
+                newly_unread[recipient.id] = 1
+            if pk is None:
+                inserts.append(
+                    Notification(
+                        recipient=recipient,
+                        project_id=discussion.project_id,
+                        discussion=discussion,
+                        cadence=recipient.notification_frequency,
+                        next_digest_at=next_digest_at(
+                            recipient.id,
+                            recipient.notification_frequency,
+                            now,
+                            recipient.time_zone,
+                        ),
+                    )
+                )
+            else:
+                updates.append(pk)
 
-            if notification.cadence == NotificationCadence.IMMEDIATE:
-                self._send_immediate(notification, discussion)
+        Notification.objects.filter(id__in=updates).update(
+            comment_count=F("comment_count") + 1,
+            discussion=discussion,
+            updated_at=now,
+            read_at=None,
+        )
+        Notification.objects.bulk_create(inserts)
+        self._unread_changed(newly_unread)
 
     def _send_immediate(
-        self, notification: Notification, discussion: Discussion
+        self, notifications: list[Notification], discussion: Discussion
     ) -> None:
         from services import HANDLERS  # noqa: PLC0415
 
         try:
-            HANDLERS.email.send_discussion_notification_email(
-                notification=notification,
+            HANDLERS.email.send_discussion_notification_emails(
+                notifications=notifications,
                 discussion=discussion,
             )
-            notification.sent = True
-            notification.sent_at = timezone.now()
-            notification.save(update_fields=["sent", "sent_at"])
         except Exception:
             logger.exception(
-                "Failed to send immediate notification %s", notification.id
+                "Failed to send immediate notifications for discussion %s",
+                discussion.id,
             )
+            return
+        Notification.objects.filter(id__in=[n.id for n in notifications]).update(
+            sent=True, sent_at=timezone.now()
+        )
+
+    def mark_read(
+        self, user_id: UUID, notification_ids: list[UUID] | None = None
+    ) -> int:
+        unread = Notification.objects.filter(recipient_id=user_id, read_at__isnull=True)
+        if notification_ids is not None:
+            unread = unread.filter(id__in=notification_ids)
+        marked = unread.update(read_at=timezone.now())
+        if marked:
+            self._unread_changed({user_id: -marked})
+        return marked
+
+    def _unread_changed(self, deltas: dict[UUID, int]) -> None:
+        """Adjust stored unread counts and tell the users' open streams."""
+        adjust_unread_counts(deltas)
+        publish(
+            [user_channel(user_id) for user_id, delta in deltas.items() if delta],
+            "notifications.changed",
+            {},
+        )
 
     def send_batch_notifications(self, cadence: str) -> None:
-        unsent = (
-            Notification.objects.filter(cadence=cadence, sent=False)
-            .select_related(
-                "recipient",
-                "discussion",
-                "discussion__project",
-                "discussion__author",
+        """Queue digests for every unsent ``cadence`` notification.
+
+        Recipients are walked in keyset order, a chunk at a time, so a large
+        backlog never has to fit in memory at once.
+        """
+        unsent = Notification.objects.filter(cadence=cadence, sent=False)
+        last_recipient_id = None
+        while True:
+            chunk = unsent.order_by("recipient_id")
+            if last_recipient_id is not None:
+                chunk = chunk.filter(recipient_id__gt=last_recipient_id)
+            recipient_ids = list(
+                chunk.values_list("recipient_id", flat=True).distinct()[
+                    :DIGEST_RECIPIENT_CHUNK_SIZE
+                ]
             )
-            .order_by("recipient_id", "created_at")
-        )
+            if not recipient_ids:
+                return
+            last_recipient_id = recipient_ids[-1]
+            self._send_digest_chunk(unsent, recipient_ids)
+
+    def send_due_digests(self) -> int:
+        """Queue digests for recipients whose slot has come round.
 
-        # Group by recipient
-        by_recipient: defaultdict[UUID, list[Notification]] = defaultdict(list)
-        for notification in unsent:
-            by_recipient[notification.recipient_id].append(notification)
+        Meant to run every minute or so. Each run handles at most one chunk of
+        recipients, most overdue first, so its cost stays bounded and a
+        backlog drains over the following runs. Returns the number of
+        recipients whose digests were queued; a chunk that fails is put back
+        ``DIGEST_RETRY_DELAY`` later and counts as none.
+        """
+        due = Notification.objects.filter(
+            sent=False, next_digest_at__lte=timezone.now()
+        )
+        recipient_ids = list(
+            due.values("recipient_id")
+            .annotate(due_at=Min("next_digest_at"))
+            .order_by("due_at")
+            .values_list("recipient_id", flat=True)[:DIGEST_RECIPIENT_CHUNK_SIZE]
+        )
+        if not recipient_ids:
+            return 0
+        if self._send_digest_chunk(due, recipient_ids):
+            return len(recipient_ids)
+        # Retried later, so the recipients queued behind a failing chunk are
+        # not held up by it
+        due.filter(recipient_id__in=recipient_ids).update(
+            next_digest_at=timezone.now() + DIGEST_RETRY_DELAY
+        )
+        return 0
 
+    def _send_digest_chunk(
+        self, unsent: QuerySet[Notification], recipient_ids: list[UUID]
+    ) -> bool:
+        """Queue the recipients' digests; return whether they went out."""
         from services import HANDLERS  # noqa: PLC0415
 
-        for _recipient_id, notifications in by_recipient.items():
-            try:
-                HANDLERS.email.send_discussion_digest_email(
-                    notifications=notifications,
+        try:
+            # Rows are locked so a comment coalesced into one mid-send waits
+            # for the next digest instead of being marked sent unseen.
+            # Queued digests and sent flags are committed together, so a
+            # crash can neither lose a digest nor send one twice
+            with transaction.atomic():
+                notifications = list(
+                    unsent.filter(recipient_id__in=recipient_ids)
+                    .select_related("recipient", "project")
+                    .select_for_update(of=("self",))
+                    .order_by("recipient_id", "created_at")
+                )
+                digests = [
+                    list(group)
+                    for _, group in groupby(
+                        notifications, key=attrgetter("recipient_id")
+                    )
+                ]
+                HANDLERS.email.send_discussion_digest_emails(digests)
+                Notification.objects.filter(
+                    id__in=[n.id for n in notifications]
+                ).update(sent=True, sent_at=timezone.now())
+        except Exception:
+            logger.exception(
+                "Failed to send digests to %d recipients starting at %s",
+                len(recipient_ids),
+                recipient_ids[0],
+            )
+            return False
+        return True
+
+    def archive_sent_notifications(self) -> int:
+        """Move notifications sent before the retention window to the archive."""
+        cutoff = timezone.now() - timedelta(days=settings.NOTIFICATION_RETENTION_DAYS)
+        expired = Notification.objects.filter(sent=True, sent_at__lt=cutoff)
+        archived = 0
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    expired.select_for_update(skip_locked=True)
+                    .order_by("sent_at")
+                    .values(*ARCHIVED_FIELDS)[:ARCHIVE_BATCH_SIZE]
+                )
+                if not rows:
+                    return archived
+                forget_unread_counts({row["recipient_id"] for row in rows})
+                # A conflict rolls back the batch rather than deleting
+                # notifications whose archive copy was not written
+                ArchivedNotification.objects.bulk_create(
+                    [ArchivedNotification(**row) for row in rows]
                 )
-                now = timezone.now()
-                for notification in notifications:
-                    notification.sent = True
-                    notification.sent_at = now
-                Notification.objects.bulk_update(notifications, ["sent", "sent_at"])
-            except Exception:
-                logger.exception("Failed to send digest to user %s", _recipient_id)
+                Notification.objects.filter(id__in=[r["id"] for r in rows]).delete()
+            archived += len(rows)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+
+from apps.notifications.models import Notification
+from services.notifications.query_interface import (
+    NotificationPage,
+    NotificationQueryInterface,
+)
+from services.pagination import decode_cursor, encode_cursor
+
+from .unread import get_unread_count
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from django.db.models import QuerySet
+
+
+def _base_queryset() -> QuerySet[Notification]:
+    return Notification.objects.select_related(
+        "project", "discussion", "discussion__author"
+    )
+
+
+class DjangoNotificationQuery(NotificationQueryInterface):
+    def list_for_user(
+        self,
+        user_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+        unread_only: bool = False,
+    ) -> NotificationPage:
+        queryset = _base_queryset().filter(recipient_id=user_id)
+        if unread_only:
+            queryset = queryset.filter(read_at__isnull=True)
+        if cursor:
+            updated_at, notification_id = decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(updated_at__lt=updated_at)
+                | Q(updated_at=updated_at, id__lt=notification_id)
+            )
+
+        notifications = list(queryset.order_by("-updated_at", "-id")[: limit + 1])
+        next_cursor = None
+        if len(notifications) > limit:
+            notifications = notifications[:limit]
+            last = notifications[-1]
+            next_cursor = encode_cursor(last.updated_at, last.id)
+        return NotificationPage(notifications=notifications, next_cursor=next_cursor)
+
+    def unread_count(self, user_id: UUID) -> int:
+        return get_unread_count(user_id)
@@ -0,0 +1,69 @@
+"""Stable per-user send slots for digest notifications.
+
+Each user gets a fixed offset into the cadence window derived from a hash of
+their id. Digests go out at that offset, so consecutive digests are exactly
+one window apart and a cadence's recipients are spread across the window
+instead of all being sent at the top of the hour or day. Daily slots fall
+within ``DIGEST_DAILY_HOURS`` in the user's own timezone, or in
+``DIGEST_TIMEZONE`` when theirs is not known.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+
+from apps.notifications.models import NotificationCadence
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+
+def slot_offset(user_id: UUID, window: timedelta) -> timedelta:
+    """Fixed offset of a user's slot within a window of the given length."""
+    digest = hashlib.sha256(user_id.bytes).digest()
+    seconds = int.from_bytes(digest[:8]) % int(window.total_seconds())
+    return timedelta(seconds=seconds)
+
+
+def _zone(time_zone: str) -> ZoneInfo:
+    if time_zone:
+        try:
+            return ZoneInfo(time_zone)
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+    return ZoneInfo(settings.DIGEST_TIMEZONE)
+
+
+def next_digest_at(
+    user_id: UUID, cadence: str, after: datetime, time_zone: str = ""
+) -> datetime:
+    """First slot for ``user_id`` in the ``cadence`` schedule later than ``after``.
+
+    ``time_zone`` is the user's IANA zone name, if known.
+    """
+    if cadence == NotificationCadence.HOURLY:
+        period = window = timedelta(hours=1)
+        window_start = after.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+    elif cadence == NotificationCadence.DAILY:
+        start_hour, end_hour = settings.DIGEST_DAILY_HOURS
+        period = timedelta(days=1)
+        window = timedelta(hours=end_hour - start_hour)
+        window_start = after.astimezone(_zone(time_zone)).replace(
+            hour=start_hour, minute=0, second=0, microsecond=0
+        )
+    else:
+        msg = f"{cadence} notifications are not sent as digests"
+        raise ValueError(msg)
+
+    offset = slot_offset(user_id, window)
+    slot = window_start + offset
+    if slot <= after:
+        # Aware arithmetic is wall-clock, so daily slots keep their local
+        # time across DST changes
+        slot = window_start + period + offset
+    return slot.astimezone(UTC)
@@ -1,18 +1,46 @@
+from datetime import timedelta
 from unittest.mock import patch
+from zoneinfo import ZoneInfo
 
 import pytest
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from hamcrest import assert_that, equal_to
 
-from apps.notifications.models import Notification, NotificationCadence
+from apps.emails.models import OutboxEmail
+from apps.notifications.models import (
+    ArchivedNotification,
+    Notification,
+    NotificationCadence,
+)
 from apps.projects.models import ProjectStatus
-from services.notifications.django_impl.handler import DjangoNotificationHandler
-from tests.factories import DiscussionFactory, ProjectFactory, UserFactory
+from apps.streams.models import StreamEvent
+from services.discussions.django_impl import DjangoDiscussionHandler
+from services.notifications.django_impl.handler import (
+    ARCHIVED_FIELDS,
+    DjangoNotificationHandler,
+)
+from services.streams.django_impl import user_channel
+from tests.factories import (
+    DiscussionFactory,
+    NotificationFactory,
+    ProjectFactory,
+    UserFactory,
+)
 
 _SEND_EMAIL = (
     "services.email.django_impl.handler"
     ".DjangoEmailHandler"
-    ".send_discussion_notification_email"
+    ".send_discussion_notification_emails"
+)
+
+_SEND_DIGESTS = (
+    "services.email.django_impl.handler"
+    ".DjangoEmailHandler"
+    ".send_discussion_digest_emails"
 )
+_HANDLER_MODULE = "services.notifications.django_impl.handler"
 
 _IMMEDIATE = NotificationCadence.IMMEDIATE
 
@@ -79,6 +107,22 @@ class TestRecipientDetermination:
         expected = {owner.id, root_author.id, participant_a.id, participant_b.id}
         assert_that(recipient_ids, equal_to(expected))
 
+    def test_reply_skips_users_whose_replies_were_deleted(self, handler) -> None:
+        owner = UserFactory(notification_frequency=_IMMEDIATE)
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+        root = DiscussionFactory(project=project, author=owner)
+        former = UserFactory(notification_frequency=_IMMEDIATE)
+        withdrawn = DiscussionFactory(project=project, author=former, parent=root)
+        with patch("api.tasks.notifications.create_discussion_notifications"):
+            DjangoDiscussionHandler().delete_discussion(withdrawn.id, former.id)
+        reply = DiscussionFactory(project=project, parent=root)
+
+        with patch(_SEND_EMAIL):
+            handler.create_notifications_for_discussion(reply.id)
+
+        recipient_ids = set(Notification.objects.values_list("recipient_id", flat=True))
+        assert_that(recipient_ids, equal_to({owner.id}))
+
     def test_deduplication_when_owner_is_also_discussion_creator(self, handler) -> None:
         owner = UserFactory(notification_frequency=_IMMEDIATE)
         project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
@@ -124,3 +168,331 @@ class TestRecipientDetermination:
 
         notification = Notification.objects.get(recipient=owner)
         assert_that(notification.cadence, equal_to(NotificationCadence.HOURLY))
+
+
+@pytest.mark.django_db
+class TestImmediateDelivery:
+    def _busy_thread(self, participants: int):
+        owner = UserFactory(notification_frequency=_IMMEDIATE)
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+        root = DiscussionFactory(project=project, author=owner)
+        for _ in range(participants):
+            DiscussionFactory(
+                project=project,
+                parent=root,
+                author=UserFactory(notification_frequency=_IMMEDIATE),
+            )
+        return DiscussionFactory(project=project, parent=root, author=UserFactory())
+
+    def test_marks_immediate_notifications_sent(self, handler, mailoutbox) -> None:
+        reply = self._busy_thread(participants=3)
+
+        handler.create_notifications_for_discussion(reply.id)
+
+        assert_that(Notification.objects.filter(sent=False).count(), equal_to(0))
+        assert_that(len(mailoutbox), equal_to(4))
+
+    def test_queues_all_emails_with_one_dispatch(self, handler) -> None:
+        reply = self._busy_thread(participants=3)
+
+        with patch("api.tasks.email.dispatch_email_outbox") as dispatch:
+            handler.create_notifications_for_discussion(reply.id)
+
+        dispatch.enqueue.assert_called_once()
+        assert_that(OutboxEmail.objects.count(), equal_to(4))
+
+    def test_query_count_does_not_grow_with_participants(
+        self, handler, django_assert_num_queries
+    ) -> None:
+        small = self._busy_thread(participants=2)
+        large = self._busy_thread(participants=20)
+
+        with (
+            patch("api.tasks.email.dispatch_email_outbox"),
+            CaptureQueriesContext(connection) as small_queries,
+        ):
+            handler.create_notifications_for_discussion(small.id)
+        with (
+            patch("api.tasks.email.dispatch_email_outbox"),
+            django_assert_num_queries(len(small_queries)),
+        ):
+            handler.create_notifications_for_discussion(large.id)
+
+    def test_failed_send_leaves_notifications_unsent(self, handler) -> None:
+        reply = self._busy_thread(participants=2)
+
+        with patch(_SEND_EMAIL, side_effect=RuntimeError("boom")):
+            handler.create_notifications_for_discussion(reply.id)
+
+        assert_that(Notification.objects.count(), equal_to(3))
+        assert_that(Notification.objects.filter(sent=True).count(), equal_to(0))
+
+
+@pytest.mark.django_db
+class TestSendBatchNotifications:
+    def _notify(self, recipient, count=1, cadence=NotificationCadence.DAILY):
+        return [
+            NotificationFactory(recipient=recipient, cadence=cadence)
+            for _ in range(count)
+        ]
+
+    def test_sends_one_digest_per_recipient(self, handler, mailoutbox) -> None:
+        alice, bob = UserFactory(), UserFactory()
+        self._notify(alice, count=3)
+        self._notify(bob, count=2)
+
+        handler.send_batch_notifications(NotificationCadence.DAILY)
+
+        assert_that(
+            sorted(m.to[0] for m in mailoutbox),
+            equal_to(sorted([alice.email, bob.email])),
+        )
+        assert_that(Notification.objects.filter(sent=False).count(), equal_to(0))
+
+    def test_walks_recipients_in_chunks(self, handler, mailoutbox) -> None:
+        recipients = [UserFactory() for _ in range(5)]
+        for recipient in recipients:
+            self._notify(recipient, count=2)
+
+        with patch(f"{_HANDLER_MODULE}.DIGEST_RECIPIENT_CHUNK_SIZE", 2):
+            handler.send_batch_notifications(NotificationCadence.DAILY)
+
+        assert_that(len(mailoutbox), equal_to(5))
+        assert_that(Notification.objects.filter(sent=False).count(), equal_to(0))
+
+    def test_ignores_other_cadences(self, handler, mailoutbox) -> None:
+        hourly = self._notify(UserFactory(), cadence=NotificationCadence.HOURLY)
+
+        handler.send_batch_notifications(NotificationCadence.DAILY)
+
+        assert_that(len(mailoutbox), equal_to(0))
+        hourly[0].refresh_from_db()
+        assert_that(hourly[0].sent, equal_to(False))
+
+    def test_failed_chunk_stays_unsent(self, handler) -> None:
+        self._notify(UserFactory(), count=2)
+
+        with patch(_SEND_DIGESTS, side_effect=RuntimeError("boom")):
+            handler.send_batch_notifications(NotificationCadence.DAILY)
+
+        assert_that(Notification.objects.filter(sent=False).count(), equal_to(2))
+        assert_that(OutboxEmail.objects.count(), equal_to(0))
+
+
+@pytest.mark.django_db
+class TestCoalescing:
+    def _comment(self, project, author=None):
+        return DiscussionFactory(project=project, author=author or UserFactory())
+
+    def test_comments_on_a_project_share_one_pending_row(self, handler) -> None:
+        owner = UserFactory(notification_frequency=NotificationCadence.DAILY)
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+        comments = [self._comment(project) for _ in range(3)]
+
+        for comment in comments:
+            handler.create_notifications_for_discussion(comment.id)
+
+        notification = Notification.objects.get(recipient=owner)
+        assert_that(notification.comment_count, equal_to(3))
+        assert_that(notification.discussion_id, equal_to(comments[-1].id))
+
+    def test_new_row_after_digest_is_sent(self, handler) -> None:
+        owner = UserFactory(notification_frequency=NotificationCadence.DAILY)
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+        handler.create_notifications_for_discussion(self._comment(project).id)
+        handler.send_batch_notifications(NotificationCadence.DAILY)
+
+        handler.create_notifications_for_discussion(self._comment(project).id)
+
+        pending = Notification.objects.get(recipient=owner, sent=False)
+        assert_that(pending.comment_count, equal_to(1))
+        assert_that(Notification.objects.count(), equal_to(2))
+
+    def test_projects_are_kept_apart(self, handler) -> None:
+        owner = UserFactory(notification_frequency=NotificationCadence.HOURLY)
+        for project in ProjectFactory.create_batch(2, owner=owner):
+            handler.create_notifications_for_discussion(self._comment(project).id)
+
+        assert_that(Notification.objects.filter(recipient=owner).count(), equal_to(2))
+
+    def test_immediate_notifications_are_not_coalesced(
+        self, handler, mailoutbox
+    ) -> None:
+        owner = UserFactory(notification_frequency=_IMMEDIATE)
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+
+        for _ in range(2):
+            handler.create_notifications_for_discussion(self._comment(project).id)
+
+        assert_that(Notification.objects.filter(recipient=owner).count(), equal_to(2))
+        assert_that(len(mailoutbox), equal_to(2))
+
+    def test_digest_reports_coalesced_comment_count(self, handler, mailoutbox) -> None:
+        owner = UserFactory(notification_frequency=NotificationCadence.DAILY)
+        project = ProjectFactory(owner=owner, title="Veðurspá")
+        for _ in range(4):
+            handler.create_notifications_for_discussion(self._comment(project).id)
+
+        handler.send_batch_notifications(NotificationCadence.DAILY)
+
+        message = OutboxEmail.objects.get(recipient=owner)
+        [group] = message.context["groups"]
+        assert_that(group["comment_count"], equal_to(4))
+
+
+@pytest.mark.django_db
+class TestStreamEvents:
+    def test_new_notifications_are_announced_to_recipients(self, handler) -> None:
+        owner = UserFactory(notification_frequency=NotificationCadence.DAILY)
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+        discussion = DiscussionFactory(project=project)
+
+        handler.create_notifications_for_discussion(discussion.id)
+
+        assert_that(
+            list(StreamEvent.objects.values_list("channel", "event")),
+            equal_to([(user_channel(owner.id), "notifications.changed")]),
+        )
+
+
+@pytest.mark.django_db
+class TestArchiveSentNotifications:
+    def test_moves_expired_sent_notifications(self, handler, settings) -> None:
+        settings.NOTIFICATION_RETENTION_DAYS = 30
+        old = NotificationFactory(
+            sent=True, sent_at=timezone.now() - timedelta(days=31), comment_count=5
+        )
+        recent = NotificationFactory(
+            sent=True, sent_at=timezone.now() - timedelta(days=1)
+        )
+        pending = NotificationFactory(sent=False)
+
+        archived = handler.archive_sent_notifications()
+
+        assert_that(archived, equal_to(1))
+        remaining = set(Notification.objects.values_list("id", flat=True))
+        assert_that(remaining, equal_to({recent.id, pending.id}))
+        archive = ArchivedNotification.objects.get(id=old.id)
+        assert_that(archive.project_id, equal_to(old.project_id))
+        assert_that(archive.comment_count, equal_to(5))
+
+    def test_archives_in_batches(self, handler) -> None:
+        sent_at = timezone.now() - timedelta(days=365)
+        NotificationFactory.create_batch(5, sent=True, sent_at=sent_at)
+
+        with patch(f"{_HANDLER_MODULE}.ARCHIVE_BATCH_SIZE", 2):
+            archived = handler.archive_sent_notifications()
+
+        assert_that(archived, equal_to(5))
+        assert_that(Notification.objects.count(), equal_to(0))
+        assert_that(ArchivedNotification.objects.count(), equal_to(5))
+
+    def test_keeps_notifications_whose_archive_copy_conflicts(self, handler) -> None:
+        notification = NotificationFactory(
+            sent=True, sent_at=timezone.now() - timedelta(days=365)
+        )
+        ArchivedNotification.objects.create(
+            **Notification.objects.values(*ARCHIVED_FIELDS).get(id=notification.id)
+        )
+
+        with pytest.raises(IntegrityError):
+            handler.archive_sent_notifications()
+
+        assert_that(Notification.objects.filter(id=notification.id).exists())
+
+
+@pytest.mark.django_db
+class TestSendDueDigests:
+    def _pending(self, due_in: timedelta, **kwargs):
+        return NotificationFactory(
+            cadence=NotificationCadence.DAILY,
+            next_digest_at=timezone.now() + due_in,
+            **kwargs,
+        )
+
+    def test_new_pending_rows_are_scheduled_in_the_recipient_slot(
+        self, handler
+    ) -> None:
+        owner = UserFactory(notification_frequency=NotificationCadence.HOURLY)
+        project = ProjectFactory(owner=owner)
+
+        handler.create_notifications_for_discussion(
+            DiscussionFactory(project=project).id
+        )
+
+        notification = Notification.objects.get(recipient=owner)
+        assert_that(
+            notification.next_digest_at > notification.created_at, equal_to(True)
+        )
+        assert_that(
+            notification.next_digest_at - notification.created_at <= timedelta(hours=1),
+            equal_to(True),
+        )
+
+    def test_sends_only_due_recipients(self, handler, mailoutbox) -> None:
+        due = self._pending(timedelta(minutes=-1))
+        later = self._pending(timedelta(hours=3))
+
+        assert_that(handler.send_due_digests(), equal_to(1))
+
+        assert_that([m.to[0] for m in mailoutbox], equal_to([due.recipient.email]))
+        later.refresh_from_db()
+        assert_that(later.sent, equal_to(False))
+
+    def test_each_sweep_is_bounded_and_most_overdue_first(
+        self, handler, mailoutbox
+    ) -> None:
+        rows = [self._pending(timedelta(minutes=-m)) for m in range(1, 6)]
+
+        with patch(f"{_HANDLER_MODULE}.DIGEST_RECIPIENT_CHUNK_SIZE", 2):
+            handler.send_due_digests()
+
+        most_overdue = {r.recipient.email for r in rows[-2:]}
+        assert_that({m.to[0] for m in mailoutbox}, equal_to(most_overdue))
+
+        with patch(f"{_HANDLER_MODULE}.DIGEST_RECIPIENT_CHUNK_SIZE", 2):
+            while handler.send_due_digests():
+                pass
+        assert_that(len(mailoutbox), equal_to(5))
+
+    def test_failing_chunk_is_retried_later_without_blocking_others(
+        self, handler, mailoutbox
+    ) -> None:
+        failing = self._pending(timedelta(minutes=-10))
+        waiting = self._pending(timedelta(minutes=-1))
+
+        with (
+            patch(f"{_HANDLER_MODULE}.DIGEST_RECIPIENT_CHUNK_SIZE", 1),
+            patch(_SEND_DIGESTS, side_effect=RuntimeError("boom")),
+        ):
+            assert_that(handler.send_due_digests(), equal_to(0))
+
+        failing.refresh_from_db()
+        assert_that(failing.sent, equal_to(False))
+        assert_that(failing.next_digest_at > timezone.now(), equal_to(True))
+
+        with patch(f"{_HANDLER_MODULE}.DIGEST_RECIPIENT_CHUNK_SIZE", 1):
+            assert_that(handler.send_due_digests(), equal_to(1))
+        assert_that([m.to[0] for m in mailoutbox], equal_to([waiting.recipient.email]))
+
+    def test_new_pending_rows_use_the_recipients_time_zone(
+        self, handler, settings
+    ) -> None:
+        settings.DIGEST_DAILY_HOURS = (8, 20)
+        owner = UserFactory(
+            notification_frequency=NotificationCadence.DAILY, time_zone="Asia/Tokyo"
+        )
+        project = ProjectFactory(owner=owner, status=ProjectStatus.APPROVED)
+
+        handler.create_notifications_for_discussion(
+            DiscussionFactory(project=project).id
+        )
+
+        notification = Notification.objects.get(recipient=owner)
+        local = notification.next_digest_at.astimezone(ZoneInfo("Asia/Tokyo"))
+        assert_that(8 <= local.hour < 20, equal_to(True))
+
+    def test_immediate_rows_are_never_swept(self, handler) -> None:
+        NotificationFactory(cadence=_IMMEDIATE)
+
+        assert_that(handler.send_due_digests(), equal_to(0))
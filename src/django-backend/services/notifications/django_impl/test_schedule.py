@@ -0,0 +1,92 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from apps.notifications.models import NotificationCadence
+from services.notifications.django_impl.schedule import next_digest_at, slot_offset
+
+NOW = datetime(2026, 3, 10, 9, 30, tzinfo=UTC)
+
+
+class TestSlotOffset:
+    def test_is_stable_per_user(self):
+        user_id = uuid.uuid4()
+        window = timedelta(hours=1)
+
+        assert slot_offset(user_id, window) == slot_offset(user_id, window)
+
+    def test_spreads_users_across_the_window(self):
+        window = timedelta(hours=1)
+        minutes = {
+            slot_offset(uuid.uuid4(), window) // timedelta(minutes=1)
+            for _ in range(500)
+        }
+
+        assert len(minutes) > 50
+
+
+class TestNextDigestAt:
+    def test_hourly_slot_is_within_the_next_hour(self):
+        slot = next_digest_at(uuid.uuid4(), NotificationCadence.HOURLY, NOW)
+
+        assert NOW < slot <= NOW + timedelta(hours=1)
+
+    def test_consecutive_slots_are_one_period_apart(self):
+        user_id = uuid.uuid4()
+        for cadence, period in [
+            (NotificationCadence.HOURLY, timedelta(hours=1)),
+            (NotificationCadence.DAILY, timedelta(days=1)),
+        ]:
+            first = next_digest_at(user_id, cadence, NOW)
+            second = next_digest_at(user_id, cadence, first)
+
+            assert second - first == period
+
+    def test_daily_slot_is_within_local_daytime_hours(self, settings):
+        settings.DIGEST_TIMEZONE = "America/New_York"
+        settings.DIGEST_DAILY_HOURS = (8, 20)
+        tz = ZoneInfo("America/New_York")
+
+        for _ in range(50):
+            slot = next_digest_at(uuid.uuid4(), NotificationCadence.DAILY, NOW)
+
+            assert NOW < slot <= NOW + timedelta(days=1)
+            assert 8 <= slot.astimezone(tz).hour < 20
+
+    def test_daily_slot_uses_the_users_own_time_zone(self, settings):
+        settings.DIGEST_TIMEZONE = "Atlantic/Reykjavik"
+        settings.DIGEST_DAILY_HOURS = (8, 20)
+        tz = ZoneInfo("Asia/Tokyo")
+
+        for _ in range(50):
+            slot = next_digest_at(
+                uuid.uuid4(), NotificationCadence.DAILY, NOW, "Asia/Tokyo"
+            )
+
+            assert 8 <= slot.astimezone(tz).hour < 20
+
+    def test_unknown_time_zone_falls_back_to_the_default(self, settings):
+        settings.DIGEST_TIMEZONE = "America/New_York"
+        user_id = uuid.uuid4()
+
+        assert next_digest_at(
+            user_id, NotificationCadence.DAILY, NOW, "Nowhere/Special"
+        ) == next_digest_at(user_id, NotificationCadence.DAILY, NOW)
+
+    def test_daily_slot_keeps_local_time_across_dst(self, settings):
+        settings.DIGEST_TIMEZONE = "Europe/London"
+        tz = ZoneInfo("Europe/London")
+        user_id = uuid.uuid4()
+        before_change = datetime(2026, 3, 28, 6, 0, tzinfo=UTC)
+
+        first = next_digest_at(user_id, NotificationCadence.DAILY, before_change)
+        second = next_digest_at(user_id, NotificationCadence.DAILY, first)
+
+        assert first.astimezone(tz).time() == second.astimezone(tz).time()
+        assert second - first == timedelta(hours=23)
+
+    def test_rejects_immediate_cadence(self):
+        with pytest.raises(ValueError, match="immediate"):
+            next_digest_at(uuid.uuid4(), NotificationCadence.IMMEDIATE, NOW)
@@ -0,0 +1,72 @@
+"""Per-user unread notification counts kept in UnreadNotificationCount.
+
+Writers adjust the stored count after their transaction commits instead of
+invalidating it, so reads are a primary key lookup rather than a COUNT. The
+adjustment is a single UPDATE, so fan-out in a task worker and mark-read in
+a web worker compose no matter which processes they run in. A missing or
+stale row is recounted on the next read, and the staleness window bounds any
+drift from paths that don't adjust it (e.g. cascading deletes).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.notifications.models import Notification, UnreadNotificationCount
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from uuid import UUID
+
+UNREAD_COUNT_TIMEOUT = timedelta(hours=1)
+
+
+def get_unread_count(user_id: UUID) -> int:
+    now = timezone.now()
+    count = (
+        UnreadNotificationCount.objects.filter(
+            user_id=user_id, counted_at__gt=now - UNREAD_COUNT_TIMEOUT
+        )
+        .values_list("count", flat=True)
+        .first()
+    )
+    if count is None:
+        count = Notification.objects.filter(
+            recipient_id=user_id, read_at__isnull=True
+        ).count()
+        UnreadNotificationCount.objects.update_or_create(
+            user_id=user_id, defaults={"count": count, "counted_at": now}
+        )
+    return max(count, 0)
+
+
+def _apply(deltas: Mapping[UUID, int]) -> None:
+    by_delta: dict[int, list[UUID]] = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(user_id)
+    # Fan-out adds the same delta for everyone, so this is usually one query.
+    # Users without a row are left alone; the next read counts them.
+    for delta, user_ids in by_delta.items():
+        UnreadNotificationCount.objects.filter(user_id__in=user_ids).update(
+            count=F("count") + delta
+        )
+
+
+def adjust_unread_counts(deltas: Mapping[UUID, int]) -> None:
+    """Add ``deltas`` to stored counts once the current transaction commits."""
+    deltas = dict(deltas)
+    transaction.on_commit(lambda: _apply(deltas))
+
+
+def forget_unread_counts(user_ids: Iterable[UUID]) -> None:
+    user_ids = list(user_ids)
+    transaction.on_commit(
+        lambda: UnreadNotificationCount.objects.filter(user_id__in=user_ids).delete()
+    )
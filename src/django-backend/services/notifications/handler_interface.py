@@ -6,5 +6,19 @@ class NotificationHandlerInterface(ABC):
     @abstractmethod
     def create_notifications_for_discussion(self, discussion_id: UUID) -> None: ...
 
+    @abstractmethod
+    def mark_read(
+        self, user_id: UUID, notification_ids: list[UUID] | None = None
+    ) -> int:
+        """Mark the user's notifications read (all if no ids); return count."""
+
     @abstractmethod
     def send_batch_notifications(self, cadence: str) -> None: ...
+
+    @abstractmethod
+    def send_due_digests(self) -> int:
+        """Queue digests whose per-user slot is due; return recipients sent to."""
+
+    @abstractmethod
+    def archive_sent_notifications(self) -> int:
+        """Archive notifications sent before the retention window; return count."""
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+from apps.notifications.models import Notification
+
+
+@dataclass(frozen=True)
+class NotificationPage:
+    notifications: list[Notification]
+    next_cursor: str | None
+
+
+class NotificationQueryInterface(ABC):
+    @abstractmethod
+    def list_for_user(
+        self,
+        user_id: UUID,
+        *,
+        cursor: str | None = None,
+        limit: int = 20,
+        unread_only: bool = False,
+    ) -> NotificationPage:
+        """Latest activity first; pass ``next_cursor`` back for the next page."""
+
+    @abstractmethod
+    def unread_count(self, user_id: UUID) -> int: ...
@@ -0,0 +1,27 @@
+"""Opaque keyset cursors over a (timestamp, id) sort key."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
+def encode_cursor(timestamp: datetime, row_id: UUID) -> str:
+    raw = f"{timestamp.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        timestamp, row_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return datetime.fromisoformat(timestamp), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError from None
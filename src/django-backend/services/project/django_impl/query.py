@@ -3,7 +3,7 @@ from typing import Any
 from urllib.parse import urlparse
 from uuid import UUID
 
-from django.db.models import Prefetch, Q, QuerySet
+from django.db.models import F, Prefetch, Q, QuerySet
 
 from apps.projects.models import Project, ProjectImage, ProjectStatus
 from services.project.exceptions import ProjectNotFoundError
@@ -13,7 +13,9 @@ from services.project.query_interface import (
     ProjectQueryInterface,
 )
 
-ALLOWED_SORT_FIELDS = {"created_at", "title", "updated_at"}
+# Public sort keys that name a differently-called column
+SORT_ALIASES = {"activity": "last_activity_at"}
+ALLOWED_SORT_FIELDS = {"created_at", "title", "updated_at", *SORT_ALIASES}
 
 
 def _base_queryset() -> QuerySet[Project]:
@@ -112,8 +114,14 @@ class DjangoProjectQuery(ProjectQueryInterface):
                 Q(title__icontains=search) | Q(description__icontains=search),
             )
 
-        order_field = f"-{sort_by}" if sort_order == "desc" else sort_by
-        queryset = queryset.order_by(order_field)
+        order_field = F(SORT_ALIASES.get(sort_by, sort_by))
+        # Projects without any activity sort as the least active
+        order = (
+            order_field.desc(nulls_last=True)
+            if sort_order == "desc"
+            else order_field.asc(nulls_first=True)
+        )
+        queryset = queryset.order_by(order, "-created_at")
 
         total = queryset.count()
         pages = ceil(total / per_page)
@@ -0,0 +1,33 @@
+"""Object storage for project images.
+
+settings.STORAGE_BACKEND selects the implementation: "s3" for Scaleway Object
+Storage, or "local" to keep files on disk for development and benchmarking.
+"""
+
+from django.conf import settings
+
+from .exceptions import ObjectNotFoundError
+from .interface import DELETE_BATCH_SIZE, StorageServiceInterface
+from .local_impl import LocalStorageService
+from .s3_impl import S3StorageService
+
+
+def _create_storage_service() -> StorageServiceInterface:
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorageService(
+            settings.LOCAL_STORAGE_ROOT, settings.LOCAL_STORAGE_URL
+        )
+    return S3StorageService()
+
+
+# Singleton instance
+storage_service = _create_storage_service()
+
+__all__ = [
+    "DELETE_BATCH_SIZE",
+    "LocalStorageService",
+    "ObjectNotFoundError",
+    "S3StorageService",
+    "StorageServiceInterface",
+    "storage_service",
+]
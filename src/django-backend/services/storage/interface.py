@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import uuid
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+# Maximum number of keys accepted by a single DeleteObjects call
+DELETE_BATCH_SIZE = 1000
+
+
+class StorageServiceInterface(ABC):
+    """Object storage used for project image uploads and their variants."""
+
+    def generate_upload_key(self, project_id: str, filename: str) -> str:
+        """Generate a unique storage key for an upload.
+
+        Format: projects/{project_id}/{uuid}/{filename}
+        """
+        unique_id = uuid.uuid4().hex[:12]
+        # Sanitize filename - keep only alphanumeric, dots, hyphens, underscores
+        safe_filename = "".join(c for c in filename if c.isalnum() or c in ".-_")
+        if not safe_filename:
+            safe_filename = "image"
+        return f"projects/{project_id}/{unique_id}/{safe_filename}"
+
+    @abstractmethod
+    def generate_presigned_upload_url(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int = 3600,
+    ) -> dict: ...
+
+    @abstractmethod
+    def create_multipart_upload(self, key: str, content_type: str) -> str: ...
+
+    @abstractmethod
+    def generate_presigned_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_count: int,
+        expires_in: int = 3600,
+    ) -> list[str]: ...
+
+    @abstractmethod
+    def complete_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        parts: list[tuple[int, str]],
+    ) -> None: ...
+
+    @abstractmethod
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None: ...
+
+    @abstractmethod
+    def download_object(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    def download_range(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        """Download bytes ``start``..``end`` (inclusive) of an object.
+
+        Returns the bytes read and the total size of the stored object. Raises
+        ObjectNotFoundError if the object does not exist.
+        """
+
+    @abstractmethod
+    def upload_object(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        acl: str = "public-read",
+    ) -> None: ...
+
+    @abstractmethod
+    def delete_object(self, key: str) -> None: ...
+
+    @abstractmethod
+    def delete_objects(self, keys: list[str]) -> list[str]:
+        """Delete many objects. Returns the keys that could not be deleted."""
+
+    @abstractmethod
+    def iter_object_pages(self, prefix: str) -> Iterator[list[tuple[str, datetime]]]:
+        """Yield pages of (key, last_modified) for objects under a prefix."""
+
+    @abstractmethod
+    def object_exists(self, key: str) -> bool: ...
@@ -0,0 +1,196 @@
+"""Local filesystem storage for development and benchmarking.
+
+Objects live under a root directory. Upload URLs point at the dev storage view
+and carry a signed token, so the browser upload flow works the same way it
+does against presigned S3 URLs without any network round trips.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import shutil
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+from urllib.parse import urlencode
+
+from django.core import signing
+
+from .exceptions import ObjectNotFoundError
+from .interface import StorageServiceInterface
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+UPLOAD_TOKEN_SALT = "services.storage.local_upload"  # noqa: S105
+LIST_PAGE_SIZE = 1000
+# Parts of in-progress multipart uploads, kept outside the object namespace
+MULTIPART_DIR = ".multipart"
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class InvalidUploadTokenError(Exception):
+    pass
+
+
+class LocalStorageService(StorageServiceInterface):
+    def __init__(self, root: Path, base_url: str) -> None:
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def path_for(self, key: str) -> Path:
+        """Resolve a key to a path, refusing anything outside the root."""
+        root = self.root.resolve()
+        path = (root / key).resolve()
+        if not path.is_relative_to(root) or path == root:
+            raise ObjectNotFoundError(key)
+        return path
+
+    def _upload_url(self, key: str, claims: dict[str, Any], expires_in: int) -> str:
+        token = signing.dumps(
+            {**claims, "key": key, "exp": int(time.time()) + expires_in},
+            salt=UPLOAD_TOKEN_SALT,
+        )
+        return f"{self.base_url}/{key}?{urlencode({'token': token})}"
+
+    def generate_presigned_upload_url(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int = 3600,
+    ) -> dict:
+        return {
+            "upload_url": self._upload_url(key, {}, expires_in),
+            "method": "PUT",
+            "headers": {"Content-Type": content_type},
+        }
+
+    def create_multipart_upload(self, key: str, content_type: str) -> str:
+        upload_id = uuid.uuid4().hex
+        (self.root / MULTIPART_DIR / upload_id).mkdir(parents=True)
+        return upload_id
+
+    def generate_presigned_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_count: int,
+        expires_in: int = 3600,
+    ) -> list[str]:
+        return [
+            self._upload_url(
+                key, {"upload_id": upload_id, "part": part_number}, expires_in
+            )
+            for part_number in range(1, part_count + 1)
+        ]
+
+    def receive_upload(self, key: str, token: str, body: BinaryIO) -> str:
+        """Store a PUT made to an upload URL. Returns the ETag of the data.
+
+        ``body`` is copied to disk in chunks, so uploads larger than Django's
+        in-memory request body limit are accepted.
+        """
+        try:
+            claims = signing.loads(token, salt=UPLOAD_TOKEN_SALT)
+        except signing.BadSignature:
+            raise InvalidUploadTokenError from None
+        if claims["key"] != key or claims["exp"] < time.time():
+            raise InvalidUploadTokenError
+
+        if "upload_id" in claims:
+            part_dir = self.root / MULTIPART_DIR / claims["upload_id"]
+            if not part_dir.is_dir():
+                raise InvalidUploadTokenError
+            path = part_dir / f"{claims['part']:05d}"
+        else:
+            path = self.path_for(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+        digest = hashlib.md5(usedforsecurity=False)
+        with path.open("wb") as out:
+            while chunk := body.read(COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                out.write(chunk)
+        return digest.hexdigest()
+
+    def complete_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        parts: list[tuple[int, str]],
+    ) -> None:
+        part_dir = self.root / MULTIPART_DIR / upload_id
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as out:
+            for part_number, _ in sorted(parts):
+                out.write((part_dir / f"{part_number:05d}").read_bytes())
+        shutil.rmtree(part_dir)
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        shutil.rmtree(self.root / MULTIPART_DIR / upload_id, ignore_errors=True)
+
+    def download_object(self, key: str) -> bytes:
+        try:
+            return self.path_for(key).read_bytes()
+        except FileNotFoundError:
+            raise ObjectNotFoundError(key) from None
+
+    def download_range(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        path = self.path_for(key)
+        try:
+            with path.open("rb") as f:
+                f.seek(start)
+                data = f.read(end - start + 1)
+                total = path.stat().st_size
+        except FileNotFoundError:
+            raise ObjectNotFoundError(key) from None
+        return data, total
+
+    def upload_object(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        acl: str = "public-read",
+    ) -> None:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+    def delete_object(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+
+    def delete_objects(self, keys: list[str]) -> list[str]:
+        failed = []
+        for key in keys:
+            try:
+                self.delete_object(key)
+            except OSError:
+                failed.append(key)
+        return failed
+
+    def iter_object_pages(self, prefix: str) -> Iterator[list[tuple[str, datetime]]]:
+        root = self.root.resolve()
+        page: list[tuple[str, datetime]] = []
+        for path in sorted(root.rglob("*")):
+            key = path.relative_to(root).as_posix()
+            if not path.is_file() or not key.startswith(prefix):
+                continue
+            if key.startswith(MULTIPART_DIR):
+                continue
+            modified = datetime.fromtimestamp(path.stat().st_mtime, tz=UTC)
+            page.append((key, modified))
+            if len(page) == LIST_PAGE_SIZE:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    def object_exists(self, key: str) -> bool:
+        try:
+            return self.path_for(key).is_file()
+        except ObjectNotFoundError:
+            return False
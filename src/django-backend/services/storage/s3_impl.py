@@ -0,0 +1,234 @@
+"""S3-compatible storage service for Scaleway Object Storage."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import boto3
+from botocore.config import Config
+from django.conf import settings
+
+from .exceptions import ObjectNotFoundError
+from .interface import DELETE_BATCH_SIZE, StorageServiceInterface
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from datetime import datetime
+
+
+class S3StorageService(StorageServiceInterface):
+    """Service for interacting with S3-compatible object storage."""
+
+    def __init__(self) -> None:
+        self._client: Any = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        """Lazy-load the S3 client.
+
+        One client is shared by every thread in the process. Its connection
+        pool is sized for concurrent uploads from task workers and keeps
+        connections alive so calls don't pay a TLS handshake each time.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = boto3.client(
+                        "s3",
+                        endpoint_url=settings.S3_ENDPOINT_URL,
+                        region_name=settings.S3_REGION,
+                        aws_access_key_id=settings.SCW_ACCESS_KEY,
+                        aws_secret_access_key=settings.SCW_SECRET_KEY,
+                        config=Config(
+                            signature_version="s3v4",
+                            max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                            connect_timeout=settings.S3_CONNECT_TIMEOUT,
+                            read_timeout=settings.S3_READ_TIMEOUT,
+                            tcp_keepalive=True,
+                            retries={"max_attempts": 3, "mode": "standard"},
+                        ),
+                    )
+        return self._client
+
+    def generate_presigned_upload_url(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int = 3600,
+    ) -> dict:
+        """Generate a presigned URL for uploading an object via PUT."""
+        url = self.client.generate_presigned_url(
+            "put_object",
+            Params={
+                "Bucket": settings.S3_BUCKET_NAME,
+                "Key": key,
+                "ContentType": content_type,
+                "ACL": "public-read",
+            },
+            ExpiresIn=expires_in,
+            HttpMethod="PUT",
+        )
+        return {
+            "upload_url": url,
+            "method": "PUT",
+            "headers": {
+                "Content-Type": content_type,
+                "x-amz-acl": "public-read",
+            },
+        }
+
+    def create_multipart_upload(self, key: str, content_type: str) -> str:
+        """Start a multipart upload and return its upload ID."""
+        response = self.client.create_multipart_upload(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+            ContentType=content_type,
+            ACL="public-read",
+        )
+        return response["UploadId"]
+
+    def generate_presigned_part_urls(
+        self,
+        key: str,
+        upload_id: str,
+        part_count: int,
+        expires_in: int = 3600,
+    ) -> list[str]:
+        """Generate one presigned PUT URL per part of a multipart upload."""
+        return [
+            self.client.generate_presigned_url(
+                "upload_part",
+                Params={
+                    "Bucket": settings.S3_BUCKET_NAME,
+                    "Key": key,
+                    "UploadId": upload_id,
+                    "PartNumber": part_number,
+                },
+                ExpiresIn=expires_in,
+                HttpMethod="PUT",
+            )
+            for part_number in range(1, part_count + 1)
+        ]
+
+    def complete_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        parts: list[tuple[int, str]],
+    ) -> None:
+        """Assemble uploaded parts, given as (part_number, etag) pairs."""
+        self.client.complete_multipart_upload(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={
+                "Parts": [
+                    {"PartNumber": part_number, "ETag": etag}
+                    for part_number, etag in sorted(parts)
+                ],
+            },
+        )
+
+    def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        """Abort a multipart upload, discarding any uploaded parts."""
+        self.client.abort_multipart_upload(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+            UploadId=upload_id,
+        )
+
+    def download_object(self, key: str) -> bytes:
+        """Download an object from storage and return its contents."""
+        response = self.client.get_object(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+        )
+        return response["Body"].read()
+
+    def download_range(self, key: str, start: int, end: int) -> tuple[bytes, int]:
+        """Download bytes ``start``..``end`` (inclusive) of an object.
+
+        Returns the bytes read and the total size of the stored object.
+        """
+        try:
+            response = self.client.get_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=key,
+                Range=f"bytes={start}-{end}",
+            )
+        except self.client.exceptions.ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code")
+            if code in {"NoSuchKey", "404"}:
+                raise ObjectNotFoundError(key) from None
+            if code == "InvalidRange":
+                # Zero-byte object: nothing to read
+                return b"", 0
+            raise
+
+        # ContentRange looks like "bytes 0-16383/188629"
+        content_range = response.get("ContentRange")
+        if content_range:
+            total = int(content_range.rsplit("/", 1)[1])
+        else:
+            total = response["ContentLength"]
+        return response["Body"].read(), total
+
+    def upload_object(
+        self,
+        key: str,
+        data: bytes,
+        content_type: str,
+        acl: str = "public-read",
+    ) -> None:
+        """Upload bytes to storage."""
+        self.client.put_object(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            ACL=acl,
+        )
+
+    def delete_object(self, key: str) -> None:
+        """Delete an object from storage."""
+        self.client.delete_object(
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=key,
+        )
+
+    def delete_objects(self, keys: list[str]) -> list[str]:
+        """Delete many objects using batched DeleteObjects calls.
+
+        Returns the keys that could not be deleted.
+        """
+        failed: list[str] = []
+        for start in range(0, len(keys), DELETE_BATCH_SIZE):
+            batch = keys[start : start + DELETE_BATCH_SIZE]
+            response = self.client.delete_objects(
+                Bucket=settings.S3_BUCKET_NAME,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+            failed.extend(error["Key"] for error in response.get("Errors", []))
+        return failed
+
+    def iter_object_pages(self, prefix: str) -> Iterator[list[tuple[str, datetime]]]:
+        """Yield pages of (key, last_modified) for objects under a prefix."""
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=settings.S3_BUCKET_NAME, Prefix=prefix):
+            yield [
+                (obj["Key"], obj["LastModified"]) for obj in page.get("Contents", [])
+            ]
+
+    def object_exists(self, key: str) -> bool:
+        """Check if an object exists in storage."""
+        try:
+            self.client.head_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=key,
+            )
+        except self.client.exceptions.ClientError:
+            return False
+        else:
+            return True
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import io
+import time
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.core import signing
+from PIL import Image
+
+from services.image.django_impl.handler import DjangoImageHandler
+from services.storage import ObjectNotFoundError, S3StorageService
+from services.storage.local_impl import (
+    UPLOAD_TOKEN_SALT,
+    InvalidUploadTokenError,
+    LocalStorageService,
+)
+
+BASE_URL = "http://testserver/dev-storage"
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageService(tmp_path, BASE_URL)
+
+
+@pytest.fixture
+def local_storage_view(storage):
+    with patch("project_showcase.views.storage_service", storage):
+        yield storage
+
+
+def _token(url: str) -> str:
+    return parse_qs(urlparse(url).query)["token"][0]
+
+
+def _path(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.path}?{parsed.query}"
+
+
+class TestLocalStorageService:
+    def test_round_trip(self, storage):
+        storage.upload_object("projects/p/a.jpg", b"hello", "image/jpeg")
+
+        assert storage.download_object("projects/p/a.jpg") == b"hello"
+        assert storage.object_exists("projects/p/a.jpg")
+
+    def test_download_range(self, storage):
+        storage.upload_object("projects/p/a.jpg", b"0123456789", "image/jpeg")
+
+        assert storage.download_range("projects/p/a.jpg", 2, 4) == (b"234", 10)
+
+    def test_missing_object(self, storage):
+        with pytest.raises(ObjectNotFoundError):
+            storage.download_object("projects/p/missing.jpg")
+        with pytest.raises(ObjectNotFoundError):
+            storage.download_range("projects/p/missing.jpg", 0, 10)
+
+    def test_rejects_keys_outside_root(self, storage):
+        with pytest.raises(ObjectNotFoundError):
+            storage.upload_object("../escape.txt", b"x", "text/plain")
+        assert not storage.object_exists("../escape.txt")
+
+    def test_delete_objects(self, storage):
+        storage.upload_object("projects/p/a.jpg", b"a", "image/jpeg")
+        storage.upload_object("projects/p/b.jpg", b"b", "image/jpeg")
+
+        failed = storage.delete_objects(["projects/p/a.jpg", "projects/p/b.jpg"])
+
+        assert failed == []
+        assert not storage.object_exists("projects/p/a.jpg")
+        assert not storage.object_exists("projects/p/b.jpg")
+
+    def test_iter_object_pages_filters_by_prefix(self, storage):
+        storage.upload_object("projects/p/a.jpg", b"a", "image/jpeg")
+        storage.upload_object("other/b.jpg", b"b", "image/jpeg")
+        storage.create_multipart_upload("projects/p/big.png", "image/png")
+
+        pages = list(storage.iter_object_pages("projects/"))
+
+        assert [key for page in pages for key, _ in page] == ["projects/p/a.jpg"]
+
+    def test_receive_upload_with_signed_url(self, storage):
+        url = storage.generate_presigned_upload_url("projects/p/a.jpg", "image/jpeg")[
+            "upload_url"
+        ]
+
+        storage.receive_upload("projects/p/a.jpg", _token(url), io.BytesIO(b"data"))
+
+        assert storage.download_object("projects/p/a.jpg") == b"data"
+
+    def test_receive_upload_rejects_token_for_other_key(self, storage):
+        url = storage.generate_presigned_upload_url("projects/p/a.jpg", "image/jpeg")[
+            "upload_url"
+        ]
+
+        with pytest.raises(InvalidUploadTokenError):
+            storage.receive_upload("projects/p/b.jpg", _token(url), io.BytesIO(b"data"))
+
+    def test_receive_upload_rejects_expired_token(self, storage):
+        token = signing.dumps(
+            {"key": "projects/p/a.jpg", "exp": int(time.time()) - 1},
+            salt=UPLOAD_TOKEN_SALT,
+        )
+
+        with pytest.raises(InvalidUploadTokenError):
+            storage.receive_upload("projects/p/a.jpg", token, io.BytesIO(b"data"))
+
+    def test_multipart_upload(self, storage):
+        key = "projects/p/big.png"
+        upload_id = storage.create_multipart_upload(key, "image/png")
+        urls = storage.generate_presigned_part_urls(key, upload_id, 2)
+
+        etags = [
+            storage.receive_upload(key, _token(url), io.BytesIO(chunk))
+            for url, chunk in zip(urls, [b"first-", b"second"], strict=True)
+        ]
+        storage.complete_multipart_upload(
+            key, upload_id, [(1, etags[0]), (2, etags[1])]
+        )
+
+        assert storage.download_object(key) == b"first-second"
+        assert not (storage.root / ".multipart" / upload_id).exists()
+
+    def test_abort_multipart_upload(self, storage):
+        key = "projects/p/big.png"
+        upload_id = storage.create_multipart_upload(key, "image/png")
+
+        storage.abort_multipart_upload(key, upload_id)
+
+        assert not (storage.root / ".multipart" / upload_id).exists()
+
+
+class TestLocalStorageView:
+    def test_put_to_presigned_url(self, client, local_storage_view):
+        url = local_storage_view.generate_presigned_upload_url(
+            "projects/p/a.jpg", "image/jpeg"
+        )["upload_url"]
+
+        response = client.put(_path(url), b"data", content_type="image/jpeg")
+
+        assert response.status_code == 200
+        assert response["ETag"]
+        assert local_storage_view.download_object("projects/p/a.jpg") == b"data"
+
+    def test_put_larger_than_the_request_body_limit(
+        self, client, local_storage_view, settings
+    ):
+        settings.DATA_UPLOAD_MAX_MEMORY_SIZE = 1024
+        data = b"x" * (5 * 1024)
+        url = local_storage_view.generate_presigned_upload_url(
+            "projects/p/a.jpg", "image/jpeg"
+        )["upload_url"]
+
+        response = client.put(_path(url), data, content_type="image/jpeg")
+
+        assert response.status_code == 200
+        assert local_storage_view.download_object("projects/p/a.jpg") == data
+
+    def test_put_with_bad_token(self, client, local_storage_view):
+        response = client.put(
+            "/dev-storage/projects/p/a.jpg?token=nope",
+            b"data",
+            content_type="image/jpeg",
+        )
+
+        assert response.status_code == 403
+        assert not local_storage_view.object_exists("projects/p/a.jpg")
+
+    def test_get_serves_object(self, client, local_storage_view):
+        local_storage_view.upload_object("projects/p/a.jpg", b"data", "image/jpeg")
+
+        response = client.get("/dev-storage/projects/p/a.jpg")
+
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == b"data"
+
+    def test_get_missing_object(self, client, local_storage_view):
+        response = client.get("/dev-storage/projects/p/missing.jpg")
+
+        assert response.status_code == 404
+
+    def test_not_available_with_s3_backend(self, client):
+        with patch("project_showcase.views.storage_service", S3StorageService()):
+            response = client.get("/dev-storage/projects/p/a.jpg")
+
+        assert response.status_code == 404
+
+
+def test_probe_upload_with_local_backend(storage):
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 480), color="red").save(buffer, format="PNG")
+    storage.upload_object("projects/p/a.png", buffer.getvalue(), "image/png")
+
+    with patch("services.image.django_impl.handler.storage_service", storage):
+        probe = DjangoImageHandler().probe_upload("projects/p/a.png", "image/png")
+
+    assert (probe.width, probe.height) == (640, 480)
+    assert probe.file_size == len(buffer.getvalue())
+
+
+def test_s3_client_uses_tuned_connection_pool(settings):
+    settings.S3_MAX_POOL_CONNECTIONS = 48
+    settings.SCW_ACCESS_KEY = "test-access-key"
+    settings.SCW_SECRET_KEY = "test-secret-key"  # noqa: S105
+
+    client = S3StorageService().client
+
+    assert client.meta.config.max_pool_connections == 48
+    assert client.meta.config.tcp_keepalive is True
@@ -0,0 +1,13 @@
+from .publish import project_channel, prune, publish, user_channel
+from .pubsub import Broker, Subscription, SubscriptionClosedError, broker
+
+__all__ = [
+    "Broker",
+    "Subscription",
+    "SubscriptionClosedError",
+    "broker",
+    "project_channel",
+    "prune",
+    "publish",
+    "user_channel",
+]
@@ -0,0 +1,45 @@
+"""Writing events for live streams.
+
+Events are rows in the writer's transaction, so a rolled back change is never
+announced and an announced change is always visible to a client that reacts
+to it.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.streams.models import StreamEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+
+def project_channel(project_id: UUID | str) -> str:
+    return f"project:{project_id}"
+
+
+def user_channel(user_id: UUID | str) -> str:
+    return f"user:{user_id}"
+
+
+def publish(channels: Iterable[str], event: str, data: dict[str, Any]) -> None:
+    StreamEvent.objects.bulk_create(
+        StreamEvent(channel=channel, event=event, data=data) for channel in channels
+    )
+
+
+def prune() -> int:
+    """Delete events older than STREAM_RETENTION_HOURS; returns how many.
+
+    Clients that reconnect after their cursor was pruned reload instead of
+    replaying.
+    """
+    cutoff = timezone.now() - timedelta(hours=settings.STREAM_RETENTION_HOURS)
+    deleted, _ = StreamEvent.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -0,0 +1,214 @@
+"""In-process fan-out of stream events to connected clients.
+
+Each worker process runs one poller that reads new ``StreamEvent`` rows past
+its cursor and hands them to the subscribers of their channel, so database
+load follows the poll interval rather than the number of open connections.
+The poller only runs while somebody is subscribed.
+
+Ids are assigned when a row is inserted but become visible when its
+transaction commits, so a lower id can appear after a higher one has been
+read. Ids skipped over by the cursor are looked up again for ``GAP_TIMEOUT``
+seconds before they are written off as rolled back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections
+from django.db.models import Max, Q
+
+from apps.streams.models import StreamEvent
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+# Events buffered per connection before a slow client is dropped; it can
+# reconnect and catch up from the database with Last-Event-ID
+QUEUE_SIZE = 100
+FETCH_LIMIT = 1000
+GAP_TIMEOUT = 30.0
+MAX_GAPS = 500
+RESET_EVENT = "stream.reset"
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    channel: str
+    event: str
+    data: dict[str, Any]
+
+    @cached_property
+    def message(self) -> bytes:
+        """The event in SSE wire format, encoded once for all its subscribers."""
+        data = json.dumps(self.data, cls=DjangoJSONEncoder)
+        return f"id: {self.id}\nevent: {self.event}\ndata: {data}\n\n".encode()
+
+
+class SubscriptionClosedError(Exception):
+    """The subscriber fell too far behind and was dropped."""
+
+
+class Subscription:
+    def __init__(self) -> None:
+        self.backlog: deque[Event] = deque()
+        self.closed = False
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(QUEUE_SIZE)
+
+    def push(self, event: Event) -> None:
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.closed = True
+
+    async def get(self) -> Event:
+        if self.closed:
+            raise SubscriptionClosedError
+        if self.backlog:
+            return self.backlog.popleft()
+        return await self._queue.get()
+
+
+def _latest_id() -> int:
+    return StreamEvent.objects.aggregate(latest=Max("id"))["latest"] or 0
+
+
+def _fetch(cursor: int, gaps: list[int]) -> list[Event]:
+    rows = (
+        StreamEvent.objects.filter(Q(id__gt=cursor) | Q(id__in=gaps))
+        .order_by("id")
+        .values_list("id", "channel", "event", "data")[:FETCH_LIMIT]
+    )
+    return [Event(*row) for row in rows]
+
+
+def _fetch_backlog(channel: str, after: int, upto: int) -> list[Event]:
+    rows = (
+        StreamEvent.objects.filter(channel=channel, id__gt=after, id__lte=upto)
+        .order_by("id")
+        .values_list("id", "channel", "event", "data")[: QUEUE_SIZE + 1]
+    )
+    events = [Event(*row) for row in rows]
+    if len(events) > QUEUE_SIZE:
+        # Too much missed to replay; the client reloads instead
+        return [Event(upto, channel, RESET_EVENT, {})]
+    return events
+
+
+class Broker:
+    def __init__(self, poll_interval: float | None = None) -> None:
+        self.poll_interval = poll_interval
+        self._channels: defaultdict[str, set[Subscription]] = defaultdict(set)
+        self._cursor = 0
+        self._gaps: dict[int, float] = {}
+        self._poller: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._channels.values())
+
+    @asynccontextmanager
+    async def subscribe(
+        self, channel: str, last_event_id: int | None = None
+    ) -> AsyncIterator[Subscription]:
+        """Receive events on ``channel`` for the duration of the block.
+
+        With ``last_event_id``, events after it that were published before the
+        subscription started are replayed first.
+        """
+        await self._ensure_polling()
+        # No await between reading the cursor and registering: every event
+        # up to it is backlog, every later one reaches the queue
+        upto = self._cursor
+        subscription = Subscription()
+        self._channels[channel].add(subscription)
+        try:
+            if last_event_id is not None and last_event_id < upto:
+                subscription.backlog.extend(
+                    await sync_to_async(_fetch_backlog)(channel, last_event_id, upto)
+                )
+            yield subscription
+        finally:
+            self._unsubscribe(channel, subscription)
+
+    def _unsubscribe(self, channel: str, subscription: Subscription) -> None:
+        subscriptions = self._channels.get(channel)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._channels[channel]
+
+    def _polling(self) -> bool:
+        return (
+            self._poller is not None
+            and not self._poller.done()
+            and self._poller.get_loop() is asyncio.get_running_loop()
+        )
+
+    async def _ensure_polling(self) -> None:
+        if self._polling():
+            return
+        latest = await sync_to_async(_latest_id)()
+        # Another subscriber may have started the poller while we waited
+        if not self._polling():
+            self._cursor = latest
+            self._gaps.clear()
+            self._poller = asyncio.create_task(self._poll())
+
+    async def _poll(self) -> None:
+        interval = self.poll_interval or settings.STREAM_POLL_INTERVAL
+        while self._channels:
+            try:
+                events = await sync_to_async(_fetch)(self._cursor, list(self._gaps))
+            except Exception:
+                logger.exception("Failed to poll stream events")
+                # Drop a broken connection so the next poll opens a new one
+                await sync_to_async(close_old_connections)()
+                events = []
+            self._advance(events)
+            self._dispatch(events)
+            if len(events) < FETCH_LIMIT:
+                await asyncio.sleep(interval)
+
+    def _advance(self, events: list[Event]) -> None:
+        now = time.monotonic()
+        seen = {event.id for event in events}
+        for event_id in seen:
+            self._gaps.pop(event_id, None)
+        newest = max(seen, default=self._cursor)
+        if newest > self._cursor:
+            if newest - self._cursor + len(self._gaps) <= MAX_GAPS:
+                for event_id in range(self._cursor + 1, newest):
+                    if event_id not in seen:
+                        self._gaps[event_id] = now
+            self._cursor = newest
+        self._gaps = {
+            event_id: first_missed
+            for event_id, first_missed in self._gaps.items()
+            if now - first_missed < GAP_TIMEOUT
+        }
+
+    def _dispatch(self, events: list[Event]) -> None:
+        for event in events:
+            for subscription in list(self._channels.get(event.channel, ())):
+                subscription.push(event)
+                if subscription.closed:
+                    self._unsubscribe(event.channel, subscription)
+
+
+broker = Broker()
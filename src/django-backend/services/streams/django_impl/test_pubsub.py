@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from hamcrest import assert_that, contains_exactly, equal_to, has_properties
+
+from apps.streams.models import StreamEvent
+from services.streams.django_impl import (
+    Broker,
+    SubscriptionClosedError,
+    project_channel,
+    publish,
+)
+from services.streams.django_impl.pubsub import (
+    GAP_TIMEOUT,
+    QUEUE_SIZE,
+    RESET_EVENT,
+    Event,
+)
+
+CHANNEL = project_channel("a")
+OTHER_CHANNEL = project_channel("b")
+
+
+def _run(coro_fn):
+    # Thread-sensitive DB calls inside run on the test thread, so they see the
+    # test transaction
+    return async_to_sync(coro_fn)()
+
+
+async def _next(subscription):
+    async with asyncio.timeout(2):
+        return await subscription.get()
+
+
+@pytest.fixture
+def broker():
+    return Broker(poll_interval=0.01)
+
+
+@pytest.mark.django_db
+class TestBroker:
+    def test_delivers_new_events_on_the_channel(self, broker) -> None:
+        async def scenario():
+            async with broker.subscribe(CHANNEL) as subscription:
+                await sync_to_async(publish)([OTHER_CHANNEL], "skipped", {})
+                await sync_to_async(publish)([CHANNEL], "created", {"n": 1})
+                return await _next(subscription)
+
+        event = _run(scenario)
+
+        assert_that(event, has_properties(event="created", data={"n": 1}))
+
+    def test_events_before_subscribing_are_not_delivered(self, broker) -> None:
+        publish([CHANNEL], "old", {})
+
+        async def scenario():
+            async with broker.subscribe(CHANNEL) as subscription:
+                await sync_to_async(publish)([CHANNEL], "new", {})
+                return await _next(subscription)
+
+        assert_that(_run(scenario).event, equal_to("new"))
+
+    def test_replays_events_after_last_event_id(self, broker) -> None:
+        publish([CHANNEL], "seen", {})
+        last_seen = StreamEvent.objects.get().id
+        publish([CHANNEL, OTHER_CHANNEL], "missed", {})
+
+        async def scenario():
+            async with broker.subscribe(CHANNEL, last_event_id=last_seen) as sub:
+                return [await _next(sub)]
+
+        assert_that(
+            [event.event for event in _run(scenario)], contains_exactly("missed")
+        )
+
+    def test_long_gap_asks_client_to_reload(self, broker) -> None:
+        publish([CHANNEL] * (QUEUE_SIZE + 1), "missed", {})
+
+        async def scenario():
+            async with broker.subscribe(CHANNEL, last_event_id=0) as subscription:
+                return await _next(subscription)
+
+        assert_that(_run(scenario).event, equal_to(RESET_EVENT))
+
+    def test_drops_subscriber_that_falls_behind(self, broker) -> None:
+        async def scenario():
+            async with broker.subscribe(CHANNEL) as subscription:
+                broker._dispatch(  # noqa: SLF001
+                    [Event(n, CHANNEL, "e", {}) for n in range(QUEUE_SIZE + 1)]
+                )
+                with pytest.raises(SubscriptionClosedError):
+                    await subscription.get()
+                return broker.subscriber_count
+
+        assert_that(_run(scenario), equal_to(0))
+
+    def test_encodes_events_as_sse(self) -> None:
+        event = Event(7, CHANNEL, "created", {"id": 1})
+
+        assert_that(
+            event.message, equal_to(b'id: 7\nevent: created\ndata: {"id": 1}\n\n')
+        )
+
+
+class TestCursor:
+    def test_skipped_ids_are_polled_again(self) -> None:
+        broker = Broker()
+
+        broker._advance([Event(1, CHANNEL, "e", {}), Event(4, CHANNEL, "e", {})])  # noqa: SLF001
+        assert_that(set(broker._gaps), equal_to({2, 3}))  # noqa: SLF001
+
+        broker._advance([Event(3, CHANNEL, "e", {})])  # noqa: SLF001
+        assert_that(set(broker._gaps), equal_to({2}))  # noqa: SLF001
+        assert_that(broker._cursor, equal_to(4))  # noqa: SLF001
+
+    def test_gaps_expire(self) -> None:
+        broker = Broker()
+        broker._gaps = {1: time.monotonic() - GAP_TIMEOUT - 1}  # noqa: SLF001
+
+        broker._advance([])  # noqa: SLF001
+
+        assert_that(broker._gaps, equal_to({}))  # noqa: SLF001
@@ -17,6 +17,8 @@ from apps.projects.models import (
 )
 from apps.tags.models import Tag, TagCategory, TagStatus
 from apps.users.models import EmailVerificationCode, PasswordResetCode
+from services.discussions.django_impl.activity import record_activity
+from services.discussions.django_impl.participants import record_participation
 
 User = get_user_model()
 
@@ -85,12 +87,24 @@ class ProjectFactory(factory.django.DjangoModelFactory):
 class DiscussionFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Discussion
+        # The hooks write their own rows; the discussion needs no re-save
+        skip_postgeneration_save = True
 
     project = factory.SubFactory(ProjectFactory)
     author = factory.SubFactory(UserFactory)
     body = factory.Faker("paragraph")
     parent = None
 
+    @factory.post_generation
+    def participation(self, create, extracted, **kwargs) -> None:
+        if create:
+            record_participation(self)
+
+    @factory.post_generation
+    def activity(self, create, extracted, **kwargs) -> None:
+        if create:
+            record_activity(self)
+
 
 class NotificationFactory(factory.django.DjangoModelFactory):
     class Meta:
@@ -98,6 +112,7 @@ class NotificationFactory(factory.django.DjangoModelFactory):
 
     recipient = factory.SubFactory(UserFactory)
     discussion = factory.SubFactory(DiscussionFactory)
+    project = factory.SelfAttribute("discussion.project")
     cadence = NotificationCadence.IMMEDIATE
 
 
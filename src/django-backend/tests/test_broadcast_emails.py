@@ -6,7 +6,11 @@ from django.urls import reverse
 from django.utils import timezone
 
 from apps.emails.admin import BroadcastEmailAdmin, BroadcastEmailImageInline
-from apps.emails.models import BroadcastEmail, BroadcastEmailImage
+from apps.emails.models import (
+    BroadcastEmail,
+    BroadcastEmailImage,
+    BroadcastEmailRecipient,
+)
 
 from .factories import BroadcastEmailFactory, BroadcastEmailImageFactory, UserFactory
 
@@ -139,6 +143,70 @@ class TestBroadcastEmailAdminViews:
         broadcast_emails = [m for m in mailoutbox if broadcast.subject in m.subject]
         assert len(broadcast_emails) >= 1
 
+    def test_send_view_post_redirects_to_progress(self, admin_client):
+        UserFactory(email_opt_in_platform_updates=True)
+        broadcast = BroadcastEmailFactory(
+            email_type="platform_updates",
+            created_by=UserFactory(email_opt_in_platform_updates=False),
+        )
+
+        url = reverse(
+            "admin:emails_broadcastemail_send",
+            args=[broadcast.pk],
+        )
+        response = admin_client.post(url)
+
+        assert response["Location"] == reverse(
+            "admin:emails_broadcastemail_progress",
+            args=[broadcast.pk],
+        )
+
+    def test_progress_view_json(self, admin_client):
+        recipient = UserFactory(email_opt_in_platform_updates=True)
+        broadcast = BroadcastEmailFactory(
+            email_type="platform_updates",
+            created_by=UserFactory(email_opt_in_platform_updates=False),
+            send_queued_at=timezone.now(),
+            total_recipients=3,
+        )
+        BroadcastEmailRecipient.objects.create(
+            broadcast_email=broadcast,
+            user=recipient,
+            success=False,
+        )
+
+        url = reverse(
+            "admin:emails_broadcastemail_progress",
+            args=[broadcast.pk],
+        )
+        response = admin_client.get(url, {"format": "json"})
+
+        assert response.json() == {
+            "total": 3,
+            "processed": 1,
+            "failed": 1,
+            "done": False,
+        }
+
+    def test_progress_view_post_resumes_sending(self, admin_client, mailoutbox):
+        UserFactory(email_opt_in_platform_updates=True)
+        broadcast = BroadcastEmailFactory(
+            email_type="platform_updates",
+            created_by=UserFactory(email_opt_in_platform_updates=False),
+            send_queued_at=timezone.now(),
+            total_recipients=1,
+        )
+
+        url = reverse(
+            "admin:emails_broadcastemail_progress",
+            args=[broadcast.pk],
+        )
+        response = admin_client.post(url)
+
+        assert response.status_code == 302
+        broadcast.refresh_from_db()
+        assert broadcast.sent_at is not None
+
     def test_send_view_rejects_already_sent(self, admin_client):
         broadcast = BroadcastEmailFactory(email_type="platform_updates")
         broadcast.sent_at = timezone.now()
@@ -0,0 +1,66 @@
+import pytest
+from django.urls import reverse
+
+from apps.notifications.models import NotificationCadence
+
+from .factories import (
+    DiscussionFactory,
+    NotificationFactory,
+    ProjectFactory,
+    UserFactory,
+)
+
+
+@pytest.mark.django_db
+class TestDigestPreviewViews:
+    def test_list_summarises_unsent_notifications(self, admin_client):
+        recipient = UserFactory(first_name="Anna", last_name="Jónsdóttir")
+        project = ProjectFactory(title="Fjallahjól")
+        NotificationFactory(
+            recipient=recipient,
+            discussion=DiscussionFactory(project=project),
+            cadence=NotificationCadence.DAILY,
+            comment_count=3,
+        )
+        NotificationFactory(recipient=recipient, sent=True)
+
+        response = admin_client.get(
+            reverse("admin:notifications_notification_preview_digest")
+        )
+
+        assert response.status_code == 200
+        assert response.context["total_unsent"] == 3
+        [row] = response.context["recipients"]
+        assert row["recipient"]["email"] == recipient.email
+        assert row["recipient"]["full_name"] == "Anna Jónsdóttir"
+        assert row["projects"] == {"Fjallahjól": 3}
+        assert "Fjallahjól (3)" in response.content.decode()
+
+    def test_list_query_count_does_not_grow_with_notifications(
+        self, admin_client, django_assert_max_num_queries
+    ):
+        for _ in range(20):
+            NotificationFactory(recipient=UserFactory())
+
+        with django_assert_max_num_queries(10):
+            response = admin_client.get(
+                reverse("admin:notifications_notification_preview_digest")
+            )
+
+        assert len(response.context["recipients"]) == 20
+
+    def test_detail_renders_digest(self, admin_client):
+        notification = NotificationFactory(
+            cadence=NotificationCadence.DAILY,
+            discussion__project__title="Sólarsella",
+        )
+
+        response = admin_client.get(
+            reverse(
+                "admin:notifications_notification_preview_digest_detail",
+                args=[notification.recipient_id],
+            )
+        )
+
+        assert response.status_code == 200
+        assert "Sólarsella" in response.content.decode()
@@ -0,0 +1,35 @@
+import pytest
+from django.urls import reverse
+
+from apps.emails.models import SentEmail, SentEmailType
+from services import HANDLERS
+
+from .factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestSentEmailAdminPreview:
+    def _preview(self, admin_client, sent_email):
+        url = reverse("admin:emails_sentemail_preview", args=[sent_email.pk])
+        return admin_client.get(url)
+
+    def test_rerenders_stored_template(self, admin_client):
+        user = UserFactory()
+        HANDLERS.email.send_verification_email(user, "424242", expires_minutes=15)
+
+        response = self._preview(admin_client, SentEmail.objects.get(recipient=user))
+
+        assert response.status_code == 200
+        assert b"424242" in response.content
+
+    def test_serves_legacy_html_body(self, admin_client):
+        sent_email = SentEmail.objects.create(
+            email_type=SentEmailType.VERIFICATION,
+            subject="Old",
+            to_email="old@example.com",
+            html_body="<p>legacy body</p>",
+        )
+
+        response = self._preview(admin_client, sent_email)
+
+        assert response.content == b"<p>legacy body</p>"
@@ -131,7 +131,11 @@ export function Settings({
               setFrequency(opt.value);
               setSaving("notification_frequency");
               try {
-                await api.auth.updateCurrentUser({ notification_frequency: opt.value });
+                await api.auth.updateCurrentUser({
+                  notification_frequency: opt.value,
+                  // Daily digests go out during the day where the user is
+                  time_zone: Intl.DateTimeFormat().resolvedOptions().timeZone,
+                });
               } catch {
                 setFrequency(prev);
               } finally {
@@ -8,6 +8,7 @@ import {
   Squares2X2Icon,
   TrophyIcon as TrophyIconOutline,
   ArrowsUpDownIcon,
+  ChatBubbleLeftIcon,
   FunnelIcon,
 } from "@heroicons/react/24/outline";
 import { TrophyIcon } from "@heroicons/react/24/solid";
@@ -21,7 +22,7 @@ import { getPlaceholderColor } from "@/lib/utils";
 import { TagFilterUnified } from "@/components/TagFilterUnified";
 import { TagBadge } from "@/components/TagBadge";
 
-type SortBy = "created_at" | "title";
+type SortBy = "created_at" | "title" | "activity";
 type ViewMode = "list" | "competition";
 
 interface ProjectsListingProps {
@@ -185,6 +186,14 @@ export function ProjectsListing({
                 >
                   Name
                 </button>
+                <button
+                  onClick={() => { setSortBy("activity"); setSortDropdownOpen(false); }}
+                  className={`w-full text-left px-3 py-2 text-sm transition-colors hover:bg-muted ${
+                    sortBy === "activity" ? "text-foreground font-medium" : "text-muted-foreground"
+                  }`}
+                >
+                  Recent activity
+                </button>
               </div>
             )}
           </div>
@@ -308,6 +317,12 @@ function ProjectCard({ project, priority }: { project: ProjectListItem; priority
             )}
           </div>
         )}
+        {project.discussion_count > 0 && (
+          <p className="mt-2 flex items-center gap-1 text-xs text-muted-foreground">
+            <ChatBubbleLeftIcon className="w-3.5 h-3.5" />
+            {project.discussion_count} comment{project.discussion_count !== 1 ? "s" : ""}
+          </p>
+        )}
       </div>
     </Link>
   );
@@ -75,6 +75,7 @@ interface DiscussionItemProps {
   currentUserId?: string;
   onReply: (discussionId: string, body: string) => Promise<void>;
   onDelete: (discussionId: string) => Promise<void>;
+  onLoadReplies: (discussionId: string, cursor: string) => Promise<void>;
 }
 
 function DiscussionItem({
@@ -82,9 +83,12 @@ function DiscussionItem({
   currentUserId,
   onReply,
   onDelete,
+  onLoadReplies,
 }: DiscussionItemProps) {
   const [showReply, setShowReply] = useState(false);
   const [deleting, setDeleting] = useState(false);
+  const [loadingReplies, setLoadingReplies] = useState(false);
+  const hiddenReplies = discussion.reply_count - discussion.replies.length;
   const isAuthor = currentUserId && discussion.author?.id === currentUserId;
 
   const handleDelete = async () => {
@@ -101,6 +105,16 @@ function DiscussionItem({
     setShowReply(false);
   };
 
+  const handleLoadReplies = async () => {
+    if (!discussion.replies_cursor) return;
+    setLoadingReplies(true);
+    try {
+      await onLoadReplies(discussion.id, discussion.replies_cursor);
+    } finally {
+      setLoadingReplies(false);
+    }
+  };
+
   return (
     <div className="bg-white rounded-xl border border-border overflow-hidden">
       <div className="p-5">
@@ -156,6 +170,19 @@ function DiscussionItem({
               onDelete={onDelete}
             />
           ))}
+          {discussion.replies_cursor && hiddenReplies > 0 && (
+            <div className="px-5 py-3 ml-4">
+              <button
+                onClick={handleLoadReplies}
+                disabled={loadingReplies}
+                className="text-xs text-muted-foreground hover:text-accent transition-colors"
+              >
+                {loadingReplies
+                  ? "Loading..."
+                  : `Show ${hiddenReplies} more ${hiddenReplies === 1 ? "reply" : "replies"}`}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
@@ -167,6 +194,7 @@ interface DiscussionListProps {
   currentUserId?: string;
   onReply: (discussionId: string, body: string) => Promise<void>;
   onDelete: (discussionId: string) => Promise<void>;
+  onLoadReplies: (discussionId: string, cursor: string) => Promise<void>;
 }
 
 export function DiscussionList({
@@ -174,6 +202,7 @@ export function DiscussionList({
   currentUserId,
   onReply,
   onDelete,
+  onLoadReplies,
 }: DiscussionListProps) {
   if (discussions.length === 0) {
     return null;
@@ -188,6 +217,7 @@ export function DiscussionList({
           currentUserId={currentUserId}
           onReply={onReply}
           onDelete={onDelete}
+          onLoadReplies={onLoadReplies}
         />
       ))}
     </div>
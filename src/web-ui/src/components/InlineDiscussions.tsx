@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useCallback, useEffect, useRef, useState } from "react";
 import { useAuth } from "@/contexts/auth";
 import { api } from "@/lib/api";
 import type { Discussion, Reply } from "@/lib/api";
@@ -38,16 +38,26 @@ export function InlineDiscussions({ projectId }: InlineDiscussionsProps) {
   const { user, isAuthenticated, isLoading: authLoading } = useAuth();
   const pathname = usePathname();
   const [discussions, setDiscussions] = useState<Discussion[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [fetched, setFetched] = useState(false);
   const [error, setError] = useState("");
 
+  // Comments already applied, so one that arrives both from our own request
+  // and from the live stream is only counted once
+  const applied = useRef(new Set<string>());
+  const [reloadKey, setReloadKey] = useState(0);
+
   useEffect(() => {
     if (!isAuthenticated || authLoading) return;
     let cancelled = false;
     api.discussions
       .list(projectId)
       .then((data) => {
-        if (!cancelled) setDiscussions(data);
+        if (cancelled) return;
+        applied.current.clear();
+        setDiscussions(data.discussions);
+        setNextCursor(data.next_cursor ?? null);
       })
       .catch(() => {
         if (!cancelled) setError("Failed to load discussions");
@@ -58,35 +68,122 @@ export function InlineDiscussions({ projectId }: InlineDiscussionsProps) {
     return () => {
       cancelled = true;
     };
-  }, [projectId, isAuthenticated, authLoading]);
+  }, [projectId, isAuthenticated, authLoading, reloadKey]);
+
+  const applyCreated = useCallback(
+    (item: Discussion, parentId: string | null) => {
+      if (applied.current.has(`created:${item.id}`)) return;
+      applied.current.add(`created:${item.id}`);
+      setDiscussions((prev) => {
+        if (!parentId) {
+          return prev.some((d) => d.id === item.id) ? prev : [item, ...prev];
+        }
+        return prev.map((d) =>
+          d.id === parentId && !d.replies.some((r) => r.id === item.id)
+            ? {
+                ...d,
+                // Only append once every earlier reply has been loaded, so
+                // the thread stays in order
+                replies: d.replies_cursor ? d.replies : [...d.replies, item],
+                reply_count: d.reply_count + 1,
+              }
+            : d
+        );
+      });
+    },
+    []
+  );
+
+  const applyDeleted = useCallback((id: string, parentId: string | null) => {
+    if (applied.current.has(`deleted:${id}`)) return;
+    applied.current.add(`deleted:${id}`);
+    setDiscussions((prev) =>
+      parentId
+        ? prev.map((d) =>
+            d.id === parentId
+              ? {
+                  ...d,
+                  replies: d.replies.filter((r: Reply) => r.id !== id),
+                  reply_count: Math.max(d.reply_count - 1, 0),
+                }
+              : d
+          )
+        : prev.filter((d) => d.id !== id)
+    );
+  }, []);
+
+  useEffect(() => {
+    if (!isAuthenticated || authLoading) return;
+    return api.discussions.stream(projectId, ({ event, data }) => {
+      if (event === "discussion.created") {
+        applyCreated(data, data.parent_id);
+      } else if (event === "discussion.deleted") {
+        applyDeleted(data.id, data.parent_id);
+      } else if (event === "stream.reset") {
+        setReloadKey((key) => key + 1);
+      }
+    });
+  }, [projectId, isAuthenticated, authLoading, applyCreated, applyDeleted]);
 
   const shouldShowSkeleton = authLoading || (isAuthenticated && !fetched);
 
-  const handleNewDiscussion = async (body: string) => {
-    const discussion = await api.discussions.create(projectId, body);
-    setDiscussions((prev) => [discussion, ...prev]);
+  const handleLoadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const data = await api.discussions.list(projectId, nextCursor);
+      setDiscussions((prev) => [
+        ...prev,
+        ...data.discussions.filter((d) => !prev.some((p) => p.id === d.id)),
+      ]);
+      setNextCursor(data.next_cursor ?? null);
+    } catch {
+      setError("Failed to load discussions");
+    } finally {
+      setLoadingMore(false);
+    }
   };
 
-  const handleReply = async (discussionId: string, body: string) => {
-    const reply = await api.discussions.reply(projectId, discussionId, body);
+  const handleLoadReplies = async (discussionId: string, cursor: string) => {
+    const data = await api.discussions.listReplies(
+      projectId,
+      discussionId,
+      cursor
+    );
     setDiscussions((prev) =>
       prev.map((d) =>
         d.id === discussionId
-          ? { ...d, replies: [...d.replies, reply] }
+          ? {
+              ...d,
+              replies: [
+                ...d.replies,
+                ...data.replies.filter(
+                  (r) => !d.replies.some((existing) => existing.id === r.id)
+                ),
+              ],
+              replies_cursor: data.next_cursor,
+            }
           : d
       )
     );
   };
 
+  const handleNewDiscussion = async (body: string) => {
+    const discussion = await api.discussions.create(projectId, body);
+    applyCreated(discussion, null);
+  };
+
+  const handleReply = async (discussionId: string, body: string) => {
+    const reply = await api.discussions.reply(projectId, discussionId, body);
+    applyCreated({ ...reply, reply_count: 0, replies: [] }, discussionId);
+  };
+
   const handleDelete = async (discussionId: string) => {
     await api.discussions.delete(projectId, discussionId);
-    setDiscussions((prev) => {
-      const filtered = prev.filter((d) => d.id !== discussionId);
-      return filtered.map((d) => ({
-        ...d,
-        replies: d.replies.filter((r: Reply) => r.id !== discussionId),
-      }));
-    });
+    const parent = discussions.find((d) =>
+      d.replies.some((r: Reply) => r.id === discussionId)
+    );
+    applyDeleted(discussionId, parent ? parent.id : null);
   };
 
   if (shouldShowSkeleton) {
@@ -131,7 +228,20 @@ export function InlineDiscussions({ projectId }: InlineDiscussionsProps) {
         currentUserId={user?.id}
         onReply={handleReply}
         onDelete={handleDelete}
+        onLoadReplies={handleLoadReplies}
       />
+
+      {nextCursor && (
+        <div className="mt-4 text-center">
+          <button
+            onClick={handleLoadMore}
+            disabled={loadingMore}
+            className="btn-secondary"
+          >
+            {loadingMore ? "Loading..." : "Load more discussions"}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -94,6 +94,87 @@ export class APIClient {
     return this.refreshPromise;
   }
 
+  /**
+   * Follow a server-sent event stream, reconnecting after drops and resuming
+   * from the last event received. Returns a function that closes it.
+   */
+  stream(
+    endpoint: string,
+    onEvent: (event: string, data: unknown) => void
+  ): () => void {
+    const controller = new AbortController();
+    let lastEventId: string | null = null;
+    let retryMs = 5000;
+
+    const connect = async (isRetry: boolean): Promise<void> => {
+      const headers: Record<string, string> = { Accept: "text/event-stream" };
+      if (this.accessToken) {
+        headers["Authorization"] = `Bearer ${this.accessToken}`;
+      }
+      if (lastEventId) {
+        headers["Last-Event-ID"] = lastEventId;
+      }
+      const response = await fetch(`${API_BASE_URL}${endpoint}`, {
+        headers,
+        signal: controller.signal,
+      });
+      if (response.status === 401) {
+        if (!isRetry && (await this.attemptTokenRefresh())) {
+          return connect(true);
+        }
+        controller.abort();
+        return;
+      }
+      if (response.status === 503) {
+        // Live updates are off on this server; callers keep working without them
+        controller.abort();
+        return;
+      }
+      if (!response.ok || !response.body) {
+        return;
+      }
+
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+      let buffer = "";
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) return;
+        buffer += value;
+        let end: number;
+        while ((end = buffer.indexOf("\n\n")) !== -1) {
+          const frame = buffer.slice(0, end);
+          buffer = buffer.slice(end + 2);
+          let event = "message";
+          let data = "";
+          for (const line of frame.split("\n")) {
+            const sep = line.indexOf(": ");
+            const field = sep === -1 ? line : line.slice(0, sep);
+            const content = sep === -1 ? "" : line.slice(sep + 2);
+            if (field === "id") lastEventId = content;
+            else if (field === "event") event = content;
+            else if (field === "data") data += content;
+            else if (field === "retry") retryMs = Number(content) || retryMs;
+          }
+          if (data) onEvent(event, JSON.parse(data));
+        }
+      }
+    };
+
+    (async () => {
+      while (!controller.signal.aborted) {
+        try {
+          await connect(false);
+        } catch {
+          // Network error or aborted; retried below unless closed
+        }
+        if (controller.signal.aborted) return;
+        await new Promise((resolve) => setTimeout(resolve, retryMs));
+      }
+    })();
+
+    return () => controller.abort();
+  }
+
   async request<T>(
     endpoint: string,
     options: RequestInit = {},
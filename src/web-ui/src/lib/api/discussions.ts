@@ -4,13 +4,55 @@ import type { APIClient } from "./base";
 export type Discussion = components["schemas"]["DiscussionResponse"];
 export type Reply = components["schemas"]["ReplyResponse"];
 export type DiscussionAuthor = components["schemas"]["DiscussionAuthor"];
+export type DiscussionListResponse =
+  components["schemas"]["DiscussionListResponse"];
+export type ReplyListResponse = components["schemas"]["ReplyListResponse"];
+
+export type DiscussionStreamEvent =
+  | {
+      event: "discussion.created";
+      data: Discussion & { parent_id: string | null };
+    }
+  | { event: "discussion.deleted"; data: { id: string; parent_id: string | null } }
+  | { event: "stream.reset"; data: Record<string, never> };
+
+function withCursor(endpoint: string, cursor?: string | null): string {
+  return cursor ? `${endpoint}?cursor=${encodeURIComponent(cursor)}` : endpoint;
+}
 
 export class DiscussionsClient {
   constructor(private client: APIClient) {}
 
-  async list(projectId: string): Promise<Discussion[]> {
-    return this.client.request<Discussion[]>(
-      `/api/projects/${projectId}/discussions`
+  async list(
+    projectId: string,
+    cursor?: string | null
+  ): Promise<DiscussionListResponse> {
+    return this.client.request<DiscussionListResponse>(
+      withCursor(`/api/projects/${projectId}/discussions`, cursor)
+    );
+  }
+
+  async listReplies(
+    projectId: string,
+    discussionId: string,
+    cursor?: string | null
+  ): Promise<ReplyListResponse> {
+    return this.client.request<ReplyListResponse>(
+      withCursor(
+        `/api/projects/${projectId}/discussions/${discussionId}/replies`,
+        cursor
+      )
+    );
+  }
+
+  /** Live new and deleted discussions; returns a function that stops it. */
+  stream(
+    projectId: string,
+    onEvent: (event: DiscussionStreamEvent) => void
+  ): () => void {
+    return this.client.stream(
+      `/api/projects/${projectId}/discussions/stream`,
+      (event, data) => onEvent({ event, data } as DiscussionStreamEvent)
     );
   }
 
@@ -31,7 +31,14 @@ export type {
 } from "./competitions";
 
 // Types - Discussions
-export type { Discussion, Reply, DiscussionAuthor } from "./discussions";
+export type {
+  Discussion,
+  Reply,
+  DiscussionAuthor,
+  DiscussionListResponse,
+  DiscussionStreamEvent,
+  ReplyListResponse,
+} from "./discussions";
 
 // Types - Projects
 export type { Project, ProjectListItem, ProjectListResponse, ListProjectsParams } from "./projects";